@@ -12,7 +12,9 @@ import time
 import requests
 import yaml
 
+from ocs_ci.deployment.device_discovery import get_device_discovery
 from ocs_ci.deployment.ocp import OCPDeployment as BaseOCPDeployment
+from ocs_ci.deployment.readiness import CSV_FAILURE_GRACE, ReadinessTracker
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp, defaults, registry
@@ -420,7 +422,16 @@ class Deployment(object):
             link_all_sa_and_secret(constants.OCS_SECRET, self.namespace)
             logger.info("Deleting all pods in openshift-storage namespace")
             exec_cmd(f"oc delete pod --all -n {self.namespace}")
-        csv.wait_for_phase("Succeeded", timeout=720)
+        # fail when the install of the CSV keeps failing instead of waiting
+        tracker = ReadinessTracker(timeout=720)
+        tracker.add(
+            "ocs-operator csv",
+            constants.CLUSTER_SERVICE_VERSION,
+            self.namespace,
+            resource_name=csv_name,
+            failure_grace=CSV_FAILURE_GRACE,
+        )
+        tracker.wait()
 
         # Modify the CSV with custom values if required
         if all(
@@ -722,22 +733,31 @@ class Deployment(object):
         self.deploy_ocs_via_operator()
         pod = ocp.OCP(kind=constants.POD, namespace=self.namespace)
         cfs = ocp.OCP(kind=constants.CEPHFILESYSTEM, namespace=self.namespace)
-        # Check for Ceph pods
-        assert pod.wait_for_resource(
-            condition="Running",
-            selector="app=rook-ceph-mon",
-            resource_count=3,
-            timeout=600,
+        # Check for Ceph pods, all of them are watched at once
+        tracker = ReadinessTracker(timeout=1800)
+        tracker.add(
+            "mon",
+            constants.POD,
+            self.namespace,
+            selector=constants.MON_APP_LABEL,
+            count=3,
         )
-        assert pod.wait_for_resource(
-            condition="Running", selector="app=rook-ceph-mgr", timeout=600
+        tracker.add(
+            "mgr",
+            constants.POD,
+            self.namespace,
+            selector=constants.MGR_APP_LABEL,
+            after=["mon"],
         )
-        assert pod.wait_for_resource(
-            condition="Running",
-            selector="app=rook-ceph-osd",
-            resource_count=3,
-            timeout=600,
+        tracker.add(
+            "osd",
+            constants.POD,
+            self.namespace,
+            selector=constants.OSD_APP_LABEL,
+            count=3,
+            after=["mon"],
         )
+        tracker.wait()
 
         # validate ceph mon/osd volumes are backed by pvc
         validate_cluster_on_pvc()
@@ -1292,34 +1312,9 @@ def get_device_paths(worker_names):
         raise UnsupportedPlatformError(
             "LSO deployment is not supported for platform: %s", platform
         )
-    for worker in worker_names:
-        logger.info("Retrieving device path for node: %s", worker)
-        out = _get_disk_by_id(worker)
-        out_lines = out.split("\n")
-        nvme_lines = [
-            line
-            for line in out_lines
-            if (pattern in line and constants.ROOT_DISK_NAME not in line)
-        ]
-        for nvme_line in nvme_lines:
-            device_path = [part for part in nvme_line.split(" ") if pattern in part][0]
-            logger.info("Adding %s to device paths", device_path)
-            device_paths.append(f"/dev/disk/by-id/{device_path}")
-
-    return device_paths
-
-
-@retry(CommandFailed)
-def _get_disk_by_id(worker):
-    """
-    Retrieve disk by-id on a worker node using the debug pod
-
-    Args:
-        worker: worker node to get disks by-id for
-
-    Returns:
-        str: stdout of disk by-id command
-
-    """
-    cmd = f"oc debug nodes/{worker} " f"-- chroot /host ls -la /dev/disk/by-id/"
-    return run_cmd(cmd)
+    # all the workers are inspected at once by the discovery agent
+    discovery = get_device_discovery()
+    try:
+        return discovery.get_device_paths(worker_names, pattern)
+    finally:
+        discovery.cleanup()
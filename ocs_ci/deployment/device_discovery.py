@@ -0,0 +1,382 @@
+"""
+Discovery of the block devices of the nodes for the local storage deployment
+
+Instead of an 'oc debug' pod started for each node in turn, one privileged
+agent pod per node is deployed by a DaemonSet and all the nodes are
+inspected concurrently by 'oc exec' into the agents. The inventory of each
+node (lsblk data and /dev/disk/by-id links) is cached, so later lookups don't
+touch the nodes again::
+
+    discovery = get_device_discovery()
+    try:
+        paths = discovery.get_device_paths(worker_names, "wwn")
+    finally:
+        discovery.cleanup()
+
+The nodes the agent pod doesn't run on in time, or fails to pull its image
+on, are inspected by 'oc debug' as before. The image of the agent is
+DEPLOYMENT['device_discovery_image'], the agent isn't deployed at all to the
+disconnected clusters.
+
+"""
+import json
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility import templating
+from ocs_ci.utility.retry import retry
+from ocs_ci.utility.utils import TimeoutSampler, run_cmd
+
+logger = logging.getLogger(__name__)
+
+# Max. number of the nodes inspected at once
+MAX_PARALLEL_NODES = 32
+# Separates the lsblk data and the by-id links in the output of the agent
+OUTPUT_SEPARATOR = "---by-id---"
+INSPECT_SCRIPT = (
+    "lsblk --json --bytes --output NAME,KNAME,TYPE,SIZE,ROTA,MOUNTPOINT,SERIAL,"
+    f"MODEL; echo {OUTPUT_SEPARATOR}; ls -l /dev/disk/by-id/"
+)
+# Mount points of the disk the node runs from
+ROOT_MOUNTPOINTS = ("/", "/boot", "/sysroot")
+# Reasons of the waiting agent container which failed to get its image
+IMAGE_PULL_ERRORS = ("ErrImagePull", "ImagePullBackOff", "InvalidImageName")
+
+_discovery = None
+_discovery_lock = threading.Lock()
+
+
+def parse_by_id(output):
+    """
+    Parse the long listing of /dev/disk/by-id
+
+    Args:
+        output (str): Output of 'ls -l /dev/disk/by-id/'
+
+    Returns:
+        dict: by-id link name -> kernel name of the device it points to
+
+    """
+    links = dict()
+    for line in output.splitlines():
+        if " -> " not in line:
+            continue
+        link, target = line.rsplit(" -> ", 1)
+        links[link.split()[-1]] = target.strip().split("/")[-1]
+    return links
+
+
+def _flag(value):
+    """
+    lsblk of some versions reports the values as strings ("0", "1")
+    """
+    return value in (True, 1, "1", "true")
+
+
+def parse_lsblk(output, by_id=None):
+    """
+    Parse the JSON output of lsblk into the disk data
+
+    Args:
+        output (str): Output of 'lsblk --json --bytes' with the columns of
+            INSPECT_SCRIPT
+        by_id (dict): by-id link name -> kernel name, see parse_by_id
+
+    Returns:
+        list: dicts with the name, type, size (bytes), rotational, serial,
+            model, mountpoints (of the device and its partitions), root
+            (True for the disk the node runs from) and by_id (link names)
+            of each block device
+
+    """
+    by_id = by_id or dict()
+    disks = []
+
+    def mountpoints(device):
+        points = [device["mountpoint"]] if device.get("mountpoint") else []
+        for child in device.get("children") or []:
+            points.extend(mountpoints(child))
+        return points
+
+    for device in json.loads(output).get("blockdevices") or []:
+        kname = device.get("kname") or device["name"]
+        device_mountpoints = mountpoints(device)
+        disks.append(
+            {
+                "name": kname,
+                "type": device.get("type"),
+                "size": int(device.get("size") or 0),
+                "rotational": _flag(device.get("rota")),
+                "serial": device.get("serial"),
+                "model": (device.get("model") or "").strip() or None,
+                "mountpoints": device_mountpoints,
+                "root": any(point in ROOT_MOUNTPOINTS for point in device_mountpoints),
+                "by_id": sorted(
+                    link for link, target in by_id.items() if target == kname
+                ),
+            }
+        )
+    return disks
+
+
+def image_pull_error(pod_status):
+    """
+    Args:
+        pod_status (dict): Status of the pod
+
+    Returns:
+        str: Reason of the failed image pull of the pod, None if the image
+            didn't fail to be pulled
+
+    """
+    for container in pod_status.get("containerStatuses") or []:
+        reason = ((container.get("state") or {}).get("waiting") or {}).get("reason")
+        if reason in IMAGE_PULL_ERRORS:
+            return reason
+    return None
+
+
+class DeviceDiscovery(object):
+    """
+    Concurrent inspection of the node block devices by the agent DaemonSet
+    """
+
+    def __init__(self, namespace=None, timeout=300):
+        """
+        Initializer function
+
+        Args:
+            namespace (str): Namespace of the agent DaemonSet, the local
+                storage namespace by default
+            timeout (int): Time in seconds to wait for the agent pods
+
+        """
+        self.namespace = namespace or config.ENV_DATA["local_storage_namespace"]
+        self.timeout = timeout
+        # node name -> inventory of the node
+        self.inventory = dict()
+        # node name -> name of the agent pod running on the node
+        self.agents = dict()
+        # names of the nodes the agent is deployed to
+        self.agent_nodes = set()
+        self._lock = threading.Lock()
+
+    def deploy(self, nodes):
+        """
+        Deploy the agent DaemonSet to the nodes and wait for the agent pods
+
+        Args:
+            nodes (list): Names of the nodes to run the agent on
+
+        Returns:
+            dict: node name -> agent pod name, the nodes without a running
+                agent in time are not included
+
+        Raises:
+            CommandFailed: In case the agent failed to be deployed
+
+        """
+        if config.DEPLOYMENT.get("disconnected"):
+            logger.info(
+                "Device discovery agent is not deployed to disconnected cluster, "
+                "the nodes will be inspected by oc debug"
+            )
+            return dict()
+        with self._lock:
+            if not self.agent_nodes:
+                self._create(list(nodes))
+                self.agent_nodes.update(nodes)
+        # the nodes added later are not covered by the DaemonSet
+        nodes = [node for node in nodes if node in self.agent_nodes]
+        pods = OCP(kind=constants.POD, namespace=self.namespace)
+        # node name -> reason of the failed image pull of the agent
+        pull_errors = dict()
+
+        def running_agents():
+            agents = dict()
+            items = pods.get(selector=constants.DEVICE_DISCOVERY_LABEL)["items"]
+            for item in items:
+                status = item.get("status") or {}
+                node = item["spec"].get("nodeName")
+                if status.get("phase") == constants.STATUS_RUNNING:
+                    agents[node] = item["metadata"]["name"]
+                elif image_pull_error(status):
+                    pull_errors[node] = image_pull_error(status)
+            return agents
+
+        try:
+            for agents in TimeoutSampler(self.timeout, 5, running_agents):
+                self.agents.update(agents)
+                if all(node in self.agents or node in pull_errors for node in nodes):
+                    break
+        except TimeoutExpiredError:
+            pass
+        missing = [node for node in nodes if node not in self.agents]
+        if missing:
+            logger.warning(
+                f"Device discovery agent is not running on {missing} (image pull "
+                f"errors: {pull_errors}), these nodes will be inspected by oc debug"
+            )
+        return {node: self.agents[node] for node in nodes if node in self.agents}
+
+    def _create(self, nodes):
+        """
+        Create the service account and the DaemonSet of the agent
+        """
+        data = list(
+            templating.load_yaml(constants.DEVICE_DISCOVERY_YAML, multi_document=True)
+        )
+        for resource in data:
+            resource["metadata"]["namespace"] = self.namespace
+            if resource["kind"] == "DaemonSet":
+                image = config.DEPLOYMENT.get("device_discovery_image")
+                if image:
+                    resource["spec"]["template"]["spec"]["containers"][0][
+                        "image"
+                    ] = image
+                terms = resource["spec"]["template"]["spec"]["affinity"][
+                    "nodeAffinity"
+                ]["requiredDuringSchedulingIgnoredDuringExecution"]["nodeSelectorTerms"]
+                terms[0]["matchExpressions"][0]["values"] = nodes
+        yaml_file = tempfile.NamedTemporaryFile(
+            mode="w+", prefix="device_discovery", delete=False
+        )
+        templating.dump_data_to_temp_yaml(data, yaml_file.name)
+        logger.info(f"Deploying device discovery agent to the nodes {nodes}")
+        OCP().exec_oc_cmd(
+            f"adm policy add-scc-to-user {constants.PRIVILEGED} "
+            f"system:serviceaccount:{self.namespace}:{constants.DEVICE_DISCOVERY}",
+            out_yaml_format=False,
+        )
+        OCP().exec_oc_cmd(f"apply -f {yaml_file.name}", out_yaml_format=False)
+
+    def _run(self, node, script):
+        """
+        Run the shell script on the host of the node, in the agent pod if
+        there's one on the node, in an 'oc debug' pod otherwise
+
+        Returns:
+            str: Output of the script
+
+        """
+        agent = self.agents.get(node)
+        if agent:
+            command = f"exec {agent} -- chroot /host sh -c '{script}'"
+            try:
+                return OCP(namespace=self.namespace).exec_oc_cmd(
+                    command, out_yaml_format=False
+                )
+            except CommandFailed as ex:
+                logger.warning(f"Device discovery agent {agent} failed: {ex}")
+        return self._debug(node, script)
+
+    @retry(CommandFailed)
+    def _debug(self, node, script):
+        """
+        Run the shell script on the host of the node in an 'oc debug' pod
+
+        Returns:
+            str: Output of the script
+
+        """
+        return run_cmd(f"oc debug nodes/{node} -- chroot /host sh -c '{script}'")
+
+    def _inspect(self, node):
+        """
+        Returns:
+            dict: The inventory of the node, with the disks (see parse_lsblk)
+                and the by_id links (see parse_by_id)
+
+        """
+        output = self._run(node, INSPECT_SCRIPT)
+        lsblk, _, by_id = output.partition(OUTPUT_SEPARATOR)
+        links = parse_by_id(by_id)
+        return {"disks": parse_lsblk(lsblk, links), "by_id": links}
+
+    def get_inventory(self, nodes, refresh=False):
+        """
+        Get the inventory of the block devices of the nodes, the nodes which
+        are not cached yet are inspected concurrently
+
+        Args:
+            nodes (list): Node names
+            refresh (bool): True for inspecting the cached nodes again
+
+        Returns:
+            dict: node name -> inventory, see _inspect
+
+        """
+        nodes = list(nodes)
+        missing = [node for node in nodes if refresh or node not in self.inventory]
+        if missing:
+            self.deploy(missing)
+            logger.info(f"Inspecting block devices of the nodes {missing}")
+            workers = min(len(missing), MAX_PARALLEL_NODES)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                inventories = list(executor.map(self._inspect, missing))
+            self.inventory.update(zip(missing, inventories))
+        return {node: self.inventory[node] for node in nodes}
+
+    def get_device_paths(self, nodes, pattern):
+        """
+        Get the /dev/disk/by-id paths of the devices usable for the local
+        storage, the links to the root disk (constants.ROOT_DISK_NAME) are
+        skipped
+
+        Args:
+            nodes (list): Node names
+            pattern (str): Part of the by-id link names of the devices
+
+        Returns:
+            list: Device paths, in the order of the nodes
+
+        """
+        device_paths = []
+        for node, inventory in self.get_inventory(nodes).items():
+            for link, target in sorted(inventory["by_id"].items()):
+                if pattern not in link or constants.ROOT_DISK_NAME in (link + target):
+                    continue
+                logger.info(f"Adding {link} of node {node} to device paths")
+                device_paths.append(f"/dev/disk/by-id/{link}")
+        return device_paths
+
+    def cleanup(self):
+        """
+        Delete the agent DaemonSet, the inventory stays cached
+        """
+        if not self.agent_nodes:
+            return
+        logger.info("Deleting device discovery agent")
+        OCP(namespace=self.namespace).exec_oc_cmd(
+            f"delete daemonset,serviceaccount {constants.DEVICE_DISCOVERY} "
+            f"--wait=false",
+            out_yaml_format=False,
+            ignore_error=True,
+        )
+        OCP().exec_oc_cmd(
+            f"adm policy remove-scc-from-user {constants.PRIVILEGED} "
+            f"system:serviceaccount:{self.namespace}:{constants.DEVICE_DISCOVERY}",
+            out_yaml_format=False,
+            ignore_error=True,
+        )
+        self.agents.clear()
+        self.agent_nodes.clear()
+
+
+def get_device_discovery():
+    """
+    Returns:
+        DeviceDiscovery: The device discovery shared by the whole session
+
+    """
+    global _discovery
+    with _discovery_lock:
+        if _discovery is None:
+            _discovery = DeviceDiscovery()
+        return _discovery
@@ -0,0 +1,431 @@
+"""
+Readiness tracking of the components of the deployment
+
+All the components expected by the deployment (operator CSVs, storage
+cluster, pod sets, ...) are declared up front and watched together, one
+'oc get' per kind and namespace per poll for all of them. The time when each
+component became ready is recorded, so the report shows where the deploy
+time went, and the wait fails as soon as some component is in a terminal
+error state instead of waiting for the timeout::
+
+    tracker = ReadinessTracker(timeout=1800)
+    tracker.add("mon", constants.POD, namespace, selector=MON_APP_LABEL, count=3)
+    tracker.add("osd", constants.POD, namespace, selector=OSD_APP_LABEL,
+                count=3, after=["mon"])
+    tracker.wait()
+
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    ResourceInUnexpectedState,
+    ResourceWrongStatusException,
+    TimeoutExpiredError,
+)
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import TimeoutSampler
+
+logger = logging.getLogger(__name__)
+
+# Status phases of the resources considered as ready (by default)
+READY_PHASES = ("Succeeded", "Ready", "Running", "Bound", "Available")
+# Status phases of the resources considered as terminal errors
+FAILED_PHASES = ("Failed", "Error")
+# Reasons of the waiting pod containers which won't recover by themselves
+TERMINAL_POD_REASONS = ("InvalidImageName", "ErrImageNeverPull")
+# Restarts of a container in CrashLoopBackOff considered as a terminal error
+CRASH_LOOP_RESTARTS = 5
+# Seconds a component has to be in a terminal error state to fail the wait
+FAILURE_GRACE = 15
+# OLM routinely moves a CSV through Failed and back to Installing (e.g. when
+# the install strategy isn't available yet), its failure has to last longer
+CSV_FAILURE_GRACE = 300
+
+
+def is_ready(item):
+    """
+    Default readiness check of the resource
+
+    Args:
+        item (dict): The resource data
+
+    Returns:
+        bool: True if the pod is running with all the containers ready or
+            the status phase of other resource is one of READY_PHASES
+
+    """
+    if item.get("metadata", {}).get("deletionTimestamp"):
+        return False
+    status = item.get("status") or {}
+    phase = status.get("phase")
+    if item.get("kind") == constants.POD:
+        # the phase of a crash looping pod is still Running
+        containers = status.get("containerStatuses") or []
+        return phase == constants.STATUS_RUNNING and all(
+            container.get("ready") for container in containers
+        )
+    return phase in READY_PHASES
+
+
+def get_failure(item):
+    """
+    Default check of the resource for a terminal error
+
+    Args:
+        item (dict): The resource data
+
+    Returns:
+        str: Description of the error, None if the resource is not failed
+
+    """
+    status = item.get("status") or {}
+    phase = status.get("phase")
+    if phase in FAILED_PHASES:
+        reason = status.get("reason") or status.get("message") or ""
+        return f"phase {phase} {reason}".strip()
+    if item.get("kind") != constants.POD:
+        return None
+    for container in status.get("containerStatuses") or []:
+        waiting = (container.get("state") or {}).get("waiting") or {}
+        reason = waiting.get("reason")
+        if reason in TERMINAL_POD_REASONS:
+            return f"container {container.get('name')} is in {reason}"
+        if (
+            reason == constants.STATUS_CLBO
+            and container.get("restartCount", 0) >= CRASH_LOOP_RESTARTS
+        ):
+            return (
+                f"container {container.get('name')} is in {reason} after "
+                f"{container['restartCount']} restarts"
+            )
+    return None
+
+
+def match_selector(item, selector):
+    """
+    Check the labels of the resource against the label selector
+
+    Args:
+        item (dict): The resource data
+        selector (str): Equality based selector, e.g. 'app=rook-ceph-mon',
+            or just the label name to match any value
+
+    Returns:
+        bool: True if the resource matches the selector
+
+    """
+    labels = item.get("metadata", {}).get("labels") or {}
+    for requirement in selector.split(","):
+        key, _, value = requirement.strip().partition("=")
+        if key not in labels or (value and labels[key] != value):
+            return False
+    return True
+
+
+class Component(object):
+    """
+    Component of the deployment watched by the tracker
+    """
+
+    def __init__(
+        self,
+        name,
+        kind,
+        namespace=None,
+        resource_name=None,
+        selector=None,
+        count=1,
+        ready=is_ready,
+        failed=get_failure,
+        after=(),
+        failure_grace=None,
+    ):
+        """
+        Initializer function
+
+        Args:
+            name (str): Name of the component shown in the report
+            kind (str): Kind of the resources of the component
+            namespace (str): Namespace of the resources
+            resource_name (str): Name of the resource
+            selector (str): Label selector of the resources
+            count (int): Number of the resources which have to be ready
+            ready (function): Called with the resource data, returns True
+                if the resource is ready
+            failed (function): Called with the resource data, returns the
+                description of the terminal error, None if there's none
+            after (list): Names of the components this one waits for, used
+                for the critical path of the report
+            failure_grace (int): Seconds the component has to be in a
+                terminal error state to fail the wait, the default of the
+                tracker when not set
+
+        """
+        self.name = name
+        self.kind = kind
+        self.namespace = namespace
+        self.resource_name = resource_name
+        self.selector = selector
+        self.count = count
+        self.ready = ready
+        self.failed = failed
+        self.after = list(after)
+        self.ready_at = None
+        self.status = "not found"
+        self.failure_grace = failure_grace
+        self.failure = None
+        # time (epoch) of the first poll of the current terminal error state
+        self.failed_since = None
+
+    def matches(self, item):
+        """
+        Args:
+            item (dict): The resource data
+
+        Returns:
+            bool: True if the resource belongs to the component
+
+        """
+        if self.resource_name and item["metadata"]["name"] != self.resource_name:
+            return False
+        return not self.selector or match_selector(item, self.selector)
+
+    def update(self, items, now):
+        """
+        Update the state of the component from the resources listed in the
+        poll
+
+        Args:
+            items (list): Data of all the resources of the kind and namespace
+            now (float): Time (epoch) of the poll
+
+        """
+        items = [item for item in items if self.matches(item)]
+        failures = [
+            f"{item['metadata']['name']}: {failure}"
+            for item, failure in ((item, self.failed(item)) for item in items)
+            if failure
+        ]
+        if failures:
+            if self.failed_since is None:
+                self.failed_since = now
+            self.failure = "; ".join(failures)
+        else:
+            self.failed_since = None
+            self.failure = None
+        ready = len([item for item in items if self.ready(item)])
+        self.status = f"{ready}/{self.count} ready"
+        if ready >= self.count:
+            self.ready_at = now
+
+
+class ReadinessTracker(object):
+    """
+    Concurrent readiness tracking of the deployment components
+    """
+
+    def __init__(self, timeout=600, sleep=5, failure_grace=FAILURE_GRACE):
+        """
+        Initializer function, the deploy time in the report is counted from
+        the creation of the tracker
+
+        Args:
+            timeout (int): Time in seconds to wait for all the components
+            sleep (int): Time in seconds between the polls
+            failure_grace (int): Seconds a component has to be in a terminal
+                error state to fail the wait, unless set by the component
+
+        """
+        self.timeout = timeout
+        self.sleep = sleep
+        self.failure_grace = failure_grace
+        self.components = dict()
+        self.start = time.time()
+
+    def add(self, name, kind, namespace=None, **kwargs):
+        """
+        Declare the component to watch
+
+        Args:
+            name (str): Unique name of the component
+            kind (str): Kind of the resources of the component
+            namespace (str): Namespace of the resources
+            **kwargs: Other arguments of :class:`Component`
+
+        Returns:
+            Component: The added component
+
+        """
+        component = Component(name, kind, namespace, **kwargs)
+        self.components[name] = component
+        return component
+
+    def pending(self):
+        """
+        Returns:
+            list: The components which are not ready yet
+
+        """
+        return [c for c in self.components.values() if c.ready_at is None]
+
+    def _list(self, kind, namespace):
+        """
+        List all the resources of the kind in the namespace
+
+        Returns:
+            list: The resource data, empty if the kind is not known yet (e.g.
+                the CRD is not created by the operator yet)
+
+        """
+        try:
+            return OCP(kind=kind, namespace=namespace).get()["items"]
+        except CommandFailed as ex:
+            logger.debug(f"Failed to list {kind} in {namespace}: {ex}")
+            return []
+
+    def poll(self):
+        """
+        Check all the pending components, the resources of each kind and
+        namespace are listed once, concurrently
+
+        Returns:
+            bool: True if all the components are ready
+
+        """
+        groups = dict()
+        for component in self.pending():
+            groups.setdefault((component.kind, component.namespace), []).append(
+                component
+            )
+        if not groups:
+            return True
+        keys = list(groups)
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            listed = list(executor.map(lambda key: self._list(*key), keys))
+        now = time.time()
+        for key, items in zip(keys, listed):
+            for component in groups[key]:
+                component.update(items, now)
+                if component.ready_at is not None:
+                    logger.info(
+                        f"{component.name} is ready after "
+                        f"{component.ready_at - self.start:.0f}s"
+                    )
+        return not self.pending()
+
+    def failed(self):
+        """
+        Returns:
+            list: The components in a terminal error state
+
+        """
+        now = time.time()
+        failed = []
+        for component in self.pending():
+            grace = component.failure_grace
+            if grace is None:
+                grace = self.failure_grace
+            if (
+                component.failed_since is not None
+                and now - component.failed_since >= grace
+            ):
+                failed.append(component)
+        return failed
+
+    def wait(self):
+        """
+        Wait for all the declared components to be ready
+
+        Returns:
+            dict: The component name -> seconds since the start of the
+                tracking when the component became ready
+
+        Raises:
+            ResourceInUnexpectedState: As soon as some component is in a
+                terminal error state
+            ResourceWrongStatusException: In case some of the components are
+                not ready in time
+
+        """
+        logger.info(f"Waiting for the components {list(self.components)} to be ready")
+        try:
+            for done in TimeoutSampler(self.timeout, self.sleep, self.poll):
+                failed = self.failed()
+                if failed:
+                    self.log_report()
+                    raise ResourceInUnexpectedState(
+                        ", ".join(f"{c.name} failed: {c.failure}" for c in failed)
+                    )
+                if done:
+                    break
+                logger.info(
+                    "Waiting for: "
+                    + ", ".join(f"{c.name} ({c.status})" for c in self.pending())
+                )
+        except TimeoutExpiredError:
+            self.log_report()
+            pending = self.pending()
+            raise ResourceWrongStatusException(
+                [c.name for c in pending], [c.status for c in pending]
+            )
+        self.log_report()
+        return {
+            name: component.ready_at - self.start
+            for name, component in self.components.items()
+        }
+
+    def critical_path(self):
+        """
+        Find the chain of the components which determined the deploy time:
+        the last ready component, the last ready one it waits for and so on
+
+        Returns:
+            list: Tuples of the component name and the seconds it took after
+                the previous component of the path, from the start of the
+                tracking
+
+        """
+        ready = [c for c in self.components.values() if c.ready_at is not None]
+        if not ready:
+            return []
+        path = []
+        component = max(ready, key=lambda c: c.ready_at)
+        while component:
+            previous = [
+                self.components[name]
+                for name in component.after
+                if name in self.components
+                and self.components[name].ready_at is not None
+            ]
+            previous = max(previous, key=lambda c: c.ready_at) if previous else None
+            since = previous.ready_at if previous else self.start
+            path.append((component.name, component.ready_at - since))
+            component = previous
+        return list(reversed(path))
+
+    def log_report(self):
+        """
+        Log when each component became ready and the critical path
+        """
+        lines = ["Deployment readiness report:"]
+        for component in sorted(
+            self.components.values(), key=lambda c: c.ready_at or float("inf")
+        ):
+            if component.ready_at is None:
+                lines.append(f"  {component.name}: not ready ({component.status})")
+            else:
+                lines.append(
+                    f"  {component.name}: ready after "
+                    f"{component.ready_at - self.start:.0f}s"
+                )
+        path = self.critical_path()
+        if path:
+            lines.append(
+                "  critical path: "
+                + " -> ".join(f"{name} (+{took:.0f}s)" for name, took in path)
+            )
+        logger.info("\n".join(lines))
@@ -0,0 +1,197 @@
+# -*- coding: utf8 -*-
+
+import json
+import time
+
+import pytest
+
+from ocs_ci.deployment import device_discovery
+from ocs_ci.deployment.device_discovery import (
+    DeviceDiscovery,
+    OUTPUT_SEPARATOR,
+    parse_by_id,
+    parse_lsblk,
+)
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility import retry as retry_module
+
+
+LSBLK = {
+    "blockdevices": [
+        {
+            "name": "sda",
+            "kname": "sda",
+            "type": "disk",
+            "size": "128849018880",
+            "rota": "1",
+            "mountpoint": None,
+            "serial": None,
+            "model": "Virtual disk    ",
+            "children": [
+                {
+                    "name": "sda1",
+                    "kname": "sda1",
+                    "type": "part",
+                    "mountpoint": "/boot",
+                },
+                {
+                    "name": "sda4",
+                    "kname": "sda4",
+                    "type": "part",
+                    "mountpoint": "/sysroot",
+                },
+            ],
+        },
+        {
+            "name": "sdb",
+            "kname": "sdb",
+            "type": "disk",
+            "size": 107374182400,
+            "rota": False,
+            "mountpoint": None,
+            "serial": "6000c29d",
+            "model": "Virtual disk",
+        },
+    ]
+}
+
+BY_ID = """total 0
+lrwxrwxrwx. 1 root root  9 Mar  1 10:00 wwn-0x6000c29a -> ../../sda
+lrwxrwxrwx. 1 root root 10 Mar  1 10:00 wwn-0x6000c29a-part1 -> ../../sda1
+lrwxrwxrwx. 1 root root  9 Mar  1 10:00 wwn-0x6000c29d -> ../../sdb
+"""
+
+
+def node_output(node):
+    return json.dumps(LSBLK) + f"\n{OUTPUT_SEPARATOR}\n" + BY_ID
+
+
+def test_parse_by_id():
+    assert parse_by_id(BY_ID) == {
+        "wwn-0x6000c29a": "sda",
+        "wwn-0x6000c29a-part1": "sda1",
+        "wwn-0x6000c29d": "sdb",
+    }
+
+
+def test_parse_lsblk():
+    disks = parse_lsblk(json.dumps(LSBLK), parse_by_id(BY_ID))
+    root, data = disks
+    assert root["root"] and root["rotational"]
+    assert root["mountpoints"] == ["/boot", "/sysroot"]
+    assert root["model"] == "Virtual disk"
+    assert data == {
+        "name": "sdb",
+        "type": "disk",
+        "size": 107374182400,
+        "rotational": False,
+        "serial": "6000c29d",
+        "model": "Virtual disk",
+        "mountpoints": [],
+        "root": False,
+        "by_id": ["wwn-0x6000c29d"],
+    }
+
+
+@pytest.fixture
+def discovery(monkeypatch):
+    runs = []
+
+    def run(self, node, script):
+        runs.append(node)
+        return node_output(node)
+
+    monkeypatch.setattr(DeviceDiscovery, "deploy", lambda self, nodes: {})
+    monkeypatch.setattr(DeviceDiscovery, "_run", run)
+    discovery = DeviceDiscovery(namespace="openshift-local-storage")
+    discovery.runs = runs
+    return discovery
+
+
+def test_get_device_paths(discovery):
+    nodes = [f"worker-{i}" for i in range(3)]
+    paths = discovery.get_device_paths(nodes, "wwn")
+    assert paths == ["/dev/disk/by-id/wwn-0x6000c29d"] * 3
+    assert sorted(discovery.runs) == nodes
+
+
+def test_inventory_is_cached(discovery):
+    discovery.get_inventory(["worker-0", "worker-1"])
+    inventory = discovery.get_inventory(["worker-1", "worker-2"])
+    assert list(inventory) == ["worker-1", "worker-2"]
+    assert sorted(discovery.runs) == ["worker-0", "worker-1", "worker-2"]
+    discovery.get_inventory(["worker-0"], refresh=True)
+    assert len(discovery.runs) == 4
+
+
+def test_shared_discovery(monkeypatch):
+    monkeypatch.setattr(device_discovery, "_discovery", None)
+    shared = device_discovery.get_device_discovery()
+    assert device_discovery.get_device_discovery() is shared
+
+
+def test_debug_fallback_is_retried(monkeypatch):
+    calls = []
+
+    def run_cmd(cmd):
+        calls.append(cmd)
+        if len(calls) == 1:
+            raise CommandFailed("debug pod failed to start")
+        return "output"
+
+    monkeypatch.setattr(device_discovery, "run_cmd", run_cmd)
+    monkeypatch.setattr(retry_module.time, "sleep", lambda seconds: None)
+    discovery = DeviceDiscovery(namespace="openshift-local-storage")
+    assert discovery._run("worker-0", "true") == "output"
+    assert len(calls) == 2
+    assert calls[0].startswith("oc debug nodes/worker-0")
+
+
+def agent_pod(node, phase, reason=None):
+    status = {"phase": phase}
+    if reason:
+        status["containerStatuses"] = [{"state": {"waiting": {"reason": reason}}}]
+    return {
+        "metadata": {"name": f"agent-{node}"},
+        "spec": {"nodeName": node},
+        "status": status,
+    }
+
+
+def test_deploy_image_pull_failure(monkeypatch):
+    created = []
+
+    class FakeOCP(object):
+        def __init__(self, **kwargs):
+            pass
+
+        def get(self, selector=None):
+            return {
+                "items": [
+                    agent_pod("worker-0", "Running"),
+                    agent_pod("worker-1", "Pending", "ImagePullBackOff"),
+                ]
+            }
+
+    monkeypatch.setattr(device_discovery, "OCP", FakeOCP)
+    monkeypatch.setattr(
+        DeviceDiscovery, "_create", lambda self, nodes: created.append(nodes)
+    )
+    monkeypatch.setitem(device_discovery.config.DEPLOYMENT, "disconnected", False)
+    discovery = DeviceDiscovery(namespace="openshift-local-storage", timeout=60)
+    start = time.time()
+    agents = discovery.deploy(["worker-0", "worker-1"])
+    # no waiting for the agent which can't get its image
+    assert time.time() - start < 5
+    assert agents == {"worker-0": "agent-worker-0"}
+    assert created == [["worker-0", "worker-1"]]
+
+
+def test_no_agent_when_disconnected(monkeypatch):
+    monkeypatch.setattr(
+        DeviceDiscovery, "_create", lambda self, nodes: pytest.fail("created")
+    )
+    monkeypatch.setitem(device_discovery.config.DEPLOYMENT, "disconnected", True)
+    discovery = DeviceDiscovery(namespace="openshift-local-storage")
+    assert discovery.deploy(["worker-0"]) == {}
+    assert not discovery.agent_nodes
@@ -0,0 +1,144 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.deployment.readiness import CSV_FAILURE_GRACE, ReadinessTracker
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import (
+    ResourceInUnexpectedState,
+    ResourceWrongStatusException,
+)
+
+
+NAMESPACE = "openshift-storage"
+
+
+def pod(name, app, phase="Running", waiting=None, restarts=0):
+    container = {
+        "name": app,
+        "ready": phase == "Running" and not waiting,
+        "restartCount": restarts,
+        "state": {},
+    }
+    if waiting:
+        container["state"]["waiting"] = {"reason": waiting}
+    return {
+        "kind": constants.POD,
+        "metadata": {"name": name, "labels": {"app": app}},
+        "status": {"phase": phase, "containerStatuses": [container]},
+    }
+
+
+def csv(phase):
+    return {
+        "kind": "ClusterServiceVersion",
+        "metadata": {"name": "ocs-operator.v4.6.0"},
+        "status": {"phase": phase},
+    }
+
+
+class FakeCluster(object):
+    """
+    Returns the next state of the cluster for each poll, the last state is
+    kept
+    """
+
+    def __init__(self, states):
+        self.states = states
+        self.lists = 0
+
+    def list(self, kind, namespace):
+        self.lists += 1
+        polls = len(self.states) - 1
+        state = self.states[min(self.lists - 1, polls)]
+        return state.get(kind, [])
+
+
+def make_tracker(monkeypatch, states):
+    cluster = FakeCluster(states)
+    monkeypatch.setattr(ReadinessTracker, "_list", cluster.list)
+    tracker = ReadinessTracker(timeout=5, sleep=0)
+    tracker.add("mon", constants.POD, NAMESPACE, selector="app=rook-ceph-mon", count=2)
+    tracker.add(
+        "osd", constants.POD, NAMESPACE, selector="app=rook-ceph-osd", after=["mon"]
+    )
+    return tracker, cluster
+
+
+def test_wait_for_components(monkeypatch):
+    states = [
+        {constants.POD: [pod("mon-a", "rook-ceph-mon", "Pending")]},
+        {
+            constants.POD: [
+                pod("mon-a", "rook-ceph-mon"),
+                pod("mon-b", "rook-ceph-mon"),
+                pod("osd-0", "rook-ceph-osd", "Pending"),
+            ]
+        },
+        {
+            constants.POD: [
+                pod("mon-a", "rook-ceph-mon"),
+                pod("mon-b", "rook-ceph-mon"),
+                pod("osd-0", "rook-ceph-osd"),
+            ]
+        },
+    ]
+    tracker, cluster = make_tracker(monkeypatch, states)
+    ready = tracker.wait()
+    assert set(ready) == {"mon", "osd"}
+    assert ready["mon"] <= ready["osd"]
+    # both the components share the list of the pods
+    assert cluster.lists == 3
+    assert [name for name, _ in tracker.critical_path()] == ["mon", "osd"]
+
+
+def test_fail_fast_on_terminal_error(monkeypatch):
+    states = [
+        {
+            constants.POD: [
+                pod("mon-a", "rook-ceph-mon"),
+                pod("mon-b", "rook-ceph-mon", waiting="InvalidImageName"),
+            ]
+        }
+    ]
+    tracker, cluster = make_tracker(monkeypatch, states)
+    tracker.failure_grace = 0
+    with pytest.raises(ResourceInUnexpectedState, match="InvalidImageName"):
+        tracker.wait()
+    assert cluster.lists == 1
+
+
+def test_transient_failure_is_tolerated(monkeypatch):
+    # many polls of the Failed CSV within the failure grace time
+    states = [{"csv": [csv("Failed")]}] * 10 + [{"csv": [csv("Succeeded")]}]
+    cluster = FakeCluster(states)
+    monkeypatch.setattr(ReadinessTracker, "_list", cluster.list)
+    tracker = ReadinessTracker(timeout=5, sleep=0, failure_grace=0)
+    tracker.add(
+        "csv",
+        "csv",
+        NAMESPACE,
+        resource_name="ocs-operator.v4.6.0",
+        failure_grace=CSV_FAILURE_GRACE,
+    )
+    assert list(tracker.wait()) == ["csv"]
+
+
+def test_failure_lasting_over_grace(monkeypatch):
+    cluster = FakeCluster([{"csv": [csv("Failed")]}])
+    monkeypatch.setattr(ReadinessTracker, "_list", cluster.list)
+    tracker = ReadinessTracker(timeout=5, sleep=0)
+    component = tracker.add(
+        "csv", "csv", NAMESPACE, resource_name="ocs-operator.v4.6.0"
+    )
+    tracker.poll()
+    assert not tracker.failed()
+    component.failed_since -= tracker.failure_grace
+    assert tracker.failed() == [component]
+
+
+def test_timeout(monkeypatch):
+    tracker, _ = make_tracker(monkeypatch, [{}])
+    tracker.timeout = 0
+    with pytest.raises(ResourceWrongStatusException, match="mon"):
+        tracker.wait()
@@ -31,6 +31,7 @@ from ocs_ci.ocs.exceptions import (
 )
 from ocs_ci.ocs.resources.ocs import get_ocs_csv, get_version_info
 from ocs_ci.ocs.utils import collect_ocs_logs, collect_prometheus_metrics
+from ocs_ci.utility import cassette
 from ocs_ci.utility.utils import (
     dump_config_to_file,
     get_ceph_version,
@@ -232,6 +233,44 @@ def pytest_addoption(parser):
             "versions, collecting logs, etc"
         ),
     )
+    parser.addoption(
+        "--record-commands",
+        dest="record_commands",
+        help=(
+            "Path to the cassette file where all the commands executed during "
+            "the run (oc, ceph, ...) are recorded with their output and timing"
+        ),
+    )
+    parser.addoption(
+        "--replay-commands",
+        dest="replay_commands",
+        help=(
+            "Path to the cassette file recorded via --record-commands, the "
+            "commands are served from it instead of the cluster"
+        ),
+    )
+    parser.addoption(
+        "--replay-speed",
+        dest="replay_speed",
+        type=float,
+        default=0,
+        help=(
+            "Factor of the recorded duration of the commands to wait during "
+            "replay, 1 for the recorded timing, 0 (default) for no waiting"
+        ),
+    )
+    parser.addoption(
+        "--replay-loose",
+        dest="replay_loose",
+        action="store_true",
+        default=False,
+        help=(
+            "Serve the commands which were not recorded with the response of "
+            "the next recorded command of the same shape (e.g. 'oc get pod' "
+            "of another pod), by default only the exactly matching commands "
+            "are served"
+        ),
+    )
 
 
 def pytest_configure(config):
@@ -483,6 +522,29 @@ def process_cluster_cli_params(config):
     if collect_logs_on_success_run:
         ocsci_config.REPORTING["collect_logs_on_success_run"] = True
     get_cli_param(config, "dev_mode")
+    record_commands = get_cli_param(config, "record_commands")
+    replay_commands = get_cli_param(config, "replay_commands")
+    if record_commands and replay_commands:
+        pytest.exit("--record-commands and --replay-commands are mutually exclusive")
+    if record_commands:
+        cassette.start_recording(os.path.expanduser(record_commands))
+    elif replay_commands:
+        cassette.start_replay(
+            os.path.expanduser(replay_commands),
+            speed=get_cli_param(config, "replay_speed", default=0),
+            strict=not get_cli_param(config, "replay_loose", default=False),
+        )
+
+
+def pytest_unconfigure(config):
+    """
+    Save the cassette with the recorded commands, if recording is enabled.
+
+    Args:
+        config (pytest.config): Pytest config object
+
+    """
+    cassette.stop()
 
 
 def pytest_collection_modifyitems(session, config, items):
@@ -2,10 +2,14 @@ import os
 import pytest
 import logging
 from py.xml import html
+from ocs_ci.ocs import request_layer, timeline
+from ocs_ci.utility import call_stats
 from ocs_ci.utility.utils import email_reports
 from pytest_reportportal import RPLogHandler
 from ocs_ci.framework import config as ocsci_config
 
+log = logging.getLogger(__name__)
+
 
 @pytest.mark.optionalhook
 def pytest_html_results_table_header(cells):
@@ -47,6 +51,11 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     report.description = str(item.function.__doc__)
+    recorder = timeline.get_recorder()
+    if recorder:
+        recorder.record_test_phase(
+            item.nodeid, call.when, call.start, call.stop, report.outcome
+        )
     extra = getattr(report, "extra", [])
 
     if report.when == "call":
@@ -55,6 +64,9 @@ def pytest_runtest_makereport(item, call):
         else:
             log_file = logging.getLogger().handlers[1].baseFilename
         extra.append(pytest_html.extras.url(log_file, name="Log File"))
+        slowest_calls = slowest_calls_html(item.nodeid)
+        if slowest_calls:
+            extra.append(pytest_html.extras.html(slowest_calls))
         report.extra = extra
         item.session.results[item] = report
     if report.skipped:
@@ -63,6 +75,62 @@ def pytest_runtest_makereport(item, call):
         item.session.results[item] = report
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Record latency of the cluster calls done by the test for the test
+    """
+    call_stats.current_test = item.nodeid
+    yield
+    call_stats.current_test = call_stats.SESSION
+
+
+def slowest_calls_html(test):
+    """
+    Build html section with the slowest cluster calls of the test and the
+    kinds of calls which took most of the time
+
+    Args:
+        test (str): Test node id
+
+    Returns:
+        str: html with the slowest cluster calls, empty if there are none
+
+    """
+    slowest = call_stats.get_slowest_calls(test)
+    if not slowest:
+        return ""
+    histograms = sorted(
+        call_stats.get_histograms(test).items(), key=lambda item: -item[1].total
+    )
+    calls_table = html.table(
+        html.tr(html.th("Seconds"), html.th("Call"), html.th("Details")),
+        [
+            html.tr(html.td(f"{duration:.3f}"), html.td(call), html.td(description))
+            for duration, _, call, description in slowest
+        ],
+    )
+    totals_table = html.table(
+        html.tr(html.th("Call"), html.th("Count"), html.th("Total"), html.th("Max")),
+        [
+            html.tr(
+                html.td(" ".join(filter(None, key))),
+                html.td(hist.count),
+                html.td(f"{hist.total:.3f}"),
+                html.td(f"{hist.max:.3f}"),
+            )
+            for key, hist in histograms[: call_stats.SLOWEST_CALLS]
+        ],
+    )
+    return html.div(
+        html.h4("Slowest cluster calls"),
+        calls_table,
+        html.h4("Cluster calls by total time"),
+        totals_table,
+        class_="slowest-calls",
+    ).unicode(indent=2)
+
+
 def pytest_sessionstart(session):
     """
     Prepare results dict
@@ -72,7 +140,16 @@ def pytest_sessionstart(session):
 
 def pytest_sessionfinish(session, exitstatus):
     """
-    send email report
+    send email report and save latency statistics of the cluster calls
     """
     if ocsci_config.RUN["cli_params"].get("email"):
         email_reports(session)
+    stats_file = os.path.join(
+        os.path.expanduser(ocsci_config.RUN["log_dir"]),
+        f"call-stats-{ocsci_config.RUN['run_id']}.json",
+    )
+    try:
+        call_stats.dump(stats_file)
+    except OSError:
+        log.exception("Failed to save call statistics")
+    log.info(f"Cluster API requests: {request_layer.get_request_layer().get_stats()}")
@@ -20,7 +20,7 @@ import yaml
 
 from ocs_ci.framework import config
 from ocs_ci.ocs.utils import mirror_image
-from ocs_ci.ocs import constants, defaults, node, ocp
+from ocs_ci.ocs import constants, defaults, node, ocp, timeline
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     ResourceWrongStatusException,
@@ -114,6 +114,83 @@ def wait_for_resource_state(resource, state, timeout=60):
     logger.info(f"{resource.kind} {resource.name} reached state {state}")
 
 
+def get_resource_state(resource_data):
+    """
+    Get the state of the resource as used by wait_for_resources_state
+
+    Args:
+        resource_data (dict): The resource data, e.g. item of 'oc get -o yaml'
+
+    Returns:
+        str: 'true' or 'false' (readyToUse) for VolumeSnapshot, status phase
+            for other kinds (e.g. 'Bound'), None when not known yet
+
+    """
+    status = resource_data.get("status") or {}
+    if resource_data.get("kind", "").lower() == constants.VOLUMESNAPSHOT.lower():
+        ready = status.get("readyToUse")
+        return None if ready is None else str(ready).lower()
+    return status.get("phase")
+
+
+def wait_for_resources_state(resources, state, timeout=60, sleep=3):
+    """
+    Wait for multiple resources to get to a given status. All the resources
+    of the same kind and namespace are checked by a single 'oc get' call per
+    poll.
+
+    Args:
+        resources (list): The resource objects (OCS obj)
+        state (str): The status to wait for, see get_resource_state
+        timeout (int): Time in seconds to wait
+        sleep (int): Time in seconds between the polls
+
+    Returns:
+        dict: The (kind, namespace, name) of the resource -> time (epoch) when
+            the resource was first seen in the state
+
+    Raises:
+        ResourceWrongStatusException: In case some of the resources haven't
+            reached the desired state
+
+    """
+    groups = {}
+    for resource in resources:
+        groups.setdefault((resource.kind, resource.namespace), set()).add(resource.name)
+    ready_times = {}
+
+    def check_state():
+        for (kind, namespace), names in groups.items():
+            pending = {
+                name for name in names if (kind, namespace, name) not in ready_times
+            }
+            if not pending:
+                continue
+            items = OCP(kind=kind, namespace=namespace).get()["items"]
+            now = time.time()
+            for item in items:
+                name = item["metadata"]["name"]
+                if name in pending and get_resource_state(item) == state:
+                    ready_times[(kind, namespace, name)] = now
+        return len(ready_times) == len(resources)
+
+    logger.info(f"Waiting for {len(resources)} resources to reach state {state}")
+    try:
+        for done in TimeoutSampler(timeout, sleep, check_state):
+            if done:
+                break
+    except TimeoutExpiredError:
+        not_ready = [
+            r for r in resources if (r.kind, r.namespace, r.name) not in ready_times
+        ]
+        logger.error(f"Resources {[r.name for r in not_ready]} failed to reach {state}")
+        raise ResourceWrongStatusException(
+            [r.name for r in not_ready], [r.describe() for r in not_ready]
+        )
+    logger.info(f"All {len(resources)} resources reached state {state}")
+    return ready_times
+
+
 def create_pod(
     interface_type=None,
     pvc_name=None,
@@ -322,6 +399,7 @@ def create_project(project_name=None):
     namespace = project_name or create_unique_resource_name("test", "namespace")
     project_obj = ocp.OCP(kind="Project", namespace=namespace)
     assert project_obj.new_project(namespace), f"Failed to create namespace {namespace}"
+    timeline.watch_namespace(namespace)
     return project_obj
 
 
@@ -1128,6 +1206,9 @@ def set_image_lookup(image_name):
 def get_snapshot_time(interface, snap_name, status):
     """
     Get the starting/ending creation time of a PVC based on provisioner logs
+    (the logs have microsecond resolution, the snapshot create to ready times
+    in ocs_ci.ocs.timeline.Timeline.snapshot_ready_times only have the second
+    resolution of the Kubernetes timestamps)
 
     Args:
         interface (str): The interface backed the PVC
@@ -1226,6 +1307,9 @@ def measure_snapshot_creation_time(interface, snap_name, snap_con_name):
 def get_provision_time(interface, pvc_name, status="start"):
     """
     Get the starting/ending creation time of a PVC based on provisioner logs
+    (the logs have microsecond resolution, the PVC create to Bound times in
+    ocs_ci.ocs.timeline.Timeline.pvc_bound_times only have the second
+    resolution of the Kubernetes timestamps)
 
     Args:
         interface (str): The interface backed the PVC
@@ -1550,7 +1634,9 @@ def pod_start_time(pod_obj):
     Function to measure time taken for container(s) to get into running state
     by measuring the difference between container's start time (when container
     went into running state) and started time (when container was actually
-    started)
+    started). The timeline has the pod conditions rather than the start of
+    each container, for the breakdown of the pod start by the conditions see
+    ocs_ci.ocs.timeline.Timeline.pod_start_breakdown
 
     Args:
         pod_obj(obj): pod object to measure start time
@@ -0,0 +1,335 @@
+"""
+Tracking of the OpenShift builds of many projects
+
+The builds of all the tracked projects are checked with one 'oc get build -A'
+per cycle instead of the per build queries. The phase transition times come
+from the build status timestamps, so the reported build timing doesn't depend
+on the polling interval::
+
+    tracker = BuildTracker(projects, builds_per_project=10)
+    tracker.wait()
+    log.info(tracker.node_distribution())
+
+"""
+import logging
+import statistics
+import time
+from datetime import datetime
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed, UnexpectedBehaviour
+from ocs_ci.ocs.ocp import OCP
+
+log = logging.getLogger(__name__)
+
+# Label of the builds with the name of their build config
+BUILD_CONFIG_LABEL = "openshift.io/build-config.name"
+# Annotation with the name of the build pod, missing for the pipeline builds
+BUILD_POD_ANNOTATION = "openshift.io/build.pod-name"
+# Selector of the Jenkins pods running the pipeline builds of a project
+JENKINS_POD_SELECTOR = "name=jenkins"
+BUILD_COMPLETE = constants.JENKINS_BUILD_COMPLETE
+BUILD_FAILED_PHASES = ("Failed", "Error", "Cancelled")
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def parse_timestamp(value):
+    """
+    Args:
+        value (str): Timestamp of the resource, e.g. 2020-11-01T10:00:00Z
+
+    Returns:
+        float: Seconds since the epoch, None if the value is not set
+
+    """
+    if not value:
+        return None
+    return (
+        datetime.strptime(value, TIMESTAMP_FORMAT) - datetime(1970, 1, 1)
+    ).total_seconds()
+
+
+def format_duration(seconds):
+    """
+    Args:
+        seconds (float): Duration in seconds
+
+    Returns:
+        str: The duration in the format of 'oc describe', e.g. 2m30s
+
+    """
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m{seconds}s" if minutes else f"{seconds}s"
+
+
+class BuildRecord(object):
+    """
+    Phase and timing of one build
+    """
+
+    def __init__(self, item):
+        """
+        Initializer function
+
+        Args:
+            item (dict): The build data
+
+        """
+        metadata = item["metadata"]
+        status = item.get("status") or {}
+        self.namespace = metadata["namespace"]
+        self.name = metadata["name"]
+        self.phase = status.get("phase")
+        self.created = parse_timestamp(metadata.get("creationTimestamp"))
+        self.started = parse_timestamp(status.get("startTimestamp"))
+        self.completed = parse_timestamp(status.get("completionTimestamp"))
+        self.pod = (metadata.get("annotations") or {}).get(BUILD_POD_ANNOTATION)
+        self.node = None
+
+    @property
+    def key(self):
+        return self.name, self.namespace
+
+    @property
+    def finished(self):
+        return self.phase == BUILD_COMPLETE or self.phase in BUILD_FAILED_PHASES
+
+    @property
+    def queued(self):
+        """
+        float: Seconds from the creation to the start of the build
+        """
+        if self.created is None or self.started is None:
+            return None
+        return self.started - self.created
+
+    @property
+    def duration(self):
+        """
+        float: Seconds from the start to the completion of the build
+        """
+        if self.started is None or self.completed is None:
+            return None
+        return self.completed - self.started
+
+
+class BuildTracker(object):
+    """
+    Batched tracking of the builds of one build config in many projects
+    """
+
+    def __init__(
+        self,
+        projects,
+        builds_per_project=1,
+        build_config=constants.JENKINS_BUILD,
+        timeout=900,
+        sleep=10,
+    ):
+        """
+        Initializer function
+
+        Args:
+            projects (list): Names of the projects with the builds
+            builds_per_project (int): Number of the builds expected in each
+                project
+            build_config (str): Name of the build config of the builds
+            timeout (int): Seconds to wait for the next build to finish, the
+                wait fails when no build finished for that long
+            sleep (int): Seconds between the cycles
+
+        """
+        self.projects = list(projects)
+        self.builds_per_project = builds_per_project
+        self.build_config = build_config
+        self.timeout = timeout
+        self.sleep = sleep
+        # (build name, project) -> BuildRecord
+        self.builds = dict()
+
+    def _list_builds(self):
+        """
+        Returns:
+            list: Data of the builds of the build config in all the projects
+
+        """
+        return OCP(kind="Build").get(
+            selector=f"{BUILD_CONFIG_LABEL}={self.build_config}", all_namespaces=True
+        )["items"]
+
+    def _list_pods(self, selector):
+        """
+        Returns:
+            list: Data of the pods matching the selector in all the projects
+
+        """
+        return OCP(kind=constants.POD).get(selector=selector, all_namespaces=True)[
+            "items"
+        ]
+
+    def snapshot(self):
+        """
+        Update the builds of the tracked projects with one list of the builds
+
+        Returns:
+            list: Records of the builds which finished since the last snapshot
+
+        """
+        try:
+            items = self._list_builds()
+        except CommandFailed as ex:
+            log.warning(f"Failed to list the builds: {ex}")
+            return []
+        finished = []
+        for item in items:
+            if item["metadata"]["namespace"] not in self.projects:
+                continue
+            record = BuildRecord(item)
+            previous = self.builds.get(record.key)
+            if record.finished and not (previous and previous.finished):
+                log.info(
+                    f"Build {record.name} in {record.namespace} finished in phase "
+                    f"{record.phase}"
+                )
+                finished.append(record)
+            self.builds[record.key] = record
+        return finished
+
+    def pending(self):
+        """
+        Returns:
+            list: (build name, project) of the builds which are not finished,
+                (None, project) for each build which doesn't exist yet
+
+        """
+        pending = [key for key, record in self.builds.items() if not record.finished]
+        for project in self.projects:
+            found = len([key for key in self.builds if key[1] == project])
+            pending.extend([(None, project)] * (self.builds_per_project - found))
+        return pending
+
+    def failed(self):
+        """
+        Returns:
+            list: Records of the builds which finished and didn't complete
+
+        """
+        return [
+            record
+            for record in self.builds.values()
+            if record.phase in BUILD_FAILED_PHASES
+        ]
+
+    def phases(self):
+        """
+        Returns:
+            dict: phase -> number of the builds in the phase
+
+        """
+        phases = dict()
+        for record in self.builds.values():
+            phases[record.phase] = phases.get(record.phase, 0) + 1
+        return phases
+
+    def wait(self):
+        """
+        Wait for all the builds of all the projects to complete
+
+        Returns:
+            list: Records of the completed builds, sorted by the project and
+                the build name
+
+        Raises:
+            UnexpectedBehaviour: In case some build failed, or no build
+                finished in the timeout
+
+        """
+        log.info(
+            f"Waiting for {self.builds_per_project} build(s) of {self.build_config} "
+            f"in each of {len(self.projects)} project(s) to reach {BUILD_COMPLETE} "
+            f"state"
+        )
+        last_progress = time.time()
+        while True:
+            if self.snapshot():
+                last_progress = time.time()
+            failed = self.failed()
+            if failed:
+                raise UnexpectedBehaviour(
+                    "Builds failed: "
+                    + ", ".join(f"{r.namespace}/{r.name} ({r.phase})" for r in failed)
+                )
+            pending = self.pending()
+            if not pending:
+                break
+            if time.time() - last_progress > self.timeout:
+                raise UnexpectedBehaviour(
+                    f"No build finished in the last {self.timeout} sec, "
+                    f"{len(pending)} build(s) pending: {pending}, "
+                    f"builds per phase: {self.phases()}"
+                )
+            log.info(
+                f"{len(pending)} build(s) pending, builds per phase: "
+                f"{self.phases()}"
+            )
+            time.sleep(self.sleep)
+        self.resolve_nodes()
+        return self.completed()
+
+    def completed(self):
+        """
+        Returns:
+            list: Records of the completed builds, sorted by the project and
+                the build name
+
+        """
+        return sorted(
+            (r for r in self.builds.values() if r.phase == BUILD_COMPLETE),
+            key=lambda r: (r.namespace, len(r.name), r.name),
+        )
+
+    def resolve_nodes(self):
+        """
+        Set the node of each build: the node of the build pod, or the node of
+        the Jenkins pod of the project for the pipeline builds
+        """
+        nodes = dict()
+        selectors = [JENKINS_POD_SELECTOR]
+        if any(record.pod for record in self.builds.values()):
+            selectors.append("openshift.io/build.name")
+        for selector in selectors:
+            try:
+                pods = self._list_pods(selector)
+            except CommandFailed as ex:
+                log.warning(f"Failed to list the pods {selector}: {ex}")
+                continue
+            for pod in pods:
+                node = pod["spec"].get("nodeName")
+                namespace = pod["metadata"]["namespace"]
+                nodes[(namespace, pod["metadata"]["name"])] = node
+                if selector == JENKINS_POD_SELECTOR:
+                    nodes[(namespace, None)] = node
+        for record in self.builds.values():
+            record.node = nodes.get((record.namespace, record.pod))
+
+    def node_distribution(self):
+        """
+        Returns:
+            dict: node -> dict with the number of the completed builds and
+                the min, median, mean and max of their durations in seconds
+
+        """
+        durations = dict()
+        for record in self.completed():
+            if record.duration is not None:
+                durations.setdefault(record.node, []).append(record.duration)
+        return {
+            node: {
+                "builds": len(values),
+                "min": min(values),
+                "median": statistics.median(values),
+                "mean": statistics.mean(values),
+                "max": max(values),
+            }
+            for node, values in durations.items()
+        }
@@ -30,6 +30,8 @@ from ocs_ci.ocs.utils import get_pod_name_by_pattern
 from ocs_ci.framework import config
 from ocs_ci.ocs import ocp, constants, exceptions
 from ocs_ci.ocs.exceptions import PoolNotFound
+from ocs_ci.ocs.health_oracle import HEALTH_OK, get_health_oracle
+from ocs_ci.ocs.request_layer import BACKGROUND, request_priority
 from ocs_ci.ocs.resources.pvc import get_all_pvc_objs
 
 logger = logging.getLogger(__name__)
@@ -202,7 +204,8 @@ class CephCluster(object):
     def cluster_health_check(self, timeout=None):
         """
         Check overall cluster health.
-        Relying on health reported by CephCluster.get()
+        Relying on 'ceph health' sampled by the health oracle, the samples
+        taken in the last 3 seconds (e.g. in the background) are reused
 
         Args:
             timeout (int): in seconds. By default timeout value will be scaled
@@ -218,7 +221,12 @@ class CephCluster(object):
         """
         # Scale timeout only if user hasn't passed any value
         timeout = timeout or (10 * len(self.pods))
-        sample = TimeoutSampler(timeout=timeout, sleep=3, func=self.is_health_ok)
+        sample = TimeoutSampler(
+            timeout=timeout,
+            sleep=3,
+            func=get_health_oracle(self.namespace).is_ceph_health_ok,
+            max_age=3,
+        )
 
         if not sample.wait_for_func_status(result=True):
             raise exceptions.CephHealthException("Cluster health is NOT OK")
@@ -703,7 +711,9 @@ class CephHealthMonitor(threading.Thread):
     """
     Context manager class for monitoring ceph health status of CephCluster.
     If CephCluster will get to HEALTH_ERROR state it will save the ceph status
-    to health_error_status variable and will stop monitoring.
+    to health_error_status variable and will stop monitoring. The health is
+    sampled by the health oracle, the health detail is taken only when the
+    health is not HEALTH_OK.
 
     """
 
@@ -713,10 +723,13 @@ class CephHealthMonitor(threading.Thread):
 
         Args:
             ceph_cluster (CephCluster): Reference to CephCluster object.
-            sleep (int): Number of seconds to sleep between health checks.
+            sleep (int): Number of seconds to sleep between health checks,
+                the health sampled by the health oracle in the meantime is
+                used.
 
         """
         self.ceph_cluster = ceph_cluster
+        self.health_oracle = get_health_oracle(ceph_cluster.namespace)
         self.sleep = sleep
         self.health_error_status = None
         self.health_monitor_enabled = False
@@ -725,12 +738,20 @@ class CephHealthMonitor(threading.Thread):
 
     def run(self):
         self.health_monitor_enabled = True
-        while self.health_monitor_enabled and (not self.health_error_status):
-            time.sleep(self.sleep)
-            self.latest_health_status = self.ceph_cluster.get_ceph_health(detail=True)
-            if "HEALTH_ERROR" in self.latest_health_status:
-                self.health_error_status = self.ceph_cluster.get_ceph_status()
-                self.log_error_status()
+        with request_priority(BACKGROUND):
+            while self.health_monitor_enabled and (not self.health_error_status):
+                time.sleep(self.sleep)
+                sample = self.health_oracle.get_sample(
+                    max_age=self.sleep, ceph_only=True
+                )
+                self.latest_health_status = sample.ceph_health
+                if sample.ceph_health != HEALTH_OK:
+                    self.latest_health_status = self.ceph_cluster.get_ceph_health(
+                        detail=True
+                    )
+                if "HEALTH_ERROR" in self.latest_health_status:
+                    self.health_error_status = self.ceph_cluster.get_ceph_status()
+                    self.log_error_status()
 
     def __enter__(self):
         self.start()
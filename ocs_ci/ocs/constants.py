@@ -45,6 +45,7 @@ TEMPLATE_MCG_DIR = os.path.join(TEMPLATE_DIR, "mcg")
 TEMPLATE_AMQ_DIR = os.path.join(TEMPLATE_WORKLOAD_DIR, "amq")
 TEMPLATE_OPENSHIFT_INFRA_DIR = os.path.join(TEMPLATE_DIR, "openshift-infra/")
 TEMPLATE_HSBENCH_DIR = os.path.join(TEMPLATE_WORKLOAD_DIR, "hsbench")
+TEMPLATE_REGISTRY_LOAD_DIR = os.path.join(TEMPLATE_WORKLOAD_DIR, "registry")
 TEMPLATE_CONFIGURE_PVC_MONITORING_POD = os.path.join(
     TEMPLATE_OPENSHIFT_INFRA_DIR, "monitoring/"
 )
@@ -116,6 +117,7 @@ OAUTH = "OAuth"
 LOCAL_VOLUME = "localvolume"
 PROXY = "Proxy"
 MACHINECONFIGPOOL = "MachineConfigPool"
+VOLUMESNAPSHOT = "VolumeSnapshot"
 VOLUMESNAPSHOTCLASS = "VolumeSnapshotClass"
 HPA = "horizontalpodautoscaler"
 VOLUMESNAPSHOTCONTENT = "VolumeSnapshotContent"
@@ -420,6 +422,12 @@ AMQ_SIMPLE_WORKLOAD_YAML = os.path.join(TEMPLATE_AMQ_DIR, "amq_simple_workload.y
 NGINX_POD_YAML = os.path.join(TEMPLATE_APP_POD_DIR, "nginx.yaml")
 
 HSBENCH_OBJ_YAML = os.path.join(TEMPLATE_HSBENCH_DIR, "hsbench_obj.yaml")
+REGISTRY_LOAD_CLIENT_POD_YAML = os.path.join(
+    TEMPLATE_REGISTRY_LOAD_DIR, "load_client_pod.yaml"
+)
+OPENSHIFT_INTERNAL_REGISTRY_URL = (
+    "https://image-registry.openshift-image-registry.svc:5000"
+)
 
 AWSCLI_SERVICE_CA_YAML = os.path.join(
     TEMPLATE_MCG_DIR, "aws-cli-service-ca-configmap.yaml"
@@ -911,6 +919,9 @@ LOCAL_VOLUME_DISCOVERY_YAML = os.path.join(
     TEMPLATE_DEPLOYMENT_DIR, "local-volume-discovery.yaml"
 )
 LOCAL_VOLUME_SET_YAML = os.path.join(TEMPLATE_DEPLOYMENT_DIR, "local-volume-set.yaml")
+DEVICE_DISCOVERY_YAML = os.path.join(TEMPLATE_DEPLOYMENT_DIR, "device-discovery.yaml")
+DEVICE_DISCOVERY = "ocs-ci-device-discovery"
+DEVICE_DISCOVERY_LABEL = "app=ocs-ci-device-discovery"
 
 # All worker default config files
 RHCOS_WORKER_CONF = os.path.join(CONF_DIR, "ocsci/aws_upi_rhcos_workers.yaml")
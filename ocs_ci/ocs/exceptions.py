@@ -235,3 +235,12 @@ class MemoryNotSufficientException(Exception):
 
 class CPUNotSufficientException(Exception):
     pass
+
+
+class APIServerError(Exception):
+    def __init__(self, reason, message):
+        self.reason = reason
+        self.message = message
+
+    def __str__(self):
+        return f"Error from server ({self.reason}): {self.message}"
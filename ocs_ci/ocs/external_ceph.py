@@ -1,16 +1,21 @@
 import datetime
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from select import select
 from time import sleep
 
-import paramiko
 from paramiko.ssh_exception import SSHException
 
 from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.ssh_pool import get_ssh_pool
 
 logger = logging.getLogger(__name__)
 
+# Max. number of remote commands run at once on the cluster nodes
+MAX_PARALLEL_COMMANDS = 32
+
 
 class Ceph(object):
     def __init__(self, name="ceph", node_list=None):
@@ -22,6 +27,11 @@ class Ceph(object):
         """
         self.name = name
         self.node_list = node_list
+        # role -> metadata list of the demons, see get_metadata_list
+        self._metadata = {}
+        # osd id -> data partition path, see get_osd_data_partition_path
+        self._osd_data_partition_paths = {}
+        self._metadata_lock = threading.Lock()
 
     def __eq__(self, ceph_cluster):
         if hasattr(ceph_cluster, "node_list"):
@@ -141,28 +151,84 @@ class Ceph(object):
             )
         return ceph_demon_counter
 
-    def get_metadata_list(self, role, client=None):
+    def _get_client(self, client=None):
         """
-        Returns metadata for demons of specified role
+        Args:
+            client(CephObject): Client with keyring and ceph-common
+
+        Returns:
+            CephObject: The given client, the first client or mon object of
+                the cluster if not given
+
+        """
+        if client:
+            return client
+        return (
+            self.get_ceph_object("client")
+            if self.get_ceph_object("client")
+            else self.get_ceph_object("mon")
+        )
+
+    def get_metadata_list(self, role, client=None, refresh=False):
+        """
+        Returns metadata for demons of specified role. Metadata of all the
+        demons of the role are fetched by a single command and cached until
+        invalidate_metadata is called.
 
         Args:
             role(str): ceph demon role
             client(CephObject): Client with keyring and ceph-common
+            refresh(bool): True for fetching the metadata even if cached
 
         Returns:
             list: metadata as json object representation
 
         """
-        if not client:
-            client = (
-                self.get_ceph_object("client")
-                if self.get_ceph_object("client")
-                else self.get_ceph_object("mon")
+        with self._metadata_lock:
+            if role in self._metadata and not refresh:
+                return self._metadata[role]
+        client = self._get_client(client)
+        out, _ = client.exec_command(f"sudo ceph {role} metadata -f json-pretty")
+        metadata_list = json.loads(out.read().decode())
+        with self._metadata_lock:
+            self._metadata[role] = metadata_list
+        return metadata_list
+
+    def load_metadata(self, roles=("osd", "mon", "mds", "mgr"), client=None):
+        """
+        Fetch metadata of the demons of all the roles at once
+
+        Args:
+            roles(list): ceph demon roles
+            client(CephObject): Client with keyring and ceph-common
+
+        Returns:
+            dict: role -> metadata list of the role
+
+        """
+        client = self._get_client(client)
+        with ThreadPoolExecutor(max_workers=len(roles)) as executor:
+            metadata_lists = executor.map(
+                lambda role: self.get_metadata_list(role, client, refresh=True), roles
             )
+        return dict(zip(roles, metadata_lists))
 
-        out, _ = client.exec_command(f"sudo ceph {role} metadata -f json-pretty")
+    def invalidate_metadata(self, role=None):
+        """
+        Drop the cached metadata, e.g. after osd is added, removed or
+        replaced
 
-        return json.loads(out.read().decode())
+        Args:
+            role(str): ceph demon role, all the roles if not specified
+
+        """
+        with self._metadata_lock:
+            if role is None:
+                self._metadata.clear()
+            else:
+                self._metadata.pop(role, None)
+            if role in (None, "osd"):
+                self._osd_data_partition_paths.clear()
 
     def get_osd_metadata(self, osd_id, client=None):
         """
@@ -192,10 +258,12 @@ class Ceph(object):
                  }
 
         """
-        metadata_list = self.get_metadata_list("osd", client)
-        for metadata in metadata_list:
-            if metadata.get("id") == osd_id:
-                return metadata
+        for refresh in (False, True):
+            metadata_list = self.get_metadata_list("osd", client, refresh=refresh)
+            for metadata in metadata_list:
+                if metadata.get("id") == osd_id:
+                    return metadata
+            # osd not known at the time the metadata were cached
         return None
 
     def get_osd_container_name_by_id(self, osd_id, client=None):
@@ -221,9 +289,9 @@ class Ceph(object):
                 empty
 
         """
-        hostname = self.get_osd_metadata(osd_id).get("hostname")
+        hostname = self.get_osd_metadata(osd_id, client).get("hostname")
         node = self.get_node_by_hostname(hostname)
-        osd_device = self.get_osd_device(osd_id)
+        osd_device = self.get_osd_device(osd_id, client)
         osd_demon_list = [
             osd_demon
             for osd_demon in node.get_ceph_objects("osd")
@@ -288,7 +356,8 @@ class Ceph(object):
 
     def get_osd_data_partition_path(self, osd_id, client=None):
         """
-        Returns data partition path by given osd id
+        Returns data partition path by given osd id, the path is cached until
+        invalidate_metadata is called
 
         Args:
             osd_id (int): osd id
@@ -298,6 +367,9 @@ class Ceph(object):
             str: data partition path
 
         """
+        with self._metadata_lock:
+            if osd_id in self._osd_data_partition_paths:
+                return self._osd_data_partition_paths[osd_id]
         osd_metadata = self.get_osd_metadata(osd_id, client)
         osd_data = osd_metadata.get("osd_data")
         osd_object = self.get_osd_by_id(osd_id, client)
@@ -307,7 +379,36 @@ class Ceph(object):
         )
         simple_scan = out.read().decode()
         simple_scan = json.loads(simple_scan[simple_scan.index("{") : :])
-        return simple_scan.get("data").get("path")
+        path = simple_scan.get("data").get("path")
+        with self._metadata_lock:
+            self._osd_data_partition_paths[osd_id] = path
+        return path
+
+    def get_osd_data_partition_paths(self, osd_ids, client=None):
+        """
+        Returns data partition paths of the osds, the osds are scanned
+        concurrently
+
+        Args:
+            osd_ids (list): osd ids
+            client (CephObject): Client with keyring and ceph-common
+
+        Returns:
+            dict: osd id -> data partition path
+
+        """
+        osd_ids = list(osd_ids)
+        if not osd_ids:
+            return {}
+        # one metadata fetch for all the osds
+        self.get_metadata_list("osd", client)
+        workers = min(len(osd_ids), MAX_PARALLEL_COMMANDS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            paths = executor.map(
+                lambda osd_id: self.get_osd_data_partition_path(osd_id, client),
+                osd_ids,
+            )
+        return dict(zip(osd_ids, paths))
 
     def get_osd_data_partition(self, osd_id, client=None):
         """
@@ -412,8 +513,7 @@ class SSHConnectionManager(object):
         self.username = username
         self.password = password
         self.look_for_keys = look_for_keys
-        self._client = paramiko.SSHClient()
-        self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self._client = None
         self._transport = None
         self._outage_start_time = None
         self.outage_timeout = datetime.timedelta(seconds=outage_timeout)
@@ -432,9 +532,10 @@ class SSHConnectionManager(object):
     def _connect(self):
         while True:
             try:
-                self._client.connect(
+                # shared with the other managers of the same host and user
+                self._client = get_ssh_pool().get_client(
                     self.ip_address,
-                    username=self.username,
+                    user=self.username,
                     password=self.password,
                     look_for_keys=self.look_for_keys,
                 )
@@ -0,0 +1,1097 @@
+"""
+In-memory stand-in of the Kubernetes API server for offline testing of the
+framework itself.
+
+The server keeps Pods, PVCs, PVs, Namespaces, StorageClasses (and any other
+kind as a plain object without status simulation) in memory and simulates
+their status transitions (PVC Pending -> Bound, Pod Pending -> Running) with
+configurable delays, API latency and error rate. When activated via
+:func:`fake_api_server`, all ``oc`` commands executed by the framework through
+``exec_cmd`` (e.g. by the ``OCP`` class) are served by it, so the framework
+code like ``helpers.create_pvc`` or ``create_pods_parallel`` can run against
+thousands of objects without any cluster.
+
+Example::
+
+    with fake_api_server(pvc_bind_delay=0.5, pod_start_delay=1) as server:
+        pvc_objs = helpers.create_multiple_pvcs(sc_name, namespace, 1000)
+        ...
+        log.info(server.stats)
+
+"""
+import calendar
+import collections
+import copy
+import datetime
+import json
+import logging
+import random
+import re
+import subprocess
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import yaml
+
+from ocs_ci.framework import merge_dict
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import APIServerError
+from ocs_ci.utility import utils
+
+log = logging.getLogger(__name__)
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+DEFAULT_NAMESPACE = "default"
+
+# kind name, namespaced and aliases used in oc command line
+KINDS = {
+    constants.POD: (True, ("pod", "pods", "po")),
+    constants.PVC: (
+        True,
+        ("persistentvolumeclaim", "persistentvolumeclaims", "pvc"),
+    ),
+    constants.PV: (False, ("persistentvolume", "persistentvolumes", "pv")),
+    constants.NAMESPACE: (
+        False,
+        ("namespace", "namespaces", "ns", "project", "projects"),
+    ),
+    constants.STORAGECLASS: (
+        False,
+        ("storageclass", "storageclasses", "sc"),
+    ),
+}
+KIND_ALIASES = {
+    alias: kind for kind, (_, aliases) in KINDS.items() for alias in aliases
+}
+# Other cluster scoped kinds the framework works with, stored without status
+# simulation (other unknown kinds are considered as namespaced)
+CLUSTER_SCOPED_KINDS = (
+    "certificatesigningrequest",
+    "clusteroperator",
+    "clusterrole",
+    "clusterrolebinding",
+    "clusterversion",
+    "machineconfigpool",
+    "node",
+    "proxy",
+)
+# Objects present in every new fake cluster
+CLUSTER_OBJECTS = (
+    {"apiVersion": "v1", "kind": constants.NAMESPACE, "metadata": {"name": "default"}},
+    {
+        "apiVersion": "config.openshift.io/v1",
+        "kind": constants.PROXY,
+        "metadata": {"name": "cluster"},
+        "spec": {},
+        "status": {},
+    },
+)
+WATCH_EVENTS_LIMIT = 100000
+
+
+def format_time(timestamp):
+    """
+    Format unix timestamp the way Kubernetes does in object metadata
+
+    Args:
+        timestamp (float): unix timestamp
+
+    Returns:
+        str: timestamp like 2020-10-19T10:00:00Z
+
+    """
+    return datetime.datetime.utcfromtimestamp(timestamp).strftime(TIME_FORMAT)
+
+
+def match_selector(obj, selector):
+    """
+    Check if labels of the object match the label selector
+
+    Args:
+        obj (dict): Kubernetes object
+        selector (str): Label selector like 'app=mds,tier!=1,env'
+
+    Returns:
+        bool: True if the object matches the selector
+
+    """
+    if not selector:
+        return True
+    labels = obj["metadata"].get("labels") or {}
+    for requirement in selector.split(","):
+        requirement = requirement.strip()
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.replace("==", "=").split("=", 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:] in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+class FakeAPIServer(object):
+    """
+    In-memory Kubernetes API server stand-in
+    """
+
+    def __init__(
+        self,
+        api_latency=0,
+        error_rate=0.0,
+        pvc_bind_delay=1,
+        pod_start_delay=2,
+        seed=None,
+        objects=CLUSTER_OBJECTS,
+    ):
+        """
+        Initializer function
+
+        Args:
+            api_latency (float): Seconds every API request takes
+            error_rate (float): Probability (0 - 1) of an API request to fail
+                with a transient server error
+            pvc_bind_delay (float): Seconds from PVC creation to Bound phase
+            pod_start_delay (float): Seconds from pod creation (or from Bound
+                phase of its last PVC) to Running phase
+            seed (int): Seed of the random errors, for reproducible runs
+            objects (list): Objects the cluster is pre-populated with
+
+        """
+        self.api_latency = api_latency
+        self.error_rate = error_rate
+        self.pvc_bind_delay = pvc_bind_delay
+        self.pod_start_delay = pod_start_delay
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        # kind -> (namespace, name) -> object
+        self._objects = collections.defaultdict(dict)
+        # (kind, namespace, name) -> time of next status transition or None
+        self._pending = {}
+        # (kind, namespace, name) -> precise time of the last transition
+        self._transition_times = {}
+        self._resource_version = 0
+        self._events = collections.deque(maxlen=WATCH_EVENTS_LIMIT)
+        self.stats = collections.Counter()
+        with self._lock:
+            for obj in objects:
+                obj = copy.deepcopy(obj)
+                obj["kind"] = self.normalize_kind(obj["kind"])
+                self._store(obj, time.time())
+
+    @staticmethod
+    def normalize_kind(kind):
+        """
+        Translate kind as used in oc command line or object to kind name
+
+        Args:
+            kind (str): e.g. 'pvc', 'pods', 'storageclasses.storage.k8s.io'
+
+        Returns:
+            str: Kind name, e.g. 'PersistentVolumeClaim'
+
+        """
+        alias = kind.split(".")[0].lower()
+        if alias in KIND_ALIASES:
+            return KIND_ALIASES[alias]
+        if kind in KINDS:
+            return kind
+        # Any other kind is stored as it is, without status simulation
+        if alias.endswith(("sses", "xes")):
+            return alias[:-2]
+        return alias[:-1] if alias.endswith("s") else alias
+
+    @staticmethod
+    def is_namespaced(kind):
+        """
+        Args:
+            kind (str): Kind name
+
+        Returns:
+            bool: True if objects of the kind live in a namespace
+
+        """
+        if kind in KINDS:
+            return KINDS[kind][0]
+        return kind not in CLUSTER_SCOPED_KINDS
+
+    def _request(self, verb, kind):
+        """
+        Account the API request, apply the API latency and error rate
+        """
+        self.stats[verb] += 1
+        self.stats[f"{verb} {kind}"] += 1
+        if self.api_latency:
+            time.sleep(self.api_latency)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats["errors"] += 1
+            raise APIServerError(
+                "InternalError", "etcdserver: request timed out (injected error)"
+            )
+
+    def _key(self, kind, name, namespace):
+        namespace = namespace or DEFAULT_NAMESPACE
+        return (namespace if self.is_namespaced(kind) else None, name)
+
+    def _not_found(self, kind, name):
+        return APIServerError("NotFound", f'{kind.lower()}s "{name}" not found')
+
+    def _record_event(self, event_type, obj):
+        """
+        Bump resource version of the object and notify watchers about it
+        """
+        self._resource_version += 1
+        obj["metadata"]["resourceVersion"] = str(self._resource_version)
+        self._events.append(
+            (self._resource_version, event_type, obj["kind"], copy.deepcopy(obj))
+        )
+        self._changed.notify_all()
+
+    def _store(self, obj, now):
+        """
+        Fill server side fields of the new object and store it
+        """
+        kind = obj["kind"]
+        metadata = obj.setdefault("metadata", {})
+        if not metadata.get("name"):
+            if not metadata.get("generateName"):
+                raise APIServerError("Invalid", "name or generateName is required")
+            metadata["name"] = metadata["generateName"] + uuid.uuid4().hex[:5]
+        if self.is_namespaced(kind):
+            metadata["namespace"] = metadata.get("namespace") or DEFAULT_NAMESPACE
+            ns_key = self._key(constants.NAMESPACE, metadata["namespace"], None)
+            if ns_key not in self._objects[constants.NAMESPACE]:
+                raise APIServerError(
+                    "NotFound", f'namespaces "{metadata["namespace"]}" not found'
+                )
+        else:
+            metadata.pop("namespace", None)
+        key = self._key(kind, metadata["name"], metadata.get("namespace"))
+        if key in self._objects[kind]:
+            raise APIServerError(
+                "AlreadyExists", f'{kind.lower()}s "{metadata["name"]}" already exists'
+            )
+        metadata["uid"] = str(uuid.uuid4())
+        metadata["creationTimestamp"] = format_time(now)
+        self._transition_times[(kind,) + key] = now
+        if kind == constants.PVC:
+            obj["status"] = {"phase": constants.STATUS_PENDING}
+            self._pending[(kind,) + key] = now + self.pvc_bind_delay
+        elif kind == constants.POD:
+            obj["status"] = {"phase": constants.STATUS_PENDING}
+            self._pending[(kind,) + key] = None
+        elif kind == constants.NAMESPACE:
+            obj["status"] = {"phase": "Active"}
+        self._objects[kind][key] = obj
+        self._record_event("ADDED", obj)
+        return obj
+
+    def _bind_pvc(self, pvc, bound_at):
+        """
+        Provision PV for the PVC and bind them together
+        """
+        spec = pvc["spec"]
+        sc_name = spec.get("storageClassName")
+        sc = self._objects[constants.STORAGECLASS].get((None, sc_name), {})
+        pv_name = f"pvc-{pvc['metadata']['uid']}"
+        capacity = spec.get("resources", {}).get("requests", {}).get("storage")
+        pv = {
+            "apiVersion": "v1",
+            "kind": constants.PV,
+            "metadata": {"name": pv_name},
+            "spec": {
+                "accessModes": spec.get("accessModes", []),
+                "capacity": {"storage": capacity},
+                "claimRef": {
+                    "kind": constants.PVC,
+                    "name": pvc["metadata"]["name"],
+                    "namespace": pvc["metadata"]["namespace"],
+                    "uid": pvc["metadata"]["uid"],
+                },
+                "persistentVolumeReclaimPolicy": sc.get("reclaimPolicy", "Delete"),
+                "storageClassName": sc_name,
+                "volumeMode": spec.get("volumeMode", "Filesystem"),
+            },
+            "status": {"phase": constants.STATUS_BOUND},
+        }
+        self._store(pv, bound_at)
+        key = (pvc["metadata"]["namespace"], pvc["metadata"]["name"])
+        self._transition_times[(constants.PVC,) + key] = bound_at
+        spec["volumeName"] = pv_name
+        pvc["status"] = {
+            "phase": constants.STATUS_BOUND,
+            "accessModes": spec.get("accessModes", []),
+            "capacity": {"storage": capacity},
+        }
+        pvc["metadata"].setdefault("annotations", {})[
+            "pv.kubernetes.io/bind-completed"
+        ] = "yes"
+        self._record_event("MODIFIED", pvc)
+
+    def _start_pod(self, pod, started_at):
+        """
+        Move the pod to Running phase
+        """
+        started = format_time(started_at)
+        pod["status"] = {
+            "phase": constants.STATUS_RUNNING,
+            "startTime": pod["metadata"]["creationTimestamp"],
+            "conditions": [
+                {"type": "Ready", "status": "True", "lastTransitionTime": started}
+            ],
+            "containerStatuses": [
+                {
+                    "name": container.get("name"),
+                    "image": container.get("image"),
+                    "ready": True,
+                    "restartCount": 0,
+                    "state": {"running": {"startedAt": started}},
+                }
+                for container in pod.get("spec", {}).get("containers", [])
+            ],
+        }
+        self._record_event("MODIFIED", pod)
+
+    def _pod_ready_at(self, pod):
+        """
+        Returns:
+            float: Time when the pod gets Running, None if some of its PVCs
+                isn't Bound yet
+
+        """
+        namespace = pod["metadata"]["namespace"]
+        ready_at = self._transition_times[
+            (constants.POD, namespace, pod["metadata"]["name"])
+        ]
+        for volume in pod.get("spec", {}).get("volumes") or []:
+            claim = volume.get("persistentVolumeClaim")
+            if not claim:
+                continue
+            pvc_key = (constants.PVC, namespace, claim["claimName"])
+            if pvc_key not in self._transition_times or pvc_key in self._pending:
+                return None
+            ready_at = max(ready_at, self._transition_times[pvc_key])
+        return ready_at + self.pod_start_delay
+
+    def advance(self):
+        """
+        Apply all the status transitions which are due by now
+
+        Returns:
+            float: Time of the next known transition, None if there is none
+
+        """
+        now = time.time()
+        with self._lock:
+            # PVCs go first, so that pods waiting for them can start
+            for pending_key, due in sorted(
+                self._pending.items(), key=lambda item: item[0][0] != constants.PVC
+            ):
+                kind, key = pending_key[0], pending_key[1:]
+                obj = self._objects[kind].get(key)
+                if obj is None:
+                    del self._pending[pending_key]
+                    continue
+                if kind == constants.POD:
+                    due = self._pod_ready_at(obj)
+                    self._pending[pending_key] = due
+                if due is None or due > now:
+                    continue
+                del self._pending[pending_key]
+                if kind == constants.PVC:
+                    self._bind_pvc(obj, due)
+                else:
+                    self._start_pod(obj, due)
+            known = [due for due in self._pending.values() if due is not None]
+            return min(known) if known else None
+
+    def create(self, obj):
+        """
+        Create the object
+
+        Args:
+            obj (dict): Kubernetes object
+
+        Returns:
+            dict: Created object
+
+        """
+        obj = copy.deepcopy(obj)
+        obj["kind"] = self.normalize_kind(obj["kind"])
+        self._request("create", obj["kind"])
+        with self._lock:
+            return copy.deepcopy(self._store(obj, time.time()))
+
+    def get(self, kind, name, namespace=None):
+        """
+        Get the object
+
+        Args:
+            kind (str): Kind of the object
+            name (str): Name of the object
+            namespace (str): Namespace of the object
+
+        Returns:
+            dict: The object
+
+        Raises:
+            APIServerError: With NotFound reason if there is no such object
+
+        """
+        kind = self.normalize_kind(kind)
+        self._request("get", kind)
+        self.advance()
+        with self._lock:
+            obj = self._objects[kind].get(self._key(kind, name, namespace))
+            if obj is None:
+                raise self._not_found(kind, name)
+            return copy.deepcopy(obj)
+
+    def list(self, kind, namespace=None, selector=None):
+        """
+        List objects of the kind
+
+        Args:
+            kind (str): Kind of the objects
+            namespace (str): Namespace to list, None for all namespaces
+            selector (str): Label selector
+
+        Returns:
+            list: The objects sorted by namespace and name
+
+        """
+        kind = self.normalize_kind(kind)
+        self._request("list", kind)
+        self.advance()
+        with self._lock:
+            return [
+                copy.deepcopy(obj)
+                for (obj_namespace, _), obj in sorted(
+                    self._objects[kind].items(),
+                    key=lambda item: (item[0][0] or "", item[0][1]),
+                )
+                if (namespace is None or obj_namespace in (None, namespace))
+                and match_selector(obj, selector)
+            ]
+
+    def delete(self, kind, name, namespace=None):
+        """
+        Delete the object together with its dependents (PV of a PVC,
+        objects in a namespace)
+
+        Args:
+            kind (str): Kind of the object
+            name (str): Name of the object
+            namespace (str): Namespace of the object
+
+        Raises:
+            APIServerError: With NotFound reason if there is no such object
+
+        """
+        kind = self.normalize_kind(kind)
+        self._request("delete", kind)
+        with self._lock:
+            self._delete(kind, self._key(kind, name, namespace))
+
+    def _delete(self, kind, key):
+        obj = self._objects[kind].pop(key, None)
+        if obj is None:
+            raise self._not_found(kind, key[1])
+        self._pending.pop((kind,) + key, None)
+        self._transition_times.pop((kind,) + key, None)
+        self._record_event("DELETED", obj)
+        if kind == constants.PVC and obj["spec"].get("volumeName"):
+            pv_key = (None, obj["spec"]["volumeName"])
+            pv = self._objects[constants.PV].get(pv_key)
+            if pv and pv["spec"]["persistentVolumeReclaimPolicy"] == "Delete":
+                self._delete(constants.PV, pv_key)
+            elif pv:
+                pv["status"]["phase"] = constants.STATUS_RELEASED
+                self._record_event("MODIFIED", pv)
+        elif kind == constants.NAMESPACE:
+            for other_kind, objects in self._objects.items():
+                for other_key in [k for k in objects if k[0] == key[1]]:
+                    self._delete(other_kind, other_key)
+
+    def patch(self, kind, name, patch, namespace=None, patch_type="merge"):
+        """
+        Patch the object
+
+        Args:
+            kind (str): Kind of the object
+            name (str): Name of the object
+            patch (dict or list): Merge patch (dict) or JSON patch (list)
+            namespace (str): Namespace of the object
+            patch_type (str): 'merge', 'strategic' (handled as merge) or 'json'
+
+        Returns:
+            dict: The patched object
+
+        """
+        kind = self.normalize_kind(kind)
+        self._request("patch", kind)
+        with self._lock:
+            obj = self._objects[kind].get(self._key(kind, name, namespace))
+            if obj is None:
+                raise self._not_found(kind, name)
+            if patch_type == "json":
+                for operation in patch:
+                    self._json_patch(obj, operation)
+            else:
+                merge_dict(obj, patch)
+                self._drop_nulls(obj)
+            self._record_event("MODIFIED", obj)
+            return copy.deepcopy(obj)
+
+    @staticmethod
+    def _drop_nulls(data):
+        for key in [k for k, v in data.items() if v is None]:
+            del data[key]
+        for value in data.values():
+            if isinstance(value, dict):
+                FakeAPIServer._drop_nulls(value)
+
+    @staticmethod
+    def _json_patch(obj, operation):
+        path = [
+            int(part) if part.isdigit() else part.replace("~1", "/")
+            for part in operation["path"].lstrip("/").split("/")
+        ]
+        parent = obj
+        for part in path[:-1]:
+            parent = parent[part]
+        last = path[-1]
+        if operation["op"] == "remove":
+            del parent[last]
+        elif isinstance(parent, list) and (last == "-" or operation["op"] == "add"):
+            parent.insert(len(parent) if last == "-" else last, operation["value"])
+        else:
+            parent[last] = operation["value"]
+
+    def watch(self, kind, namespace=None, selector=None, timeout=None, since=None):
+        """
+        Watch changes of the objects of the kind
+
+        Args:
+            kind (str): Kind of the objects
+            namespace (str): Namespace to watch, None for all namespaces
+            selector (str): Label selector
+            timeout (float): Stop watching after this many seconds, watch
+                forever when None
+            since (int): Resource version to start the watch from, only new
+                changes are reported when None
+
+        Yields:
+            tuple: Event type ('ADDED', 'MODIFIED', 'DELETED') and the object
+
+        """
+        kind = self.normalize_kind(kind)
+        self._request("watch", kind)
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._lock:
+            last_version = self._resource_version if since is None else since
+        while True:
+            next_transition = self.advance()
+            with self._lock:
+                events = [
+                    event
+                    for event in self._events
+                    if event[0] > last_version and event[2] == kind
+                ]
+                if not events:
+                    now = time.time()
+                    waits = [
+                        due - now
+                        for due in (next_transition, deadline)
+                        if due is not None
+                    ]
+                    if deadline is not None and now >= deadline:
+                        return
+                    self._changed.wait(max(min(waits), 0.01) if waits else None)
+                    continue
+                last_version = events[-1][0]
+            for _, event_type, _, obj in events:
+                obj_namespace = obj["metadata"].get("namespace")
+                if namespace not in (None, obj_namespace):
+                    continue
+                if match_selector(obj, selector):
+                    yield event_type, copy.deepcopy(obj)
+
+    def handle_command(self, cmd, timeout=None, **kwargs):
+        """
+        Serve ``oc`` command, to be used in ``utils.command_handlers``
+
+        Args:
+            cmd (list): Command split to arguments
+            timeout (int): Timeout of the command
+            **kwargs: Ignored subprocess.run arguments
+
+        Returns:
+            CompletedProcess: Result of the command, None if it's not an
+                ``oc`` command
+
+        """
+        if not cmd or cmd[0] != "oc":
+            return None
+        returncode, stdout, stderr = 0, "", ""
+        try:
+            stdout = OCCommand(self, cmd[1:], timeout).run()
+        except APIServerError as ex:
+            returncode, stderr = 1, str(ex)
+        except (KeyError, IndexError, ValueError, OSError, yaml.YAMLError) as ex:
+            returncode, stderr = 1, f"error: {ex!r}"
+        return subprocess.CompletedProcess(
+            cmd, returncode, stdout.encode(), stderr.encode()
+        )
+
+
+class OCCommand(object):
+    """
+    Translation of ``oc`` command line to the fake API server requests
+    """
+
+    OPTIONS_WITH_VALUE = {
+        "-n": "namespace",
+        "--namespace": "namespace",
+        "-o": "output",
+        "--output": "output",
+        "-l": "selector",
+        "--selector": "selector",
+        "-f": "filename",
+        "--filename": "filename",
+        "-p": "patch",
+        "--patch": "patch",
+        "--type": "type",
+        "--for": "for",
+        "--timeout": "timeout",
+        "--kubeconfig": "kubeconfig",
+        "-c": "container",
+        "--container": "container",
+    }
+    TABLE_COLUMNS = {
+        constants.POD: ("NAME", "READY", "STATUS", "RESTARTS", "AGE"),
+        constants.PVC: (
+            "NAME",
+            "STATUS",
+            "VOLUME",
+            "CAPACITY",
+            "ACCESS MODES",
+            "STORAGECLASS",
+            "AGE",
+        ),
+        constants.PV: (
+            "NAME",
+            "CAPACITY",
+            "ACCESS MODES",
+            "RECLAIM POLICY",
+            "STATUS",
+            "CLAIM",
+            "STORAGECLASS",
+            "REASON",
+            "AGE",
+        ),
+        constants.NAMESPACE: ("NAME", "STATUS", "AGE"),
+        constants.STORAGECLASS: (
+            "NAME",
+            "PROVISIONER",
+            "RECLAIMPOLICY",
+            "VOLUMEBINDINGMODE",
+            "AGE",
+        ),
+    }
+    ACCESS_MODES = {
+        "ReadWriteOnce": "RWO",
+        "ReadWriteMany": "RWX",
+        "ReadOnlyMany": "ROX",
+    }
+
+    def __init__(self, server, args, timeout=None):
+        self.server = server
+        self.timeout = timeout
+        self.options = {}
+        self.flags = set()
+        self.positional = []
+        args = list(args)
+        while args:
+            arg = args.pop(0)
+            if "=" in arg and arg.split("=", 1)[0] in self.OPTIONS_WITH_VALUE:
+                option, value = arg.split("=", 1)
+                self.options[self.OPTIONS_WITH_VALUE[option]] = value
+            elif arg in self.OPTIONS_WITH_VALUE and args:
+                self.options[self.OPTIONS_WITH_VALUE[arg]] = args.pop(0)
+            elif arg.startswith("-o") and len(arg) > 2:
+                self.options["output"] = arg[2:]
+            elif arg.startswith("-"):
+                self.flags.add(arg)
+            else:
+                self.positional.append(arg)
+        self.namespace = self.options.get("namespace", DEFAULT_NAMESPACE)
+        self.all_namespaces = bool({"-A", "--all-namespaces"} & self.flags)
+
+    def run(self):
+        """
+        Returns:
+            str: stdout of the command
+
+        """
+        if not self.positional:
+            raise APIServerError("BadRequest", "no command given")
+        verb = self.positional[0].replace("-", "_")
+        handler = getattr(self, f"cmd_{verb}", None)
+        if handler is None:
+            raise APIServerError(
+                "BadRequest",
+                f"command '{self.positional[0]}' is not supported by fake "
+                f"API server",
+            )
+        return handler(self.positional[1:])
+
+    def _resources(self, args):
+        """
+        Parse 'kind name1 name2' or 'kind/name' arguments
+
+        Returns:
+            list: tuples of (kind, name), name is None when not specified
+
+        """
+        if args and "/" in args[0]:
+            return [
+                (self.server.normalize_kind(arg.split("/")[0]), arg.split("/")[1])
+                for arg in args
+            ]
+        if not args:
+            raise APIServerError("BadRequest", "resource type is required")
+        kind = self.server.normalize_kind(args[0])
+        return [(kind, name) for name in args[1:]] or [(kind, None)]
+
+    def _load_file(self):
+        with open(self.options["filename"]) as file_stream:
+            objects = []
+            for document in yaml.safe_load_all(file_stream):
+                if not document:
+                    continue
+                if document.get("kind") == "List":
+                    objects.extend(document.get("items", []))
+                else:
+                    objects.append(document)
+            for obj in objects:
+                if self.options.get("namespace"):
+                    obj.setdefault("metadata", {}).setdefault(
+                        "namespace", self.namespace
+                    )
+            return objects
+
+    def _output(self, objects, single):
+        """
+        Format the objects according to the -o option
+        """
+        output = self.options.get("output")
+        if single and len(objects) == 1:
+            data = objects[0]
+        else:
+            data = {"apiVersion": "v1", "kind": "List", "items": objects}
+        if output == "yaml":
+            return yaml.safe_dump(data, default_flow_style=False)
+        if output == "json":
+            return json.dumps(data, indent=4)
+        if output == "name":
+            return "".join(
+                f"{obj['kind'].lower()}/{obj['metadata']['name']}\n" for obj in objects
+            )
+        if output and output.startswith("jsonpath="):
+            return self._jsonpath(data, output[len("jsonpath=") :])
+        return self._table(objects)
+
+    @staticmethod
+    def _jsonpath(data, template):
+        """
+        Evaluate simple jsonpath templates like {.items[0].metadata.name}
+        """
+
+        def evaluate(match):
+            values = [data]
+            for part in re.findall(r"[^.\[\]]+|\[[^\]]*\]", match.group(1)):
+                if part.startswith("["):
+                    index = part[1:-1]
+                    values = [
+                        item
+                        for value in values
+                        for item in (value if index == "*" else [value[int(index)]])
+                    ]
+                else:
+                    values = [
+                        value[part]
+                        for value in values
+                        if isinstance(value, dict) and part in value
+                    ]
+            return " ".join(
+                json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+                for value in values
+            )
+
+        return re.sub(r"{\.?([^}]*)}", evaluate, template.strip("'"))
+
+    def _row(self, obj):
+        kind = obj["kind"]
+        status = obj.get("status", {})
+        spec = obj.get("spec", {})
+        created = calendar.timegm(
+            time.strptime(obj["metadata"]["creationTimestamp"], TIME_FORMAT)
+        )
+        age = f"{max(int(time.time() - created), 0)}s"
+        name = obj["metadata"]["name"]
+        if kind == constants.POD:
+            containers = spec.get("containers", [])
+            ready = sum(1 for c in status.get("containerStatuses", []) if c["ready"])
+            return (
+                name,
+                f"{ready}/{len(containers)}",
+                status.get("phase"),
+                "0",
+                age,
+            )
+        if kind == constants.PVC:
+            modes = ",".join(
+                self.ACCESS_MODES.get(mode, mode)
+                for mode in status.get("accessModes", [])
+            )
+            return (
+                name,
+                status.get("phase"),
+                spec.get("volumeName", ""),
+                status.get("capacity", {}).get("storage", ""),
+                modes,
+                spec.get("storageClassName", ""),
+                age,
+            )
+        if kind == constants.PV:
+            claim = spec["claimRef"]
+            return (
+                name,
+                spec["capacity"]["storage"],
+                ",".join(self.ACCESS_MODES.get(m, m) for m in spec["accessModes"]),
+                spec["persistentVolumeReclaimPolicy"],
+                status.get("phase"),
+                f"{claim['namespace']}/{claim['name']}",
+                spec.get("storageClassName", ""),
+                "",
+                age,
+            )
+        if kind == constants.NAMESPACE:
+            return (name, status.get("phase"), age)
+        if kind == constants.STORAGECLASS:
+            return (
+                name,
+                obj.get("provisioner", ""),
+                obj.get("reclaimPolicy", "Delete"),
+                obj.get("volumeBindingMode", "Immediate"),
+                age,
+            )
+        return (name, age)
+
+    def _table(self, objects):
+        if not objects:
+            return ""
+        columns = self.TABLE_COLUMNS.get(objects[0]["kind"], ("NAME", "AGE"))
+        rows = [columns] + [
+            tuple(value or "<none>" for value in self._row(obj)) for obj in objects
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+        return "".join(
+            "   ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip()
+            + "\n"
+            for row in rows
+        )
+
+    def cmd_get(self, args):
+        objects = []
+        resources = self._resources(args)
+        for kind, name in resources:
+            if name:
+                objects.append(self.server.get(kind, name, self.namespace))
+            else:
+                namespace = None if self.all_namespaces else self.namespace
+                objects.extend(
+                    self.server.list(kind, namespace, self.options.get("selector"))
+                )
+        single = len(resources) == 1 and resources[0][1] is not None
+        return self._output(objects, single)
+
+    def cmd_describe(self, args):
+        self.options["output"] = "yaml"
+        return self.cmd_get(args)
+
+    def cmd_create(self, args):
+        if "filename" in self.options:
+            created = [self.server.create(obj) for obj in self._load_file()]
+        else:
+            kind, name = self._resources(args)[0]
+            created = [self.server.create({"kind": kind, "metadata": {"name": name}})]
+        if self.options.get("output"):
+            return self._output(created, single=len(created) == 1)
+        return "".join(
+            f"{obj['kind'].lower()}/{obj['metadata']['name']} created\n"
+            for obj in created
+        )
+
+    def cmd_apply(self, args):
+        lines = []
+        for obj in self._load_file():
+            kind = self.server.normalize_kind(obj["kind"])
+            name = obj["metadata"]["name"]
+            namespace = obj["metadata"].get("namespace", self.namespace)
+            try:
+                self.server.get(kind, name, namespace)
+            except APIServerError as ex:
+                if ex.reason != "NotFound":
+                    raise
+                self.server.create(obj)
+                lines.append(f"{kind.lower()}/{name} created\n")
+            else:
+                self.server.patch(kind, name, obj, namespace)
+                lines.append(f"{kind.lower()}/{name} configured\n")
+        return "".join(lines)
+
+    def cmd_delete(self, args):
+        if "filename" in self.options:
+            resources = [
+                (obj["kind"], obj["metadata"]["name"], obj["metadata"].get("namespace"))
+                for obj in self._load_file()
+            ]
+        else:
+            resources = [
+                (kind, name, self.namespace) for kind, name in self._resources(args)
+            ]
+        lines = []
+        for kind, name, namespace in resources:
+            kind = self.server.normalize_kind(kind)
+            try:
+                self.server.delete(kind, name, namespace or self.namespace)
+            except APIServerError as ex:
+                if ex.reason == "NotFound" and "--ignore-not-found" in self.flags:
+                    continue
+                raise
+            lines.append(f'{kind.lower()} "{name}" deleted\n')
+        return "".join(lines)
+
+    def cmd_patch(self, args):
+        kind, name = self._resources(args)[0]
+        patch_type = self.options.get("type", "strategic")
+        self.server.patch(
+            kind,
+            name,
+            json.loads(self.options["patch"].strip("'")),
+            self.namespace,
+            patch_type,
+        )
+        return f"{kind.lower()}/{name} patched\n"
+
+    def cmd_label(self, args):
+        if "/" in args[0]:
+            kind, name = self._resources(args[:1])[0]
+            args = args[1:]
+        else:
+            kind, name = self._resources(args[:2])[0]
+            args = args[2:]
+        labels = {}
+        for label in args:
+            if label.endswith("-"):
+                labels[label[:-1]] = None
+            else:
+                key, value = label.split("=", 1)
+                labels[key] = value.strip("'\"")
+        self.server.patch(kind, name, {"metadata": {"labels": labels}}, self.namespace)
+        return f"{kind.lower()}/{name} labeled\n"
+
+    def cmd_new_project(self, args):
+        self.server.create({"kind": constants.NAMESPACE, "metadata": {"name": args[0]}})
+        return f'Now using project "{args[0]}" on server "https://fake-api:6443".\n'
+
+    def cmd_project(self, args):
+        self.server.get(constants.NAMESPACE, args[0])
+        return f'Now using project "{args[0]}" on server "https://fake-api:6443".\n'
+
+    def cmd_wait(self, args):
+        """
+        Support of ``oc wait --for condition=<type>`` and ``--for=delete``
+        """
+        condition = self.options.get("for", "")
+        timeout = self.options.get("timeout", "30s")
+        timeout = float(timeout.rstrip("s")) if timeout else 30
+        resources = self._resources(args)
+        kind = resources[0][0]
+        selector = self.options.get("selector")
+
+        def is_met(obj):
+            if condition == "delete":
+                return False
+            cond_type = condition.split("=", 1)[-1].lower()
+            return any(
+                cond["type"].lower() == cond_type and cond["status"] == "True"
+                for cond in obj.get("status", {}).get("conditions", [])
+            )
+
+        deadline = time.time() + timeout
+        while True:
+            if resources[0][1]:
+                objects = []
+                for _, name in resources:
+                    try:
+                        objects.append(self.server.get(kind, name, self.namespace))
+                    except APIServerError as ex:
+                        if ex.reason != "NotFound" or condition != "delete":
+                            raise
+            else:
+                objects = self.server.list(kind, self.namespace, selector)
+            if condition == "delete" and not objects:
+                return ""
+            if objects and all(is_met(obj) for obj in objects):
+                return "".join(
+                    f"{kind.lower()}/{obj['metadata']['name']} condition met\n"
+                    for obj in objects
+                )
+            if time.time() >= deadline:
+                raise APIServerError(
+                    "Timeout", f"timed out waiting for the condition on {kind}"
+                )
+            for _ in self.server.watch(
+                kind, self.namespace, selector, timeout=deadline - time.time()
+            ):
+                break
+
+    def cmd_logs(self, args):
+        return ""
+
+    def cmd_whoami(self, args):
+        return "kube:admin\n"
+
+
+@contextmanager
+def fake_api_server(**kwargs):
+    """
+    Serve all ``oc`` commands executed in the context by fake API server
+
+    Args:
+        **kwargs: Passed to :class:`FakeAPIServer`
+
+    Yields:
+        FakeAPIServer: The running server
+
+    """
+    server = FakeAPIServer(**kwargs)
+    utils.command_handlers.append(server.handle_command)
+    log.info("Fake API server is serving oc commands: %s", kwargs)
+    try:
+        yield server
+    finally:
+        utils.command_handlers.remove(server.handle_command)
+        log.info("Fake API server stopped, requests: %s", dict(server.stats))
@@ -12,8 +12,11 @@ fixtures (see :py:mod:`ocs_ci.utility.workloadfixture`).
 """
 
 
+import copy
 import logging
+import math
 import os
+import re
 import textwrap
 import time
 
@@ -22,7 +25,7 @@ import yaml
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp
-from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
 from ocs_ci.ocs.exceptions import UnexpectedVolumeType
 from ocs_ci.ocs.resources import pod
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
@@ -32,6 +35,22 @@ from ocs_ci.utility.workloadfixture import measure_operation
 
 logger = logging.getLogger(__name__)
 
+# Seconds between the fio status (eta) lines and the progress checks of the
+# sharded storage utilization fill
+FIO_STATUS_INTERVAL = 30
+# fio status line, e.g.:
+# Jobs: 1 (f=8): [W(1)][45.2%][w=120MiB/s][w=30.7k IOPS][eta 02m:13s]
+FIO_STATUS_RE = re.compile(
+    r"^Jobs: .*\]\[(?P<percent>[\d.]+)%\]\[w=(?P<rate>[\d.]+)(?P<unit>[KMGT]?i?B)/s\]"
+)
+FIO_RATE_UNITS = {
+    "B": 1,
+    "KiB": 2 ** 10,
+    "MiB": 2 ** 20,
+    "GiB": 2 ** 30,
+    "TiB": 2 ** 40,
+}
+
 
 def get_ceph_storage_stats(ceph_pool_name):
     """
@@ -260,6 +279,249 @@ def write_data_via_fio(fio_job_file, write_timeout, pvc_size, target_percentage)
     return result
 
 
+def parse_fio_status(fio_output):
+    """
+    Parse the last status line of fio, which is printed every
+    FIO_STATUS_INTERVAL seconds when fio runs with ``--eta=always`` and
+    ``--eta-newline`` options.
+
+    Args:
+        fio_output (str): output (or its tail) of fio
+
+    Returns:
+        tuple: progress of the fio job in percent (float) and its current
+            write rate in Bytes/s (float), None if there is no status line
+
+    """
+    for line in reversed(fio_output.splitlines()):
+        match = FIO_STATUS_RE.match(line.strip())
+        if match:
+            rate = float(match.group("rate")) * FIO_RATE_UNITS.get(
+                match.group("unit"), 1
+            )
+            return float(match.group("percent")), rate
+    return None
+
+
+def get_sharded_fio_objs(
+    fixture_name, fio_pvc_dict, fio_job_dict, fio_configmap_dict, shards, shard_size
+):
+    """
+    Create k8s structs of fio Jobs writing to ``shards`` PVCs of
+    ``shard_size`` GiB each. The Jobs share the fio configuration and their
+    pods are spread over the nodes.
+
+    Args:
+        fixture_name (str): name of the fixture, used to label the Jobs
+        fio_pvc_dict (dict): PVC k8s struct for fio target volume
+        fio_job_dict (dict): Job k8s struct for fio job
+        fio_configmap_dict (dict): configmap k8s struct with fio config file
+        shards (int): number of PVCs and fio Jobs
+        shard_size (int): size of each PVC in GiB
+
+    Returns:
+        list: k8s structs of the configmap, PVCs and Jobs
+
+    """
+    label = {"fio-fill": fixture_name}
+    fio_objs = [fio_configmap_dict]
+    for shard in range(shards):
+        pvc_dict = copy.deepcopy(fio_pvc_dict)
+        pvc_name = f"{fio_pvc_dict['metadata']['name']}-{shard}"
+        pvc_dict["metadata"]["name"] = pvc_name
+        pvc_dict["spec"]["resources"]["requests"]["storage"] = f"{shard_size}Gi"
+        job_dict = copy.deepcopy(fio_job_dict)
+        job_dict["metadata"]["name"] = f"{fio_job_dict['metadata']['name']}-{shard}"
+        pod_template = job_dict["spec"]["template"]
+        pod_template["metadata"].setdefault("labels", {}).update(label)
+        pod_template["spec"]["affinity"] = {
+            "podAntiAffinity": {
+                "preferredDuringSchedulingIgnoredDuringExecution": [
+                    {
+                        "weight": 100,
+                        "podAffinityTerm": {
+                            "labelSelector": {"matchLabels": label},
+                            "topologyKey": "kubernetes.io/hostname",
+                        },
+                    }
+                ]
+            }
+        }
+        container = pod_template["spec"]["containers"][0]
+        container["command"] = container["command"][:1] + [
+            "--eta=always",
+            f"--eta-newline={FIO_STATUS_INTERVAL}",
+            *container["command"][1:],
+        ]
+        for volume in pod_template["spec"]["volumes"]:
+            if "persistentVolumeClaim" in volume:
+                volume["persistentVolumeClaim"]["claimName"] = pvc_name
+        fio_objs.extend([pvc_dict, job_dict])
+    return fio_objs
+
+
+def write_data_via_sharded_fio(
+    fio_job_file,
+    write_timeout,
+    pvc_size,
+    target_percentage,
+    ceph_pool_name,
+):
+    """
+    Write data via multiple fio Jobs (see get_sharded_fio_objs) to reach
+    desired utilization level. Progress of the Jobs is logged every
+    FIO_STATUS_INTERVAL seconds, and the Jobs are stopped as soon as ``ceph
+    df`` shows that ``pvc_size`` GiB were written.
+    """
+    namespace = fio_job_file.project.namespace
+    selector = f"fio-fill={fio_job_file.name}"
+    ocp_pod = ocp.OCP(kind="Pod", namespace=namespace)
+    stored_start, _ = get_ceph_storage_stats(ceph_pool_name)
+    target_stored = stored_start + pvc_size * 2 ** 30
+    fio_job_start_ts = time.time()
+    fio_job_file.create()
+    failed_pods = []
+
+    def record_failed(pods):
+        """
+        Returns:
+            bool: True if some of the pods failed, the names of the failed
+                pods are recorded in failed_pods
+
+        """
+        failed = [p for p in pods if p["status"].get("phase") == "Failed"]
+        # TimeoutSampler swallows the exceptions of the sampled function,
+        # the failure is raised by the caller
+        failed_pods.extend(p["metadata"]["name"] for p in failed)
+        return bool(failed)
+
+    def check_finished():
+        """
+        Returns:
+            list: pod data of the fio Jobs, once all of them finished (or
+                some of them failed), None otherwise
+
+        """
+        pods = ocp_pod.get(selector=selector)["items"]
+        if record_failed(pods):
+            return pods
+        if pods and all(p["status"].get("phase") == "Succeeded" for p in pods):
+            return pods
+        return None
+
+    def check_progress():
+        """
+        Returns:
+            list: pod data of the fio Jobs, once all of them finished
+                (or the target was reached, or some of them failed), None
+                otherwise
+
+        """
+        pods = ocp_pod.get(selector=selector)["items"]
+        if record_failed(pods):
+            return pods
+        running = [p for p in pods if p["status"].get("phase") != "Succeeded"]
+        stored, _ = get_ceph_storage_stats(ceph_pool_name)
+        elapsed = time.time() - fio_job_start_ts
+        rate = (stored - stored_start) / elapsed / 2 ** 20
+        logger.info(
+            f"{(stored - stored_start) / 2 ** 30:.1f} of {pvc_size} Gi written "
+            f"by {len(pods)} fio jobs, aggregate fill rate {rate:.1f} MiB/s"
+        )
+        for pod_dict in running:
+            pod_name = pod_dict["metadata"]["name"]
+            status = parse_fio_status(
+                ocp_pod.exec_oc_cmd(
+                    f"logs {pod_name} --tail=5",
+                    out_yaml_format=False,
+                    ignore_error=True,
+                )
+                or ""
+            )
+            if status:
+                logger.info(
+                    f"fio pod {pod_name}: {status[0]}% done, "
+                    f"{status[1] / 2 ** 20:.1f} MiB/s"
+                )
+        if pods and not running:
+            return pods
+        if stored >= target_stored:
+            logger.info("Target utilization reached, stopping fio jobs")
+            for pod_dict in running:
+                stop_fio(ocp_pod, pod_dict["metadata"]["name"])
+            return pods
+        return None
+
+    error_msg = (
+        f"fio Jobs failed to write {pvc_size} Gi data on OCS backed "
+        f"volumes in expected time {write_timeout} seconds."
+    )
+    try:
+        for pods in TimeoutSampler(write_timeout, FIO_STATUS_INTERVAL, check_progress):
+            if pods:
+                break
+        # stopped jobs still need to finish writing the fio reports, a job
+        # failing on the way out is reported the same way as a failure above
+        if not failed_pods:
+            for pods in TimeoutSampler(300, 10, check_finished):
+                if pods:
+                    break
+        assert (
+            not failed_pods
+        ), f"fio pods {failed_pods} failed, check the container logs"
+    except TimeoutExpiredError as ex:
+        logger.error(error_msg)
+        ex.message = error_msg
+        raise
+    fio_job_stop_ts = time.time()
+    stored_stop, _ = get_ceph_storage_stats(ceph_pool_name)
+
+    fio_reports = []
+    for pod_dict in pods:
+        fio_report = fio_to_dict(ocp_pod.get_logs(pod_dict["metadata"]["name"]))
+        if fio_report is None:
+            logger.warning("fio report is empty")
+        fio_reports.append(fio_report)
+
+    written = stored_stop - stored_start
+    fill_rate = written / (fio_job_stop_ts - fio_job_start_ts)
+    logger.info(
+        f"{len(pods)} fio jobs wrote {written / 2 ** 30:.1f} Gi, "
+        f"aggregate fill rate was {fill_rate / 2 ** 20:.1f} MiB/s"
+    )
+
+    result = {
+        "fio_job_start": fio_job_start_ts,
+        "fio": fio_reports,
+        "pvc_size": pvc_size,
+        "target_p": target_percentage,
+        "namespace": namespace,
+        "shards": len(pods),
+        "written": written,
+        "fill_rate": fill_rate,
+    }
+
+    return result
+
+
+def stop_fio(ocp_pod, pod_name):
+    """
+    Stop fio running in the pod, fio still writes its report on the way out.
+
+    Args:
+        ocp_pod (ocp.OCP): OCP object of Pod kind in the namespace of the pod
+        pod_name (str): name of the fio pod
+
+    """
+    try:
+        ocp_pod.exec_oc_cmd(
+            f"exec {pod_name} -- /bin/sh -c 'kill -INT 1'", out_yaml_format=False
+        )
+    except CommandFailed as ex:
+        # the pod might have just finished
+        logger.warning(f"Failed to stop fio in pod {pod_name}: {ex}")
+
+
 def delete_fio_data(fio_job_file, delete_check_func):
     """
     Delete fio data by removing the fio job resource, with a wait to
@@ -301,6 +563,7 @@ def workload_fio_storageutilization(
     with_checksum=False,
     keep_fio_data=False,
     minimal_time=480,
+    shards=1,
 ):
     """
     This function implements core functionality of fio storage utilization
@@ -345,6 +608,9 @@ def workload_fio_storageutilization(
             storage utilization is completed. Else if false, deletes the fio data.
         minimal_time (int): Minimal number of seconds to monitor a system.
             (See more details in the function 'measure_operation')
+        shards (int): number of PVCs and fio Jobs the data are written by
+            in parallel, the writing is stopped as soon as the target is
+            reached (can't be combined with ``with_checksum``)
 
     Returns:
         dict: measurement results with timestamps and other medatada from
@@ -358,6 +624,8 @@ def workload_fio_storageutilization(
         )
     if target_size is not None and target_percentage is not None:
         raise ValueError(val_err_msg + ", not both.")
+    if shards > 1 and with_checksum:
+        raise ValueError("Checksum of the data is not supported with shards.")
 
     # TODO: move out storage class names
     if fixture_name.endswith("rbd"):
@@ -422,6 +690,9 @@ def workload_fio_storageutilization(
         logger.warning(skip_msg)
         pytest.skip(skip_msg)
 
+    # each shard writes its part of the data to its own volume
+    shard_size = math.ceil(pvc_size / shards)
+
     fio_conf = textwrap.dedent(
         """
         [simple-write]
@@ -458,7 +729,7 @@ def workload_fio_storageutilization(
     elif fixture_name.endswith("rbd"):
         fio_conf += "fill_fs=1\n"
     else:
-        fio_conf += f"size={pvc_size}G\n"
+        fio_conf += f"size={shard_size}G\n"
 
     # When we ask for checksum to be generated for all files written in the
     # /mnt/target directory, we change the command of the container to run
@@ -479,16 +750,32 @@ def workload_fio_storageutilization(
     fio_configmap_dict["data"]["workload.fio"] = fio_conf
     fio_pvc_dict["spec"]["storageClassName"] = storage_class_name
     fio_pvc_dict["spec"]["resources"]["requests"]["storage"] = f"{pvc_size}Gi"
-    fio_objs = [fio_pvc_dict, fio_configmap_dict, fio_job_dict]
+    if shards > 1:
+        fio_objs = get_sharded_fio_objs(
+            fixture_name,
+            fio_pvc_dict,
+            fio_job_dict,
+            fio_configmap_dict,
+            shards,
+            shard_size,
+        )
+    else:
+        fio_objs = [fio_pvc_dict, fio_configmap_dict, fio_job_dict]
     fio_job_file = ObjectConfFile(fixture_name, fio_objs, project, tmp_path)
 
+    # the min. write speed is the one of the whole cluster, all the shards
+    # together have to write pvc_size
     fio_min_mbps = config.ENV_DATA["fio_storageutilization_min_mbps"]
     write_timeout = get_timeout(fio_min_mbps, pvc_size)
 
     test_file = os.path.join(measurement_dir, f"{fixture_name}.json")
 
     measured_op = measure_operation(
-        lambda: write_data_via_fio(
+        lambda: write_data_via_sharded_fio(
+            fio_job_file, write_timeout, pvc_size, target_percentage, ceph_pool_name
+        )
+        if shards > 1
+        else write_data_via_fio(
             fio_job_file, write_timeout, pvc_size, target_percentage
         ),
         test_file,
@@ -2,6 +2,7 @@ import logging
 
 from ocs_ci.ocs import node, defaults, exceptions, constants
 from ocs_ci.ocs.node import wait_for_nodes_status
+from ocs_ci.ocs.request_layer import BACKGROUND, request_priority
 from ocs_ci.ocs.resources import pod as pod_helpers
 from ocs_ci.ocs.resources.pod import wait_for_storage_pods
 from ocs_ci.utility.utils import TimeoutSampler, ceph_health_check
@@ -156,15 +157,18 @@ class BackgroundOps:
         iterations = kwargs.get("iterations", 1)
         func_name = func.__name__
         del kwargs["iterations"]
-        for i in range(iterations):
-            if self.OPERATION_COMPLETED:
-                logger.info(
-                    f"{func_name}: Done with execution. Stopping the thread. In iteration {i}"
-                )
-                return True
-            else:
-                func(*args, **kwargs)
-                logger.info(f"{func_name}: iteration {i}")
+        # the background operations are throttled in favour of the test flow
+        with request_priority(BACKGROUND):
+            for i in range(iterations):
+                if self.OPERATION_COMPLETED:
+                    logger.info(
+                        f"{func_name}: Done with execution. Stopping the thread. "
+                        f"In iteration {i}"
+                    )
+                    return True
+                else:
+                    func(*args, **kwargs)
+                    logger.info(f"{func_name}: iteration {i}")
 
     def wait_for_bg_operations(self, bg_ops, timeout=1200):
         """
@@ -0,0 +1,293 @@
+"""
+Session wide oracle of the cluster health.
+
+The oracle keeps the name of the ceph tools pod, so that the ceph health is
+checked by a single ``oc exec`` command, samples the Ceph and NooBaa health in
+the background and answers the health checks from the cached sample when it
+is fresh enough. Changes of the health are recorded as a timeline.
+
+Usage::
+
+    oracle = get_health_oracle()
+    oracle.start()
+    ...
+    oracle.check_ceph_health(max_age=60)
+    ...
+    oracle.stop()
+
+"""
+import logging
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CephHealthException, CommandFailed
+from ocs_ci.utility.utils import run_cmd
+
+log = logging.getLogger(__name__)
+
+HEALTH_OK = "HEALTH_OK"
+# Seconds between the health samples taken in the background
+DEFAULT_INTERVAL = 30
+
+# Health of the cluster at the time of the sample, noobaa_phase is None when
+# NooBaa is not deployed
+HealthSample = namedtuple("HealthSample", ["timestamp", "ceph_health", "noobaa_phase"])
+# Change of health of a component
+HealthTransition = namedtuple(
+    "HealthTransition", ["timestamp", "component", "previous", "current"]
+)
+
+_oracle = None
+_oracle_lock = threading.Lock()
+
+
+class HealthOracle(object):
+    """
+    Cached and background sampled health of the cluster
+    """
+
+    def __init__(self, namespace=None, interval=DEFAULT_INTERVAL):
+        """
+        Initializer function
+
+        Args:
+            namespace (str): Namespace of OCS
+                (default: config.ENV_DATA['cluster_namespace'])
+            interval (int): Seconds between the samples taken in background
+
+        """
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        self.interval = interval
+        self.latest = None
+        self.timeline = []
+        self._tools_pod = None
+        self._sample_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def tools_pod(self):
+        """
+        Name of the ceph tools pod, it's looked up only when it's not known
+        yet or the previously used pod is gone
+
+        Returns:
+            str: Name of the tools pod
+
+        """
+        if not self._tools_pod:
+            run_cmd(
+                f"oc wait --for condition=ready pod "
+                f"-l {constants.TOOL_APP_LABEL} "
+                f"-n {self.namespace} "
+                f"--timeout=120s"
+            )
+            self._tools_pod = run_cmd(
+                f"oc -n {self.namespace} get pod -l '{constants.TOOL_APP_LABEL}' "
+                f"-o jsonpath='{{.items[0].metadata.name}}'",
+                timeout=60,
+            )
+        return self._tools_pod
+
+    def get_ceph_health(self):
+        """
+        Exec `ceph health` cmd on tools pod
+
+        Returns:
+            str: Ceph health
+
+        Raises:
+            CommandFailed: If the command to retrieve the tools pod name or
+                the command to get ceph health returns a non-zero exit code
+
+        """
+        try:
+            return run_cmd(
+                f"oc -n {self.namespace} exec {self.tools_pod} -- ceph health"
+            ).strip()
+        except CommandFailed:
+            # tools pod might be re-spinned, try once more with a new one
+            log.warning("Failed to get ceph health, looking for the tools pod again")
+            self._tools_pod = None
+            return run_cmd(
+                f"oc -n {self.namespace} exec {self.tools_pod} -- ceph health"
+            ).strip()
+
+    def get_noobaa_phase(self):
+        """
+        Returns:
+            str: Phase of the NooBaa system, None if it's not deployed
+
+        """
+        phase = run_cmd(
+            f"oc -n {self.namespace} get noobaa "
+            f"-o jsonpath='{{.items[*].status.phase}}'",
+            ignore_error=True,
+        )
+        return phase.strip() or None
+
+    def sample(self, ceph_only=False):
+        """
+        Take a new sample of the cluster health. When another thread is taking
+        a sample at the same time, its result is used.
+
+        Args:
+            ceph_only (bool): True for sampling only the ceph health, the
+                NooBaa phase of the previous sample is kept
+
+        Returns:
+            HealthSample: The new sample
+
+        """
+        requested = time.time()
+        with self._sample_lock:
+            latest = self.latest
+            if latest and latest.timestamp >= requested:
+                return latest
+            ceph_only = ceph_only and latest is not None
+            sample = HealthSample(
+                time.time(),
+                self.get_ceph_health(),
+                latest.noobaa_phase if ceph_only else self.get_noobaa_phase(),
+            )
+            if latest:
+                for component, field in (
+                    ("ceph", "ceph_health"),
+                    ("noobaa", "noobaa_phase"),
+                ):
+                    previous = getattr(latest, field)
+                    current = getattr(sample, field)
+                    if previous != current:
+                        log.info(
+                            f"Health of {component} changed: {previous} -> {current}"
+                        )
+                        self.timeline.append(
+                            HealthTransition(
+                                sample.timestamp, component, previous, current
+                            )
+                        )
+            self.latest = sample
+            return sample
+
+    def get_sample(self, max_age=None, ceph_only=False):
+        """
+        Args:
+            max_age (int): Max. age in seconds of the cached sample to be used,
+                a new sample is taken when the cached one is older. None for
+                always taking a new sample
+            ceph_only (bool): True for sampling only the ceph health when a
+                new sample is taken, see sample
+
+        Returns:
+            HealthSample: Sample of the cluster health
+
+        """
+        latest = self.latest
+        if (
+            latest is not None
+            and max_age is not None
+            and time.time() - latest.timestamp <= max_age
+        ):
+            return latest
+        return self.sample(ceph_only)
+
+    def is_ceph_health_ok(self, max_age=None):
+        """
+        Args:
+            max_age (int): Max. age in seconds of the cached sample to be used
+
+        Returns:
+            bool: True if the ceph health is HEALTH_OK, see get_sample
+
+        """
+        return self.get_sample(max_age, ceph_only=True).ceph_health == HEALTH_OK
+
+    def check_ceph_health(self, max_age=None):
+        """
+        Check that Ceph health is HEALTH_OK, see get_sample
+
+        Args:
+            max_age (int): Max. age in seconds of the cached sample to be used
+
+        Returns:
+            bool: True if HEALTH_OK
+
+        Raises:
+            CephHealthException: If the ceph health is not HEALTH_OK
+
+        """
+        sample = self.get_sample(max_age, ceph_only=True)
+        if sample.ceph_health == HEALTH_OK:
+            log.info(
+                f"Ceph cluster health is HEALTH_OK "
+                f"({time.time() - sample.timestamp:.0f}s ago)."
+            )
+            return True
+        raise CephHealthException(
+            f"Ceph cluster health is not OK. Health: {sample.ceph_health}"
+        )
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                log.exception("Failed to sample the cluster health")
+
+    def start(self):
+        """
+        Start sampling of the cluster health in the background
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="health-oracle", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop sampling of the cluster health in the background
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def log_timeline(self):
+        """
+        Log all the recorded changes of the cluster health
+        """
+        for transition in self.timeline:
+            log.info(
+                f"{datetime.utcfromtimestamp(transition.timestamp)} "
+                f"{transition.component}: {transition.previous} -> "
+                f"{transition.current}"
+            )
+
+
+def get_health_oracle(namespace=None):
+    """
+    Args:
+        namespace (str): Namespace of OCS, the shared oracle is used when not
+            set or it's the namespace of the shared oracle
+
+    Returns:
+        HealthOracle: The health oracle shared by the whole session, a new
+            oracle (not sampled in the background) for another namespace
+
+    """
+    global _oracle
+    with _oracle_lock:
+        if _oracle is None:
+            _oracle = HealthOracle(
+                interval=config.RUN.get("health_check_interval", DEFAULT_INTERVAL)
+            )
+        if namespace and namespace != _oracle.namespace:
+            return HealthOracle(namespace)
+        return _oracle
@@ -13,7 +13,7 @@ from ocs_ci.ocs.exceptions import (
     UnexpectedBehaviour,
 )
 from ocs_ci.ocs import constants
-from ocs_ci.ocs.constants import JENKINS_BUILD_COMPLETE
+from ocs_ci.ocs.build_tracker import BuildTracker, format_duration
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.utility import templating
 from ocs_ci.ocs.resources.ocs import OCS
@@ -53,6 +53,7 @@ class Jenkins(object):
         self.num_of_builds = num_of_builds
         self.num_of_projects = num_of_projects
         self.build_completed = OrderedDict()
+        self.build_tracker = None
         self.create_project_names()
 
     @property
@@ -132,35 +133,44 @@ class Jenkins(object):
         """
         Wait for build status to reach complete state
 
+        The builds of all the projects are tracked with one list of the builds
+        per cycle, the build durations are taken from the build timestamps
+
         Args:
-            timeout (int): Time  in seconds to wait
+            timeout (int): Time in seconds to wait for the next build to
+                complete
 
         """
-        log.info(f"Waiting for the build to reach {JENKINS_BUILD_COMPLETE} state")
-        for project in self.projects:
-            jenkins_builds = self.get_builds_sorted_by_number(project=project)
-            for jenkins_build in jenkins_builds:
-                if (jenkins_build.name, project) not in self.build_completed:
-                    try:
-                        wait_for_resource_state(
-                            resource=jenkins_build,
-                            state=JENKINS_BUILD_COMPLETE,
-                            timeout=timeout,
-                        )
-                        self.get_build_duration_time(
-                            namespace=project, build_name=jenkins_build.name
-                        )
-                    except ResourceWrongStatusException:
-                        ocp_obj = OCP(namespace=project, kind="build")
-                        output = ocp_obj.describe(resource_name=jenkins_build.name)
-                        error_msg = (
-                            f"{jenkins_build.name} did not reach to "
-                            f"{JENKINS_BUILD_COMPLETE} state after {timeout} sec\n"
-                            f"oc describe output of {jenkins_build.name} \n:{output}"
-                        )
-                        log.error(error_msg)
-                        self.print_completed_builds_results()
-                        raise UnexpectedBehaviour(error_msg)
+        self.build_tracker = BuildTracker(
+            self.projects, builds_per_project=self.num_of_builds, timeout=timeout
+        )
+        try:
+            completed = self.build_tracker.wait()
+        except UnexpectedBehaviour as ex:
+            self.update_completed_builds(self.build_tracker.completed())
+            details = []
+            for name, project in self.build_tracker.pending()[:5]:
+                if name:
+                    ocp_obj = OCP(namespace=project, kind="build")
+                    output = ocp_obj.describe(resource_name=name)
+                    details.append(f"oc describe output of {name}:\n{output}")
+            error_msg = "\n".join([str(ex)] + details)
+            log.error(error_msg)
+            self.print_completed_builds_results()
+            raise UnexpectedBehaviour(error_msg)
+        self.update_completed_builds(completed)
+
+    def update_completed_builds(self, records):
+        """
+        Record the durations of the completed builds
+
+        Args:
+            records (list): BuildRecord of the completed builds
+
+        """
+        for record in records:
+            if record.duration is not None:
+                self.build_completed[record.key] = format_duration(record.duration)
 
     def get_builds_sorted_by_number(self, project):
         """
@@ -356,6 +366,26 @@ class Jenkins(object):
         for build, time_build in self.build_completed.items():
             build_table.add_row([build[1], build[0], time_build])
         log.info(f"\n{build_table}\n")
+        if self.build_tracker:
+            self.print_build_time_per_node()
+
+    def print_build_time_per_node(self):
+        """
+        Print the distribution of the build durations per node on table
+        """
+        node_table = PrettyTable()
+        node_table.field_names = ["Node", "Builds", "Min", "Median", "Mean", "Max"]
+        for node, stats in sorted(
+            self.build_tracker.node_distribution().items(), key=lambda i: str(i[0])
+        ):
+            node_table.add_row(
+                [node, stats["builds"]]
+                + [
+                    format_duration(stats[key])
+                    for key in ("min", "median", "mean", "max")
+                ]
+            )
+        log.info(f"Build time per node\n{node_table}\n")
 
     def export_builds_results_to_googlesheet(
         self, sheet_name="E2E Workloads", sheet_index=3
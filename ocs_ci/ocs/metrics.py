@@ -6,12 +6,25 @@ Code in this module Supports monitoring test cases dealing with OCS metrics.
 """
 
 import logging
+import re
+import time
 
 from ocs_ci.ocs import constants
 
 
 logger = logging.getLogger(__name__)
 
+# Availability of metrics is remembered for a short time, so that repeated
+# checks of the same metrics don't query prometheus again
+METRICS_CACHE_TTL = 30
+# Maximal number of metric names checked by a single query, to keep the size
+# of the query url reasonable
+METRICS_QUERY_BATCH = 100
+METRIC_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+# prometheus endpoint -> {metric name: time when the metric was available}
+_available_metrics = {}
+
 
 # See: https://ceph.com/rbd/new-in-nautilus-rbd-performance-monitoring/
 # This is not a full list, but it is enough to check whether we have
@@ -285,7 +298,47 @@ ceph_rgw_metrics = tuple(
 ceph_metrics_all = tuple(ceph_metrics + ceph_rbd_metrics)
 
 
-def get_missing_metrics(prometheus, metrics, current_platform=None):
+def get_available_metrics(prometheus, metrics, use_cache=True):
+    """
+    Using given prometheus instance, find out which of the given metrics have
+    some value. Metric names are checked in batches via a single query
+    ``count by (__name__) ({__name__=~"metric_a|metric_b|..."})`` instead of
+    querying each metric separately, and available metrics are cached for
+    METRICS_CACHE_TTL seconds.
+
+    Args:
+        prometheus (ocs_ci.utility.prometheus.PrometheusAPI): prometheus instance
+        metrics (list): list or tuple with metrics to be checked
+        use_cache (bool): True for using availability of metrics checked
+            within last METRICS_CACHE_TTL seconds
+
+    Returns:
+        set: metrics which are available
+
+    """
+    now = time.time()
+    cache = _available_metrics.setdefault(prometheus._endpoint, {})
+    available = set()
+    names = []
+    for metric in dict.fromkeys(metrics):
+        if use_cache and now - cache.get(metric, 0) < METRICS_CACHE_TTL:
+            available.add(metric)
+        elif METRIC_NAME_RE.match(metric):
+            names.append(metric)
+        elif len(prometheus.query(metric)) > 0:
+            # not a plain metric name, e.g. an expression
+            available.add(metric)
+    for i in range(0, len(names), METRICS_QUERY_BATCH):
+        batch = "|".join(names[i : i + METRICS_QUERY_BATCH])
+        result = prometheus.query(f'count by (__name__) ({{__name__=~"{batch}"}})')
+        for item in result:
+            metric = item["metric"]["__name__"]
+            available.add(metric)
+            cache[metric] = now
+    return available
+
+
+def get_missing_metrics(prometheus, metrics, current_platform=None, use_cache=True):
     """
     Using given prometheus instance, check that all given metrics which are
     expected to be available on current platform are there.
@@ -294,16 +347,18 @@ def get_missing_metrics(prometheus, metrics, current_platform=None):
         prometheus (ocs_ci.utility.prometheus.PrometheusAPI): prometheus instance
         metrics (list): list or tuple with metrics to be checked
         current_platform (str): name of current platform (optional)
+        use_cache (bool): True for using availability of metrics checked
+            within last METRICS_CACHE_TTL seconds, see get_available_metrics
 
     Returns:
         list: metrics which were not available but should be
 
     """
+    available_metrics = get_available_metrics(prometheus, metrics, use_cache)
     metrics_without_results = []
     for metric in metrics:
-        result = prometheus.query(metric)
         # check that we actually received some values
-        if len(result) == 0:
+        if metric not in available_metrics:
             # Ceph Object Gateway https://docs.ceph.com/docs/master/radosgw/ is
             # deployed on on-prem platforms only, so we are going to ignore
             # missing metrics from these components on such platforms.
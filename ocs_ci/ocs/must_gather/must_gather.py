@@ -3,12 +3,13 @@ import logging
 import shutil
 import tempfile
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from ocs_ci.helpers.helpers import storagecluster_independent_check
 from ocs_ci.ocs.resources.pod import get_all_pods
 from ocs_ci.ocs.utils import collect_ocs_logs
 from ocs_ci.ocs.must_gather.const_must_gather import GATHER_COMMANDS_VERSION
+from ocs_ci.ocs.must_gather.must_gather_index import MustGatherIndex
 from ocs_ci.ocs.ocp import get_ocs_parsed_version
 
 
@@ -28,6 +29,20 @@ class MustGather(object):
         self.empty_files = list()
         self.files_not_exist = list()
         self.files_content_issue = list()
+        self._index = None
+
+    @property
+    def index(self):
+        """
+        Index of the must gather files, built by a single walk of the tree
+
+        Returns:
+            MustGatherIndex: The index of self.root
+
+        """
+        if self._index is None or self._index.root != self.root:
+            self._index = MustGatherIndex(self.root)
+        return self._index
 
     @property
     def log_type(self):
@@ -47,6 +62,7 @@ class MustGather(object):
         temp_folder = tempfile.mkdtemp()
         collect_ocs_logs(dir_name=temp_folder, ocp=False)
         self.root = temp_folder + "_ocs_logs"
+        self._index = None
 
     def search_file_path(self):
         """
@@ -59,24 +75,21 @@ class MustGather(object):
         else:
             files = GATHER_COMMANDS_VERSION[version][self.type_log]
         for file in files:
-            self.files_not_exist.append(file)
-            for dir_name, subdir_list, files_list in os.walk(self.root):
-                if file in files_list:
-                    self.files_path[file] = os.path.join(dir_name, file)
-                    self.files_not_exist.remove(file)
-                    break
+            file_path = self.index.find(file)
+            if file_path:
+                self.files_path[file] = file_path
+            else:
+                self.files_not_exist.append(file)
 
     def validate_file_size(self):
         """
         Validate the file is not empty
 
         """
-        for path, subdirs, files in os.walk(self.root):
-            for file in files:
-                file_path = os.path.join(path, file)
-                if Path(file_path).stat().st_size == 0:
-                    logger.error(f"log file {file} empty!")
-                    self.empty_files.append(file)
+        for file_path in self.index.empty_files():
+            file = os.path.basename(file_path)
+            logger.error(f"log file {file} empty!")
+            self.empty_files.append(file)
 
     def validate_expected_files(self):
         """
@@ -85,15 +98,14 @@ class MustGather(object):
         """
         self.search_file_path()
         self.verify_noobaa_diagnostics()
+        yaml_files = dict()
         for file, file_path in self.files_path.items():
-            if not Path(file_path).is_file():
-                self.files_not_exist.append(file)
-            elif Path(file_path).stat().st_size == 0:
+            if self.index.sizes[file_path] == 0:
                 self.empty_files.append(file)
             elif re.search(r"\.yaml$", file):
-                with open(file_path, "r") as f:
-                    if "kind" not in f.read().lower():
-                        self.files_content_issue.append(file)
+                yaml_files[file_path] = file
+        for file_path in self.index.find_without_content(yaml_files, "kind"):
+            self.files_content_issue.append(yaml_files[file_path])
 
     def compare_running_pods(self):
         """
@@ -107,12 +119,10 @@ class MustGather(object):
             if not must_gather_helper.match(pod.name):
                 pod_names.append(pod.name)
 
-        for dir_name, subdir_list, files_list in os.walk(self.root):
-            if re.search("openshift-storage/pods$", dir_name):
-                pod_path = dir_name
+        pod_path = self.index.match_dirs("openshift-storage/pods$")[-1]
 
         pod_files = []
-        for pod_file in os.listdir(pod_path):
+        for pod_file in self.index.dirs[pod_path]:
             if not must_gather_helper.match(pod_file):
                 pod_files.append(pod_file)
 
@@ -143,13 +153,8 @@ class MustGather(object):
 
         """
         if self.type_log == "OTHERS" and get_ocs_parsed_version() >= 4.6:
-            flag = False
             logger.info("Verify noobaa_diagnostics folder exist")
-            for path, subdirs, files in os.walk(self.root):
-                for file in files:
-                    if re.search(r"noobaa_diagnostics_.*.tar.gz", file):
-                        flag = True
-            if not flag:
+            if not self.index.match(r"noobaa_diagnostics_.*.tar.gz"):
                 logger.error("noobaa_diagnostics.tar.gz does not exist")
                 self.files_not_exist.append("noobaa_diagnostics.tar.gz")
 
@@ -157,11 +162,17 @@ class MustGather(object):
         """
         Validate must_gather
 
+        The tree is indexed once, the comparison of the running pods (which
+        lists the pods in the cluster) runs in parallel with the file checks.
+
         """
-        self.validate_file_size()
-        self.validate_expected_files()
-        self.print_invalid_files()
-        self.compare_running_pods()
+        logger.info(f"Validating {len(self.index.sizes)} must gather files")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            running_pods = executor.submit(self.compare_running_pods)
+            self.validate_file_size()
+            self.validate_expected_files()
+            self.print_invalid_files()
+        running_pods.result()
 
     def cleanup(self):
         """
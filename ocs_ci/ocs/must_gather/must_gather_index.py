@@ -0,0 +1,151 @@
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+# Number of files checked for their content at once
+CONTENT_CHECK_WORKERS = 16
+
+
+class MustGatherIndex(object):
+    """
+    Index of the files of the must gather directory tree
+
+    The tree is walked only once, all the lookups (by file name, by name
+    pattern, empty files, content of the directories) are done against the
+    index.
+
+    """
+
+    def __init__(self, root):
+        """
+        Initializer function
+
+        Args:
+            root (str): Root directory of the must gather
+
+        """
+        self.root = root
+        # file name -> paths of the files with the name, in the walk order
+        self.files = dict()
+        # file path -> size of the file in bytes
+        self.sizes = dict()
+        # directory path -> names of the files and directories in it
+        self.dirs = dict()
+        self._build()
+
+    def _build(self):
+        """
+        Walk the tree and index all the files and directories
+
+        """
+        pending = [self.root]
+        while pending:
+            dir_path = pending.pop(0)
+            children = []
+            subdirs = []
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError as ex:
+                logger.warning(f"Failed to list directory {dir_path}: {ex}")
+                entries = []
+            for entry in entries:
+                children.append(entry.name)
+                if entry.is_dir():
+                    # symlinked directories are not followed, as by os.walk
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                self.files.setdefault(entry.name, []).append(entry.path)
+                self.sizes[entry.path] = size
+            self.dirs[dir_path] = children
+            # depth first, top down - the order of os.walk
+            pending[0:0] = subdirs
+        logger.info(
+            f"Indexed {len(self.sizes)} files in {len(self.dirs)} directories "
+            f"of {self.root}"
+        )
+
+    def find(self, name):
+        """
+        Args:
+            name (str): File name
+
+        Returns:
+            str: Path of the first file with the name, None if there's none
+
+        """
+        paths = self.files.get(name)
+        return paths[0] if paths else None
+
+    def match(self, pattern):
+        """
+        Args:
+            pattern (str): Regular expression searched in the file names
+
+        Returns:
+            list: Paths of the files with the name matching the pattern
+
+        """
+        regex = re.compile(pattern)
+        return [
+            path
+            for name, paths in self.files.items()
+            if regex.search(name)
+            for path in paths
+        ]
+
+    def match_dirs(self, pattern):
+        """
+        Args:
+            pattern (str): Regular expression searched in the directory paths
+
+        Returns:
+            list: Paths of the directories matching the pattern
+
+        """
+        regex = re.compile(pattern)
+        return [path for path in self.dirs if regex.search(path)]
+
+    def empty_files(self):
+        """
+        Returns:
+            list: Paths of the empty files
+
+        """
+        return [path for path, size in self.sizes.items() if size == 0]
+
+    def find_without_content(self, paths, text, workers=CONTENT_CHECK_WORKERS):
+        """
+        Find the files which don't contain the text (case insensitive). The
+        files are read line by line until the text is found, at most the
+        given number of the files at once.
+
+        Args:
+            paths (list): Paths of the files to check
+            text (str): Text searched in the files
+            workers (int): Number of the files checked at once
+
+        Returns:
+            list: Paths of the files without the text
+
+        """
+        text = text.lower()
+
+        def contains(path):
+            with open(path, "r", errors="replace") as file_obj:
+                return any(text in line.lower() for line in file_obj)
+
+        paths = list(paths)
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(contains, paths))
+        return [path for path, found in zip(paths, results) if not found]
@@ -83,6 +83,47 @@ def get_all_nodes():
     return [node["metadata"]["name"] for node in node_items]
 
 
+def get_node_status(node_data):
+    """
+    Get the node status as shown in the STATUS column of 'oc get node'
+
+    Args:
+        node_data (dict): The node data, e.g. item of 'oc get node -o yaml'
+
+    Returns:
+        str: The node status (e.g. 'Ready', 'NotReady,SchedulingDisabled')
+
+    """
+    status = constants.NODE_NOT_READY
+    for condition in node_data.get("status", {}).get("conditions", []):
+        if condition.get("type") == "Ready" and condition.get("status") == "True":
+            status = constants.NODE_READY
+    if node_data.get("spec", {}).get("unschedulable"):
+        status = f"{status},SchedulingDisabled"
+    return status
+
+
+def get_nodes_status(node_names=None):
+    """
+    Get status of the nodes by a single 'oc get node' call
+
+    Args:
+        node_names (list): The node names to get their status for.
+            If None, will return status of all cluster nodes
+
+    Returns:
+        dict: The node name -> node status, nodes not found in the cluster
+            are not included
+
+    """
+    node_dicts = OCP(kind="node").get()["items"]
+    return {
+        node_data["metadata"]["name"]: get_node_status(node_data)
+        for node_data in node_dicts
+        if not node_names or node_data["metadata"]["name"] in node_names
+    }
+
+
 def wait_for_nodes_status(node_names=None, status=constants.NODE_READY, timeout=180):
     """
     Wait until all nodes are in the given status
@@ -108,11 +149,11 @@ def wait_for_nodes_status(node_names=None, status=constants.NODE_READY, timeout=
                     break
         nodes_not_in_state = copy.deepcopy(node_names)
         log.info(f"Waiting for nodes {node_names} to reach status {status}")
-        for sample in TimeoutSampler(timeout, 3, get_node_objs, nodes_not_in_state):
-            for node in sample:
-                if node.ocp.get_resource_status(node.name) == status:
-                    log.info(f"Node {node.name} reached status {status}")
-                    nodes_not_in_state.remove(node.name)
+        for sample in TimeoutSampler(timeout, 3, get_nodes_status, nodes_not_in_state):
+            for node_name, node_status in sample.items():
+                if node_status == status:
+                    log.info(f"Node {node_name} reached status {status}")
+                    nodes_not_in_state.remove(node_name)
             if not nodes_not_in_state:
                 break
         log.info(f"The following nodes reached status {status}: {node_names}")
@@ -0,0 +1,226 @@
+"""
+Orchestration of the node lifecycle operations (restart, stop and start) on
+multiple nodes.
+
+Platform calls for the nodes are issued concurrently and the progress of all
+the nodes is tracked together - each poll is a single listing of the reboot
+events and a single listing of the nodes, instead of a call per node and a
+fixed sleep. Nodes can be processed in rolling batches, e.g. to restart one
+node after another::
+
+    lifecycle = NodeLifecycle(nodes_platform, parallelism=1)
+    lifecycle.restart(worker_nodes)
+
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants, node
+from ocs_ci.ocs.exceptions import ResourceWrongStatusException, TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import TimeoutSampler
+
+log = logging.getLogger(__name__)
+
+# Seconds between the polls of the nodes progress
+POLL_INTERVAL = 5
+
+
+def run_concurrently(func, items, max_workers=None):
+    """
+    Call the function for all the items concurrently
+
+    Args:
+        func (function): Function called with an item as its only argument
+        items (list): Items to call the function for
+        max_workers (int): Max. number of concurrent calls, all at once when
+            not specified
+
+    Returns:
+        list: Results of the function in the order of the items
+
+    Raises:
+        Exception: The first exception raised by the function, the function
+            is called for all the items anyway
+
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers or len(items)) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    return [future.result() for future in futures]
+
+
+def get_reboot_event_counts(node_names):
+    """
+    Count the reboot events of the nodes by a single listing of the events
+
+    Args:
+        node_names (list): Names of the nodes
+
+    Returns:
+        dict: Node name -> number of its reboot events
+
+    """
+    events = OCP(kind="event").exec_oc_cmd(
+        "get events -A --field-selector reason=Rebooted -o yaml"
+    )
+    counts = dict.fromkeys(node_names, 0)
+    for event in events["items"]:
+        name = event.get("involvedObject", {}).get("name")
+        if name in counts:
+            counts[name] += 1
+    return counts
+
+
+def get_nodes_progress(node_names, reboot_counts_before=None):
+    """
+    Find out which of the nodes are Ready and, when the reboot event counts
+    are given, which of them were rebooted since then
+
+    Args:
+        node_names (list): Names of the nodes
+        reboot_counts_before (dict): Node name -> number of its reboot events
+            before the operation, None for not checking the reboot
+
+    Returns:
+        list: Names of the nodes which are not done yet
+
+    """
+    nodes_status = node.get_nodes_status(node_names)
+    if reboot_counts_before is not None:
+        reboot_counts = get_reboot_event_counts(node_names)
+    pending = []
+    for node_name in node_names:
+        if nodes_status.get(node_name) != constants.NODE_READY:
+            pending.append(node_name)
+        elif (
+            reboot_counts_before is not None
+            and reboot_counts[node_name] <= reboot_counts_before[node_name]
+        ):
+            pending.append(node_name)
+    return pending
+
+
+def wait_for_nodes_ready(node_names, reboot_counts_before=None, timeout=600):
+    """
+    Wait until all the nodes are Ready and, when the reboot event counts are
+    given, were rebooted
+
+    Args:
+        node_names (list): Names of the nodes
+        reboot_counts_before (dict): Node name -> number of its reboot events
+            before the operation, None for not checking the reboot
+        timeout (int): Time in seconds to wait
+
+    Raises:
+        ResourceWrongStatusException: In case one or more nodes haven't got
+            ready (or rebooted) in time
+
+    """
+    log.info(f"Waiting for nodes {node_names} to get ready")
+    pending = list(node_names)
+    try:
+        for pending in TimeoutSampler(
+            timeout,
+            POLL_INTERVAL,
+            get_nodes_progress,
+            node_names,
+            reboot_counts_before,
+        ):
+            if not pending:
+                break
+            log.info(f"Nodes not ready yet: {pending}")
+    except TimeoutExpiredError:
+        raise ResourceWrongStatusException(
+            pending,
+            [n.describe() for n in node.get_node_objs(pending)],
+        )
+    log.info(f"Nodes {node_names} are ready")
+
+
+class NodeLifecycle(object):
+    """
+    Restart, stop and start of the nodes in rolling batches
+    """
+
+    def __init__(self, nodes_platform, parallelism=None, timeout=600):
+        """
+        Initializer function
+
+        Args:
+            nodes_platform (NodesBase): Platform nodes object, see
+                ocs_ci.ocs.platform_nodes.PlatformNodesFactory
+            parallelism (int): Max. number of nodes processed at once, the
+                next batch is started once the previous one is ready. All the
+                nodes at once by default (config.RUN['node_parallelism'])
+            timeout (int): Time in seconds to wait for each batch
+
+        """
+        self.nodes_platform = nodes_platform
+        self.parallelism = parallelism or config.RUN.get("node_parallelism")
+        self.timeout = timeout
+
+    def batches(self, nodes):
+        """
+        Split the nodes to the batches processed at once
+
+        Args:
+            nodes (list): The OCS objects of the nodes
+
+        Returns:
+            list: Lists of the nodes
+
+        """
+        size = self.parallelism or len(nodes) or 1
+        return [nodes[i : i + size] for i in range(0, len(nodes), size)]
+
+    def restart(self, nodes, **kwargs):
+        """
+        Restart the nodes and wait until they are rebooted and Ready
+
+        Args:
+            nodes (list): The OCS objects of the nodes
+            **kwargs: Arguments of the platform restart_nodes
+
+        """
+        for batch in self.batches(nodes):
+            node_names = [n.name for n in batch]
+            log.info(f"Restarting nodes {node_names}")
+            reboot_counts = get_reboot_event_counts(node_names)
+            self.nodes_platform.restart_nodes(batch, wait=False, **kwargs)
+            wait_for_nodes_ready(node_names, reboot_counts, self.timeout)
+
+    def stop(self, nodes, **kwargs):
+        """
+        Stop the nodes and wait until they are NotReady
+
+        Args:
+            nodes (list): The OCS objects of the nodes
+            **kwargs: Arguments of the platform stop_nodes
+
+        """
+        for batch in self.batches(nodes):
+            node_names = [n.name for n in batch]
+            log.info(f"Stopping nodes {node_names}")
+            self.nodes_platform.stop_nodes(batch, **kwargs)
+            node.wait_for_nodes_status(
+                node_names, constants.NODE_NOT_READY, self.timeout
+            )
+
+    def start(self, nodes, **kwargs):
+        """
+        Start the nodes and wait until they are Ready
+
+        Args:
+            nodes (list): The OCS objects of the nodes
+            **kwargs: Arguments of the platform start_nodes
+
+        """
+        for batch in self.batches(nodes):
+            node_names = [n.name for n in batch]
+            log.info(f"Starting nodes {node_names}")
+            self.nodes_platform.start_nodes(nodes=batch, **kwargs)
+            wait_for_nodes_ready(node_names, timeout=self.timeout)
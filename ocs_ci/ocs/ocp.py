@@ -23,7 +23,7 @@ from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility.utils import exec_cmd, run_cmd, update_container_with_mirrored_image
 from ocs_ci.utility.templating import dump_data_to_temp_yaml, load_yaml
-from ocs_ci.ocs import defaults, constants
+from ocs_ci.ocs import defaults, constants, request_layer
 from ocs_ci.framework import config
 
 
@@ -123,21 +123,15 @@ class OCP(object):
             str: If out_yaml_format is False.
 
         """
-        oc_cmd = "oc "
-        env_kubeconfig = os.getenv("KUBECONFIG")
-        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
-            cluster_dir_kubeconfig = os.path.join(
-                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
-            )
-            if os.path.exists(cluster_dir_kubeconfig):
-                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
+        oc_cmd = " ".join(["oc"] + get_kubeconfig_args()) + " "
 
         if self.namespace:
             oc_cmd += f"-n {self.namespace} "
 
         oc_cmd += command
-        out = run_cmd(
-            cmd=oc_cmd,
+        out = request_layer.get_request_layer().execute(
+            run_cmd,
+            oc_cmd,
             secrets=secrets,
             timeout=timeout,
             ignore_error=ignore_error,
@@ -931,6 +925,25 @@ class OCP(object):
         return output
 
 
+def get_kubeconfig_args():
+    """
+    Get the kubeconfig arguments of the 'oc' commands, the kubeconfig of the
+    cluster dir is used when KUBECONFIG is not set or doesn't exist
+
+    Returns:
+        list: ['--kubeconfig', <path>] or empty list when KUBECONFIG is used
+
+    """
+    env_kubeconfig = os.getenv("KUBECONFIG")
+    if not env_kubeconfig or not os.path.exists(env_kubeconfig):
+        cluster_dir_kubeconfig = os.path.join(
+            config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
+        )
+        if os.path.exists(cluster_dir_kubeconfig):
+            return ["--kubeconfig", cluster_dir_kubeconfig]
+    return []
+
+
 def get_clustername():
     """
     Return the name (DNS short name) of the cluster
@@ -15,7 +15,6 @@ from ocs_ci.ocs.node import get_nodes
 from ocs_ci.ocs.resources.catalog_source import CatalogSource
 from ocs_ci.ocs.resources.csv import CSV
 from ocs_ci.ocs.resources.install_plan import wait_for_install_plan_and_approve
-from ocs_ci.ocs.resources.pod import verify_pods_upgraded
 from ocs_ci.ocs.resources.packagemanifest import (
     get_selector_for_ocs_operator,
     PackageManifest,
@@ -24,6 +23,7 @@ from ocs_ci.ocs.resources.storage_cluster import (
     get_osd_count,
     ocs_install_verification,
 )
+from ocs_ci.ocs.upgrade_tracker import UpgradeComponent, UpgradeTracker
 from ocs_ci.ocs.utils import setup_ceph_toolbox
 from ocs_ci.utility.utils import (
     get_latest_ds_olm_tag,
@@ -72,65 +72,42 @@ def get_upgrade_image_info(old_csv_images, new_csv_images):
     )
 
 
-def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
+def get_upgrade_components(upgrade_version, version_before_upgrade):
     """
-    Verify if all the images of OCS objects got upgraded
+    Get the pod sets of OCS which have to be upgraded
 
     Args:
-        old_images (set): set with old images
         upgrade_version (packaging.version.Version): version of OCS
         version_before_upgrade (float): version of OCS before upgrade
 
+    Returns:
+        list: UpgradeComponent of the pod sets
+
     """
     number_of_worker_nodes = len(get_nodes())
     osd_count = get_osd_count()
-    verify_pods_upgraded(old_images, selector=constants.OCS_OPERATOR_LABEL)
-    verify_pods_upgraded(old_images, selector=constants.OPERATOR_LABEL)
     # in 4.3 app selector nooba have those pods: noobaa-core-ID, noobaa-db-ID,
     # noobaa-operator-ID but in 4.2 only 2: noobaa-core-ID, noobaa-operator-ID
     nooba_pods = 2 if upgrade_version < parse_version("4.3") else 3
-    verify_pods_upgraded(
-        old_images, selector=constants.NOOBAA_APP_LABEL, count=nooba_pods
-    )
-    verify_pods_upgraded(
-        old_images,
-        selector=constants.CSI_CEPHFSPLUGIN_LABEL,
-        count=number_of_worker_nodes,
-    )
-    verify_pods_upgraded(
-        old_images, selector=constants.CSI_CEPHFSPLUGIN_PROVISIONER_LABEL, count=2
-    )
-    verify_pods_upgraded(
-        old_images,
-        selector=constants.CSI_RBDPLUGIN_LABEL,
-        count=number_of_worker_nodes,
-    )
-    verify_pods_upgraded(
-        old_images, selector=constants.CSI_RBDPLUGIN_PROVISIONER_LABEL, count=2
-    )
-    verify_pods_upgraded(
-        old_images,
-        selector=constants.MON_APP_LABEL,
-        count=3,
-    )
-    verify_pods_upgraded(old_images, selector=constants.MGR_APP_LABEL)
     osd_timeout = 600 if upgrade_version >= parse_version("4.5") else 750
-    verify_pods_upgraded(
-        old_images,
-        selector=constants.OSD_APP_LABEL,
-        count=osd_count,
-        timeout=osd_timeout * osd_count,
-    )
-    verify_pods_upgraded(old_images, selector=constants.MDS_APP_LABEL, count=2)
+    components = [
+        UpgradeComponent(constants.OCS_OPERATOR_LABEL),
+        UpgradeComponent(constants.OPERATOR_LABEL),
+        UpgradeComponent(constants.NOOBAA_APP_LABEL, nooba_pods),
+        UpgradeComponent(constants.CSI_CEPHFSPLUGIN_LABEL, number_of_worker_nodes),
+        UpgradeComponent(constants.CSI_CEPHFSPLUGIN_PROVISIONER_LABEL, 2),
+        UpgradeComponent(constants.CSI_RBDPLUGIN_LABEL, number_of_worker_nodes),
+        UpgradeComponent(constants.CSI_RBDPLUGIN_PROVISIONER_LABEL, 2),
+        UpgradeComponent(constants.MON_APP_LABEL, 3),
+        UpgradeComponent(constants.MGR_APP_LABEL),
+        UpgradeComponent(constants.OSD_APP_LABEL, osd_count, osd_timeout * osd_count),
+        UpgradeComponent(constants.MDS_APP_LABEL, 2),
+    ]
     if config.ENV_DATA.get("platform") in constants.ON_PREM_PLATFORMS:
         # RGW count is 1 if the cluster was upgraded from <= 4.4
         # Related bug - https://bugzilla.redhat.com/show_bug.cgi?id=1857802
         rgw_count = 2 if float(version_before_upgrade) >= 4.5 else 1
-        verify_pods_upgraded(
-            old_images,
-            selector=constants.RGW_APP_LABEL,
-            count=rgw_count,
-        )
+        components.append(UpgradeComponent(constants.RGW_APP_LABEL, rgw_count))
 
     # With 4.4 OCS cluster deployed over Azure, RGW is the default backingstore
     if config.ENV_DATA.get("platform") == constants.AZURE_PLATFORM:
@@ -138,12 +115,33 @@ def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
             float(config.ENV_DATA["ocs_version"]) == 4.5
             and float(version_before_upgrade) < 4.5
         ):
-            rgw_count = 1
-            verify_pods_upgraded(
-                old_images,
-                selector=constants.RGW_APP_LABEL,
-                count=rgw_count,
-            )
+            components.append(UpgradeComponent(constants.RGW_APP_LABEL, 1))
+    return components
+
+
+def verify_image_versions(old_images, upgrade_version, version_before_upgrade):
+    """
+    Verify if all the images of OCS objects got upgraded, all the pod sets
+    are checked together against one snapshot of the pods per cycle
+
+    Args:
+        old_images (set): set with old images
+        upgrade_version (packaging.version.Version): version of OCS
+        version_before_upgrade (float): version of OCS before upgrade
+
+    Returns:
+        UpgradeTracker: The tracker with the rollout timing
+
+    Raises:
+        TimeoutException: If the pods didn't get upgraded till the timeout.
+
+    """
+    tracker = UpgradeTracker(
+        get_upgrade_components(upgrade_version, version_before_upgrade),
+        old_images=old_images,
+    )
+    tracker.wait()
+    return tracker
 
 
 class OCSUpgrade(object):
@@ -343,8 +341,9 @@ class OCSUpgrade(object):
 
     def get_images_post_upgrade(self, channel, pre_upgrade_images, upgrade_version):
         """
-        Checks if all images of OCS cluster upgraded,
-            and return list of all images if upgrade success
+        Checks if all images of OCS cluster upgraded (the CSV succeeded and
+            all the pods run the new images), and return list of all images
+            if upgrade success. The rollout timing is saved to the log dir.
 
         Args:
             channel: (str): OCS subscription channel
@@ -354,6 +353,10 @@ class OCSUpgrade(object):
         Returns:
             set: Contains full path of OCS cluster old images
 
+        Raises:
+            TimeoutException: If the CSV or the pods didn't get upgraded in
+                time
+
         """
         operator_selector = get_selector_for_ocs_operator()
         package_manifest = PackageManifest(
@@ -373,8 +376,30 @@ class OCSUpgrade(object):
             setup_ceph_toolbox(force_setup=True)
         # End of workaround
 
+        # the CSV and all the pods are checked together, the pods are rolled
+        # out while the CSV is still installing
         osd_count = get_osd_count()
-        csv_post_upgrade.wait_for_phase("Succeeded", timeout=200 * osd_count)
+        self.upgrade_tracker = UpgradeTracker(
+            get_upgrade_components(
+                parse_version(upgrade_version), self.version_before_upgrade
+            ),
+            pre_upgrade_images=pre_upgrade_images,
+            csv_name=csv_name_post_upgrade,
+            csv_timeout=200 * osd_count,
+            namespace=self.namespace,
+        )
+        try:
+            self.upgrade_tracker.wait()
+        finally:
+            self.upgrade_tracker.save(
+                os.path.join(
+                    os.path.expanduser(config.RUN["log_dir"]),
+                    f"upgrade-rollout-{config.RUN['run_id']}.json",
+                ),
+                version_before_upgrade=self.version_before_upgrade,
+                upgrade_version=upgrade_version,
+                csv=csv_name_post_upgrade,
+            )
         post_upgrade_images = get_images(csv_post_upgrade.get())
         old_images, _, _ = get_upgrade_image_info(
             pre_upgrade_images, post_upgrade_images
@@ -473,14 +498,10 @@ def run_ocs_upgrade(operation=None, *operation_args, **operation_kwargs):
                     break
             except TimeoutException:
                 raise TimeoutException("No new CSV found after upgrade!")
-        old_image = upgrade_ocs.get_images_post_upgrade(
+        # verifies the images of all the pods as well
+        upgrade_ocs.get_images_post_upgrade(
             channel, pre_upgrade_images, upgrade_version
         )
-    verify_image_versions(
-        old_image,
-        upgrade_ocs.get_parsed_versions()[1],
-        upgrade_ocs.version_before_upgrade,
-    )
     ocs_install_verification(
         timeout=600,
         skip_osd_distribution_check=True,
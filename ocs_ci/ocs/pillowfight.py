@@ -3,7 +3,6 @@ Pillowfight Class to run various workloads and scale tests
 """
 import logging
 import tempfile
-import re
 from os import listdir
 from os.path import isfile, join
 from shutil import rmtree
@@ -12,6 +11,11 @@ from ocs_ci.utility.spreadsheet.spreadsheet_api import GoogleSpreadSheetAPI
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs import constants
+from ocs_ci.ocs.pillowfight_collector import (
+    PillowfightCollector,
+    new_stats,
+    parse_pillowfight_line,
+)
 from ocs_ci.ocs.utils import get_pod_name_by_pattern
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility import utils, templating
@@ -57,12 +61,13 @@ class PillowFight(object):
         self.ocp = OCP()
         self.up_check = OCP(namespace=constants.COUCHBASE_OPERATOR)
         self.logs = tempfile.mkdtemp(prefix="pf_logs_")
+        self.collector = None
 
     def run_pillowfights(self, replicas=1, num_items=None, num_threads=None):
         """
         loop through all the yaml files extracted from the pillowfight repo
-        and run them.  Run oc logs on the results and save the logs in self.logs
-        directory
+        and run them.  The logs of the pillowfight pods are streamed and parsed
+        while they run (see self.collector) and saved in self.logs directory
 
         Args:
             replicas (int): Number of pod replicas
@@ -95,6 +100,7 @@ class PillowFight(object):
                 lpillowfight = OCS(**pfight)
                 lpillowfight.create()
         self.pods_info = {}
+        self.collector = PillowfightCollector(self.namespace, log_dir=self.logs)
 
         for pillowfight_pods in TimeoutSampler(
             self.WAIT_FOR_TIME,
@@ -108,22 +114,33 @@ class PillowFight(object):
                 for pf_pod in pillowfight_pods:
                     pod_info = self.up_check.exec_oc_cmd(f"get pods {pf_pod} -o json")
                     pf_status = pod_info["status"]["containerStatuses"][0]["state"]
+                    if "running" in pf_status or "terminated" in pf_status:
+                        self.collector.follow(pf_pod)
                     if "terminated" in pf_status:
                         pf_completion_info = pf_status["terminated"]["reason"]
                         if pf_completion_info == constants.STATUS_COMPLETED:
                             counter += 1
                             self.pods_info.update({pf_pod: pf_completion_info})
-                    elif "running" in pf_status:
-                        pass
                 if counter == self.replicas:
                     break
             except IndexError:
                 log.info("Pillowfight not yet completed")
 
         logging.info(self.pods_info)
+        following = self.collector.join(timeout=300)
+        if following:
+            log.warning(f"Stopping the log streams of {following}, still running")
+        # the complete logs of the stopped streams are fetched below
+        self.collector.stop()
+        if self.collector.collapses:
+            log.warning(f"Pillowfight throughput collapses: {self.collector.collapses}")
         pf_yaml = pf_files[0]  # for  basic-fillowfight.yaml
         for pod, pf_completion_info in self.pods_info.items():
             if pf_completion_info == "Completed":
+                if self.collector.returncodes.get(pod) == 0:
+                    continue
+                # the log stream failed or was stopped, fetch the complete log
+                log.info(f"Collecting the complete log of {pod}")
                 pf_endlog = f"{pod}.log"
                 pf_log = join(self.logs, pf_endlog)
                 data_from_log = ocp_local.exec_oc_cmd(
@@ -132,15 +149,23 @@ class PillowFight(object):
                 data_from_log = data_from_log.replace("\x00", "")
                 with open(pf_log, "w") as fd:
                     fd.write(data_from_log)
+                self.collector.stats[pod] = self.parse_pillowfight_log(data_from_log)
 
             elif pf_completion_info == "Error":
                 raise Exception(f"Pillowfight {pf_yaml} failed to complete")
 
     def analyze_all(self):
         """
-        Analyze the data extracted into self.logs files
+        Analyze the data parsed from the streamed logs, or the data extracted
+        into self.logs files
 
         """
+        if self.collector:
+            # parsed while streamed
+            for pod, pf_completion_info in self.pods_info.items():
+                logging.info(f"Analyzing the results of {pod}")
+                self.sanity_check(self.collector.stats[pod])
+            return
         for path in listdir(self.logs):
             full_path = join(self.logs, path)
             logging.info(f"Analyzing {full_path}")
@@ -191,29 +216,10 @@ class PillowFight(object):
         # So what's left is a list of OPS/SEC values and a histogram of
         # response times.  This routine organizes that data.
 
-        ops_per_sec = []
-        resp_hist = {}
         log.info("*******Couchbase raw output log*********\n" f"{data_from_log}")
-        lines = data_from_log.split("\n")
-        for dline in lines:
-            try:
-                if dline.startswith("OPS/SEC"):
-                    dfields = dline.split(" ")
-                    dnumb = int(dfields[-1].strip())
-                    ops_per_sec.append(dnumb)
-                if re.match("^\\[\\d+ +- \\d+ *\\][um]s \\|#* - \\d+", dline):
-                    for element in ["[", "]", "|", "-", "#"]:
-                        dline = dline.replace(element, " ")
-                    parts = dline.split()
-                    i1 = int(parts[0])
-                    i2 = int(parts[1])
-                    if parts[2] == "ms":
-                        i1 *= 1000
-                        i2 *= 1000
-                    resp_hist[i2] = {"minindx": i1, "number": int(parts[3])}
-            except ValueError:
-                log.info(f"{dline} -- contains invalid data")
-        ret_data = {"opspersec": ops_per_sec, "resptimes": resp_hist}
+        ret_data = new_stats()
+        for dline in data_from_log.split("\n"):
+            parse_pillowfight_line(dline, ret_data)
         return ret_data
 
     def export_pfoutput_to_googlesheet(self, sheet_name, sheet_index):
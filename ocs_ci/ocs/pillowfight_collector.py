@@ -0,0 +1,288 @@
+"""
+Streaming collection of the pillowfight results
+
+The logs of the pillowfight pods are followed ('oc logs -f') while the
+workload runs, each line is parsed as it arrives. The throughput of all the
+pods is aggregated in real time and a throughput collapse of any pod is
+flagged when it happens, not after the run::
+
+    collector = PillowfightCollector(namespace, log_dir=logs)
+    for pod in pods:
+        collector.follow(pod)
+    ...
+    collector.join()
+    log.info(collector.collapses)
+
+"""
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+
+from ocs_ci.ocs.ocp import get_kubeconfig_args
+
+log = logging.getLogger(__name__)
+
+# Histogram line of the response times, e.g. '[100 - 199]us |### - 1234'
+RESP_HIST_LINE = re.compile("^\\[\\d+ +- \\d+ *\\][um]s \\|#* - \\d+")
+
+
+def new_stats():
+    """
+    Returns:
+        dict: Empty pillowfight stats, see parse_pillowfight_line
+
+    """
+    return {"opspersec": [], "resptimes": {}}
+
+
+def parse_pillowfight_line(dline, stats):
+    """
+    Parse one line of the pillowfight log into the stats
+
+    Args:
+        dline (str): Line of the log
+        stats (dict): 'opspersec' is the list of the ops per second numbers
+            reported, 'resptimes' is a dictionary indexed by the max response
+            time (us) of a range with the min response time of the range and
+            the number of the messages in the range
+
+    Returns:
+        int: The ops per second of the line, None if the line doesn't report
+            the ops per second
+
+    """
+    try:
+        if dline.startswith("OPS/SEC"):
+            dfields = dline.split(" ")
+            dnumb = int(dfields[-1].strip())
+            stats["opspersec"].append(dnumb)
+            return dnumb
+        if RESP_HIST_LINE.match(dline):
+            for element in ["[", "]", "|", "-", "#"]:
+                dline = dline.replace(element, " ")
+            parts = dline.split()
+            i1 = int(parts[0])
+            i2 = int(parts[1])
+            if parts[2] == "ms":
+                i1 *= 1000
+                i2 *= 1000
+            stats["resptimes"][i2] = {"minindx": i1, "number": int(parts[3])}
+    except ValueError:
+        log.info(f"{dline} -- contains invalid data")
+    return None
+
+
+class PillowfightCollector(object):
+    """
+    Follows the logs of the pillowfight pods and aggregates the results
+    """
+
+    def __init__(
+        self, namespace, log_dir=None, collapse_ratio=0.5, window=5, on_collapse=None
+    ):
+        """
+        Initializer function
+
+        Args:
+            namespace (str): Namespace of the pillowfight pods
+            log_dir (str): Directory the logs are saved to as <pod>.log, the
+                logs are not saved when not set
+            collapse_ratio (float): The throughput of a pod collapsed when it
+                drops below this fraction of its best ops per second in the
+                last window samples
+            window (int): Number of the previous samples the collapse is
+                checked against, no collapse is flagged before that
+            on_collapse (callable): Called with the collapse event (dict) as
+                it happens
+
+        """
+        self.namespace = namespace
+        self.log_dir = log_dir
+        self.collapse_ratio = collapse_ratio
+        self.window = window
+        self.on_collapse = on_collapse
+        self.start = time.time()
+        # pod -> stats of the pod, see parse_pillowfight_line
+        self.stats = dict()
+        # pod -> last ops per second of the pod which is still running
+        self.current = dict()
+        # (seconds since the start, ops per second of all the pods)
+        self.timeline = []
+        # dicts with the pod, time, opspersec and baseline of each collapse
+        self.collapses = []
+        # pod -> exit code of the log stream
+        self.returncodes = dict()
+        self._collapsed = set()
+        self._threads = dict()
+        # pod -> 'oc logs -f' process of the pod
+        self._procs = dict()
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def _log_command(self, pod):
+        """
+        Returns:
+            list: Command streaming the log of the pod
+
+        """
+        return ["oc", *get_kubeconfig_args(), "-n", self.namespace, "logs", "-f", pod]
+
+    def follow(self, pod):
+        """
+        Start following the log of the pod, does nothing if it's already
+        followed
+
+        Args:
+            pod (str): Name of the pillowfight pod
+
+        """
+        with self._lock:
+            if pod in self._threads:
+                return
+            self.stats[pod] = new_stats()
+            thread = threading.Thread(target=self._stream, args=(pod,), daemon=True)
+            self._threads[pod] = thread
+        log.info(f"Following the log of the pillowfight pod {pod}")
+        thread.start()
+
+    def _stream(self, pod):
+        """
+        Read and parse the log of the pod line by line until it ends
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            proc = subprocess.Popen(
+                self._log_command(pod),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._procs[pod] = proc
+        log_file = None
+        if self.log_dir:
+            log_file = open(os.path.join(self.log_dir, f"{pod}.log"), "w")
+        try:
+            for raw in proc.stdout:
+                line = raw.decode(errors="replace").replace("\x00", "")
+                if log_file:
+                    log_file.write(line)
+                self.add_line(pod, line.rstrip("\n"))
+        finally:
+            self.returncodes[pod] = proc.wait()
+            if log_file:
+                log_file.close()
+            with self._lock:
+                self.current.pop(pod, None)
+                stopped = self._stopped
+            samples = len(self.stats[pod]["opspersec"])
+            if self.returncodes[pod] and not stopped:
+                log.warning(
+                    f"Log stream of the pillowfight pod {pod} failed with exit "
+                    f"code {self.returncodes[pod]} after {samples} OPS/SEC samples"
+                )
+            else:
+                log.info(
+                    f"Log of the pillowfight pod {pod} ended with "
+                    f"{samples} OPS/SEC samples"
+                )
+
+    def add_line(self, pod, line):
+        """
+        Parse the line of the pod log and update the aggregated throughput
+
+        Args:
+            pod (str): Name of the pod
+            line (str): Line of the log
+
+        """
+        with self._lock:
+            stats = self.stats.setdefault(pod, new_stats())
+            ops = parse_pillowfight_line(line, stats)
+            if ops is None:
+                return
+            self.current[pod] = ops
+            now = time.time() - self.start
+            self.timeline.append((now, sum(self.current.values())))
+            event = self._check_collapse(pod, stats["opspersec"], now)
+        if event:
+            log.warning(
+                f"Pillowfight throughput of {pod} collapsed to {event['opspersec']} "
+                f"OPS/SEC, from {event['baseline']} OPS/SEC"
+            )
+            if self.on_collapse:
+                self.on_collapse(event)
+
+    def _check_collapse(self, pod, samples, now):
+        """
+        Returns:
+            dict: The collapse event, None if the throughput didn't collapse
+                or the collapse was already flagged
+
+        """
+        if len(samples) <= self.window:
+            return None
+        baseline = max(samples[-self.window - 1 : -1])
+        if samples[-1] >= baseline * self.collapse_ratio:
+            self._collapsed.discard(pod)
+            return None
+        if pod in self._collapsed:
+            return None
+        self._collapsed.add(pod)
+        event = {
+            "pod": pod,
+            "time": now,
+            "opspersec": samples[-1],
+            "baseline": baseline,
+        }
+        self.collapses.append(event)
+        return event
+
+    def throughput(self):
+        """
+        Returns:
+            int: Current ops per second of all the running pods
+
+        """
+        with self._lock:
+            return sum(self.current.values())
+
+    def following(self):
+        """
+        Returns:
+            list: Names of the pods whose logs are still streamed
+
+        """
+        return [pod for pod, thread in self._threads.items() if thread.is_alive()]
+
+    def join(self, timeout=None):
+        """
+        Wait for the logs of all the followed pods to end
+
+        Args:
+            timeout (int): Seconds to wait, no limit when not set
+
+        Returns:
+            list: Names of the pods whose logs are still streamed
+
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        for thread in list(self._threads.values()):
+            thread.join(None if deadline is None else max(deadline - time.time(), 0))
+        return self.following()
+
+    def stop(self):
+        """
+        Stop following the logs, the log streams which are still running are
+        killed, their return code is not 0
+
+        """
+        with self._lock:
+            self._stopped = True
+            procs = [proc for proc in self._procs.values() if proc.poll() is None]
+        for proc in procs:
+            proc.kill()
+        for thread in list(self._threads.values()):
+            thread.join()
@@ -44,6 +44,11 @@ from ocs_ci.utility.utils import (
     run_cmd,
 )
 from ocs_ci.ocs.node import wait_for_nodes_status
+from ocs_ci.ocs.node_lifecycle import (
+    get_reboot_event_counts,
+    run_concurrently,
+    wait_for_nodes_ready,
+)
 from ocs_ci.utility.vsphere_nodes import VSPHERENode
 from paramiko.ssh_exception import NoValidConnectionsError, AuthenticationException
 from semantic_version import Version
@@ -264,18 +269,11 @@ class VMWareNodes(NodesBase):
                 reaches READY state. False otherwise
 
         """
-        num_events_pre_reboot = {}
         vms = self.get_vms(nodes)
         assert vms, f"Failed to get VM objects for nodes {[n.name for n in nodes]}"
-
-        for node in nodes:
-            reboot_events_cmd = (
-                "get events -A --field-selector involvedObject.name="
-                f"{node.name},reason=Rebooted -o yaml"
-            )
-            num_events_pre_reboot[node.name] = len(
-                node.ocp.exec_oc_cmd(reboot_events_cmd)["items"]
-            )
+        nodes_names = [n.name for n in nodes]
+        if wait:
+            reboot_counts = get_reboot_event_counts(nodes_names)
 
         self.vsphere.restart_vms(vms, force=force)
 
@@ -287,23 +285,7 @@ class VMWareNodes(NodesBase):
             When the reboot operation is completed and the VM is reachable the
             OCP node reaches status Ready and a Reboot event is logged.
             """
-            logger.info("Waiting for 30 seconds for reboot to complete...")
-            time.sleep(30)
-
-            nodes_names = [n.name for n in nodes]
-
-            wait_for_nodes_status(
-                node_names=nodes_names, status=constants.NODE_READY, timeout=timeout
-            )
-            for node in nodes:
-                reboot_events_cmd = (
-                    "get events -A --field-selector involvedObject.name="
-                    f"{node.name},reason=Rebooted -o yaml"
-                )
-                assert num_events_pre_reboot[node.name] < len(
-                    node.ocp.exec_oc_cmd(reboot_events_cmd)["items"]
-                ), f"Reboot event not found on node {node.name}"
-                logger.info(f"Node {node.name} rebooted")
+            wait_for_nodes_ready(nodes_names, reboot_counts, timeout=timeout)
 
     def restart_nodes_by_stop_and_start(self, nodes, force=True):
         """
@@ -496,20 +478,13 @@ class AWSNodes(NodesBase):
                 and 'ready' state.
 
         """
-        num_events_pre_reboot = {}
         instances = self.get_ec2_instances(nodes)
         assert instances, (
             f"Failed to get the EC2 instances for " f"nodes {[n.name for n in nodes]}"
         )
-
-        for node in nodes:
-            reboot_events_cmd = (
-                "get events -A --field-selector involvedObject.name="
-                f"{node.name},reason=Rebooted -o yaml"
-            )
-            num_events_pre_reboot[node.name] = len(
-                node.ocp.exec_oc_cmd(reboot_events_cmd)["items"]
-            )
+        nodes_names = [n.name for n in nodes]
+        if wait:
+            reboot_counts = get_reboot_event_counts(nodes_names)
 
         self.aws.restart_ec2_instances(instances=instances)
 
@@ -521,23 +496,7 @@ class AWSNodes(NodesBase):
             When the reboot operation is complete and the instance is reachable
             the OCP node reaches status Ready and a Reboot event is logged.
             """
-            logger.info("Waiting for 60 seconds for reboot to complete...")
-            time.sleep(60)
-
-            nodes_names = [n.name for n in nodes]
-            logger.info(f"Waiting for nodes: {nodes_names} to reach ready state")
-            wait_for_nodes_status(
-                node_names=nodes_names, status=constants.NODE_READY, timeout=timeout
-            )
-            for node in nodes:
-                reboot_events_cmd = (
-                    "get events -A --field-selector involvedObject.name="
-                    f"{node.name},reason=Rebooted -o yaml"
-                )
-                assert num_events_pre_reboot[node.name] < len(
-                    node.ocp.exec_oc_cmd(reboot_events_cmd)["items"]
-                ), f"Reboot event not found on node {node.name}"
-                logger.info(f"Node {node.name} rebooted")
+            wait_for_nodes_ready(nodes_names, reboot_counts, timeout=timeout)
 
     def restart_nodes_by_stop_and_start(self, nodes, wait=True, force=True):
         """
@@ -1602,16 +1561,17 @@ class BaremetalNodes(NodesBase):
         """
         self.baremetal.start_baremetal_machines(nodes, wait=wait)
 
-    def restart_nodes(self, nodes, force=True):
+    def restart_nodes(self, nodes, force=True, wait=True):
         """
         Restart Baremetal Machine
 
         Args:
             nodes (list): The OCS objects of the nodes
             force (bool): True for force BM stop, False otherwise
+            wait (bool): Wait for node status
 
         """
-        self.baremetal.restart_baremetal_machines(nodes, force=force)
+        self.baremetal.restart_baremetal_machines(nodes, force=force, wait=wait)
 
     def restart_nodes_teardown(self):
         """
@@ -1716,8 +1676,7 @@ class AZURENodes(NodesBase):
             logger.error("No nodes found for restarting")
             raise ValueError
         node_names = [n.name for n in nodes]
-        for node_name in node_names:
-            self.azure.restart_az_vm_instance(node_name)
+        run_concurrently(self.azure.restart_az_vm_instance, node_names)
 
         if wait:
             """
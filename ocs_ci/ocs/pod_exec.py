@@ -15,16 +15,23 @@ dispatcher class Exec.
 
 
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import io
 import logging
+import os
+import threading
+import time
+
+import yaml
 
 from ocs_ci.ocs.exceptions import CommandFailed
 
 # Upstream KubernetesClient
 from kubernetes import config
-from kubernetes.client import Configuration
+from kubernetes.client import ApiClient, Configuration
 from kubernetes.client.apis import core_v1_api
-from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
+from kubernetes.stream.ws_client import ERROR_CHANNEL, STDERR_CHANNEL, STDOUT_CHANNEL
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +40,14 @@ logger = logging.getLogger(__name__)
 # Used by factory function to dynamically find the class to be instantiated
 _clsmap = dict()
 
+# Instantiated api-clients, reused by all the Exec objects, see get_client
+_clients = dict()
+_clients_lock = threading.Lock()
+
+# Size of the connection pool of the cached api-client, big enough for
+# running the command on many pods in parallel
+CONNECTION_POOL_MAXSIZE = 32
+
 # Packing all elements required for execution
 CmdObj = namedtuple(
     "CmdObj",
@@ -53,11 +68,40 @@ def register_class(cls):
     class name.
 
     """
-    name = str(cls).split(".")[2].rstrip("'>")
-    _clsmap[name] = cls
+    _clsmap[cls.__name__] = cls
     return cls
 
 
+def get_client(oc_client="KubClient"):
+    """
+    Get api-client instance, the instance is created only once per api-client
+    and kubeconfig, so the loaded config and connection pool are reused by all
+    the commands.
+
+    Args:
+        oc_client (str): Name of the api-client class
+
+    Returns:
+        object: Instance of the api-client
+
+    """
+    key = (oc_client, os.getenv("KUBECONFIG"))
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = _clsmap[oc_client]()
+            logger.info(f"Instantiated api-client {oc_client}")
+        return _clients[key]
+
+
+def clear_clients():
+    """
+    Drop all the cached api-client instances, e.g. when the cluster
+    credentials were changed.
+    """
+    with _clients_lock:
+        _clients.clear()
+
+
 class Exec(object):
     """Dispatcher class for proper api client instantiation
 
@@ -76,10 +120,33 @@ class Exec(object):
         (stdout, stderr, retval)
 
         """
-        # Get api-client specific object
-        apiclnt = _clsmap[self.oc_client]()
-        logger.info(f"Instantiated api-client {self.oc_client}")
-        return apiclnt.run(podname, namespace, cmd_obj)
+        return get_client(self.oc_client).run(podname, namespace, cmd_obj)
+
+    def run_on_pods(self, pods, cmd_obj, max_workers=None):
+        """
+        Run the same command on many pods at once
+
+        Args:
+            pods (list): Tuples of pod name and namespace
+            cmd_obj (CmdObj): Command to run on every pod
+            max_workers (int): Maximal number of commands running at once,
+                CONNECTION_POOL_MAXSIZE by default
+
+        Returns:
+            list: 3 tuples (stdout, stderr, retval) in the order of the pods
+
+        Raises:
+            CommandFailed: When the command failed to run on any of the pods,
+                raised after all the commands are finished
+
+        """
+        max_workers = max_workers or CONNECTION_POOL_MAXSIZE
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.run, podname, namespace, cmd_obj)
+                for podname, namespace in pods
+            ]
+        return [future.result() for future in futures]
 
 
 @register_class
@@ -92,74 +159,99 @@ class KubClient(object):
         oc cluster config.
 
         """
-        config.load_kube_config()
         conf = Configuration()
+        config.load_kube_config(client_configuration=conf)
         conf.assert_hostname = False
-        Configuration.set_default(conf)
-        self.api = core_v1_api.CoreV1Api()
+        conf.connection_pool_maxsize = max(
+            conf.connection_pool_maxsize, CONNECTION_POOL_MAXSIZE
+        )
+        self.conf = conf
+        self._local = threading.local()
+
+    @property
+    def api(self):
+        """
+        CoreV1Api: The api of this thread. The stream() helper swaps the
+            request method of the api-client in place, so the threads running
+            commands at once mustn't share the api-client
+        """
+        api = getattr(self._local, "api", None)
+        if api is None:
+            api = core_v1_api.CoreV1Api(ApiClient(self.conf))
+            self._local.api = api
+        return api
 
     def run(self, podname, namespace, cmd_obj):
-        resp = None
-        stdout = None
-        stderr = None
-        ret = None
+        """
+        Run the command in the pod, the output is read until the command
+        finishes or the timeout is reached.
 
-        try:
-            resp = self.api.read_namespaced_pod(name=podname, namespace=namespace)
-            logger.info(resp)
-        except ApiException as ex:
-            if ex.status != 404:
-                logger.error("Unknown error: %s" % ex)
-
-        # run command in bash
-        bash = ["/bin/bash"]
+        Args:
+            podname (str): Name of the pod
+            namespace (str): Namespace of the pod
+            cmd_obj (CmdObj): Command to run, it's executed by bash so the
+                shell syntax can be used. The wait and long_running fields
+                are not needed anymore as all the output is always read
+
+        Returns:
+            tuple: stdout, stderr and return code of the command, return code
+                is None when it's not available
+
+        Raises:
+            CommandFailed: When the command didn't finish within the timeout
+
+        """
         resp = stream(
             self.api.connect_get_namespaced_pod_exec,
             podname,
             namespace,
-            command=bash,
+            command=["/bin/bash", "-c", cmd_obj.cmd],
             stderr=True,
-            stdin=True,
+            stdin=False,
             stdout=True,
             tty=False,
             _preload_content=False,
         )
-        done = False
-        outbuf = ""
-        while resp.is_open():
-            resp.update(timeout=1)
-            if resp.peek_stdout():
-                stdout = resp.read_stdout(timeout=cmd_obj.timeout)
-                outbuf = outbuf + stdout
-                if cmd_obj.long_running:
-                    while resp.peek_stdout(timeout=cmd_obj.timeout):
-                        stdout = resp.read_stdout(timeout=cmd_obj.timeout)
-                        outbuf = outbuf + stdout
-            if resp.peek_stderr():
-                stderr = resp.read_stderr(timeout=60)
-            if not done:
-                resp.write_stdin(cmd_obj.cmd)
-                resp.write_stdin("\n")
-                done = True
-            else:
-                break
-        """
-        Couple of glitches in capturing return value.
-        Rest api doesn't return ret value of the command
-        hence this workaround.
-        we can fix this once we have facility to capture err code
-        """
-        if cmd_obj.check_ec:
-            resp.write_stdin("echo $?\n")
-            try:
-                ret = int(resp.readline_stdout(timeout=5))
-            except (ValueError, TypeError):
-                logger.error(f"TimeOut: Command timedout after {cmd_obj.timeout}")
-                raise CommandFailed(f'Failed to run "{cmd_obj.cmd}"')
-            finally:
-                resp.close()
-
-        if outbuf:
-            stdout = outbuf
-
-        return stdout, stderr, ret
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        deadline = time.time() + cmd_obj.timeout
+        try:
+            while resp.is_open():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    logger.error(f"TimeOut: Command timedout after {cmd_obj.timeout}")
+                    raise CommandFailed(f'Failed to run "{cmd_obj.cmd}"')
+                # wakes up as soon as any frame is received
+                resp.update(timeout=remaining)
+                stdout.write(resp.read_channel(STDOUT_CHANNEL))
+                stderr.write(resp.read_channel(STDERR_CHANNEL))
+            ret = get_returncode(resp.read_channel(ERROR_CHANNEL))
+        finally:
+            resp.close()
+        if cmd_obj.check_ec and ret is None:
+            raise CommandFailed(f'Failed to get return code of "{cmd_obj.cmd}"')
+        return stdout.getvalue(), stderr.getvalue(), ret
+
+
+def get_returncode(status):
+    """
+    Parse return code of the command from the status received via error
+    channel of the exec connection
+
+    Args:
+        status (str): Status of the command in yaml (json) format
+
+    Returns:
+        int: Return code of the command, None when the status is missing
+
+    """
+    status = yaml.safe_load(status) if status else None
+    if not status:
+        return None
+    if status.get("status") == "Success":
+        return 0
+    for cause in status.get("details", {}).get("causes", []):
+        if cause.get("reason") == "ExitCode":
+            return int(cause["message"])
+    logger.warning(f"Command failed without exit code: {status.get('message')}")
+    return None
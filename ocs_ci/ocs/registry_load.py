@@ -0,0 +1,311 @@
+"""
+Push/pull load generator for the image registry
+
+Many clients push images with synthetic layers to the registry concurrently
+and pull them back, the push and pull throughput and the latency percentiles
+of the blob and manifest operations are collected. The clients run either in
+threads of the test process (e.g. against the in-process fake registry)::
+
+    with fake_registry() as registry:
+        result = RegistryLoad(registry.url, clients=4).run_local()
+
+or in client pods in the cluster, against the OCS backed OpenShift registry::
+
+    result = RegistryLoad(
+        constants.OPENSHIFT_INTERNAL_REGISTRY_URL, clients=8
+    ).run_in_pods(namespace)
+    log.info(result.summary())
+
+"""
+import json
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources import pod
+from ocs_ci.utility import registry_client, templating
+from ocs_ci.utility.utils import run_cmd
+from ocs_ci.helpers import helpers
+
+log = logging.getLogger(__name__)
+
+# Latency percentiles reported for each kind of the operations
+PERCENTILES = (50, 90, 99)
+# Path of the client script in the client pods
+CLIENT_SCRIPT_PATH = "/tmp/registry_client.py"
+MIB = 1048576
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile
+
+    Args:
+        values (list): The values
+        pct (float): Percentile, 0 - 100
+
+    Returns:
+        float: The percentile of the values, None if there are no values
+
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(int(math.ceil(pct / 100.0 * len(values))), 1)
+    return values[rank - 1]
+
+
+class RegistryLoadResult(object):
+    """
+    Samples of all the clients of the load run
+    """
+
+    def __init__(self, samples):
+        """
+        Initializer function
+
+        Args:
+            samples (list): Samples of the operations, see
+                ocs_ci.utility.registry_client.run_client
+
+        """
+        self.samples = list(samples)
+
+    def select(self, op, kind=None):
+        """
+        Args:
+            op (str): push or pull
+            kind (str): blob or manifest, both when not set
+
+        Returns:
+            list: The passed samples of the operation
+
+        """
+        return [
+            sample
+            for sample in self.samples
+            if sample["op"] == op
+            and (kind is None or sample["kind"] == kind)
+            and not sample["error"]
+        ]
+
+    def errors(self):
+        """
+        Returns:
+            list: The failed samples
+
+        """
+        return [sample for sample in self.samples if sample["error"]]
+
+    def throughput(self, op):
+        """
+        Aggregated throughput of all the clients, the transferred bytes over
+        the wall clock time from the start of the first operation to the end
+        of the last one
+
+        Args:
+            op (str): push or pull
+
+        Returns:
+            float: MiB per second, None if there are no passed operations
+
+        """
+        samples = self.select(op)
+        if not samples:
+            return None
+        start = min(sample["start"] for sample in samples)
+        end = max(sample["start"] + sample["seconds"] for sample in samples)
+        total = sum(sample["bytes"] for sample in samples)
+        return total / MIB / max(end - start, 1e-6)
+
+    def latency(self, op, kind):
+        """
+        Args:
+            op (str): push or pull
+            kind (str): blob or manifest
+
+        Returns:
+            dict: p<N> -> the latency percentile in seconds, for each of
+                PERCENTILES, and max
+
+        """
+        seconds = [sample["seconds"] for sample in self.select(op, kind)]
+        latency = {f"p{pct}": percentile(seconds, pct) for pct in PERCENTILES}
+        latency["max"] = max(seconds) if seconds else None
+        return latency
+
+    def summary(self):
+        """
+        Returns:
+            dict: push and pull -> operations, bytes, throughput (MiB/s) and
+                latency of the blob and manifest operations, errors -> number
+                of the failed operations
+
+        """
+        summary = {"errors": len(self.errors())}
+        for op in ("push", "pull"):
+            samples = self.select(op)
+            summary[op] = {
+                "operations": len(samples),
+                "bytes": sum(sample["bytes"] for sample in samples),
+                "throughput": self.throughput(op),
+                "latency": {
+                    kind: self.latency(op, kind) for kind in ("blob", "manifest")
+                },
+            }
+        return summary
+
+
+class RegistryLoad(object):
+    """
+    Concurrent push/pull load of the registry
+    """
+
+    def __init__(
+        self,
+        url,
+        clients=4,
+        images=10,
+        layers=3,
+        layer_size=MIB,
+        token=None,
+        repo_prefix=None,
+    ):
+        """
+        Initializer function
+
+        Args:
+            url (str): URL of the registry
+            clients (int): Number of the concurrent clients
+            images (int): Number of the images pushed and pulled by each
+                client
+            layers (int): Number of the layers of each image
+            layer_size (int): Size of each layer in bytes
+            token (str): Token for the registry, e.g. 'oc whoami -t'
+            repo_prefix (str): Prefix of the repositories, the namespace of
+                the client pods in run_in_pods, 'registry-load' in run_local
+                by default
+
+        """
+        self.url = url
+        self.clients = clients
+        self.images = images
+        self.layers = layers
+        self.layer_size = layer_size
+        self.token = token
+        self.repo_prefix = repo_prefix
+
+    def run_local(self):
+        """
+        Run the clients in threads of this process
+
+        Returns:
+            RegistryLoadResult: The samples of all the clients
+
+        """
+        log.info(
+            f"Running {self.clients} registry load clients against {self.url}: "
+            f"{self.images} images with {self.layers} layers of "
+            f"{self.layer_size} bytes each"
+        )
+        with ThreadPoolExecutor(max_workers=self.clients) as executor:
+            runs = [
+                executor.submit(
+                    registry_client.run_client,
+                    self.url,
+                    client=client,
+                    images=self.images,
+                    layers=self.layers,
+                    layer_size=self.layer_size,
+                    repo_prefix=self.repo_prefix or "registry-load",
+                    token=self.token,
+                )
+                for client in range(self.clients)
+            ]
+            samples = [sample for run in runs for sample in run.result()]
+        result = RegistryLoadResult(samples)
+        log.info(f"Registry load summary: {result.summary()}")
+        return result
+
+    def _create_clients(self, namespace, pods, image=None):
+        """
+        Create the client pods with the client script
+
+        Args:
+            namespace (str): Namespace of the client pods
+            pods (list): OCS objects of the client pods are appended to it as
+                they are created, so they can be deleted on a failure
+            image (str): Image of the client pods
+
+        """
+        for client in range(self.clients):
+            pod_data = templating.load_yaml(constants.REGISTRY_LOAD_CLIENT_POD_YAML)
+            pod_data["metadata"]["name"] = f"registry-load-client-{client}"
+            pod_data["metadata"]["namespace"] = namespace
+            if image:
+                pod_data["spec"]["containers"][0]["image"] = image
+            pods.append(helpers.create_resource(**pod_data))
+        helpers.wait_for_resources_state(pods, constants.STATUS_RUNNING, timeout=300)
+        script = os.path.abspath(registry_client.__file__)
+        for client_pod in pods:
+            run_cmd(
+                f"oc cp {script} {namespace}/{client_pod.name}:{CLIENT_SCRIPT_PATH}"
+            )
+
+    def _run_client_pod(self, namespace, client_pod, client):
+        """
+        Run the client script in the pod
+
+        Returns:
+            list: Samples of the client
+
+        """
+        command = (
+            f"exec {client_pod.name} -- python3 {CLIENT_SCRIPT_PATH} --url {self.url} "
+            f"--client {client} --images {self.images} --layers {self.layers} "
+            f"--layer-size {self.layer_size} "
+            f"--repo-prefix {self.repo_prefix or namespace}"
+        )
+        secrets = None
+        if self.token:
+            command += f" --token {self.token}"
+            secrets = [self.token]
+        out = OCP(namespace=namespace).exec_oc_cmd(
+            command, out_yaml_format=False, secrets=secrets, timeout=3600
+        )
+        return [json.loads(line) for line in out.splitlines() if line.startswith("{")]
+
+    def run_in_pods(self, namespace, image=None, cleanup=True):
+        """
+        Run each client in its own pod in the cluster, all at once
+
+        Args:
+            namespace (str): Namespace of the client pods
+            image (str): Image of the client pods, needs python3
+            cleanup (bool): True for deleting the client pods at the end
+
+        Returns:
+            RegistryLoadResult: The samples of all the clients
+
+        """
+        if self.token is None:
+            self.token = OCP().exec_oc_cmd("whoami -t", out_yaml_format=False).strip()
+        pods = []
+        try:
+            self._create_clients(namespace, pods, image)
+            log.info(f"Running {self.clients} registry load client pods")
+            with ThreadPoolExecutor(max_workers=self.clients) as executor:
+                runs = [
+                    executor.submit(self._run_client_pod, namespace, client_pod, i)
+                    for i, client_pod in enumerate(pods)
+                ]
+                samples = [sample for run in runs for sample in run.result()]
+        finally:
+            if cleanup and pods:
+                pod.delete_pods(pods, wait=False)
+        result = RegistryLoadResult(samples)
+        log.info(f"Registry load summary: {result.summary()}")
+        return result
@@ -0,0 +1,301 @@
+"""
+Client side control of the requests to the cluster API done via OCP.
+
+Identical read requests (e.g. ``oc get`` or ``ceph status``) which are in
+flight at the same moment, typically issued by a test and monitoring threads,
+are executed only once and all the callers get the same result (single
+flight). Requests are also rate limited via a token bucket per priority class,
+so that the background monitoring threads don't starve the test itself. The
+priority of the requests is set per thread via ``request_priority``::
+
+    def monitor():
+        with request_priority(BACKGROUND):
+            while True:
+                ocp_obj.get()
+                ...
+
+Rate limits are configured in ``RUN['api_rate_limits']``, the foreground
+requests are not limited by default.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from ocs_ci.framework import config
+from ocs_ci.utility.call_stats import positional_args
+
+log = logging.getLogger(__name__)
+
+FOREGROUND = "foreground"
+BACKGROUND = "background"
+# oc verbs which don't change anything on the cluster
+READ_ONLY_VERBS = ("get", "describe", "version", "whoami", "api-resources", "explain")
+# ceph commands which don't change anything on the cluster
+READ_ONLY_CEPH_COMMANDS = (
+    "status",
+    "health",
+    "df",
+    "versions",
+    "quorum_status",
+    "osd tree",
+    "osd df",
+    "osd stat",
+    "osd dump",
+    "pg stat",
+    "pg dump",
+    "mon stat",
+    "mon dump",
+    "fs ls",
+    "fs status",
+)
+
+_local = threading.local()
+_layer = None
+_layer_lock = threading.Lock()
+
+
+@contextmanager
+def request_priority(priority):
+    """
+    Set priority of the requests done by the current thread in the context
+
+    Args:
+        priority (str): Priority class, e.g. FOREGROUND or BACKGROUND
+
+    """
+    previous = get_request_priority()
+    _local.priority = priority
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def get_request_priority():
+    """
+    Returns:
+        str: Priority class of the requests done by the current thread
+
+    """
+    return getattr(_local, "priority", FOREGROUND)
+
+
+def is_read_only(cmd):
+    """
+    Check whether the oc command only reads from the cluster
+
+    Args:
+        cmd (str): oc command, e.g. 'oc -n ns get pod'
+
+    Returns:
+        bool: True if the command doesn't change anything on the cluster
+
+    """
+    positional = positional_args(cmd.split()[1:])
+    if not positional:
+        return False
+    if positional[0] in READ_ONLY_VERBS:
+        return True
+    if positional[0] in ("rsh", "exec") and positional[2:3] == ["ceph"]:
+        ceph_command = " ".join(positional[3:5])
+        return any(
+            ceph_command == command or ceph_command.startswith(f"{command} ")
+            for command in READ_ONLY_CEPH_COMMANDS
+        )
+    return False
+
+
+class TokenBucket(object):
+    """
+    Token bucket rate limiter
+    """
+
+    def __init__(self, rate, burst):
+        """
+        Initializer function
+
+        Args:
+            rate (float): Number of tokens added per second
+            burst (int): Max. number of tokens in the bucket
+
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take a token from the bucket, wait for it if the bucket is empty.
+        Tokens are reserved in the order of the calls.
+
+        Returns:
+            float: Number of seconds spent waiting for the token
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class _Call(object):
+    """
+    Request in flight, shared by all the callers
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class RequestLayer(object):
+    """
+    Coalescing of identical read requests and rate limiting per priority
+    """
+
+    def __init__(self, rate_limits=None):
+        """
+        Initializer function
+
+        Args:
+            rate_limits (dict): priority -> dict with rate (requests per
+                second) and burst, priorities without limits are unlimited
+
+        """
+        self.buckets = {
+            priority: TokenBucket(limit["rate"], limit["burst"])
+            for priority, limit in (rate_limits or {}).items()
+            if limit
+        }
+        self.stats = Counter()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def execute(self, func, cmd, **kwargs):
+        """
+        Execute the request
+
+        Args:
+            func (function): Function executing the request, called with the
+                command and the keyword arguments
+            cmd (str): oc command of the request, used to find out whether it
+                can be coalesced with another request
+            **kwargs: Keyword arguments of the function, requests with
+                other kwargs than secrets, timeout and ignore_error are not
+                coalesced
+
+        Returns:
+            any: Result of the function
+
+        """
+        key = None
+        if set(kwargs) <= {"secrets", "timeout", "ignore_error"} and is_read_only(cmd):
+            key = (cmd, kwargs.get("ignore_error"))
+        else:
+            # reads of this thread mustn't get results of requests started
+            # before this change
+            _local.last_write = time.monotonic()
+        with self._lock:
+            self.stats["calls"] += 1
+            call = self._join(key)
+        if not call:
+            # the request is registered only once it passed the throttling,
+            # callers never join a request waiting for its token
+            self.throttle()
+            if key:
+                with self._lock:
+                    call = self._join(key)
+                    if call:
+                        pass
+                    elif key in self._in_flight:
+                        # a request started before the last write is in
+                        # flight, this one runs on its own
+                        key = None
+                    else:
+                        self._in_flight[key] = _Call()
+        if call:
+            log.debug(f"Waiting for the same request in flight: {cmd}")
+            call.done.wait()
+            if call.exception:
+                raise call.exception
+            return call.result
+        if not key:
+            return func(cmd, **kwargs)
+        call = self._in_flight[key]
+        try:
+            call.result = func(cmd, **kwargs)
+            return call.result
+        except Exception as ex:
+            call.exception = ex
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def _join(self, key):
+        """
+        Get the same request in flight, the lock has to be held
+
+        Returns:
+            _Call: The request to wait for, None if there is no such request
+                or it started before the last write of this thread
+
+        """
+        call = self._in_flight.get(key) if key else None
+        if call and call.started < getattr(_local, "last_write", 0):
+            return None
+        if call:
+            self.stats["coalesced"] += 1
+        return call
+
+    def throttle(self):
+        """
+        Wait for a token of the priority of this thread, used by execute and
+        by the requests which don't go through it (e.g. REST API calls)
+
+        """
+        priority = get_request_priority()
+        bucket = self.buckets.get(priority)
+        if not bucket:
+            return
+        waited = bucket.acquire()
+        if waited:
+            with self._lock:
+                self.stats[f"throttled_{priority}"] += 1
+                self.stats[f"throttled_{priority}_seconds"] += waited
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Counters of all, coalesced and throttled requests
+
+        """
+        with self._lock:
+            return dict(self.stats)
+
+
+def get_request_layer():
+    """
+    Returns:
+        RequestLayer: The request layer shared by all OCP objects
+
+    """
+    global _layer
+    with _layer_lock:
+        if _layer is None:
+            _layer = RequestLayer(config.RUN.get("api_rate_limits"))
+        return _layer
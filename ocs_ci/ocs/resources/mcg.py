@@ -22,7 +22,7 @@ from ocs_ci.ocs.resources import pod
 from ocs_ci.ocs.resources.pod import cal_md5sum
 from ocs_ci.ocs.resources.pod import get_pods_having_label, Pod
 from ocs_ci.ocs.resources.ocs import check_if_cluster_was_upgraded
-from ocs_ci.utility import templating
+from ocs_ci.utility import call_stats, templating
 from ocs_ci.utility.utils import TimeoutSampler, exec_cmd
 from ocs_ci.helpers.helpers import (
     create_unique_resource_name,
@@ -141,6 +141,7 @@ class MCG:
         )
 
         self.s3_client = self.s3_resource.meta.client
+        call_stats.instrument_boto3_client(self.s3_client)
 
         if config.ENV_DATA["platform"].lower() == "aws" and kwargs.get(
             "create_aws_creds"
@@ -157,6 +158,9 @@ class MCG:
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_access_key,
             )
+            call_stats.instrument_boto3_client(
+                self.aws_s3_resource.meta.client, component="aws-s3"
+            )
 
         if (
             config.ENV_DATA["platform"].lower() in constants.CLOUD_PLATFORMS
@@ -376,11 +380,12 @@ class MCG:
             "params": params,
             "auth_token": self.noobaa_token,
         }
-        return requests.post(
-            url=self.mgmt_endpoint,
-            data=json.dumps(payload),
-            verify=retrieve_verification_mode(),
-        )
+        with call_stats.timed("mcg-rpc", api, method, f"{api}.{method}"):
+            return requests.post(
+                url=self.mgmt_endpoint,
+                data=json.dumps(payload),
+                verify=retrieve_verification_mode(),
+            )
 
     def check_data_reduction(self, bucketname, expected_reduction_in_bytes):
         """
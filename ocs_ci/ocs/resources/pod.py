@@ -10,6 +10,7 @@ import yaml
 import tempfile
 import time
 import calendar
+import threading
 from threading import Thread
 import base64
 
@@ -33,6 +34,10 @@ from ocs_ci.utility.utils import check_if_executable_in_path
 from ocs_ci.utility.retry import retry
 
 logger = logging.getLogger(__name__)
+
+# Last resolved Ceph tools pod per namespace, see get_ceph_tools_pod
+_ceph_tools_pods = {}
+_ceph_tools_pod_lock = threading.Lock()
 FIO_TIMEOUT = 600
 
 TEXT_CONTENT = (
@@ -503,37 +508,76 @@ def get_all_pods(
     return pod_objs
 
 
-def get_ceph_tools_pod():
+def is_pod_running(pod_data):
     """
-    Get the Ceph tools pod
+    Check the pod is Running, the same way as the STATUS column of 'oc get'
+    does - all the containers are running and the pod is not terminating
+
+    Args:
+        pod_data (dict): The pod data as returned by 'oc get -o yaml'
 
     Returns:
-        Pod object: The Ceph tools pod object
+        bool: True if the pod is running, False otherwise
+
     """
-    ocp_pod_obj = OCP(
-        kind=constants.POD, namespace=config.ENV_DATA["cluster_namespace"]
+    if pod_data.get("metadata", {}).get("deletionTimestamp"):
+        return False
+    status = pod_data.get("status", {})
+    if status.get("phase") != constants.STATUS_RUNNING:
+        return False
+    return all(
+        "running" in container.get("state", {})
+        for container in status.get("containerStatuses", [])
     )
-    ct_pod_items = ocp_pod_obj.get(selector="app=rook-ceph-tools")["items"]
-    if not ct_pod_items:
-        # setup ceph_toolbox pod if the cluster has been setup by some other CI
-        setup_ceph_toolbox()
-        ct_pod_items = ocp_pod_obj.get(selector="app=rook-ceph-tools")["items"]
 
-    assert ct_pod_items, "No Ceph tools pod found"
 
-    # In the case of node failure, the CT pod will be recreated with the old
-    # one in status Terminated. Therefore, need to filter out the Terminated pod
-    running_ct_pods = list()
-    for pod in ct_pod_items:
-        if (
-            ocp_pod_obj.get_resource_status(pod.get("metadata").get("name"))
-            == constants.STATUS_RUNNING
-        ):
-            running_ct_pods.append(pod)
+def get_ceph_tools_pod(skip_cache=False):
+    """
+    Get the Ceph tools pod
+
+    The last resolved pod is reused as long as it is still running, which
+    is checked by a single 'oc get' of the pod. When it is gone (e.g. after
+    a node failure or a respin of the pod) the running tools pod is looked
+    up again.
+
+    Args:
+        skip_cache (bool): True for looking up the tools pod regardless of
+            the last resolved one
+
+    Returns:
+        Pod object: The Ceph tools pod object
+    """
+    namespace = config.ENV_DATA["cluster_namespace"]
+    ocp_pod_obj = OCP(kind=constants.POD, namespace=namespace)
+    with _ceph_tools_pod_lock:
+        ceph_pod = _ceph_tools_pods.get(namespace)
+        if ceph_pod and not skip_cache:
+            try:
+                if is_pod_running(ocp_pod_obj.get(resource_name=ceph_pod.name)):
+                    return ceph_pod
+            except CommandFailed as ex:
+                logger.info(f"Ceph tools pod {ceph_pod.name} is gone: {ex}")
+            logger.info("Looking up the running Ceph tools pod again")
+        _ceph_tools_pods.pop(namespace, None)
 
-    assert running_ct_pods, "No running Ceph tools pod found"
-    ceph_pod = Pod(**running_ct_pods[0])
-    return ceph_pod
+        ct_pod_items = ocp_pod_obj.get(selector="app=rook-ceph-tools")["items"]
+        if not ct_pod_items:
+            # setup ceph_toolbox pod if the cluster has been setup by some
+            # other CI
+            setup_ceph_toolbox()
+            ct_pod_items = ocp_pod_obj.get(selector="app=rook-ceph-tools")["items"]
+
+        assert ct_pod_items, "No Ceph tools pod found"
+
+        # In the case of node failure, the CT pod will be recreated with the
+        # old one in status Terminated. Therefore, need to filter out the
+        # Terminated pod
+        running_ct_pods = [pod for pod in ct_pod_items if is_pod_running(pod)]
+
+        assert running_ct_pods, "No running Ceph tools pod found"
+        ceph_pod = Pod(**running_ct_pods[0])
+        _ceph_tools_pods[namespace] = ceph_pod
+        return ceph_pod
 
 
 def get_csi_provisioner_pod(interface):
@@ -1,9 +1,13 @@
 import logging
+import os
+import tempfile
 import threading
 import random
 import time
+import uuid
+
+import yaml
 
-from ocs_ci.helpers import helpers
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.framework import config
 from ocs_ci.utility import templating, utils
@@ -15,10 +19,26 @@ from ocs_ci.ocs.exceptions import (
     UnexpectedBehaviour,
     CephHealthException,
     UnsupportedPlatformError,
+    ResourceWrongStatusException,
+    TimeoutExpiredError,
 )
+from ocs_ci.helpers import helpers
 
 logger = logging.getLogger(__name__)
 
+# Number of objects applied by a single request of BulkApply
+BULK_CHUNK_SIZE = 500
+# State in which the objects created by BulkApply are ready, by kind, see
+# helpers.get_resource_state
+BULK_READY_STATES = {
+    constants.PVC: constants.STATUS_BOUND,
+    constants.POD: constants.STATUS_RUNNING,
+    "ObjectBucketClaim": constants.STATUS_BOUND,
+    constants.VOLUMESNAPSHOT: "true",
+}
+# Label used by BulkApply to list all the objects of the bulk at once
+BULK_LABEL = "ocs-ci/bulk"
+
 
 class FioPodScale(object):
     """
@@ -922,6 +942,171 @@ def construct_pvc_clone_yaml_bulk_for_kube_job(pvc_dict_list, clone_yaml, sc_nam
     return pvc_clone_dict_list
 
 
+class BulkApply(object):
+    """
+    Creation of many resources at once with tracking of their readiness
+
+    The resources are applied by chunks, each chunk is a single List
+    manifest applied by one request. All the resources are labeled with a
+    label of the bulk, so the readiness of all the resources of a kind in a
+    namespace is checked by a single listing per poll::
+
+        bulk = BulkApply(pvc_dict_list, namespace)
+        bulk.apply()
+        timing = bulk.wait_for_ready(timeout=600)
+
+    """
+
+    def __init__(self, resource_dicts, namespace=None, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Initializer function
+
+        Args:
+            resource_dicts (list): The resource dicts (e.g. of
+                construct_pvc_creation_yaml_bulk_for_kube_job), they are
+                updated with the bulk label and the namespace
+            namespace (str): Namespace of the resources without namespace in
+                their metadata
+            chunk_size (int): Number of resources applied by a single request
+
+        """
+        self.bulk_id = uuid.uuid4().hex[:12]
+        self.chunk_size = chunk_size
+        self.resources = resource_dicts
+        self.submitted = {}
+        for resource in self.resources:
+            metadata = resource.setdefault("metadata", {})
+            if namespace:
+                metadata.setdefault("namespace", namespace)
+            metadata.setdefault("labels", {})[BULK_LABEL] = self.bulk_id
+
+    @staticmethod
+    def _key(resource):
+        metadata = resource["metadata"]
+        return resource["kind"], metadata.get("namespace"), metadata["name"]
+
+    def chunks(self):
+        """
+        Returns:
+            list: List manifests (dicts) of the chunks of the resources
+
+        """
+        return [
+            {
+                "apiVersion": "v1",
+                "kind": "List",
+                "items": self.resources[i : i + self.chunk_size],
+            }
+            for i in range(0, len(self.resources), self.chunk_size)
+        ]
+
+    def apply(self, server_side=True):
+        """
+        Apply all the resources, one request per chunk
+
+        Args:
+            server_side (bool): True for server side apply, False for client
+                side apply (e.g. for older clusters)
+
+        """
+        command = "apply --server-side" if server_side else "apply"
+        logger.info(
+            f"Applying {len(self.resources)} resources of bulk {self.bulk_id} "
+            f"by chunks of {self.chunk_size}"
+        )
+        for chunk in self.chunks():
+            with tempfile.NamedTemporaryFile(
+                mode="w+", prefix="bulk_", suffix=".yaml", delete=False
+            ) as chunk_file:
+                yaml.safe_dump(chunk, chunk_file)
+            try:
+                submitted_at = time.time()
+                OCP().exec_oc_cmd(
+                    f"{command} -f {chunk_file.name}", out_yaml_format=False
+                )
+            finally:
+                os.remove(chunk_file.name)
+            for resource in chunk["items"]:
+                self.submitted[self._key(resource)] = submitted_at
+
+    def get_ready(self, ready_states=None):
+        """
+        Check which of the resources are ready, by a single listing of the
+        resources of the bulk per kind and namespace
+
+        Args:
+            ready_states (dict): Kind -> ready state, see BULK_READY_STATES
+
+        Returns:
+            set: Keys (kind, namespace, name) of the ready resources
+
+        """
+        ready_states = ready_states or BULK_READY_STATES
+        ready = set()
+        for kind, namespace in {key[:2] for key in self.submitted}:
+            items = OCP(kind=kind, namespace=namespace).get(
+                selector=f"{BULK_LABEL}={self.bulk_id}"
+            )["items"]
+            for item in items:
+                item.setdefault("kind", kind)
+                if helpers.get_resource_state(item) == ready_states.get(kind):
+                    ready.add((kind, namespace, item["metadata"]["name"]))
+        return ready
+
+    def wait_for_ready(self, timeout=600, sleep=3, ready_states=None):
+        """
+        Wait until all the applied resources are ready
+
+        Args:
+            timeout (int): Time in seconds to wait
+            sleep (int): Time in seconds between the polls
+            ready_states (dict): Kind -> ready state, see BULK_READY_STATES
+
+        Returns:
+            dict: (kind, namespace, name) of the resource -> dict with the
+                time (epoch) the resource was 'submitted' and was first seen
+                'ready' and the 'elapsed' seconds in between
+
+        Raises:
+            ResourceWrongStatusException: In case some of the resources
+                haven't got ready in time
+
+        """
+        ready_times = {}
+
+        def check_ready():
+            now = time.time()
+            for key in self.get_ready(ready_states):
+                ready_times.setdefault(key, now)
+            return len(ready_times) == len(self.submitted)
+
+        logger.info(
+            f"Waiting for {len(self.submitted)} resources of bulk "
+            f"{self.bulk_id} to get ready"
+        )
+        try:
+            for done in utils.TimeoutSampler(timeout, sleep, check_ready):
+                if done:
+                    break
+        except TimeoutExpiredError:
+            not_ready = sorted(set(self.submitted).difference(ready_times))
+            logger.error(f"{len(not_ready)} resources are not ready: {not_ready}")
+            raise ResourceWrongStatusException(
+                [key[2] for key in not_ready],
+                f"{len(not_ready)} of {len(self.submitted)} resources of bulk "
+                f"{self.bulk_id} haven't got ready in {timeout} seconds",
+            )
+        logger.info(f"All resources of bulk {self.bulk_id} are ready")
+        return {
+            key: {
+                "submitted": self.submitted[key],
+                "ready": ready_times[key],
+                "elapsed": ready_times[key] - self.submitted[key],
+            }
+            for key in self.submitted
+        }
+
+
 def check_all_pvc_reached_bound_state_in_kube_job(
     kube_job_obj, namespace, no_of_pvc, timeout=30
 ):
@@ -932,49 +1117,47 @@ def check_all_pvc_reached_bound_state_in_kube_job(
         kube_job_obj (obj): Kube Job Object
         namespace (str): Namespace of PVC's created
         no_of_pvc (int): Bulk PVC count
-        timeout: a timeout for all the pvc in kube job to reach bound status
+        timeout: the PVCs are checked until all of them are Bound, for at most
+            timeout*10 seconds
 
     Returns:
         pvc_bound_list (list): List of all PVCs which is in Bound state.
 
+    Raises:
+        UnexpectedBehaviour: In case the PVCs of the kube job couldn't be
+            listed at all
+
     Asserts:
         If not all PVC reached to Bound state.
 
     """
-    # Check all the PVC reached Bound state
-    pvc_bound_list, pvc_not_bound_list = ([] for i in range(2))
-    while_iteration_count = 0
-    while True:
+    pvc_not_bound_list = []
+    job_get_output = None
+
+    def get_pvc_not_bound():
         # Get kube_job obj and fetch either all PVC's are in Bound state
-        # If not bound adding those PVCs to pvc_not_bound_list
         job_get_output = kube_job_obj.get(namespace=namespace)
-        for i in range(no_of_pvc):
-            status = job_get_output["items"][i]["status"]["phase"]
-            logging.info(
-                f"pvc {job_get_output['items'][i]['metadata']['name']} status {status}"
-            )
-            if status != "Bound":
-                pvc_not_bound_list.append(
-                    job_get_output["items"][i]["metadata"]["name"]
-                )
-
-        # Check the length of pvc_not_bound_list to decide either all PVCs reached Bound state
-        # If not then wait for timeout secs and re-iterate while loop
-        if len(pvc_not_bound_list):
-            time.sleep(timeout)
-            while_iteration_count += 1
-            # Breaking while loop after 10 Iteration i.e. after timeout*10 secs of wait_time
-            # And if PVCs still not in bound state then there will be assert.
-            if while_iteration_count >= 10:
-                assert logging.error(
-                    f" Listed PVCs took more than {timeout*10} secs to bound {pvc_not_bound_list}"
-                )
+        pvc_not_bound_list[:] = [
+            item["metadata"]["name"]
+            for item in job_get_output["items"][:no_of_pvc]
+            if item["status"]["phase"] != constants.STATUS_BOUND
+        ]
+        return job_get_output
+
+    try:
+        for job_get_output in utils.TimeoutSampler(timeout * 10, 3, get_pvc_not_bound):
+            if not pvc_not_bound_list:
                 break
-            pvc_not_bound_list.clear()
-            continue
-        elif not len(pvc_not_bound_list):
-            for i in range(no_of_pvc):
-                pvc_bound_list.append(job_get_output["items"][i]["metadata"]["name"])
-            logging.info("All PVCs in Bound state")
-            break
-    return pvc_bound_list
+            logger.info(f"{len(pvc_not_bound_list)} PVCs are not Bound yet")
+    except TimeoutExpiredError:
+        if job_get_output is None:
+            raise UnexpectedBehaviour(
+                f"Failed to list the PVCs of the kube job in {timeout*10} secs, "
+                f"see the exceptions logged above"
+            )
+        assert not pvc_not_bound_list, (
+            f"Listed PVCs took more than {timeout*10} secs to bound "
+            f"{pvc_not_bound_list}"
+        )
+    logger.info("All PVCs in Bound state")
+    return [item["metadata"]["name"] for item in job_get_output["items"][:no_of_pvc]]
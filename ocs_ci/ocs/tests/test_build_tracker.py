@@ -0,0 +1,130 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs.build_tracker import (
+    BuildTracker,
+    format_duration,
+    parse_timestamp,
+)
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+
+
+def build(project, number, phase, start=None, end=None):
+    status = {"phase": phase}
+    if start is not None:
+        status["startTimestamp"] = f"2020-11-01T10:{start:02d}:00Z"
+    if end is not None:
+        status["completionTimestamp"] = f"2020-11-01T10:{end:02d}:30Z"
+    return {
+        "metadata": {
+            "name": f"jax-rs-build-{number}",
+            "namespace": project,
+            "creationTimestamp": "2020-11-01T10:00:00Z",
+        },
+        "status": status,
+    }
+
+
+def jenkins_pod(project, node):
+    return {
+        "metadata": {"name": "jenkins-1-abcde", "namespace": project},
+        "spec": {"nodeName": node},
+    }
+
+
+class FakeCluster(object):
+    """
+    Returns the next list of the builds for each cycle, the last one is kept
+    """
+
+    def __init__(self, snapshots, pods=()):
+        self.snapshots = snapshots
+        self.pods = list(pods)
+        self.calls = 0
+
+    def list_builds(self):
+        self.calls += 1
+        return self.snapshots[min(self.calls, len(self.snapshots)) - 1]
+
+
+@pytest.fixture
+def make_tracker(monkeypatch):
+    def make(snapshots, pods=(), **kwargs):
+        cluster = FakeCluster(snapshots, pods)
+        monkeypatch.setattr(
+            BuildTracker, "_list_builds", lambda self: cluster.list_builds()
+        )
+        monkeypatch.setattr(
+            BuildTracker, "_list_pods", lambda self, selector: cluster.pods
+        )
+        kwargs.setdefault("sleep", 0)
+        tracker = BuildTracker(["myjenkins-1", "myjenkins-2"], **kwargs)
+        return tracker, cluster
+
+    return make
+
+
+def test_parse_and_format():
+    assert parse_timestamp("1970-01-01T00:02:30Z") == 150
+    assert parse_timestamp(None) is None
+    assert format_duration(150.4) == "2m30s"
+    assert format_duration(42) == "42s"
+
+
+def test_wait_all_projects(make_tracker):
+    snapshots = [
+        [
+            build("myjenkins-1", 1, "Running", start=1),
+            build("myjenkins-1", 2, "New"),
+            build("other", 1, "Running", start=1),
+        ],
+        [
+            build("myjenkins-1", 1, "Complete", start=1, end=3),
+            build("myjenkins-1", 2, "Running", start=3),
+            build("myjenkins-2", 1, "Running", start=2),
+        ],
+        [
+            build("myjenkins-1", 1, "Complete", start=1, end=3),
+            build("myjenkins-1", 2, "Complete", start=3, end=4),
+            build("myjenkins-2", 1, "Complete", start=2, end=6),
+            build("myjenkins-2", 2, "Complete", start=4, end=5),
+        ],
+    ]
+    pods = [jenkins_pod("myjenkins-1", "worker-0"), jenkins_pod("myjenkins-2", "w-1")]
+    tracker, cluster = make_tracker(snapshots, pods, builds_per_project=2)
+    completed = tracker.wait()
+    # one list of the builds per cycle for all the projects
+    assert cluster.calls == 3
+    assert [(r.namespace, r.name) for r in completed] == [
+        ("myjenkins-1", "jax-rs-build-1"),
+        ("myjenkins-1", "jax-rs-build-2"),
+        ("myjenkins-2", "jax-rs-build-1"),
+        ("myjenkins-2", "jax-rs-build-2"),
+    ]
+    # durations from the timestamps, not from the polling
+    assert [r.duration for r in completed] == [150, 90, 270, 90]
+    assert completed[0].queued == 60
+    distribution = tracker.node_distribution()
+    assert distribution["worker-0"]["builds"] == 2
+    assert distribution["worker-0"]["median"] == 120
+    assert distribution["w-1"]["max"] == 270
+
+
+def test_failed_build(make_tracker):
+    snapshots = [
+        [
+            build("myjenkins-1", 1, "Failed", start=1, end=2),
+            build("myjenkins-2", 1, "Running", start=1),
+        ]
+    ]
+    tracker, _ = make_tracker(snapshots)
+    with pytest.raises(UnexpectedBehaviour, match="myjenkins-1/jax-rs-build-1"):
+        tracker.wait()
+
+
+def test_no_progress_timeout(make_tracker):
+    snapshots = [[build("myjenkins-1", 1, "Complete", start=1, end=2)]]
+    tracker, _ = make_tracker(snapshots, timeout=-1)
+    with pytest.raises(UnexpectedBehaviour, match="myjenkins-2"):
+        tracker.wait()
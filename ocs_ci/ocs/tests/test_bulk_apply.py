@@ -0,0 +1,143 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import constants, fake_apiserver
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    ResourceWrongStatusException,
+    UnexpectedBehaviour,
+)
+from ocs_ci.ocs.scale_lib import (
+    BULK_LABEL,
+    BulkApply,
+    check_all_pvc_reached_bound_state_in_kube_job,
+)
+from ocs_ci.utility import utils
+from ocs_ci.helpers import helpers
+
+
+def pvc_dict(name):
+    return {
+        "apiVersion": "v1",
+        "kind": constants.PVC,
+        "metadata": {"name": name},
+        "spec": {
+            "accessModes": [constants.ACCESS_MODE_RWO],
+            "resources": {"requests": {"storage": "1Gi"}},
+            "storageClassName": "ocs-storagecluster-ceph-rbd",
+        },
+    }
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """
+    Fake API server serving all oc commands of the test, the commands are
+    recorded in server.commands.
+    """
+    kubeconfig = tmp_path / "kubeconfig"
+    kubeconfig.write_text("")
+    monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+    commands = []
+
+    def record(cmd, timeout, **kwargs):
+        commands.append(cmd[1:3])
+
+    with fake_apiserver.fake_api_server(pvc_bind_delay=0.2) as server:
+        utils.command_handlers.insert(0, record)
+        server.commands = commands
+        try:
+            yield server
+        finally:
+            utils.command_handlers.remove(record)
+
+
+def test_bulk_apply(server):
+    bulk = BulkApply(
+        [pvc_dict(f"pvc-{i}") for i in range(50)], namespace="default", chunk_size=20
+    )
+    bulk.apply()
+    timing = bulk.wait_for_ready(timeout=10, sleep=0.1)
+    assert sorted(timing) == sorted(
+        (constants.PVC, "default", f"pvc-{i}") for i in range(50)
+    )
+    for pvc_timing in timing.values():
+        assert pvc_timing["elapsed"] >= 0.2
+        assert pvc_timing["ready"] - pvc_timing["submitted"] == pvc_timing["elapsed"]
+    pvc = server.get(constants.PVC, "pvc-0", "default")
+    assert pvc["metadata"]["labels"][BULK_LABEL] == bulk.bulk_id
+    applies = [cmd for cmd in server.commands if cmd[0] == "apply"]
+    assert applies == [["apply", "--server-side"]] * 3
+    assert len(server.commands) - len(applies) < 10
+
+
+def test_bulk_apply_not_ready(server):
+    bulk = BulkApply([pvc_dict("pvc-a")], namespace="default")
+    bulk.apply(server_side=False)
+    with pytest.raises(ResourceWrongStatusException):
+        bulk.wait_for_ready(
+            timeout=0.5, sleep=0.1, ready_states={constants.PVC: "Lost"}
+        )
+
+
+def test_bulk_apply_same_name_of_kinds(server):
+    pod = {
+        "apiVersion": "v1",
+        "kind": constants.POD,
+        "metadata": {"name": "app"},
+        "spec": {"containers": [{"name": "app", "image": "busybox"}]},
+    }
+    bulk = BulkApply([pvc_dict("app"), pod], namespace="default")
+    bulk.apply()
+    timing = bulk.wait_for_ready(timeout=10, sleep=0.1)
+    assert sorted(timing) == [
+        (constants.PVC, "default", "app"),
+        (constants.POD, "default", "app"),
+    ]
+
+
+def test_wait_for_resources_same_name_in_namespaces(server):
+    class Resource(object):
+        kind = constants.PVC
+
+        def __init__(self, name, namespace):
+            self.name = name
+            self.namespace = namespace
+
+        def describe(self):
+            return ""
+
+    pvcs = [Resource("pvc-a", "first"), Resource("pvc-a", "second")]
+    for pvc in pvcs:
+        server.create(
+            {
+                "apiVersion": "v1",
+                "kind": constants.NAMESPACE,
+                "metadata": {"name": pvc.namespace},
+            }
+        )
+        server.create(
+            dict(
+                pvc_dict(pvc.name),
+                metadata={"name": pvc.name, "namespace": pvc.namespace},
+            )
+        )
+    ready_times = helpers.wait_for_resources_state(
+        pvcs, constants.STATUS_BOUND, timeout=10, sleep=0.1
+    )
+    assert sorted(ready_times) == [
+        (constants.PVC, "first", "pvc-a"),
+        (constants.PVC, "second", "pvc-a"),
+    ]
+
+
+def test_kube_job_pvcs_never_listed():
+    class FailingKubeJob(object):
+        def get(self, namespace=None):
+            raise CommandFailed("the server is currently unable to handle the request")
+
+    with pytest.raises(UnexpectedBehaviour, match="Failed to list the PVCs"):
+        check_all_pvc_reached_bound_state_in_kube_job(
+            FailingKubeJob(), "default", no_of_pvc=1, timeout=0
+        )
@@ -0,0 +1,85 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources import pod
+
+
+def tools_pod(name, phase=constants.STATUS_RUNNING, terminating=False):
+    metadata = {
+        "name": name,
+        "namespace": "openshift-storage",
+        "labels": {"app": "rook-ceph-tools"},
+    }
+    if terminating:
+        metadata["deletionTimestamp"] = "2021-03-01T10:00:00Z"
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": metadata,
+        "status": {
+            "phase": phase,
+            "containerStatuses": [{"state": {"running": {}}}],
+        },
+    }
+
+
+class FakePods(object):
+    """
+    Tools pods of the fake cluster with counting of the 'oc get' calls.
+    """
+
+    def __init__(self, pods):
+        self.pods = pods
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        return self
+
+    def get(self, resource_name="", selector=None, **kwargs):
+        self.calls.append(resource_name or selector)
+        if selector:
+            return {"items": list(self.pods.values())}
+        if resource_name not in self.pods:
+            raise CommandFailed(f'pods "{resource_name}" not found')
+        return self.pods[resource_name]
+
+
+@pytest.fixture
+def pods(monkeypatch):
+    fake_pods = FakePods(
+        {
+            "tools-old": tools_pod("tools-old", terminating=True),
+            "tools-a": tools_pod("tools-a"),
+        }
+    )
+    monkeypatch.setattr(pod, "OCP", fake_pods)
+    monkeypatch.setattr(pod, "_ceph_tools_pods", {})
+    monkeypatch.setitem(pod.config.ENV_DATA, "cluster_namespace", "openshift-storage")
+    return fake_pods
+
+
+def test_is_pod_running():
+    assert pod.is_pod_running(tools_pod("a"))
+    assert not pod.is_pod_running(tools_pod("a", terminating=True))
+    assert not pod.is_pod_running(tools_pod("a", phase="Pending"))
+    waiting = tools_pod("a")
+    waiting["status"]["containerStatuses"] = [{"state": {"waiting": {}}}]
+    assert not pod.is_pod_running(waiting)
+
+
+def test_tools_pod_is_cached(pods):
+    ceph_pod = pod.get_ceph_tools_pod()
+    assert ceph_pod.name == "tools-a"
+    assert pod.get_ceph_tools_pod() is ceph_pod
+    assert pods.calls == ["app=rook-ceph-tools", "tools-a"]
+
+
+def test_tools_pod_is_resolved_again(pods):
+    assert pod.get_ceph_tools_pod().name == "tools-a"
+    del pods.pods["tools-a"]
+    pods.pods["tools-b"] = tools_pod("tools-b")
+    assert pod.get_ceph_tools_pod().name == "tools-b"
+    assert pods.calls == ["app=rook-ceph-tools", "tools-a", "app=rook-ceph-tools"]
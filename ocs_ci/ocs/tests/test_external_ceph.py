@@ -0,0 +1,69 @@
+# -*- coding: utf8 -*-
+
+import io
+import json
+from collections import Counter
+
+from ocs_ci.ocs.external_ceph import Ceph
+
+
+OSD_METADATA = [
+    {
+        "id": osd_id,
+        "hostname": f"ceph-osd-{osd_id}",
+        "osd_objectstore": "bluestore",
+        "bluefs_db_dev_node": f"vd{chr(ord('b') + osd_id)}",
+        "osd_data": f"/var/lib/ceph/osd/ceph-{osd_id}",
+    }
+    for osd_id in range(3)
+]
+
+
+class FakeClient(object):
+    """
+    Client object answering ceph metadata commands, counts the commands.
+    """
+
+    def __init__(self):
+        self.metadata = {"osd": list(OSD_METADATA), "mon": [{"name": "a"}]}
+        self.commands = Counter()
+
+    def exec_command(self, cmd, **kwargs):
+        self.commands[cmd] += 1
+        role = cmd.split()[2]
+        return io.BytesIO(json.dumps(self.metadata[role]).encode()), io.BytesIO()
+
+
+def test_osd_lookups_from_cache():
+    client = FakeClient()
+    ceph = Ceph(node_list=[])
+    for osd_id in range(3):
+        assert ceph.get_osd_metadata(osd_id, client)["hostname"] == f"ceph-osd-{osd_id}"
+        assert (
+            ceph.get_osd_device(osd_id, client)
+            == OSD_METADATA[osd_id]["bluefs_db_dev_node"]
+        )
+    assert client.commands == {"sudo ceph osd metadata -f json-pretty": 1}
+
+
+def test_new_osd_refreshes_cache():
+    client = FakeClient()
+    ceph = Ceph(node_list=[])
+    assert ceph.get_osd_metadata(0, client)
+    client.metadata["osd"].append(dict(OSD_METADATA[0], id=3))
+    assert ceph.get_osd_metadata(3, client)["id"] == 3
+    assert ceph.get_osd_metadata(4, client) is None
+    assert client.commands["sudo ceph osd metadata -f json-pretty"] == 3
+
+
+def test_load_and_invalidate_metadata():
+    client = FakeClient()
+    ceph = Ceph(node_list=[])
+    metadata = ceph.load_metadata(roles=("osd", "mon"), client=client)
+    assert metadata == {"osd": OSD_METADATA, "mon": [{"name": "a"}]}
+    ceph.get_metadata_list("mon", client)
+    assert sum(client.commands.values()) == 2
+    ceph.invalidate_metadata("mon")
+    ceph.get_metadata_list("mon", client)
+    ceph.get_metadata_list("osd", client)
+    assert sum(client.commands.values()) == 3
@@ -0,0 +1,109 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import constants, fake_apiserver
+from ocs_ci.ocs.exceptions import APIServerError, CommandFailed
+from ocs_ci.ocs.ocp import OCP
+
+
+PVC_DATA = {
+    "apiVersion": "v1",
+    "kind": constants.PVC,
+    "metadata": {"name": "pvc-test", "namespace": "default"},
+    "spec": {
+        "accessModes": [constants.ACCESS_MODE_RWO],
+        "resources": {"requests": {"storage": "1Gi"}},
+        "storageClassName": "ocs-storagecluster-ceph-rbd",
+    },
+}
+
+POD_DATA = {
+    "apiVersion": "v1",
+    "kind": constants.POD,
+    "metadata": {"name": "pod-test", "namespace": "default"},
+    "spec": {
+        "containers": [{"name": "web-server", "image": "nginx"}],
+        "volumes": [
+            {"name": "data", "persistentVolumeClaim": {"claimName": "pvc-test"}}
+        ],
+    },
+}
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """
+    Fake API server serving all oc commands of the test.
+    """
+    kubeconfig = tmp_path / "kubeconfig"
+    kubeconfig.write_text("")
+    monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+    with fake_apiserver.fake_api_server(
+        pvc_bind_delay=0.1, pod_start_delay=0.1
+    ) as server:
+        yield server
+
+
+def test_pvc_and_pod_transitions(server):
+    server.create(POD_DATA)
+    server.create(PVC_DATA)
+    assert server.get(constants.PVC, "pvc-test")["status"]["phase"] == "Pending"
+    events = []
+    for event_type, obj in server.watch("pods", timeout=5):
+        events.append((event_type, obj["status"]["phase"]))
+        if obj["status"]["phase"] == constants.STATUS_RUNNING:
+            break
+    assert events == [("MODIFIED", constants.STATUS_RUNNING)]
+    pvc = server.get("pvc", "pvc-test")
+    assert pvc["status"]["phase"] == constants.STATUS_BOUND
+    pv = server.get("pv", pvc["spec"]["volumeName"])
+    assert pv["spec"]["claimRef"]["name"] == "pvc-test"
+    server.delete("pvc", "pvc-test")
+    assert server.list("pv") == []
+
+
+def test_namespace_delete_removes_its_objects(server):
+    server.create({"kind": constants.NAMESPACE, "metadata": {"name": "test-ns"}})
+    for i in range(10):
+        pvc = dict(PVC_DATA, metadata={"name": f"pvc-{i}", "namespace": "test-ns"})
+        server.create(pvc)
+    assert len(server.list("pvc", namespace="test-ns")) == 10
+    server.delete("namespace", "test-ns")
+    assert server.list("pvc") == []
+    with pytest.raises(APIServerError, match="NotFound"):
+        server.create(dict(PVC_DATA, metadata={"name": "x", "namespace": "test-ns"}))
+
+
+def test_error_rate(server):
+    server.error_rate = 1
+    with pytest.raises(APIServerError, match="InternalError"):
+        server.list("pod")
+    assert server.stats["errors"] == 1
+
+
+def test_ocp_commands(server, tmp_path):
+    pvc_ocp = OCP(kind=constants.PVC, namespace="default")
+    yaml_file = tmp_path / "pvc.yaml"
+    yaml_file.write_text(fake_apiserver.yaml.safe_dump(PVC_DATA))
+    created = pvc_ocp.create(yaml_file=str(yaml_file))
+    assert created["metadata"]["uid"]
+    assert pvc_ocp.wait_for_resource(
+        constants.STATUS_BOUND, resource_name="pvc-test", timeout=10, sleep=0.1
+    )
+    assert pvc_ocp.get_resource("pvc-test", "STATUS") == constants.STATUS_BOUND
+    assert pvc_ocp.patch("pvc-test", '{"metadata": {"labels": {"app": "a"}}}')
+    assert len(pvc_ocp.get(selector="app=a")["items"]) == 1
+    assert len(pvc_ocp.get(selector="app=b")["items"]) == 0
+    pvc_ocp.delete(resource_name="pvc-test")
+    with pytest.raises(CommandFailed, match="NotFound"):
+        pvc_ocp.get("pvc-test")
+    assert pvc_ocp.wait_for_delete("pvc-test")
+
+
+def test_jsonpath_output(server):
+    server.create(PVC_DATA)
+    out = OCP(kind=constants.PVC, namespace="default").exec_oc_cmd(
+        "get pvc -o jsonpath='{.items[0].metadata.name}'", out_yaml_format=False
+    )
+    assert out == "pvc-test"
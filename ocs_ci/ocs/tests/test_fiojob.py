@@ -8,7 +8,7 @@ import textwrap
 import pytest
 import yaml
 
-from ocs_ci.ocs import fiojob
+from ocs_ci.ocs import fio_artefacts, fiojob
 
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -179,3 +179,131 @@ def test_get_timeout_basic():
     fio_min_mbps = 2 ** 10  # MiB/s
     pvc_size = 1  # GiB
     assert fiojob.get_timeout(fio_min_mbps, pvc_size) == 1
+
+
+@pytest.mark.parametrize(
+    "fio_output,expected",
+    [
+        ("", None),
+        (
+            "Jobs: 1 (f=8): [W(1)][45.2%][w=120MiB/s][w=30.7k IOPS][eta 02m:13s]",
+            (45.2, 120 * 2 ** 20),
+        ),
+        (
+            "Jobs: 1 (f=8): [W(1)][10.0%][w=2KiB/s][w=1 IOPS][eta 10m:00s]\n"
+            "Jobs: 1 (f=8): [W(1)][12.5%][w=1024KiB/s][w=256 IOPS][eta 09m:00s]\n",
+            (12.5, 2 ** 20),
+        ),
+    ],
+)
+def test_parse_fio_status(fio_output, expected):
+    assert fiojob.parse_fio_status(fio_output) == expected
+
+
+def test_get_sharded_fio_objs():
+    """
+    Each shard has its own PVC and Job, all of them use the same ConfigMap.
+    """
+    with patch(
+        "ocs_ci.ocs.fio_artefacts.get_system_architecture", return_value="x86_64"
+    ):
+        job_dict = fio_artefacts.get_job_dict()
+    fio_objs = fiojob.get_sharded_fio_objs(
+        "fixture_rbd",
+        fio_artefacts.get_pvc_dict(),
+        job_dict,
+        fio_artefacts.get_configmap_dict(),
+        shards=3,
+        shard_size=10,
+    )
+    assert [obj["kind"] for obj in fio_objs] == [
+        "ConfigMap",
+        "PersistentVolumeClaim",
+        "Job",
+        "PersistentVolumeClaim",
+        "Job",
+        "PersistentVolumeClaim",
+        "Job",
+    ]
+    pvcs = fio_objs[1::2]
+    jobs = fio_objs[2::2]
+    assert [pvc["metadata"]["name"] for pvc in pvcs] == [
+        "fio-target-0",
+        "fio-target-1",
+        "fio-target-2",
+    ]
+    assert {pvc["spec"]["resources"]["requests"]["storage"] for pvc in pvcs} == {"10Gi"}
+    for pvc, job in zip(pvcs, jobs):
+        pod_spec = job["spec"]["template"]["spec"]
+        claims = [
+            volume["persistentVolumeClaim"]["claimName"]
+            for volume in pod_spec["volumes"]
+            if "persistentVolumeClaim" in volume
+        ]
+        assert claims == [pvc["metadata"]["name"]]
+        assert job["spec"]["template"]["metadata"]["labels"] == {
+            "fio-fill": "fixture_rbd"
+        }
+        assert "--eta=always" in pod_spec["containers"][0]["command"]
+        assert pod_spec["containers"][0]["command"][-1] == "/etc/fio/workload.fio"
+    # the template is not changed
+    assert job_dict["metadata"]["name"] == "fio"
+
+
+def test_sharded_fio_fails_fast(monkeypatch):
+    """
+    A failed fio pod fails the write at once, not after the write timeout.
+    """
+    pods = {
+        "items": [
+            {"metadata": {"name": "fio-0"}, "status": {"phase": "Running"}},
+            {"metadata": {"name": "fio-1"}, "status": {"phase": "Failed"}},
+        ]
+    }
+    ocp_pod = Mock()
+    ocp_pod.get.return_value = pods
+    monkeypatch.setattr(fiojob.ocp, "OCP", Mock(return_value=ocp_pod))
+    monkeypatch.setattr(fiojob, "get_ceph_storage_stats", Mock(return_value=(0, 0)))
+    fio_job_file = Mock()
+    fio_job_file.name = "fixture_rbd"
+    with pytest.raises(AssertionError, match="fio-1"):
+        fiojob.write_data_via_sharded_fio(fio_job_file, 3600, 10, 0.25, "rbd")
+    ocp_pod.wait_for_resource.assert_not_called()
+
+
+def test_sharded_fio_fails_after_stop(monkeypatch):
+    """
+    A fio pod failing after it was stopped fails the write as well.
+    """
+
+    def pods(*phases):
+        return {
+            "items": [
+                {"metadata": {"name": f"fio-{i}"}, "status": {"phase": phase}}
+                for i, phase in enumerate(phases)
+            ]
+        }
+
+    ocp_pod = Mock()
+    ocp_pod.get.side_effect = [
+        pods("Running", "Running"),
+        pods("Succeeded", "Failed"),
+    ]
+    ocp_pod.exec_oc_cmd.return_value = ""
+    monkeypatch.setattr(fiojob.ocp, "OCP", Mock(return_value=ocp_pod))
+    monkeypatch.setattr(
+        fiojob,
+        "get_ceph_storage_stats",
+        Mock(side_effect=[(0, 0), (11 * 2 ** 30, 0)]),
+    )
+    fio_job_file = Mock()
+    fio_job_file.name = "fixture_rbd"
+    with pytest.raises(AssertionError, match="fio-1"):
+        fiojob.write_data_via_sharded_fio(fio_job_file, 3600, 10, 0.25, "rbd")
+    stops = [
+        call
+        for call in ocp_pod.exec_oc_cmd.call_args_list
+        if "kill -INT 1" in call[0][0]
+    ]
+    assert len(stops) == 2
+    ocp_pod.get_logs.assert_not_called()
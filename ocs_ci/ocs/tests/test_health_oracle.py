@@ -0,0 +1,110 @@
+# -*- coding: utf8 -*-
+
+import subprocess
+
+import pytest
+
+from ocs_ci.ocs import health_oracle
+from ocs_ci.ocs.cluster import CephHealthMonitor
+from ocs_ci.ocs.exceptions import CephHealthException
+from ocs_ci.utility import utils
+
+
+class FakeCluster(object):
+    """
+    Serves oc commands used by the health oracle.
+    """
+
+    def __init__(self):
+        self.ceph_health = "HEALTH_OK"
+        self.commands = []
+
+    def __call__(self, cmd, timeout, **kwargs):
+        self.commands.append(cmd)
+        if "ceph" in cmd:
+            out = self.ceph_health + "\n"
+        elif "noobaa" in cmd:
+            out = "Ready"
+        elif "jsonpath={.items[0].metadata.name}" in cmd:
+            out = "rook-ceph-tools-abc"
+        else:
+            out = ""
+        return subprocess.CompletedProcess(cmd, 0, out.encode(), b"")
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    fake_cluster = FakeCluster()
+    monkeypatch.setattr(utils, "command_handlers", [fake_cluster])
+    return fake_cluster
+
+
+def test_cached_health(cluster):
+    oracle = health_oracle.HealthOracle(namespace="openshift-storage")
+    assert oracle.check_ceph_health()
+    # wait, get tools pod, ceph health and noobaa phase
+    assert len(cluster.commands) == 4
+    assert oracle.check_ceph_health(max_age=60)
+    assert len(cluster.commands) == 4
+    # tools pod is cached for new samples, only ceph health is checked
+    assert oracle.check_ceph_health()
+    assert len(cluster.commands) == 5
+    assert oracle.latest.noobaa_phase == "Ready"
+
+
+def test_health_timeline(cluster):
+    oracle = health_oracle.HealthOracle(namespace="openshift-storage")
+    oracle.sample()
+    cluster.ceph_health = "HEALTH_WARN 1 osds down"
+    with pytest.raises(CephHealthException, match="HEALTH_WARN"):
+        oracle.check_ceph_health(max_age=0)
+    cluster.ceph_health = "HEALTH_OK"
+    oracle.sample()
+    assert [(t.previous, t.current) for t in oracle.timeline] == [
+        ("HEALTH_OK", "HEALTH_WARN 1 osds down"),
+        ("HEALTH_WARN 1 osds down", "HEALTH_OK"),
+    ]
+
+
+def test_background_sampling(cluster):
+    oracle = health_oracle.HealthOracle(namespace="openshift-storage", interval=0.01)
+    oracle.start()
+    try:
+        utils.TimeoutSampler(
+            5, 0.01, lambda: oracle.latest is not None
+        ).wait_for_func_status(True)
+    finally:
+        oracle.stop()
+    assert oracle.latest.noobaa_phase == "Ready"
+
+
+def test_ceph_health_check_uses_shared_oracle(cluster, monkeypatch):
+    oracle = health_oracle.HealthOracle(namespace="openshift-storage")
+    monkeypatch.setattr(health_oracle, "_oracle", oracle)
+    assert health_oracle.get_health_oracle("openshift-storage") is oracle
+    assert health_oracle.get_health_oracle("other") is not oracle
+    assert utils.ceph_health_check_base("openshift-storage")
+    assert utils.ceph_health_check_base()
+    # the tools pod is waited for and looked up once for both checks
+    assert len([cmd for cmd in cluster.commands if "pod" in cmd]) == 2
+    assert oracle.latest.ceph_health == "HEALTH_OK"
+
+
+def test_health_monitor_takes_detail(cluster, monkeypatch):
+    class FakeCephCluster(object):
+        namespace = "openshift-storage"
+
+        def get_ceph_health(self, detail=False):
+            assert detail
+            return "HEALTH_WARN 1 osds down\n[WRN] OSD_DOWN: 1 osds down"
+
+    oracle = health_oracle.HealthOracle(namespace="openshift-storage")
+    monkeypatch.setattr(health_oracle, "_oracle", oracle)
+    cluster.ceph_health = "HEALTH_WARN 1 osds down"
+    monitor = CephHealthMonitor(FakeCephCluster(), sleep=0.01)
+    with monitor:
+        utils.TimeoutSampler(
+            5, 0.01, lambda: monitor.latest_health_status is not None
+        ).wait_for_func_status(True)
+    monitor.join()
+    assert "OSD_DOWN" in monitor.latest_health_status
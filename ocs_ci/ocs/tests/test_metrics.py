@@ -0,0 +1,64 @@
+# -*- coding: utf8 -*-
+
+import re
+
+import pytest
+
+from ocs_ci.ocs import metrics
+
+
+class FakePrometheus(object):
+    """
+    Prometheus with given metrics available, answering only the queries used
+    by get_available_metrics.
+    """
+
+    _endpoint = "https://prometheus.example.com"
+
+    def __init__(self, available):
+        self.available = available
+        self.queries = []
+
+    def query(self, query):
+        self.queries.append(query)
+        match = re.match(r'count by \(__name__\) \({__name__=~"(.*)"}\)$', query)
+        if not match:
+            return [{"metric": {}, "value": [0, "1"]}] if "rate" in query else []
+        return [
+            {"metric": {"__name__": name}, "value": [0, "1"]}
+            for name in match.group(1).split("|")
+            if name in self.available
+        ]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    metrics._available_metrics.clear()
+    yield
+    metrics._available_metrics.clear()
+
+
+def test_get_missing_metrics_batched():
+    prometheus = FakePrometheus(metrics.ceph_metrics[1:])
+    missing = metrics.get_missing_metrics(prometheus, metrics.ceph_metrics_all)
+    assert missing == [metrics.ceph_metrics[0]] + list(metrics.ceph_rbd_metrics)
+    expected_queries = -(-len(metrics.ceph_metrics_all) // metrics.METRICS_QUERY_BATCH)
+    assert len(prometheus.queries) == expected_queries
+
+
+def test_get_missing_metrics_cache():
+    prometheus = FakePrometheus(["ceph_health_status"])
+    checked = ["ceph_health_status", "ceph_osd_up"]
+    assert metrics.get_missing_metrics(prometheus, checked) == ["ceph_osd_up"]
+    assert metrics.get_missing_metrics(prometheus, checked) == ["ceph_osd_up"]
+    # available metric is cached, missing one is checked again
+    assert prometheus.queries[-1] == 'count by (__name__) ({__name__=~"ceph_osd_up"})'
+    metrics.get_missing_metrics(prometheus, checked, use_cache=False)
+    assert "ceph_health_status" in prometheus.queries[-1]
+
+
+def test_get_missing_metrics_expression():
+    prometheus = FakePrometheus([])
+    expression = "rate(ceph_osd_op_r[5m])"
+    assert metrics.get_missing_metrics(prometheus, [expression]) == []
+    assert prometheus.queries == [expression]
@@ -0,0 +1,45 @@
+# -*- coding: utf8 -*-
+
+import os
+
+import pytest
+
+from ocs_ci.ocs.must_gather.must_gather_index import MustGatherIndex
+
+
+@pytest.fixture
+def gather_root(tmp_path):
+    """
+    Small must gather tree with an empty file and a yaml file without kind.
+    """
+    commands = tmp_path / "ceph" / "must_gather_commands"
+    commands.mkdir(parents=True)
+    (commands / "ceph_status").write_text("HEALTH_OK\n")
+    (commands / "ceph_osd_tree").write_text("")
+    (commands / "storagecluster.yaml").write_text("apiVersion: v1\nKind: List\n")
+    (commands / "pods.yaml").write_text("apiVersion: v1\n")
+    pods = tmp_path / "namespaces" / "openshift-storage" / "pods"
+    for pod_name in ("rook-ceph-mon-a", "noobaa-core-0"):
+        (pods / pod_name).mkdir(parents=True)
+    (tmp_path / "noobaa_diagnostics_1603100000.tar.gz").write_text("gz")
+    return str(tmp_path)
+
+
+def test_index(gather_root):
+    index = MustGatherIndex(gather_root)
+    commands = os.path.join(gather_root, "ceph", "must_gather_commands")
+    assert index.find("ceph_status") == os.path.join(commands, "ceph_status")
+    assert index.find("ceph_mon_dump") is None
+    assert index.empty_files() == [os.path.join(commands, "ceph_osd_tree")]
+    assert len(index.match(r"noobaa_diagnostics_.*.tar.gz")) == 1
+    (pods,) = index.match_dirs("openshift-storage/pods$")
+    assert sorted(index.dirs[pods]) == ["noobaa-core-0", "rook-ceph-mon-a"]
+
+
+def test_find_without_content(gather_root):
+    index = MustGatherIndex(gather_root)
+    yaml_files = index.match(r"\.yaml$")
+    assert [
+        os.path.basename(path)
+        for path in index.find_without_content(yaml_files, "kind", workers=2)
+    ] == ["pods.yaml"]
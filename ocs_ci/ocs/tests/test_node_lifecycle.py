@@ -0,0 +1,137 @@
+# -*- coding: utf8 -*-
+
+import threading
+from collections import namedtuple
+
+import pytest
+
+from ocs_ci.ocs import constants, node, node_lifecycle
+from ocs_ci.ocs.node_lifecycle import NodeLifecycle, run_concurrently
+
+
+Node = namedtuple("Node", ["name"])
+
+
+def node_data(ready="True", unschedulable=False):
+    return {
+        "metadata": {"name": "worker-0"},
+        "spec": {"unschedulable": True} if unschedulable else {},
+        "status": {
+            "conditions": [
+                {"type": "MemoryPressure", "status": "False"},
+                {"type": "Ready", "status": ready},
+            ]
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (node_data(), constants.NODE_READY),
+        (node_data(ready="False"), constants.NODE_NOT_READY),
+        (node_data(ready="Unknown"), constants.NODE_NOT_READY),
+        (node_data(unschedulable=True), constants.NODE_READY_SCHEDULING_DISABLED),
+        (
+            node_data(ready="False", unschedulable=True),
+            constants.NODE_NOT_READY_SCHEDULING_DISABLED,
+        ),
+    ],
+)
+def test_get_node_status(data, expected):
+    assert node.get_node_status(data) == expected
+
+
+def test_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_others(item):
+        barrier.wait()
+        return item * 2
+
+    assert run_concurrently(wait_for_others, [1, 2, 3]) == [2, 4, 6]
+
+
+def test_run_concurrently_raises():
+    called = []
+
+    def fail_on_two(item):
+        called.append(item)
+        if item == 2:
+            raise ValueError(item)
+
+    with pytest.raises(ValueError):
+        run_concurrently(fail_on_two, [1, 2, 3])
+    assert sorted(called) == [1, 2, 3]
+
+
+class FakeCluster(object):
+    """
+    Nodes rebooted by the fake platform, they are Ready with a new reboot
+    event after the given number of polls.
+    """
+
+    def __init__(self, node_names, polls=2):
+        self.polls = polls
+        self.reboots = dict.fromkeys(node_names, 0)
+        self.pending = {}
+        self.restarted = []
+
+    def restart_nodes(self, nodes, wait=True):
+        assert not wait
+        self.restarted.append([n.name for n in nodes])
+        for n in nodes:
+            self.pending[n.name] = self.polls
+
+    def get_nodes_status(self, node_names):
+        status = {}
+        for name in node_names:
+            if self.pending.get(name):
+                self.pending[name] -= 1
+                if not self.pending[name]:
+                    self.reboots[name] += 1
+                    del self.pending[name]
+            status[name] = (
+                constants.NODE_NOT_READY
+                if name in self.pending
+                else constants.NODE_READY
+            )
+        return status
+
+    def get_reboot_event_counts(self, node_names):
+        return {name: self.reboots[name] for name in node_names}
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    fake_cluster = FakeCluster(["worker-0", "worker-1", "worker-2"])
+    monkeypatch.setattr(node, "get_nodes_status", fake_cluster.get_nodes_status)
+    monkeypatch.setattr(
+        node_lifecycle, "get_reboot_event_counts", fake_cluster.get_reboot_event_counts
+    )
+    monkeypatch.setattr(node_lifecycle, "POLL_INTERVAL", 0)
+    return fake_cluster
+
+
+@pytest.mark.parametrize(
+    "parallelism,batches",
+    [
+        (None, [["worker-0", "worker-1", "worker-2"]]),
+        (1, [["worker-0"], ["worker-1"], ["worker-2"]]),
+        (2, [["worker-0", "worker-1"], ["worker-2"]]),
+    ],
+)
+def test_rolling_restart(cluster, parallelism, batches):
+    nodes = [Node(name) for name in ["worker-0", "worker-1", "worker-2"]]
+    NodeLifecycle(cluster, parallelism=parallelism, timeout=10).restart(nodes)
+    assert cluster.restarted == batches
+    assert cluster.reboots == {"worker-0": 1, "worker-1": 1, "worker-2": 1}
+
+
+def test_wait_for_reboot(cluster):
+    reboot_counts = cluster.get_reboot_event_counts(["worker-0"])
+    # node is Ready all the time, but it's done only with the reboot event
+    assert node_lifecycle.get_nodes_progress(["worker-0"], reboot_counts) == [
+        "worker-0"
+    ]
+    assert node_lifecycle.get_nodes_progress(["worker-0"]) == []
@@ -0,0 +1,118 @@
+# -*- coding: utf8 -*-
+
+import logging
+import sys
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.pillowfight_collector import (
+    PillowfightCollector,
+    new_stats,
+    parse_pillowfight_line,
+)
+
+
+# Prints the OPS/SEC lines with a histogram line and a NUL in between
+FAKE_LOG = """
+import sys, time
+for ops in {ops}:
+    print("OPS/SEC: %d" % ops)
+    sys.stdout.flush()
+    time.sleep(0.01)
+print("[100 - 199]us |### - 1234\\x00")
+"""
+
+
+def test_parse_line():
+    stats = new_stats()
+    assert parse_pillowfight_line("OPS/SEC: 2500", stats) == 2500
+    assert parse_pillowfight_line("[1 - 2]ms |#### - 77", stats) is None
+    assert parse_pillowfight_line("OPS/SEC: garbage", stats) is None
+    assert stats == {
+        "opspersec": [2500],
+        "resptimes": {2000: {"minindx": 1000, "number": 77}},
+    }
+
+
+def test_collapse_flagged_once():
+    events = []
+    collector = PillowfightCollector("ns", window=3, on_collapse=events.append)
+    for ops in (1000, 1200, 1100, 400, 300, 1000, 200):
+        collector.add_line("pf-0", f"OPS/SEC: {ops}")
+    collector.add_line("pf-1", "OPS/SEC: 500")
+    # 400 and 300 are one collapse, 200 after the recovery is a new one
+    assert [(e["opspersec"], e["baseline"]) for e in events] == [
+        (400, 1200),
+        (200, 1000),
+    ]
+    assert collector.collapses == events
+    assert collector.throughput() == 700
+    assert collector.timeline[-1][1] == 700
+
+
+def test_stream_logs(monkeypatch, tmpdir):
+    ops = {"pf-0": [3000, 3100, 3200], "pf-1": [2000, 2100]}
+    monkeypatch.setattr(
+        PillowfightCollector,
+        "_log_command",
+        lambda self, pod: [sys.executable, "-c", FAKE_LOG.format(ops=ops[pod])],
+    )
+    collector = PillowfightCollector("ns", log_dir=str(tmpdir))
+    for pod in ops:
+        collector.follow(pod)
+        collector.follow(pod)
+    assert collector.join(timeout=60) == []
+    assert collector.returncodes == {"pf-0": 0, "pf-1": 0}
+    for pod, values in ops.items():
+        assert collector.stats[pod]["opspersec"] == values
+        assert collector.stats[pod]["resptimes"][199]["number"] == 1234
+        assert "OPS/SEC: 3000" in tmpdir.join("pf-0.log").read()
+    assert not collector.collapses
+    # the pods whose logs ended don't count to the current throughput
+    assert collector.throughput() == 0
+    assert len(collector.timeline) == 5
+
+
+def test_stop_running_stream(monkeypatch, tmpdir):
+    monkeypatch.setattr(
+        PillowfightCollector,
+        "_log_command",
+        lambda self, pod: [sys.executable, "-c", "import time; time.sleep(60)"],
+    )
+    collector = PillowfightCollector("ns", log_dir=str(tmpdir))
+    collector.follow("pf-0")
+    assert collector.join(timeout=0.5) == ["pf-0"]
+    collector.stop()
+    assert collector.following() == []
+    assert collector.returncodes["pf-0"] != 0
+
+
+def test_stream_failed(monkeypatch, tmpdir, caplog):
+    monkeypatch.setattr(
+        PillowfightCollector,
+        "_log_command",
+        lambda self, pod: [sys.executable, "-c", "import sys; sys.exit(1)"],
+    )
+    collector = PillowfightCollector("ns", log_dir=str(tmpdir))
+    with caplog.at_level(logging.WARNING):
+        collector.follow("pf-0")
+        assert collector.join(timeout=60) == []
+    assert collector.returncodes["pf-0"] == 1
+    assert "pf-0 failed with exit code 1" in caplog.text
+
+
+def test_log_command_kubeconfig(monkeypatch, tmpdir):
+    tmpdir.mkdir("auth").join("kubeconfig").write("")
+    monkeypatch.delenv("KUBECONFIG", raising=False)
+    monkeypatch.setitem(config.ENV_DATA, "cluster_path", str(tmpdir))
+    monkeypatch.setitem(config.RUN, "kubeconfig_location", "auth/kubeconfig")
+    collector = PillowfightCollector("ns")
+    assert collector._log_command("pf-0") == [
+        "oc",
+        "--kubeconfig",
+        str(tmpdir.join("auth", "kubeconfig")),
+        "-n",
+        "ns",
+        "logs",
+        "-f",
+        "pf-0",
+    ]
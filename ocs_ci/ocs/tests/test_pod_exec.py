@@ -0,0 +1,132 @@
+# -*- coding: utf8 -*-
+
+import json
+import time
+
+import pytest
+
+from ocs_ci.ocs import pod_exec
+from ocs_ci.ocs.exceptions import CommandFailed
+
+
+class FakeExecResponse(object):
+    """
+    Exec websocket receiving the given frames, one per update call.
+    """
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.channels = {}
+        self.closed = False
+
+    def is_open(self):
+        return bool(self.frames) and not self.closed
+
+    def update(self, timeout=0):
+        channel, data = self.frames.pop(0)
+        if channel is not None:
+            self.channels[channel] = self.channels.get(channel, "") + data
+
+    def read_channel(self, channel, timeout=0):
+        return self.channels.pop(channel, "")
+
+    def close(self):
+        self.closed = True
+
+
+def exit_status(code):
+    if code == 0:
+        return json.dumps({"status": "Success"})
+    return json.dumps(
+        {
+            "status": "Failure",
+            "reason": "NonZeroExitCode",
+            "details": {"causes": [{"reason": "ExitCode", "message": str(code)}]},
+        }
+    )
+
+
+@pytest.fixture
+def exec_frames(monkeypatch):
+    """
+    Frames returned by the exec of every pod, by pod name.
+    """
+    frames = {}
+    monkeypatch.setattr(pod_exec.config, "load_kube_config", lambda **kwargs: None)
+    monkeypatch.setattr(
+        pod_exec,
+        "stream",
+        lambda func, podname, namespace, **kwargs: FakeExecResponse(frames[podname]),
+    )
+    pod_exec.clear_clients()
+    yield frames
+    pod_exec.clear_clients()
+
+
+def test_run_collects_output_and_exit_code(exec_frames):
+    exec_frames["pod-a"] = [
+        (pod_exec.STDOUT_CHANNEL, "line 1\n"),
+        (pod_exec.STDERR_CHANNEL, "warning\n"),
+        (pod_exec.STDOUT_CHANNEL, "line 2\n"),
+        (pod_exec.ERROR_CHANNEL, exit_status(2)),
+    ]
+    cmd_obj = pod_exec.CmdObj("cat file", 10, True, True, False)
+    executor = pod_exec.Exec()
+    assert executor.run("pod-a", "ns", cmd_obj) == ("line 1\nline 2\n", "warning\n", 2)
+    # the api-client is instantiated only once
+    assert pod_exec.get_client() is pod_exec.get_client()
+
+
+def test_run_on_pods(exec_frames):
+    pods = [(f"pod-{i}", "ns") for i in range(20)]
+    for podname, _ in pods:
+        exec_frames[podname] = [
+            (pod_exec.STDOUT_CHANNEL, podname),
+            (pod_exec.ERROR_CHANNEL, exit_status(0)),
+        ]
+    cmd_obj = pod_exec.CmdObj("hostname", 10, True, True, False)
+    results = pod_exec.Exec().run_on_pods(pods, cmd_obj)
+    assert results == [(podname, "", 0) for podname, _ in pods]
+
+
+def test_run_timeout(exec_frames):
+    exec_frames["pod-a"] = [(None, "")] * 5
+    cmd_obj = pod_exec.CmdObj("sleep 100", 0, True, True, False)
+    with pytest.raises(CommandFailed):
+        pod_exec.Exec().run("pod-a", "ns", cmd_obj)
+
+
+def test_run_on_pods_api_client_per_thread(monkeypatch):
+    """
+    stream() swaps the request method of the api-client while it connects,
+    the concurrent commands mustn't see the swapped method of another one.
+    """
+    monkeypatch.setattr(pod_exec.config, "load_kube_config", lambda **kwargs: None)
+    races = []
+
+    def swapping_stream(func, podname, namespace, **kwargs):
+        api_client = func.__self__.api_client
+        original = api_client.request
+        marker = object()
+        api_client.request = marker
+        time.sleep(0.01)
+        if api_client.request is not marker:
+            races.append(podname)
+        api_client.request = original
+        return FakeExecResponse(
+            [
+                (pod_exec.STDOUT_CHANNEL, podname),
+                (pod_exec.ERROR_CHANNEL, exit_status(0)),
+            ]
+        )
+
+    monkeypatch.setattr(pod_exec, "stream", swapping_stream)
+    pod_exec.clear_clients()
+    pods = [(f"pod-{i}", "ns") for i in range(16)]
+    cmd_obj = pod_exec.CmdObj("hostname", 10, True, True, False)
+    try:
+        results = pod_exec.Exec().run_on_pods(pods, cmd_obj, max_workers=8)
+    finally:
+        pod_exec.clear_clients()
+    assert results == [(podname, "", 0) for podname, _ in pods]
+    assert not races
@@ -0,0 +1,112 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import registry_load
+from ocs_ci.ocs.exceptions import ResourceWrongStatusException
+from ocs_ci.ocs.registry_load import RegistryLoad, percentile
+from ocs_ci.utility.fake_registry import fake_registry
+from ocs_ci.utility.registry_client import RegistryError, RegistryClient, run_client
+
+
+LAYER_SIZE = 4096
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([3.0], 90) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_load_summary():
+    with fake_registry(token="secret") as registry:
+        result = RegistryLoad(
+            registry.url,
+            clients=3,
+            images=2,
+            layers=2,
+            layer_size=LAYER_SIZE,
+            token="secret",
+        ).run_local()
+    summary = result.summary()
+    assert summary["errors"] == 0
+    # 2 layers and config blob + manifest per image
+    assert summary["push"]["operations"] == 3 * 2 * 4
+    assert summary["pull"]["operations"] == 3 * 2 * 4
+    assert len(registry.manifests) == 6
+    layer_bytes = 3 * 2 * 2 * LAYER_SIZE
+    assert summary["push"]["bytes"] == summary["pull"]["bytes"] > layer_bytes
+    assert summary["push"]["throughput"] > 0
+    for op in ("push", "pull"):
+        for kind in ("blob", "manifest"):
+            latency = summary[op]["latency"][kind]
+            assert set(latency) == {"p50", "p90", "p99", "max"}
+            assert latency["p50"] <= latency["p99"] <= latency["max"]
+
+
+def test_auth_required():
+    with fake_registry(token="secret") as registry:
+        samples = run_client(registry.url, images=1, layers=1, layer_size=16)
+        assert samples and all(sample["error"] for sample in samples)
+        assert not registry.blobs
+        client = RegistryClient(registry.url, token="wrong")
+        with pytest.raises(Exception):
+            client.push_blob("load/image", b"data")
+
+
+def test_manifest_with_unknown_blob():
+    with fake_registry() as registry:
+        client = RegistryClient(registry.url)
+        with pytest.raises(RegistryError, match="BLOB_UNKNOWN"):
+            client.push_manifest("load/image", "latest", ("sha256:" + "0" * 64, 2), [])
+
+
+def test_client_pods_deleted_on_failure(monkeypatch):
+    created = []
+    deleted = []
+
+    class FakePod(object):
+        def __init__(self, **data):
+            self.name = data["metadata"]["name"]
+
+    def create_resource(**data):
+        created.append(FakePod(**data))
+        return created[-1]
+
+    def wait_for_resources_state(pods, state, timeout):
+        raise ResourceWrongStatusException(pods[0].name, "Pending")
+
+    monkeypatch.setattr(registry_load.helpers, "create_resource", create_resource)
+    monkeypatch.setattr(
+        registry_load.helpers, "wait_for_resources_state", wait_for_resources_state
+    )
+    monkeypatch.setattr(
+        registry_load.pod, "delete_pods", lambda pods, wait: deleted.extend(pods)
+    )
+    load = RegistryLoad("registry:5000", clients=2, token="secret")
+    with pytest.raises(ResourceWrongStatusException):
+        load.run_in_pods("load-ns")
+    assert len(created) == 2
+    assert deleted == created
+
+
+def test_repo_prefix_defaults_to_namespace(monkeypatch):
+    commands = []
+
+    class FakeOCP(object):
+        def __init__(self, namespace=None):
+            pass
+
+        def exec_oc_cmd(self, command, **kwargs):
+            commands.append(command)
+            return ""
+
+    class FakePod(object):
+        name = "registry-load-client-0"
+
+    monkeypatch.setattr(registry_load, "OCP", FakeOCP)
+    RegistryLoad("registry:5000")._run_client_pod("load-ns", FakePod(), 0)
+    assert "--repo-prefix load-ns" in commands[0]
@@ -0,0 +1,199 @@
+# -*- coding: utf8 -*-
+
+import threading
+import time
+
+import pytest
+
+from ocs_ci.ocs import request_layer
+from ocs_ci.ocs.request_layer import (
+    BACKGROUND,
+    FOREGROUND,
+    RequestLayer,
+    TokenBucket,
+    get_request_priority,
+    is_read_only,
+    request_priority,
+)
+
+
+@pytest.mark.parametrize(
+    "cmd,expected",
+    [
+        ("oc -n openshift-storage get pod -o yaml", True),
+        ("oc --kubeconfig /tmp/kc describe node worker-0", True),
+        ("oc -n openshift-storage rsh rook-ceph-tools-abc ceph health detail", True),
+        ("oc -n openshift-storage exec tools -- ceph osd tree", True),
+        ("oc -n openshift-storage rsh tools ceph osd pool create rbd", False),
+        ("oc -n openshift-storage delete pod pod-1", False),
+        ("oc -n openshift-storage apply -f /tmp/pod.yaml", False),
+        ("oc -n openshift-storage", False),
+    ],
+)
+def test_is_read_only(cmd, expected):
+    assert is_read_only(cmd) is expected
+
+
+def test_request_priority():
+    assert get_request_priority() == FOREGROUND
+    with request_priority(BACKGROUND):
+        assert get_request_priority() == BACKGROUND
+    assert get_request_priority() == FOREGROUND
+
+
+class SlowRequest(object):
+    """
+    Request waiting until it's released, counting its executions.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, cmd, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return f"{cmd} {self.calls}"
+
+
+def run_in_threads(func, count):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(func())) for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_identical_reads_coalesced():
+    layer = RequestLayer()
+    request = SlowRequest()
+    cmd = "oc -n ns get pod"
+    threads, results = run_in_threads(
+        lambda: layer.execute(request, cmd, timeout=600), 5
+    )
+    time.sleep(0.2)
+    request.release.set()
+    for thread in threads:
+        thread.join()
+    assert request.calls == 1
+    assert results == [f"{cmd} 1"] * 5
+    assert layer.get_stats() == {"calls": 5, "coalesced": 4}
+
+
+def test_writes_not_coalesced():
+    layer = RequestLayer()
+    request = SlowRequest()
+    request.release.set()
+    cmd = "oc -n ns delete pod pod-1"
+    for _ in range(2):
+        layer.execute(request, cmd)
+    assert request.calls == 2
+    assert layer.get_stats() == {"calls": 2}
+
+
+def test_exception_shared():
+    layer = RequestLayer()
+    release = threading.Event()
+
+    def failing(cmd):
+        release.wait(5)
+        raise ValueError(cmd)
+
+    errors = []
+
+    def call():
+        try:
+            layer.execute(failing, "oc get pod")
+        except ValueError as ex:
+            errors.append(ex)
+
+    threads, _ = run_in_threads(call, 3)
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3
+    assert layer.get_stats()["coalesced"] == 2
+
+
+def test_read_after_write_not_coalesced():
+    layer = RequestLayer()
+    request = SlowRequest()
+    cmd = "oc -n ns get pod"
+    threads, _ = run_in_threads(lambda: layer.execute(request, cmd), 1)
+    time.sleep(0.1)
+
+    def write_and_read():
+        # the read in flight started before the write, so it may not see it
+        layer.execute(lambda cmd: None, "oc -n ns delete pod pod-1")
+        return layer.execute(request, cmd)
+
+    reader, _ = run_in_threads(write_and_read, 1)
+    time.sleep(0.1)
+    request.release.set()
+    for thread in threads + reader:
+        thread.join()
+    assert request.calls == 2
+    assert "coalesced" not in layer.get_stats()
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=100, burst=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.01, abs=0.005)
+
+
+def test_background_requests_throttled():
+    layer = RequestLayer({BACKGROUND: {"rate": 100, "burst": 1}})
+    for _ in range(3):
+        layer.execute(str, "oc get pod")
+    with request_priority(BACKGROUND):
+        for _ in range(3):
+            layer.execute(str, "oc get pod")
+    stats = layer.get_stats()
+    assert stats["calls"] == 6
+    assert stats["throttled_background"] == 2
+    assert "throttled_foreground" not in stats
+
+
+def test_throttle_without_execute():
+    layer = RequestLayer({BACKGROUND: {"rate": 100, "burst": 1}})
+    layer.throttle()
+    with request_priority(BACKGROUND):
+        for _ in range(3):
+            layer.throttle()
+    stats = layer.get_stats()
+    assert stats["throttled_background"] == 2
+    assert "calls" not in stats
+
+
+def test_foreground_does_not_join_throttled_request():
+    # the background read waits ~1s for its token
+    layer = RequestLayer({BACKGROUND: {"rate": 1, "burst": 1}})
+    cmd = "oc -n ns get pod"
+    with request_priority(BACKGROUND):
+        layer.execute(str, cmd)
+
+    def background_read():
+        with request_priority(BACKGROUND):
+            return layer.execute(str, cmd)
+
+    threads, _ = run_in_threads(background_read, 1)
+    time.sleep(0.1)
+    start = time.monotonic()
+    assert layer.execute(str, cmd) == cmd
+    assert time.monotonic() - start < 0.5
+    for thread in threads:
+        thread.join()
+    stats = layer.get_stats()
+    assert stats["throttled_background"] == 1
+    assert "coalesced" not in stats
+
+
+def test_get_request_layer(monkeypatch):
+    monkeypatch.setattr(request_layer, "_layer", None)
+    layer = request_layer.get_request_layer()
+    assert layer is request_layer.get_request_layer()
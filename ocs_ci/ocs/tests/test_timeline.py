@@ -0,0 +1,163 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import constants, timeline
+from ocs_ci.ocs.health_oracle import HealthTransition
+from ocs_ci.ocs.timeline import Timeline, TimelineRecorder, parse_timestamp
+
+
+T0 = "2021-03-01T10:00:00Z"
+EPOCH0 = 1614592800
+
+
+def meta(name, uid, created=T0, namespace="test-ns"):
+    return {
+        "name": name,
+        "uid": uid,
+        "namespace": namespace,
+        "creationTimestamp": created,
+    }
+
+
+CLUSTER = {
+    "Event": [
+        {
+            "metadata": {"uid": "e1"},
+            "involvedObject": {
+                "kind": constants.PVC,
+                "name": "pvc-a",
+                "namespace": "test-ns",
+            },
+            "reason": "ProvisioningSucceeded",
+            "message": "Successfully provisioned volume",
+            "count": 1,
+            "lastTimestamp": "2021-03-01T10:00:04Z",
+        }
+    ],
+    constants.POD: [
+        {
+            "metadata": meta("pod-a", "p1"),
+            "status": {
+                "phase": "Running",
+                "conditions": [
+                    {
+                        "type": "Initialized",
+                        "status": "True",
+                        "lastTransitionTime": "2021-03-01T10:00:07Z",
+                    },
+                    {
+                        "type": "Ready",
+                        "status": "True",
+                        "lastTransitionTime": "2021-03-01T10:00:20Z",
+                    },
+                    {
+                        "type": "ContainersReady",
+                        "status": "True",
+                        "lastTransitionTime": "2021-03-01T10:00:20Z",
+                    },
+                    {
+                        "type": "PodScheduled",
+                        "status": "True",
+                        "lastTransitionTime": "2021-03-01T10:00:01Z",
+                    },
+                ],
+            },
+        }
+    ],
+    constants.PVC: [
+        {"metadata": meta("pvc-a", "v1"), "status": {"phase": "Bound"}},
+        {"metadata": meta("pvc-b", "v2"), "status": {"phase": "Pending"}},
+    ],
+    constants.VOLUMESNAPSHOT: [],
+}
+
+
+class FakeOracle(object):
+    timeline = [
+        HealthTransition(EPOCH0 + 30, "ceph", "HEALTH_OK", "HEALTH_WARN"),
+    ]
+
+
+@pytest.fixture
+def recorder(monkeypatch, tmpdir):
+    monkeypatch.setattr(TimelineRecorder, "_list", lambda self, kind: CLUSTER[kind])
+    monkeypatch.setattr(timeline, "get_health_oracle", FakeOracle)
+    return TimelineRecorder(str(tmpdir.join("timeline.jsonl")))
+
+
+def test_parse_timestamp():
+    assert parse_timestamp(T0) == EPOCH0
+    assert parse_timestamp("2021-03-01T10:00:00.250000Z") == EPOCH0 + 0.25
+    assert parse_timestamp(None) is None
+
+
+def test_poll_is_deduplicated(recorder):
+    recorder.poll()
+    entries = len(recorder.entries)
+    recorder.poll()
+    assert len(recorder.entries) == entries
+    assert len(Timeline.load(recorder.path).entries) == entries
+    health = recorder.timeline().select(source=timeline.HEALTH)
+    assert [entry["what"] for entry in health] == ["HEALTH_WARN"]
+
+
+def test_queries(recorder):
+    recorder.poll()
+    loaded = Timeline.load(recorder.path)
+    assert loaded.pvc_bound_times() == {"test-ns/pvc-a": 4}
+    assert loaded.pod_start_breakdown(namespace="test-ns") == {
+        "test-ns/pod-a": {
+            "PodScheduled": 1,
+            "Initialized": 7,
+            "ContainersReady": 20,
+            "Ready": 20,
+        }
+    }
+    assert loaded.pvc_bound_times(namespace="other-ns") == {}
+
+
+def test_test_window(recorder):
+    nodeid = "tests/test_a.py::test_a"
+    recorder.record_test_phase(nodeid, "setup", EPOCH0, EPOCH0 + 2, "passed")
+    recorder.record_test_phase(nodeid, "call", EPOCH0 + 2, EPOCH0 + 9, "passed")
+    recorder.record_test_phase(nodeid, "teardown", EPOCH0 + 9, EPOCH0 + 10, "passed")
+    recorder.poll()
+    loaded = Timeline.load(recorder.path)
+    start, stop = loaded.test_window(nodeid)
+    assert (start, stop) == (EPOCH0, EPOCH0 + 10)
+    during_test = loaded.select(source=timeline.EVENT, start=start, stop=stop)
+    assert [entry["what"] for entry in during_test] == ["ProvisioningSucceeded"]
+    assert loaded.test_window("tests/test_a.py::test_b") is None
+
+
+def test_durations_of_recreated_object():
+    entries = [
+        {"t": 0, "src": timeline.OBJECT, "kind": constants.PVC, "ns": "ns"},
+        {"t": 9, "src": timeline.OBJECT, "kind": constants.PVC, "ns": "ns"},
+        {"t": 10, "src": timeline.OBJECT, "kind": constants.PVC, "ns": "ns"},
+        {"t": 12, "src": timeline.OBJECT, "kind": constants.PVC, "ns": "ns"},
+    ]
+    whats = [timeline.CREATED, constants.STATUS_BOUND, timeline.CREATED, "Bound"]
+    for entry, what in zip(entries, whats):
+        entry.update(name="pvc-a", what=what)
+    assert Timeline(entries).pvc_bound_times() == {"ns/pvc-a": 2}
+
+
+def test_only_watched_namespaces_are_listed(monkeypatch, tmpdir):
+    listed = []
+
+    class FakeOCP(object):
+        def __init__(self, kind, namespace=None):
+            self.kind = kind
+            self.namespace = namespace
+
+        def get(self):
+            listed.append((self.kind, self.namespace))
+            return {"items": []}
+
+    monkeypatch.setattr(timeline, "OCP", FakeOCP)
+    recorder = TimelineRecorder(str(tmpdir.join("t.jsonl")), namespaces=["ns-a"])
+    recorder.watch("ns-b")
+    recorder.poll_pvcs()
+    assert listed == [(constants.PVC, "ns-a"), (constants.PVC, "ns-b")]
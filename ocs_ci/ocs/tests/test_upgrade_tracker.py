@@ -0,0 +1,209 @@
+# -*- coding: utf8 -*-
+
+import json
+
+import pytest
+
+from ocs_ci.ocs.exceptions import TimeoutException
+from ocs_ci.ocs.upgrade_tracker import (
+    CSV_COMPONENT,
+    UpgradeComponent,
+    UpgradeTracker,
+)
+
+
+PRE_UPGRADE_IMAGES = {"rook": "rook:4.5", "ceph": "ceph:14", "noobaa": "noobaa:5.5"}
+CSV_IMAGES = {"rook": "rook:4.6", "ceph": "ceph:14", "noobaa": "noobaa:5.6"}
+
+
+def csv(phase):
+    return {
+        "metadata": {"name": "ocs-operator.v4.6.0"},
+        "spec": {
+            "install": {
+                "spec": {
+                    "deployments": [
+                        {
+                            "spec": {
+                                "template": {
+                                    "spec": {
+                                        "containers": [
+                                            {
+                                                "name": "rook-ceph-operator",
+                                                "env": [
+                                                    {
+                                                        "name": f"{k.upper()}_IMAGE",
+                                                        "value": v,
+                                                    }
+                                                    for k, v in CSV_IMAGES.items()
+                                                ],
+                                            }
+                                        ]
+                                    }
+                                }
+                            }
+                        }
+                    ]
+                }
+            }
+        },
+        "status": {"phase": phase},
+    }
+
+
+def pod(name, app, image, phase="Running"):
+    return {
+        "metadata": {"name": name, "labels": {"app": app}},
+        "spec": {"containers": [{"name": app, "image": image}]},
+        "status": {"phase": phase},
+    }
+
+
+class FakeCluster(object):
+    """
+    Returns the next snapshot for each cycle, the last one is kept
+    """
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.calls = {"csv": 0, "pods": 0}
+
+    def _next(self, what):
+        self.calls[what] += 1
+        index = min(self.calls[what], len(self.snapshots)) - 1
+        return self.snapshots[index][what]
+
+    def get_csv(self):
+        return self._next("csv")
+
+    def get_pods(self):
+        return self._next("pods")
+
+
+COMPONENTS = [
+    UpgradeComponent("app=rook-ceph-mon", 2),
+    UpgradeComponent("app=noobaa"),
+]
+
+
+@pytest.fixture
+def make_tracker(monkeypatch):
+    def make(snapshots, **kwargs):
+        cluster = FakeCluster(snapshots)
+        monkeypatch.setattr(UpgradeTracker, "_get_csv", lambda self: cluster.get_csv())
+        monkeypatch.setattr(
+            UpgradeTracker, "_get_pods", lambda self: cluster.get_pods()
+        )
+        tracker = UpgradeTracker(
+            COMPONENTS,
+            pre_upgrade_images=PRE_UPGRADE_IMAGES,
+            csv_name="ocs-operator.v4.6.0",
+            namespace="openshift-storage",
+            **kwargs,
+        )
+        return tracker, cluster
+
+    return make
+
+
+SNAPSHOTS = [
+    {
+        "csv": csv("Installing"),
+        "pods": [
+            pod("mon-a", "rook-ceph-mon", "rook:4.6"),
+            pod("mon-b", "rook-ceph-mon", "rook:4.5"),
+            pod("noobaa-core", "noobaa", "noobaa:5.5"),
+        ],
+    },
+    {
+        "csv": csv("Succeeded"),
+        "pods": [
+            pod("mon-a", "rook-ceph-mon", "rook:4.6"),
+            pod("mon-b", "rook-ceph-mon", "rook:4.6"),
+            pod("noobaa-core", "noobaa", "noobaa:5.5"),
+        ],
+    },
+    {
+        "csv": csv("Succeeded"),
+        "pods": [
+            pod("mon-a", "rook-ceph-mon", "rook:4.6"),
+            pod("mon-b", "rook-ceph-mon", "rook:4.6"),
+            pod("noobaa-core", "noobaa", "noobaa:5.6"),
+        ],
+    },
+]
+
+
+def test_snapshot_progress(make_tracker):
+    tracker, _ = make_tracker(SNAPSHOTS)
+    assert not tracker.snapshot()
+    # the images which are the same in the new CSV are not waited for
+    assert tracker.old_images == {"rook:4.5", "noobaa:5.5"}
+    # 1 of 2 mons, no noobaa, CSV not succeeded
+    assert tracker.progress() == 25.0
+    assert not tracker.snapshot()
+    assert tracker.pending() == ["app=noobaa"]
+    assert tracker.progress() == 75.0
+
+
+def test_wait_records_timing(make_tracker, tmpdir):
+    tracker, cluster = make_tracker(SNAPSHOTS)
+    timing = tracker.wait(sleep=0)
+    assert set(timing) == {CSV_COMPONENT, "app=rook-ceph-mon", "app=noobaa"}
+    assert timing[CSV_COMPONENT] <= timing["app=noobaa"]
+    # one CSV and one pod list per cycle, the CSV isn't fetched once succeeded
+    assert cluster.calls == {"csv": 2, "pods": 3}
+    path = tmpdir.join("rollout.json")
+    tracker.save(str(path), upgrade_version="4.6")
+    saved = json.loads(path.read())
+    assert saved["upgrade_version"] == "4.6"
+    assert saved["progress"][-1][1] == 100.0
+    assert saved["pending"] == []
+
+
+def test_timeout(make_tracker):
+    tracker, _ = make_tracker(SNAPSHOTS[:1], csv_timeout=0)
+    with pytest.raises(TimeoutException, match=CSV_COMPONENT):
+        tracker.wait(sleep=0)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_timeout_counts_from_previous_component(make_tracker, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("ocs_ci.ocs.upgrade_tracker.time", clock)
+    monkeypatch.setattr(
+        "ocs_ci.ocs.tests.test_upgrade_tracker.COMPONENTS",
+        [
+            UpgradeComponent("app=rook-ceph-osd", 1, 60),
+            UpgradeComponent("app=mds", 1, 10),
+        ],
+    )
+    osd_old = pod("osd-0", "rook-ceph-osd", "rook:4.5")
+    osd_new = pod("osd-0", "rook-ceph-osd", "rook:4.6")
+    mds_old = pod("mds-a", "mds", "rook:4.5")
+    mds_new = pod("mds-a", "mds", "rook:4.6")
+    # the OSDs roll out for 30 seconds, longer than the budget of the MDS
+    snapshots = [{"csv": csv("Succeeded"), "pods": [osd_old, mds_old]}] * 7
+    snapshots += [
+        {"csv": csv("Succeeded"), "pods": [osd_new, mds_old]},
+        {"csv": csv("Succeeded"), "pods": [osd_new, mds_new]},
+    ]
+    tracker, _ = make_tracker(snapshots)
+    timing = tracker.wait(sleep=5)
+    assert timing["app=rook-ceph-osd"] == 35
+    assert timing["app=mds"] == 40
+
+    # the MDS timeout counts once the OSDs are upgraded
+    tracker, _ = make_tracker(snapshots[-2:-1])
+    with pytest.raises(TimeoutException, match="app=mds"):
+        tracker.wait(sleep=5)
@@ -0,0 +1,578 @@
+"""
+Timeline of the cluster and test events for latency attribution.
+
+The recorder polls the cluster in the background and appends Kubernetes
+Events, creation and condition transitions of pods, phase changes of PVCs,
+readiness of volume snapshots, Ceph and NooBaa health changes (as sampled by
+the health oracle) and the test phases (setup, call and teardown) into a
+timeline file, one compact JSON entry per line. The timeline can be queried
+afterwards, e.g.::
+
+    timeline = Timeline.load("/tmp/timeline.jsonl")
+    timeline.pvc_bound_times(namespace="test-ns")
+    timeline.pod_start_breakdown(namespace="test-ns")
+
+The recorder is enabled by ``RUN['timeline_recorder']``, the file is stored in
+the log directory. Only the watched namespaces are polled: the cluster
+namespace, ``RUN['timeline_namespaces']`` and the projects created by the
+tests (see ocs_ci.helpers.helpers.create_project).
+"""
+import bisect
+import calendar
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.health_oracle import get_health_oracle
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.request_layer import BACKGROUND, request_priority
+
+log = logging.getLogger(__name__)
+
+# Sources of the timeline entries
+EVENT = "event"
+OBJECT = "object"
+HEALTH = "health"
+TEST = "test"
+# What happened to an object, besides its conditions and phases
+CREATED = "created"
+READY = "ready"
+# Seconds between the polls of the cluster
+DEFAULT_INTERVAL = 10
+# Conditions of the pod in the order they are reached when the pod starts
+POD_CONDITIONS = ("PodScheduled", "Initialized", "ContainersReady", "Ready")
+
+_recorder = None
+
+
+def parse_timestamp(timestamp):
+    """
+    Args:
+        timestamp (str): Kubernetes timestamp, e.g. '2021-03-01T10:00:00Z' or
+            '2021-03-01T10:00:00.123456Z'
+
+    Returns:
+        float: Unix timestamp, None if the timestamp is not set
+
+    """
+    if not timestamp:
+        return None
+    timestamp = timestamp.rstrip("Z")
+    fraction = 0.0
+    if "." in timestamp:
+        timestamp, micro = timestamp.split(".")
+        fraction = float(f"0.{micro}")
+    parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S")
+    return calendar.timegm(parsed.timetuple()) + fraction
+
+
+class Timeline(object):
+    """
+    Recorded timeline with queries
+    """
+
+    def __init__(self, entries=None):
+        """
+        Initializer function
+
+        Args:
+            entries (list): Timeline entries (dicts with keys t, src, kind,
+                ns, name, what and info)
+
+        """
+        self.entries = sorted(entries or [], key=lambda entry: entry["t"])
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load the timeline from the file
+
+        Args:
+            path (str): Path to the timeline file
+
+        Returns:
+            Timeline: The loaded timeline
+
+        """
+        with open(path) as timeline_file:
+            return cls([json.loads(line) for line in timeline_file if line.strip()])
+
+    def select(
+        self,
+        source=None,
+        kind=None,
+        name=None,
+        namespace=None,
+        what=None,
+        start=None,
+        stop=None,
+    ):
+        """
+        Select the entries matching all the given criteria
+
+        Args:
+            source (str): Source of the entry, e.g. EVENT
+            kind (str): Kind of the object, e.g. Pod
+            name (str): Name of the object or the test node id
+            namespace (str): Namespace of the object
+            what (str): What happened, e.g. event reason or pod condition
+            start (float): Only entries at this time or later
+            stop (float): Only entries at this time or sooner
+
+        Returns:
+            list: The matching entries
+
+        """
+        criteria = {
+            "src": source,
+            "kind": kind,
+            "name": name,
+            "ns": namespace,
+            "what": what,
+        }
+        criteria = {key: value for key, value in criteria.items() if value is not None}
+        return [
+            entry
+            for entry in self.entries
+            if all(entry.get(key) == value for key, value in criteria.items())
+            and (start is None or entry["t"] >= start)
+            and (stop is None or entry["t"] <= stop)
+        ]
+
+    def test_window(self, nodeid):
+        """
+        Args:
+            nodeid (str): Node id of the test
+
+        Returns:
+            tuple: Start of the setup and end of the teardown of the test,
+                None when the test is not in the timeline
+
+        """
+        phases = self.select(source=TEST, name=nodeid)
+        if not phases:
+            return None
+        return phases[0]["t"], max(phase["info"]["stop"] for phase in phases)
+
+    def _durations(self, kind, namespace, done):
+        """
+        Seconds from creation of the objects to the first of the done
+        entries of the object
+
+        Args:
+            kind (str): Kind of the objects
+            namespace (str): Namespace of the objects, all when None
+            done (list): tuples (source, what) marking the object done
+
+        Returns:
+            dict: 'namespace/name' -> seconds, objects which are not done are
+                not included
+
+        """
+        done = set(done)
+        # (namespace, name) -> creation and done times of the object, in
+        # one pass over the (time sorted) entries
+        created = {}
+        finished = {}
+        for entry in self.entries:
+            if entry["kind"] != kind or (
+                namespace is not None and entry["ns"] != namespace
+            ):
+                continue
+            key = (entry["ns"], entry["name"])
+            if entry["src"] == OBJECT and entry["what"] == CREATED:
+                created.setdefault(key, []).append(entry["t"])
+            elif (entry["src"], entry["what"]) in done:
+                finished.setdefault(key, []).append(entry["t"])
+        durations = {}
+        for key, starts in created.items():
+            times = finished.get(key, [])
+            for start in starts:
+                index = bisect.bisect_left(times, start)
+                if index < len(times):
+                    durations["/".join(key)] = times[index] - start
+        return durations
+
+    def pvc_bound_times(self, namespace=None):
+        """
+        Args:
+            namespace (str): Namespace of the PVCs, all when None
+
+        Returns:
+            dict: 'namespace/name' -> seconds from PVC creation to Bound
+
+        """
+        return self._durations(
+            constants.PVC,
+            namespace,
+            [(EVENT, "ProvisioningSucceeded"), (OBJECT, constants.STATUS_BOUND)],
+        )
+
+    def snapshot_ready_times(self, namespace=None):
+        """
+        Args:
+            namespace (str): Namespace of the snapshots, all when None
+
+        Returns:
+            dict: 'namespace/name' -> seconds from VolumeSnapshot creation to
+                ready to use
+
+        """
+        return self._durations(
+            constants.VOLUMESNAPSHOT,
+            namespace,
+            [(EVENT, "SnapshotReady"), (OBJECT, READY)],
+        )
+
+    def pod_start_breakdown(self, namespace=None):
+        """
+        Breakdown of the pod start from Pending to Running
+
+        Args:
+            namespace (str): Namespace of the pods, all when None
+
+        Returns:
+            dict: 'namespace/name' -> dict with seconds from the pod creation
+                to each of POD_CONDITIONS reached by the pod
+
+        """
+        breakdown = {}
+        for condition in POD_CONDITIONS:
+            durations = self._durations(constants.POD, namespace, [(OBJECT, condition)])
+            for key, duration in durations.items():
+                breakdown.setdefault(key, {})[condition] = duration
+        return breakdown
+
+
+class TimelineRecorder(object):
+    """
+    Records the timeline of the cluster into a file
+    """
+
+    def __init__(self, path, interval=DEFAULT_INTERVAL, namespaces=None):
+        """
+        Initializer function
+
+        Args:
+            path (str): Path to the timeline file, entries are appended
+            interval (int): Seconds between the polls of the cluster
+            namespaces (list): Namespaces polled, more can be added by watch
+
+        """
+        self.path = path
+        self.interval = interval
+        self.namespaces = set(namespaces or [])
+        self.entries = []
+        self._seen = set()
+        self._health_seen = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def record(self, source, kind, name, what, namespace="", timestamp=None, info=None):
+        """
+        Append an entry to the timeline
+
+        Args:
+            source (str): Source of the entry, e.g. EVENT
+            kind (str): Kind of the object, e.g. Pod
+            name (str): Name of the object or the test node id
+            what (str): What happened, e.g. event reason or pod condition
+            namespace (str): Namespace of the object
+            timestamp (float): Time of the entry, now by default
+            info (any): Additional JSON serializable data
+
+        """
+        entry = {
+            "t": time.time() if timestamp is None else timestamp,
+            "src": source,
+            "kind": kind,
+            "ns": namespace or "",
+            "name": name,
+            "what": what,
+        }
+        if info is not None:
+            entry["info"] = info
+        with self._lock:
+            self.entries.append(entry)
+            with open(self.path, "a") as timeline_file:
+                timeline_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def _record_once(self, key, *args, **kwargs):
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.record(*args, **kwargs)
+
+    def watch(self, namespace):
+        """
+        Poll also the namespace
+
+        Args:
+            namespace (str): Name of the namespace
+
+        """
+        with self._lock:
+            self.namespaces.add(namespace)
+
+    def _list(self, kind):
+        with self._lock:
+            namespaces = sorted(self.namespaces)
+        items = []
+        for namespace in namespaces:
+            try:
+                items.extend(OCP(kind=kind, namespace=namespace).get()["items"])
+            except CommandFailed as ex:
+                log.debug(f"Failed to list {kind} in {namespace}: {ex}")
+        return items
+
+    def poll_events(self):
+        """
+        Record the new Kubernetes events
+        """
+        for event in self._list("Event"):
+            involved = event.get("involvedObject", {})
+            self._record_once(
+                (EVENT, event["metadata"]["uid"], event.get("count")),
+                EVENT,
+                involved.get("kind"),
+                involved.get("name"),
+                event.get("reason"),
+                namespace=involved.get("namespace"),
+                timestamp=parse_timestamp(
+                    event.get("lastTimestamp") or event.get("eventTime")
+                ),
+                info=event.get("message"),
+            )
+
+    def _record_created(self, obj):
+        metadata = obj["metadata"]
+        self._record_once(
+            (CREATED, metadata["uid"]),
+            OBJECT,
+            obj["kind"],
+            metadata["name"],
+            CREATED,
+            namespace=metadata.get("namespace"),
+            timestamp=parse_timestamp(metadata.get("creationTimestamp")),
+        )
+
+    def poll_pods(self):
+        """
+        Record creation, phase changes and condition transitions of the pods
+        """
+        for pod in self._list(constants.POD):
+            pod["kind"] = constants.POD
+            self._record_created(pod)
+            metadata = pod["metadata"]
+            status = pod.get("status", {})
+            phase = status.get("phase")
+            self._record_once(
+                (OBJECT, metadata["uid"], phase),
+                OBJECT,
+                constants.POD,
+                metadata["name"],
+                phase,
+                namespace=metadata["namespace"],
+            )
+            for condition in status.get("conditions", []):
+                if condition.get("status") != "True":
+                    continue
+                transition = condition.get("lastTransitionTime")
+                self._record_once(
+                    (OBJECT, metadata["uid"], condition["type"], transition),
+                    OBJECT,
+                    constants.POD,
+                    metadata["name"],
+                    condition["type"],
+                    namespace=metadata["namespace"],
+                    timestamp=parse_timestamp(transition),
+                )
+
+    def poll_pvcs(self):
+        """
+        Record creation and phase changes of the PVCs
+        """
+        for pvc in self._list(constants.PVC):
+            pvc["kind"] = constants.PVC
+            self._record_created(pvc)
+            metadata = pvc["metadata"]
+            phase = pvc.get("status", {}).get("phase")
+            self._record_once(
+                (OBJECT, metadata["uid"], phase),
+                OBJECT,
+                constants.PVC,
+                metadata["name"],
+                phase,
+                namespace=metadata["namespace"],
+            )
+
+    def poll_snapshots(self):
+        """
+        Record creation and readiness of the volume snapshots
+        """
+        for snapshot in self._list(constants.VOLUMESNAPSHOT):
+            snapshot["kind"] = constants.VOLUMESNAPSHOT
+            self._record_created(snapshot)
+            if snapshot.get("status", {}).get("readyToUse"):
+                metadata = snapshot["metadata"]
+                self._record_once(
+                    (READY, metadata["uid"]),
+                    OBJECT,
+                    constants.VOLUMESNAPSHOT,
+                    metadata["name"],
+                    READY,
+                    namespace=metadata["namespace"],
+                )
+
+    def poll_health(self):
+        """
+        Record the health changes sampled by the health oracle
+        """
+        transitions = get_health_oracle().timeline
+        for transition in transitions[self._health_seen :]:
+            self.record(
+                HEALTH,
+                transition.component,
+                transition.component,
+                transition.current,
+                timestamp=transition.timestamp,
+                info=transition.previous,
+            )
+        self._health_seen = len(transitions)
+
+    def poll(self):
+        """
+        Record everything new in the cluster
+        """
+        self.poll_events()
+        self.poll_pods()
+        self.poll_pvcs()
+        self.poll_snapshots()
+        self.poll_health()
+
+    def record_test_phase(self, nodeid, when, start, stop, outcome):
+        """
+        Record a phase of the test
+
+        Args:
+            nodeid (str): Node id of the test
+            when (str): Phase of the test - setup, call or teardown
+            start (float): Start of the phase
+            stop (float): End of the phase
+            outcome (str): Outcome of the phase, e.g. passed
+
+        """
+        self.record(
+            TEST,
+            TEST,
+            nodeid,
+            when,
+            timestamp=start,
+            info={"stop": stop, "outcome": outcome},
+        )
+
+    def _run(self):
+        with request_priority(BACKGROUND):
+            while True:
+                try:
+                    self.poll()
+                except Exception:
+                    log.exception("Failed to record the cluster timeline")
+                if self._stop_event.wait(self.interval):
+                    return
+
+    def start(self):
+        """
+        Start recording of the cluster in the background
+        """
+        log.info(f"Recording the cluster timeline to {self.path}")
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="timeline-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop recording of the cluster
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def timeline(self):
+        """
+        Returns:
+            Timeline: The timeline recorded so far
+
+        """
+        with self._lock:
+            return Timeline(list(self.entries))
+
+
+def start_recording(path, interval=None, namespaces=None):
+    """
+    Start the session timeline recorder
+
+    Args:
+        path (str): Path to the timeline file
+        interval (int): Seconds between the polls of the cluster
+            (default: config.RUN['timeline_interval'])
+        namespaces (list): Namespaces polled (default: the cluster namespace
+            and config.RUN['timeline_namespaces'])
+
+    Returns:
+        TimelineRecorder: The started recorder
+
+    """
+    global _recorder
+    stop_recording()
+    if namespaces is None:
+        namespaces = [config.ENV_DATA["cluster_namespace"]]
+        namespaces += config.RUN.get("timeline_namespaces") or []
+    _recorder = TimelineRecorder(
+        path,
+        interval or config.RUN.get("timeline_interval", DEFAULT_INTERVAL),
+        namespaces,
+    )
+    _recorder.start()
+    return _recorder
+
+
+def stop_recording():
+    """
+    Stop the session timeline recorder, if any
+    """
+    global _recorder
+    if _recorder:
+        _recorder.stop()
+        _recorder = None
+
+
+def watch_namespace(namespace):
+    """
+    Poll also the namespace by the session timeline recorder, if any
+
+    Args:
+        namespace (str): Name of the namespace
+
+    """
+    if _recorder:
+        _recorder.watch(namespace)
+
+
+def get_recorder():
+    """
+    Returns:
+        TimelineRecorder: The session timeline recorder, None when the
+            timeline is not recorded
+
+    """
+    return _recorder
@@ -0,0 +1,269 @@
+"""
+Tracking of the rollout of the upgraded OCS images
+
+All the upgraded components (the CSV and the pod sets) are checked against
+one snapshot per cycle: one 'oc get' of the CSV and one of all the pods of
+the namespace. The images which have to be replaced are the pre upgrade
+images missing in the new CSV, the pods of a component are upgraded once
+none of them runs any of those images. The progress of the rollout and the
+time when each component finished are recorded::
+
+    tracker = UpgradeTracker(components, pre_upgrade_images=images,
+                             csv_name=csv_name)
+    tracker.wait()
+    tracker.save(os.path.join(log_dir, "upgrade-rollout.json"))
+
+"""
+import json
+import logging
+import time
+from collections import namedtuple
+
+from ocs_ci.deployment.readiness import match_selector
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutException
+from ocs_ci.ocs.ocp import OCP, get_images
+
+log = logging.getLogger(__name__)
+
+# Name of the CSV in the rollout timing
+CSV_COMPONENT = "csv"
+
+# Pod set upgraded by the rollout: the label selector of the pods, the number
+# of the pods and the seconds to wait for them, counted from the previous pod
+# set upgraded
+UpgradeComponent = namedtuple("UpgradeComponent", ["selector", "count", "timeout"])
+UpgradeComponent.__new__.__defaults__ = (1, 720)
+
+
+class UpgradeTracker(object):
+    """
+    Snapshot based tracking of the upgrade rollout
+    """
+
+    def __init__(
+        self,
+        components,
+        old_images=None,
+        pre_upgrade_images=None,
+        csv_name=None,
+        csv_timeout=720,
+        namespace=None,
+    ):
+        """
+        Initializer function
+
+        Args:
+            components (list): UpgradeComponent of the pod sets to track
+            old_images (set): Images which have to be replaced, not needed
+                when the CSV is tracked
+            pre_upgrade_images (dict): Images of the CSV before the upgrade,
+                see ocs_ci.ocs.ocp.get_images
+            csv_name (str): Name of the upgraded CSV, the CSV is tracked
+                (has to succeed) when set
+            csv_timeout (int): Seconds to wait for the CSV to succeed
+            namespace (str): Namespace of the upgraded cluster
+
+        """
+        self.components = list(components)
+        self.old_images = set(old_images) if old_images is not None else None
+        self.pre_upgrade_images = pre_upgrade_images or dict()
+        self.csv_name = csv_name
+        self.csv_timeout = csv_timeout
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        self.start = time.time()
+        # component name -> seconds since the start when it was upgraded
+        self.timing = dict()
+        # component name -> number of its upgraded pods in the last snapshot
+        self.upgraded = dict()
+        # (seconds since the start, progress) of each snapshot
+        self.history = []
+        self.csv_ready = csv_name is None
+
+    def _get_csv(self):
+        """
+        Returns:
+            dict: The CSV data, None if it's not found
+
+        """
+        try:
+            return OCP(kind="csv", namespace=self.namespace).get(
+                resource_name=self.csv_name
+            )
+        except CommandFailed as ex:
+            log.warning(f"Failed to get CSV {self.csv_name}: {ex}")
+            return None
+
+    def _get_pods(self):
+        """
+        Returns:
+            list: Data of all the pods in the namespace
+
+        """
+        try:
+            return OCP(kind=constants.POD, namespace=self.namespace).get()["items"]
+        except CommandFailed as ex:
+            log.warning(f"Failed to list pods: {ex}")
+            return []
+
+    def snapshot(self):
+        """
+        Take one snapshot of the CSV and the pods and update the state of all
+        the components
+
+        Returns:
+            bool: True if all the components are upgraded
+
+        """
+        if not self.csv_ready:
+            csv_data = self._get_csv()
+            if csv_data:
+                new_images = set(get_images(csv_data).values())
+                self.old_images = set(self.pre_upgrade_images.values()) - new_images
+                phase = (csv_data.get("status") or {}).get("phase")
+                log.info(f"CSV {self.csv_name} is in phase {phase}")
+                if phase == "Succeeded":
+                    self.csv_ready = True
+                    self._done(CSV_COMPONENT)
+        if self.old_images is not None:
+            pods = [
+                pod
+                for pod in self._get_pods()
+                if not pod["metadata"].get("deletionTimestamp")
+            ]
+            for component in self.components:
+                self._check_component(component, pods)
+        self.history.append((time.time() - self.start, self.progress()))
+        log.info(f"Upgrade rollout progress: {self.progress():.0f}%")
+        return not self.pending()
+
+    def _check_component(self, component, pods):
+        """
+        Update the upgraded pods of the component from the snapshot of the
+        pods
+        """
+        if component.selector in self.timing:
+            return
+        pods = [pod for pod in pods if match_selector(pod, component.selector)]
+        upgraded = [
+            pod["metadata"]["name"]
+            for pod in pods
+            if (pod.get("status") or {}).get("phase") == constants.STATUS_RUNNING
+            and not self.old_images.intersection(get_images(pod).values())
+        ]
+        self.upgraded[component.selector] = len(upgraded)
+        if len(pods) != component.count:
+            log.info(
+                f"Found {len(pods)} pod(s) for selector {component.selector}, "
+                f"expected {component.count}"
+            )
+        elif len(upgraded) == component.count:
+            self._done(component.selector)
+
+    def _done(self, name):
+        self.timing[name] = time.time() - self.start
+        log.info(f"{name} upgraded after {self.timing[name]:.0f}s")
+
+    def pending(self):
+        """
+        Returns:
+            list: Names of the components which are not upgraded yet
+
+        """
+        pending = [] if self.csv_ready else [CSV_COMPONENT]
+        return pending + [
+            c.selector for c in self.components if c.selector not in self.timing
+        ]
+
+    def progress(self):
+        """
+        Returns:
+            float: Percentage of the upgraded pods (and the CSV) of all the
+                tracked ones
+
+        """
+        total = sum(c.count for c in self.components)
+        done = sum(
+            c.count
+            if c.selector in self.timing
+            else min(self.upgraded.get(c.selector, 0), c.count)
+            for c in self.components
+        )
+        if self.csv_name:
+            total += 1
+            done += self.csv_ready
+        return 100.0 * done / total if total else 100.0
+
+    def timed_out(self):
+        """
+        The pod sets roll out one after another in the order of the
+        components, the timeout of a component counts from the time all the
+        previous ones were upgraded (the CSV for the first one)
+
+        Returns:
+            list: Names of the pending components which are over their
+                timeout
+
+        """
+        now = time.time()
+        if not self.csv_ready:
+            return [CSV_COMPONENT] if now - self.start > self.csv_timeout else []
+        since = self.timing.get(CSV_COMPONENT, 0)
+        for component in self.components:
+            if component.selector not in self.timing:
+                if now - self.start - since > component.timeout:
+                    return [component.selector]
+                # the clock of the next components didn't start yet
+                return []
+            since = max(since, self.timing[component.selector])
+        return []
+
+    def wait(self, sleep=5):
+        """
+        Wait for all the components to be upgraded
+
+        Args:
+            sleep (int): Seconds between the snapshots
+
+        Returns:
+            dict: component name -> seconds since the start when it was
+                upgraded
+
+        Raises:
+            TimeoutException: In case some component is not upgraded in time
+
+        """
+        log.info(f"Waiting for the upgrade of {self.pending()}")
+        while not self.snapshot():
+            timed_out = self.timed_out()
+            if timed_out:
+                raise TimeoutException(
+                    f"Components {timed_out} weren't upgraded in time, upgrade "
+                    f"progress: {self.progress():.0f}%"
+                )
+            time.sleep(sleep)
+        log.info(f"Upgrade rollout finished after {time.time() - self.start:.0f}s")
+        return self.timing
+
+    def save(self, path, **info):
+        """
+        Save the rollout timing as JSON, for the comparison of the upgrade
+        runs
+
+        Args:
+            path (str): Path of the file
+            **info: Additional data to save, e.g. the versions
+
+        """
+        data = dict(info)
+        data.update(
+            {
+                "timing": self.timing,
+                "progress": self.history,
+                "pending": self.pending(),
+            }
+        )
+        with open(path, "w") as timing_file:
+            json.dump(data, timing_file, indent=2)
+        log.info(f"Upgrade rollout timing saved to {path}")
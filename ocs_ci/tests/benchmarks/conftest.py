@@ -0,0 +1,201 @@
+# -*- coding: utf8 -*-
+"""
+Fixtures for the framework hot-path micro-benchmarks.
+
+All data used here are recorded outputs of real cluster commands (one sample
+line or object per kind), which are replicated to a realistic size, so the
+benchmarks run completely offline without any cluster.
+"""
+
+import copy
+import datetime
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+FIO_OUTPUT = os.path.join(HERE, os.pardir, os.pardir, "ocs", "tests", "fio.output")
+
+# Number of objects used by the benchmarks, from a small cluster to a big
+# scale run
+SIZES = (1000, 10000, 50000)
+
+# Recorded ``oc get pvc -n namespace-test`` output
+PVC_TABLE_HEADER = (
+    "NAME                      STATUS   VOLUME                                     "
+    "CAPACITY   ACCESS MODES   STORAGECLASS                  AGE"
+)
+PVC_TABLE_ROW = (
+    "pvc-test-{index:08d}      Bound    pvc-5f3c2a6e-7d26-4b8c-9a3b-{index:012d}   "
+    "3Gi        RWO            ocs-storagecluster-ceph-rbd   2m"
+)
+
+# Recorded csi-provisioner container log lines for one PVC
+CSI_PROVISIONER_LOG = (
+    "I1019 {time_start} 1 controller.go:1284] provision "
+    '"namespace-test/{pvc_name}" class "ocs-storagecluster-ceph-rbd": started\n'
+    "I1019 {time_end} 1 controller.go:1383] provision "
+    '"namespace-test/{pvc_name}" class "ocs-storagecluster-ceph-rbd": '
+    'volume "pvc-{pvc_name}" provisioned\n'
+    "I1019 {time_end} 1 controller.go:1400] provision "
+    '"namespace-test/{pvc_name}" class "ocs-storagecluster-ceph-rbd": succeeded\n'
+)
+
+# Recorded ripsaw pgbench output of one run
+PGSQL_LOG_RUN = (
+    "PGBench Results\n"
+    "{{'run_id': {run}, 'scaling_factor': 100, 'number_of_clients': 2,\n"
+    "'number_of_threads': 2, 'number_of_transactions_per_client': 1000,\n"
+    "'number_of_transactions_actually_processed': 2000,\n"
+    "'latency_average_ms': 7, 'latency_stddev_ms': 0,\n"
+    "'tps_incl_con_est': 234, 'tps_excl_con_est': 243}}\n"
+)
+
+# Recorded item of ``oc get pod -A -o yaml`` output
+POD_ITEM = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "pod-test-rbd-0",
+        "namespace": "namespace-test",
+        "labels": {"app": "pod-test"},
+        "uid": "3f2c9c3e-6f7e-4b5e-8f1e-000000000000",
+    },
+    "spec": {
+        "containers": [{"name": "web-server", "image": "nginx"}],
+        "nodeName": "compute-0",
+    },
+    "status": {"phase": "Running"},
+}
+
+
+def _size_id(size):
+    return f"{size}-objects"
+
+
+@pytest.fixture(params=SIZES, ids=_size_id)
+def size(request):
+    """
+    Number of objects the benchmark works with.
+    """
+    return request.param
+
+
+@pytest.fixture
+def pvc_table(size):
+    """
+    ``oc get pvc`` table output with ``size`` rows.
+    """
+    rows = [PVC_TABLE_ROW.format(index=i) for i in range(size)]
+    return "\n".join([PVC_TABLE_HEADER] + rows)
+
+
+@pytest.fixture
+def make_pod_items():
+    """
+    Factory replicating the recorded pod item.
+    """
+
+    def factory(count, prefix="pod-test"):
+        """
+        Args:
+            count (int): Number of pod items to create
+            prefix (str): Prefix of the pod names
+
+        Returns:
+            list: pod items as returned by ``oc get pod -o yaml``
+
+        """
+        items = []
+        for i in range(count):
+            item = copy.deepcopy(POD_ITEM)
+            item["metadata"]["name"] = f"{prefix}-{i}"
+            item["metadata"]["uid"] = f"{item['metadata']['uid'][:-12]}{i:012d}"
+            items.append(item)
+        return items
+
+    return factory
+
+
+@pytest.fixture
+def pgsql_logs(size):
+    """
+    ripsaw pgbench log with ``size`` runs.
+    """
+    return "".join(PGSQL_LOG_RUN.format(run=i) for i in range(size + 1))
+
+
+@pytest.fixture
+def csi_provisioner_logs(size):
+    """
+    csi-provisioner log of ``size`` provisioned PVCs and their names.
+    """
+    start = datetime.datetime(2020, 10, 19, 10, 0, 0)
+    lines = []
+    pvc_names = []
+    for i in range(size):
+        pvc_name = f"pvc-test-{i:08d}"
+        time_start = start + datetime.timedelta(milliseconds=10 * i)
+        time_end = time_start + datetime.timedelta(seconds=2)
+        lines.append(
+            CSI_PROVISIONER_LOG.format(
+                time_start=time_start.strftime("%H:%M:%S.%f"),
+                time_end=time_end.strftime("%H:%M:%S.%f"),
+                pvc_name=pvc_name,
+            )
+        )
+        pvc_names.append(pvc_name)
+    return "".join(lines), pvc_names
+
+
+@pytest.fixture
+def fio_output():
+    """
+    Recorded fio json output, with io_u error lines as produced by fio when
+    the volume is full.
+    """
+    with open(FIO_OUTPUT, "r") as fio_file:
+        content = fio_file.read()
+    err_line = (
+        "fio: io_u error on file /mnt/target/simple-write.0.0: "
+        "No space left on device: write offset=90280222720, buflen=4096"
+    )
+    return "\n".join([err_line] * 100 + [content])
+
+
+@pytest.fixture
+def make_must_gather_tree(tmp_path):
+    """
+    Factory of a synthetic must gather tree, with the expected gather files
+    and pod log directories.
+    """
+
+    def factory(expected_files, pod_count):
+        """
+        Args:
+            expected_files (list): Names of the gather files, yaml files
+                get a 'kind' line
+            pod_count (int): Number of the pod directories with logs
+
+        Returns:
+            str: Root of the must gather tree
+
+        """
+        root = tmp_path / "must_gather_ocs_logs"
+        gather = root / "quay-io-ocs-must-gather" / "ceph" / "must_gather_commands"
+        gather.mkdir(parents=True)
+        for name in expected_files:
+            content = "kind: List\n" if name.endswith(".yaml") else "output\n"
+            (gather / name).write_text(content)
+        pods = root / "quay-io-ocs-must-gather" / "namespaces" / "openshift-storage"
+        pods = pods / "pods"
+        for i in range(pod_count):
+            logs = pods / f"pod-test-{i}" / "web-server" / "web-server" / "logs"
+            logs.mkdir(parents=True)
+            (logs / "current.log").write_text("log line\n")
+            (logs / "previous.log").write_text("")
+        return str(root)
+
+    return factory
@@ -0,0 +1,152 @@
+# -*- coding: utf8 -*-
+"""
+Micro-benchmarks of the framework hot paths.
+
+Run via ``tox -e benchmark``, which stores the results and fails when
+a benchmark regresses compared to the previously stored run.
+"""
+
+import pytest
+
+from ocs_ci.framework import merge_dict
+from ocs_ci.ocs import constants, fiojob
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.helpers import helpers  # needs ocs modules imported first
+from ocs_ci.ocs.must_gather import must_gather
+from ocs_ci.ocs.must_gather.const_must_gather import GATHER_COMMANDS_VERSION
+from ocs_ci.utility import environment_check, prometheus
+from ocs_ci.utility.templating import Templating
+from ocs_ci.utility.utils import mask_secrets, parse_pgsql_logs
+
+
+def test_ocp_get_resource(benchmark, monkeypatch, pvc_table):
+    ocp_pvc = OCP(kind=constants.PVC, namespace="namespace-test")
+    monkeypatch.setattr(ocp_pvc, "get", lambda *args, **kwargs: pvc_table)
+    # data of the object are checked by get_resource for the build WA
+    ocp_pvc._data = {"items": [{"kind": constants.PVC}]}
+    status = benchmark(ocp_pvc.get_resource, "pvc-test-00000000", "STATUS")
+    assert status == constants.STATUS_BOUND
+
+
+# compare_dicts is quadratic, so the biggest size is out of reach here
+@pytest.mark.parametrize("count", [1000, 5000])
+def test_compare_dicts(benchmark, make_pod_items, count):
+    before = make_pod_items(count)
+    after = before[: count // 2] + make_pod_items(count // 10, prefix="leftover")
+    added, removed = benchmark(environment_check.compare_dicts, before, after)
+    assert len(added) == count // 10
+    assert len(removed) == count - count // 2
+
+
+def test_fio_to_dict(benchmark, fio_output):
+    fio_dict = benchmark(fiojob.fio_to_dict, fio_output)
+    assert len(fio_dict["jobs"]) == 1
+
+
+def test_parse_pgsql_logs(benchmark, pgsql_logs, size):
+    result = benchmark(parse_pgsql_logs, pgsql_logs)
+    assert len(result) == size
+
+
+@pytest.fixture
+def csi_provisioner(monkeypatch, csi_provisioner_logs):
+    """
+    Serve the recorded csi-provisioner logs instead of the provisioner pods.
+    """
+    logs, pvc_names = csi_provisioner_logs
+    monkeypatch.setattr(
+        helpers.pod,
+        "get_csi_provisioner_pod",
+        lambda interface: ("provisioner-a", "provisioner-b"),
+    )
+    monkeypatch.setattr(
+        helpers.pod,
+        "get_pod_logs",
+        lambda pod_name, *args, **kwargs: logs if pod_name == "provisioner-a" else "",
+    )
+    return pvc_names
+
+
+def test_get_provision_time(benchmark, csi_provisioner):
+    provision_time = benchmark(
+        helpers.get_provision_time,
+        constants.CEPHBLOCKPOOL,
+        csi_provisioner[-1],
+        status="end",
+    )
+    assert provision_time is not None
+
+
+def test_measure_pvc_creation_time(benchmark, csi_provisioner):
+    creation_time = benchmark(
+        helpers.measure_pvc_creation_time,
+        constants.CEPHBLOCKPOOL,
+        csi_provisioner[len(csi_provisioner) // 2],
+    )
+    assert creation_time == 2.0
+
+
+def test_mask_secrets(benchmark, pvc_table):
+    secrets = [f"pvc-test-{i:08d}" for i in range(0, 1000, 10)]
+    masked = benchmark(mask_secrets, pvc_table, secrets)
+    assert "pvc-test-00000000" not in masked
+
+
+def test_render_template(benchmark, size):
+    templating = Templating()
+    data = {
+        "pod_kubeconfig": "/tmp/kubeconfig",
+        "pod_pull_secret": "/tmp/pull-secret",
+        "rhel_worker_nodes": [f"compute-{i}.example.com" for i in range(size)],
+    }
+    inventory = benchmark(
+        templating.render_template,
+        "ocp-deployment/" + constants.INVENTORY_TEMPLATE,
+        data,
+    )
+    assert f"compute-{size - 1}.example.com" in inventory
+
+
+def test_merge_dict(benchmark, make_pod_items, size):
+    # config loading merges several layers of configuration into the defaults
+    new = {
+        "ENV_DATA": {f"key_{i}": {"items": make_pod_items(1)} for i in range(size)},
+        "RUN": {"log_dir": "/tmp", "cli_params": {"io_in_bg": True}},
+    }
+    result = benchmark(lambda: merge_dict({"ENV_DATA": {}, "RUN": {}}, new))
+    assert len(result["ENV_DATA"]) == size
+
+
+def test_check_query_range_result_limits(benchmark, size):
+    # utilization of 10 OSDs sampled with 1s step
+    start = 1585652658.918
+    result = [
+        {
+            "metric": {"__name__": "ceph_osd_utilization", "ceph_daemon": f"osd.{i}"},
+            "values": [[start + j, str(40 + j % 20)] for j in range(size)],
+        }
+        for i in range(10)
+    ]
+    assert benchmark(prometheus.check_query_range_result_limits, result, 0, 80)
+
+
+@pytest.mark.parametrize("pod_count", [1000, 5000])
+def test_validate_must_gather_files(
+    benchmark, monkeypatch, make_must_gather_tree, pod_count
+):
+    files = GATHER_COMMANDS_VERSION[4.6]["OTHERS"]
+    root = make_must_gather_tree(files, pod_count)
+    monkeypatch.setattr(must_gather, "get_ocs_parsed_version", lambda: 4.6)
+    monkeypatch.setattr(must_gather, "storagecluster_independent_check", lambda: False)
+
+    def validate():
+        mustgather = must_gather.MustGather()
+        mustgather.root = root
+        mustgather.log_type = "OTHERS"
+        mustgather.validate_file_size()
+        mustgather.validate_expected_files()
+        return mustgather
+
+    mustgather = benchmark(validate)
+    assert len(mustgather.empty_files) == pod_count
+    assert mustgather.files_not_exist == ["noobaa_diagnostics.tar.gz"]
@@ -0,0 +1,314 @@
+"""
+Latency statistics of the calls to the cluster.
+
+Every command executed via ``exec_cmd`` (oc commands including those executed
+in the pods via ``oc rsh`` or ``oc exec`` such as ceph commands, and other
+CLI tools), every Prometheus API request and every MCG RPC and S3 call is
+recorded with its latency into a histogram per test and per the kind of the
+call (component, verb and kind, e.g. ``oc get pod``). The slowest calls of
+each test are kept as well, so that they can be shown in the html report.
+The calls done with background priority (see
+``ocs_ci.ocs.request_layer.request_priority``), e.g. by the monitoring
+threads, are recorded separately under ``<test> [background]``, so that they
+don't skew the statistics of the test itself.
+
+The statistics are exported into a JSON file at the end of the run, see
+``ocs_ci.framework.pytest_customization.reports``.
+"""
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket
+# is for all the longer calls
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+# Number of the slowest calls kept for each test
+SLOWEST_CALLS = 10
+# Calls done outside of any test (e.g. session fixtures) are recorded here
+SESSION = "session"
+# Suffix of the test the background calls are recorded under
+BACKGROUND_SUFFIX = " [background]"
+# Options of oc which take a value, needed to find positional arguments
+OC_OPTIONS_WITH_VALUE = (
+    "-n",
+    "--namespace",
+    "-o",
+    "--output",
+    "-l",
+    "--selector",
+    "-f",
+    "--filename",
+    "-p",
+    "--patch",
+    "--type",
+    "-c",
+    "--container",
+    "--kubeconfig",
+)
+
+current_test = SESSION
+_histograms = defaultdict(dict)
+_slowest = defaultdict(list)
+_lock = threading.Lock()
+# sequence number of the call, to keep heap items comparable
+_sequence = 0
+
+
+class CallHistogram(object):
+    """
+    Latency histogram of one kind of calls
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, duration):
+        """
+        Add latency of a call to the histogram
+
+        Args:
+            duration (float): Latency of the call in seconds
+
+        """
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if duration <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: The histogram data
+
+        """
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "max": round(self.max, 6),
+            "buckets": dict(
+                zip([str(bound) for bound in LATENCY_BUCKETS] + ["inf"], self.buckets)
+            ),
+        }
+
+
+def positional_args(cmd):
+    """
+    Positional arguments of oc command, options and their values are
+    skipped.
+
+    Args:
+        cmd (list): Command split to arguments, without the program
+
+    Returns:
+        list: Positional arguments
+
+    """
+    positional = []
+    args = iter(cmd)
+    for arg in args:
+        if arg == "--":
+            positional.extend(args)
+        elif arg in OC_OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith("-"):
+            positional.append(arg)
+    return positional
+
+
+def classify_command(cmd):
+    """
+    Find out component, verb and kind of the command for the statistics, e.g.
+    ``oc get pod`` for ``oc -n ns get pod pod-name -o yaml`` or
+    ``oc rsh ceph`` for ``oc rsh rook-ceph-tools-xyz ceph health``.
+
+    Args:
+        cmd (list): Command split to arguments
+
+    Returns:
+        tuple: component, verb and kind of the command
+
+    """
+    if not cmd:
+        return "", "", ""
+    component = os.path.basename(cmd[0])
+    positional = positional_args(cmd[1:])
+    verb = positional[0] if positional else ""
+    kind = ""
+    if component == "oc" and verb in ("rsh", "exec"):
+        # program executed in the pod instead of the pod name
+        kind = positional[2] if len(positional) > 2 else ""
+    elif component == "oc" and len(positional) > 1:
+        kind = positional[1].lower()
+    return component, verb, kind
+
+
+def stats_key():
+    """
+    Returns:
+        str: The test the calls of this thread are recorded under, with
+            BACKGROUND_SUFFIX for the calls done with background priority
+
+    """
+    # request_layer imports this module
+    from ocs_ci.ocs.request_layer import BACKGROUND, get_request_priority
+
+    if get_request_priority() == BACKGROUND:
+        return current_test + BACKGROUND_SUFFIX
+    return current_test
+
+
+def record(component, verb, kind, duration, description=""):
+    """
+    Record latency of a call for the currently running test, see stats_key
+
+    Args:
+        component (str): Component called, e.g. oc, prometheus, s3
+        verb (str): Verb of the call, e.g. get, GET
+        kind (str): Kind of the resource, e.g. pod
+        duration (float): Latency of the call in seconds
+        description (str): Description of the call shown in the list of the
+            slowest calls, it mustn't contain secrets
+
+    """
+    global _sequence
+    key = (component, verb, kind)
+    test = stats_key()
+    with _lock:
+        histograms = _histograms[test]
+        if key not in histograms:
+            histograms[key] = CallHistogram()
+        histograms[key].add(duration)
+        _sequence += 1
+        item = (duration, _sequence, " ".join(filter(None, key)), description[:200])
+        slowest = _slowest[test]
+        if len(slowest) < SLOWEST_CALLS:
+            heapq.heappush(slowest, item)
+        elif duration > slowest[0][0]:
+            heapq.heapreplace(slowest, item)
+
+
+@contextmanager
+def timed(component, verb, kind="", description=""):
+    """
+    Record latency of the code in the context, see record
+    """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        record(component, verb, kind, time.monotonic() - start, description)
+
+
+def instrument_boto3_client(client, component="s3"):
+    """
+    Record latency of all the calls done via the boto3 client
+
+    Args:
+        client (botocore.client.BaseClient): The client to instrument
+        component (str): Component name used for the calls
+
+    """
+    service_id = client.meta.service_model.service_id.hyphenize()
+
+    def before_call(model, context, **kwargs):
+        context["call_stats"] = (model.name, time.monotonic())
+
+    def after_call(context, **kwargs):
+        operation, start = context.pop("call_stats", (None, None))
+        if operation:
+            record(component, operation, "", time.monotonic() - start, operation)
+
+    client.meta.events.register(f"before-parameter-build.{service_id}", before_call)
+    client.meta.events.register(f"after-call.{service_id}", after_call)
+    client.meta.events.register(f"after-call-error.{service_id}", after_call)
+
+
+def get_histograms(test=None):
+    """
+    Args:
+        test (str): Test node id, the current test by default
+
+    Returns:
+        dict: (component, verb, kind) -> CallHistogram
+
+    """
+    with _lock:
+        return dict(_histograms.get(test or current_test, {}))
+
+
+def get_slowest_calls(test=None):
+    """
+    Args:
+        test (str): Test node id, the current test by default
+
+    Returns:
+        list: tuples (duration, sequence, call kind, description) of the
+            slowest calls, the slowest first
+
+    """
+    with _lock:
+        return sorted(_slowest.get(test or current_test, []), reverse=True)
+
+
+def to_dict():
+    """
+    Returns:
+        dict: All the statistics, per test
+
+    """
+    with _lock:
+        return {
+            test: {
+                "calls": [
+                    dict(component=key[0], verb=key[1], kind=key[2], **hist.to_dict())
+                    for key, hist in sorted(
+                        histograms.items(), key=lambda item: -item[1].total
+                    )
+                ],
+                "slowest": [
+                    {"call": call, "description": description, "duration": duration}
+                    for duration, _, call, description in sorted(
+                        _slowest[test], reverse=True
+                    )
+                ],
+            }
+            for test, histograms in _histograms.items()
+        }
+
+
+def dump(path):
+    """
+    Write all the statistics into the JSON file
+
+    Args:
+        path (str): Path to the JSON file
+
+    """
+    with open(path, "w") as stats_file:
+        json.dump(to_dict(), stats_file, indent=2)
+    log.info(f"Latency statistics of the cluster calls saved to {path}")
+
+
+def reset():
+    """
+    Drop all the recorded statistics
+    """
+    global current_test
+    with _lock:
+        _histograms.clear()
+        _slowest.clear()
+        current_test = SESSION
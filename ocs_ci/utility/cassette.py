@@ -0,0 +1,422 @@
+"""
+Record and replay of the commands executed by the framework.
+
+In record mode, every command executed via ``exec_cmd`` (so every ``oc``
+command of ``OCP.exec_oc_cmd`` and every Ceph command of
+``Pod.exec_ceph_cmd`` as well) is stored together with its timing, return
+code and output into a cassette file. In replay mode, the recorded responses
+are served from the cassette instead of running the commands, so the test can
+be re-run without any cluster, either instantly or with the recorded timing
+scaled down by ``speed`` factor.
+
+Cassette is a gzip compressed JSON document with an index of the commands and
+deduplicated outputs (polling commands usually return the same output over
+and over again). Note that the outputs are stored as they are, without
+masking any secrets, so the cassette should be handled as sensitive data
+like the cluster logs.
+
+Usage from the command line::
+
+    run-ci ... --record-commands /tmp/test.cassette
+    run-ci ... --replay-commands /tmp/test.cassette --replay-speed 0.1
+
+The commands are matched exactly by default. With ``--replay-loose``, a
+command which wasn't recorded gets the response of the next recorded command
+of the same shape (e.g. 'oc get pod' with another pod name), which allows to
+replay the runs with randomly generated names, but may serve wrong data.
+
+Or in the code::
+
+    with recording("/tmp/test.cassette"):
+        ...
+
+"""
+import collections
+import gzip
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+
+from ocs_ci.utility import call_stats, utils
+
+log = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+MISSING_RETURNCODE = 127
+
+
+def command_key(cmd):
+    """
+    Key identifying the command in the cassette. Kubeconfig path is dropped
+    and paths of files passed to the command are replaced by hash of the
+    file content, because those differ between the runs.
+
+    Args:
+        cmd (list): Command split to arguments
+
+    Returns:
+        str: Key of the command
+
+    """
+    key = []
+    args = iter(cmd)
+    for arg in args:
+        if arg == "--kubeconfig":
+            next(args, None)
+        elif arg.startswith("--kubeconfig="):
+            continue
+        elif arg in ("-f", "--filename"):
+            key.extend([arg, file_digest(next(args, ""))])
+        else:
+            key.append(arg)
+    return " ".join(key)
+
+
+def command_shape(cmd):
+    """
+    Shape of the command - the program with its first two positional
+    arguments, e.g. 'oc get pod'. Used to match commands which differ only
+    in randomly generated names.
+
+    Args:
+        cmd (list): Command split to arguments
+
+    Returns:
+        str: Shape of the command
+
+    """
+    positional = call_stats.positional_args(cmd[1:])[:2]
+    return " ".join(cmd[:1] + [arg.lower() for arg in positional])
+
+
+def file_digest(path):
+    """
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        str: Hash of the file content, the path when the file doesn't exist
+
+    """
+    if not os.path.isfile(path):
+        return path
+    with open(path, "rb") as file_stream:
+        return "sha1:" + hashlib.sha1(file_stream.read()).hexdigest()
+
+
+class Cassette(object):
+    """
+    Recorded commands with their responses
+    """
+
+    def __init__(self, path):
+        """
+        Initializer function
+
+        Args:
+            path (str): Path to the cassette file
+
+        """
+        self.path = path
+        self.entries = []
+        self.blobs = {}
+        self.index = collections.defaultdict(list)
+        self.shapes = collections.defaultdict(list)
+        self.started = time.time()
+        self._consumed = set()
+        self._lock = threading.Lock()
+
+    def _store_blob(self, data):
+        text = data.decode(errors="surrogateescape")
+        digest = hashlib.sha1(data).hexdigest()
+        self.blobs.setdefault(digest, text)
+        return digest
+
+    def _blob(self, digest):
+        return self.blobs[digest].encode(errors="surrogateescape")
+
+    def add(self, cmd, completed_process, start, duration):
+        """
+        Record the command
+
+        Args:
+            cmd (list): Command split to arguments
+            completed_process (CompletedProcess): Result of the command
+            start (float): Time when the command was started
+            duration (float): How long the command took in seconds
+
+        """
+        with self._lock:
+            entry_id = len(self.entries)
+            self.entries.append(
+                {
+                    "cmd": list(cmd),
+                    "returncode": completed_process.returncode,
+                    "stdout": self._store_blob(completed_process.stdout),
+                    "stderr": self._store_blob(completed_process.stderr),
+                    "start": round(start - self.started, 6),
+                    "duration": round(duration, 6),
+                }
+            )
+            self.index[command_key(cmd)].append(entry_id)
+            self.shapes[command_shape(cmd)].append(entry_id)
+
+    def _next(self, entry_ids):
+        """
+        Returns:
+            int: The first not yet replayed entry, the last one when all of
+                them were already replayed (e.g. polling went longer than in
+                the recorded run), None for no entries
+
+        """
+        for entry_id in entry_ids:
+            if entry_id not in self._consumed:
+                return entry_id
+        return entry_ids[-1] if entry_ids else None
+
+    def lookup(self, cmd, strict=True):
+        """
+        Find the recorded response of the command. Responses of the same
+        command are replayed in the recorded order.
+
+        Args:
+            cmd (list): Command split to arguments
+            strict (bool): When False and the exact command wasn't recorded,
+                use response of the next recorded command of the same shape
+
+        Returns:
+            tuple: CompletedProcess and recorded duration, None when there is
+                no recorded response
+
+        """
+        with self._lock:
+            entry_id = self._next(self.index.get(command_key(cmd), []))
+            loose = False
+            if entry_id is None and not strict:
+                entry_id = self._next(self.shapes.get(command_shape(cmd), []))
+                loose = True
+            if entry_id is None:
+                return None
+            self._consumed.add(entry_id)
+            entry = self.entries[entry_id]
+            if loose:
+                log.warning(
+                    "Command %s not found in the cassette, serving the response "
+                    "of the recorded command %s",
+                    command_key(cmd),
+                    command_key(entry["cmd"]),
+                )
+            completed_process = subprocess.CompletedProcess(
+                cmd,
+                entry["returncode"],
+                self._blob(entry["stdout"]),
+                self._blob(entry["stderr"]),
+            )
+            return completed_process, entry["duration"]
+
+    def save(self):
+        """
+        Write the cassette to its file
+        """
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "started": self.started,
+                "entries": self.entries,
+                "blobs": self.blobs,
+                "index": self.index,
+            }
+            with gzip.open(self.path, "wt") as cassette_file:
+                json.dump(data, cassette_file, separators=(",", ":"))
+        log.info(
+            "Cassette with %d commands and %d unique outputs saved to %s",
+            len(self.entries),
+            len(self.blobs),
+            self.path,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load the cassette from the file
+
+        Args:
+            path (str): Path to the cassette file
+
+        Returns:
+            Cassette: The loaded cassette
+
+        """
+        with gzip.open(path, "rt") as cassette_file:
+            data = json.load(cassette_file)
+        if data["version"] != CASSETTE_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version {data['version']} of {path}"
+            )
+        cassette = cls(path)
+        cassette.started = data["started"]
+        cassette.entries = data["entries"]
+        cassette.blobs = data["blobs"]
+        cassette.index.update(data["index"])
+        for entry_id, entry in enumerate(cassette.entries):
+            cassette.shapes[command_shape(entry["cmd"])].append(entry_id)
+        return cassette
+
+    def summary(self):
+        """
+        Summary of the time spent in the recorded commands, which is the
+        cluster (and CLI) latency part of the recorded run
+
+        Returns:
+            dict: Shape of the command -> number of calls and total duration
+
+        """
+        summary = collections.defaultdict(lambda: {"calls": 0, "duration": 0.0})
+        for entry in self.entries:
+            shape = summary[command_shape(entry["cmd"])]
+            shape["calls"] += 1
+            shape["duration"] += entry["duration"]
+        return dict(summary)
+
+
+class Recorder(object):
+    """
+    Command handler running the commands and recording them to a cassette
+    """
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def __call__(self, cmd, timeout, **kwargs):
+        start = time.time()
+        completed_process = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            timeout=timeout,
+            **kwargs,
+        )
+        self.cassette.add(cmd, completed_process, start, time.time() - start)
+        return completed_process
+
+
+class Player(object):
+    """
+    Command handler serving the commands from a cassette
+    """
+
+    def __init__(self, cassette, speed=0, strict=True):
+        """
+        Initializer function
+
+        Args:
+            cassette (Cassette): Cassette to replay
+            speed (float): Factor of the recorded command duration to wait
+                before the response is returned, 0 for instant replay
+            strict (bool): Match the commands exactly, see Cassette.lookup
+
+        """
+        self.cassette = cassette
+        self.speed = speed
+        self.strict = strict
+
+    def __call__(self, cmd, timeout, **kwargs):
+        recorded = self.cassette.lookup(cmd, self.strict)
+        if recorded is None:
+            log.warning("Command %s not found in the cassette", cmd)
+            return subprocess.CompletedProcess(
+                cmd,
+                MISSING_RETURNCODE,
+                b"",
+                f"command not found in cassette {self.cassette.path}".encode(),
+            )
+        completed_process, duration = recorded
+        if self.speed:
+            time.sleep(duration * self.speed)
+        return completed_process
+
+
+_active = []
+
+
+def start_recording(path):
+    """
+    Start recording of all the executed commands
+
+    Args:
+        path (str): Path to the cassette file to create
+
+    Returns:
+        Cassette: The cassette being recorded
+
+    """
+    cassette = Cassette(path)
+    _activate(Recorder(cassette))
+    log.info("Recording executed commands to %s", path)
+    return cassette
+
+
+def start_replay(path, speed=0, strict=True):
+    """
+    Start serving all the executed commands from the cassette
+
+    Args:
+        path (str): Path to the recorded cassette file
+        speed (float): Factor of the recorded command duration to wait
+        strict (bool): Match the commands exactly, see Cassette.lookup
+
+    Returns:
+        Cassette: The cassette being replayed
+
+    """
+    cassette = Cassette.load(path)
+    _activate(Player(cassette, speed, strict))
+    log.info("Replaying commands from %s with speed %s", path, speed)
+    return cassette
+
+
+def _activate(handler):
+    stop()
+    utils.command_handlers.insert(0, handler)
+    _active.append(handler)
+
+
+def stop():
+    """
+    Stop recording or replay, the recorded cassette is saved
+    """
+    while _active:
+        handler = _active.pop()
+        utils.command_handlers.remove(handler)
+        if isinstance(handler, Recorder):
+            handler.cassette.save()
+
+
+@contextmanager
+def recording(path):
+    """
+    Record all the commands executed in the context to the cassette
+    """
+    cassette = start_recording(path)
+    try:
+        yield cassette
+    finally:
+        stop()
+
+
+@contextmanager
+def replaying(path, speed=0, strict=True):
+    """
+    Serve all the commands executed in the context from the cassette
+    """
+    cassette = start_replay(path, speed, strict)
+    try:
+        yield cassette
+    finally:
+        stop()
@@ -4,15 +4,19 @@ Module that connects to remote server and execute operations on remote server
 
 import logging
 
-from paramiko import SSHClient, AutoAddPolicy
 from paramiko.auth_handler import AuthenticationException, SSHException
 
+from ocs_ci.utility.ssh_pool import get_ssh_pool
+
 logger = logging.getLogger(__name__)
 
 
 class Connection(object):
     """
     A class that connects to remote server
+
+    The connection is taken from the shared SSH session pool, so instances
+    for the same host and credentials reuse one SSH connection.
     """
 
     def __init__(self, host, user=None, private_key=None):
@@ -43,9 +47,9 @@ class Connection(object):
 
         """
         try:
-            client = SSHClient()
-            client.set_missing_host_key_policy(AutoAddPolicy())
-            client.connect(self.host, username=self.user, key_filename=self.private_key)
+            client = get_ssh_pool().get_client(
+                self.host, user=self.user, private_key=self.private_key
+            )
         except AuthenticationException as authException:
             logger.error(f"Authentication failed: {authException}")
             raise authException
@@ -67,10 +71,11 @@ class Connection(object):
 
         """
         logger.info(f"Executing cmd: {cmd} on {self.host}")
-        _, out, err = self.client.exec_command(cmd)
-        retcode = out.channel.recv_exit_status()
-        stdout = out.read().decode("ascii").strip("\n")
-        stderr = err.read().decode("ascii").strip("\n")
+        retcode, stdout, stderr = get_ssh_pool().exec_cmd(
+            self.host, cmd, user=self.user, private_key=self.private_key
+        )
+        stdout = stdout.strip("\n")
+        stderr = stderr.strip("\n")
         logger.debug(f"retcode: {retcode}")
         logger.debug(f"stdout: {stdout}")
         logger.debug(f"stderr: {stderr}")
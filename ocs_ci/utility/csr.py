@@ -1,14 +1,39 @@
+import base64
+import calendar
+import json
 import logging
+import threading
 import time
 
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.x509.oid import NameOID
+
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, exceptions, ocp
+from ocs_ci.ocs.request_layer import BACKGROUND, request_priority
 from ocs_ci.utility.vsphere import VSPHERE
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import run_cmd, TimeoutSampler
 
 logger = logging.getLogger(__name__)
 
+# Seconds between the checks of the CSRs by CSRApprover
+CSR_POLL_INTERVAL = 10
+# Columns of the CSRs checked by CSRApprover in each cycle, the complete CSRs
+# are fetched only for the new ones
+CSR_STATE_COLUMNS = (
+    "NAME:.metadata.name,USER:.spec.username,CONDITIONS:.status.conditions[*].type"
+)
+# Max. number of CSRs approved by a single command
+CSR_APPROVE_BATCH = 50
+# Requestors of the CSRs of the nodes - kubelet client certificate requested
+# by node bootstrapper and kubelet serving certificate requested by the node
+NODE_CSR_USERNAMES = (
+    "system:serviceaccount:openshift-machine-config-operator:node-bootstrapper",
+    "system:node:",
+)
+
 
 @retry(
     (exceptions.PendingCSRException, exceptions.TimeoutExpiredError),
@@ -133,13 +158,240 @@ def get_nodes_csr():
     return csr_nodes
 
 
+def list_csrs(names=None, csr_ocp=None):
+    """
+    List the CSRs
+
+    Args:
+        names (list): Names of the CSRs to list, all the CSRs when not set
+        csr_ocp (ocp.OCP): OCP object of the CSRs, see get_csr_resource
+
+    Returns:
+        list: CSR items
+
+    """
+    csr_ocp = csr_ocp or get_csr_resource()
+    out = csr_ocp.exec_oc_cmd(
+        f"get csr {' '.join(names or [])} -o json", out_yaml_format=False
+    )
+    data = json.loads(out)
+    # a single CSR is returned as the item itself, not as a list
+    return data["items"] if "items" in data else [data]
+
+
+def list_csr_states(csr_ocp=None):
+    """
+    List the names, requestors and states of all the CSRs, without the
+    certificate requests and the issued certificates
+
+    Args:
+        csr_ocp (ocp.OCP): OCP object of the CSRs, see get_csr_resource
+
+    Returns:
+        list: tuples (name, requestor, pending) of the CSRs, pending is True
+            if the CSR is neither approved nor denied
+
+    """
+    csr_ocp = csr_ocp or get_csr_resource()
+    out = csr_ocp.exec_oc_cmd(
+        f"get csr --no-headers -o custom-columns={CSR_STATE_COLUMNS}",
+        out_yaml_format=False,
+    )
+    states = []
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) == 3:
+            states.append((fields[0], fields[1], fields[2] == "<none>"))
+    return states
+
+
+def get_csr_node_name(csr_item):
+    """
+    Get name of the node the CSR is for, from the common name of the
+    requested certificate (system:node:<node name>)
+
+    Args:
+        csr_item (dict): The CSR item
+
+    Returns:
+        str: Name of the node, None if the CSR is not for a node
+
+    """
+    try:
+        request = x509.load_pem_x509_csr(
+            base64.b64decode(csr_item["spec"]["request"]), default_backend()
+        )
+        common_name = request.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+    except (KeyError, ValueError) as ex:
+        logger.debug(f"Failed to decode CSR {csr_item['metadata']['name']}: {ex}")
+        return None
+    if common_name and common_name[0].value.startswith("system:node:"):
+        return common_name[0].value[len("system:node:") :]
+    return None
+
+
+class CSRApprover(object):
+    """
+    Approves the pending CSRs of the nodes in the background, as soon as
+    they appear, and measures how long the nodes waited for the approval::
+
+        with CSRApprover() as approver:
+            add_nodes()
+        logger.info(approver.get_join_latency())
+
+    """
+
+    def __init__(self, interval=CSR_POLL_INTERVAL, usernames=NODE_CSR_USERNAMES):
+        """
+        Initializer function
+
+        Args:
+            interval (float): Seconds between the checks of the CSRs
+            usernames (tuple): Prefixes of the requestors of the CSRs to
+                approve, all the pending CSRs are approved when empty
+
+        """
+        self.interval = interval
+        self.usernames = usernames
+        self.approved = {}
+        # node name -> creation time of its first CSR and time of the last
+        # approval of its CSR
+        self.nodes = {}
+        # last part of the requestor name -> names of its CSRs, the same as
+        # get_nodes_csr
+        self.csr_nodes = {}
+        self._seen = set()
+        self._csr_ocp = ocp.OCP(kind="csr", namespace=constants.DEFAULT_NAMESPACE)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _matches(self, username):
+        return not self.usernames or username.startswith(self.usernames)
+
+    def _add(self, item):
+        """
+        Add the new CSR to the CSRs of its requestor and its node
+        """
+        name = item["metadata"]["name"]
+        user = item["spec"].get("username", "").split(":")[-1]
+        self.csr_nodes.setdefault(user, []).append(name)
+        node_name = get_csr_node_name(item)
+        if node_name:
+            created = time.strptime(
+                item["metadata"]["creationTimestamp"], "%Y-%m-%dT%H:%M:%SZ"
+            )
+            node = self.nodes.setdefault(
+                node_name, {"first_csr": calendar.timegm(created)}
+            )
+            node.setdefault("csrs", []).append(name)
+
+    def check(self):
+        """
+        Approve the pending CSRs, by batches. Only the states of the CSRs are
+        listed, the complete CSRs are fetched only for the new ones.
+
+        Returns:
+            list: Names of the approved CSRs
+
+        """
+        states = list_csr_states(self._csr_ocp)
+        new = [name for name, _, _ in states if name not in self._seen]
+        new_items = list_csrs(new, self._csr_ocp) if new else []
+        pending = [
+            name
+            for name, username, is_pending in states
+            if is_pending and self._matches(username)
+        ]
+        with self._lock:
+            for item in new_items:
+                if item["metadata"]["name"] not in self._seen:
+                    self._seen.add(item["metadata"]["name"])
+                    self._add(item)
+        for i in range(0, len(pending), CSR_APPROVE_BATCH):
+            batch = pending[i : i + CSR_APPROVE_BATCH]
+            logger.info(f"Approving CSRs {batch}")
+            approve_csrs(batch)
+            now = time.time()
+            with self._lock:
+                for name in batch:
+                    self.approved[name] = now
+                for node in self.nodes.values():
+                    if set(batch) & set(node["csrs"]):
+                        node["approved"] = now
+        return pending
+
+    def _run(self):
+        with request_priority(BACKGROUND):
+            while True:
+                try:
+                    self.check()
+                except Exception:
+                    logger.exception("Failed to approve the pending CSRs")
+                if self._stop_event.wait(self.interval):
+                    return
+
+    def start(self):
+        """
+        Start approving the CSRs in the background
+        """
+        logger.info("Starting approval of the pending CSRs")
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="csr-approver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop approving the CSRs
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        logger.info(f"Approved {len(self.approved)} CSRs")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def get_nodes_csr(self):
+        """
+        Returns:
+            dict: The CSRs seen so far, in the format of get_nodes_csr
+
+        """
+        with self._lock:
+            return {user: list(csrs) for user, csrs in self.csr_nodes.items()}
+
+    def get_join_latency(self):
+        """
+        Returns:
+            dict: node name -> seconds from creation of its first CSR to the
+                approval of its last CSR, nodes with no approved CSR are not
+                included
+
+        """
+        with self._lock:
+            return {
+                node_name: node["approved"] - node["first_csr"]
+                for node_name, node in self.nodes.items()
+                if "approved" in node
+            }
+
+
 def wait_for_all_nodes_csr_and_approve(timeout=900, sleep=10, expected_node_num=None):
     """
-    Wait for CSR to generate for nodes
+    Wait for CSR to generate for nodes. The pending CSRs of the nodes are
+    approved by CSRApprover as soon as they appear.
 
     Args:
         timeout (int): Time in seconds to wait
-        sleep (int): Sampling time in seconds
+        sleep (int): Sampling time in seconds of the CSRs seen by the approver
         expected_node_num (int): Number of nodes to verify CSR is generated
 
     Returns:
@@ -165,26 +417,26 @@ def wait_for_all_nodes_csr_and_approve(timeout=900, sleep=10, expected_node_num=
         expected_node_num = (
             config.ENV_DATA["master_replicas"] + config.ENV_DATA["worker_replicas"] + 1
         )
-    for csr_nodes in TimeoutSampler(timeout=timeout, sleep=sleep, func=get_nodes_csr):
-        logger.debug(f"CSR data: {csr_nodes}")
-        if len(csr_nodes.keys()) == expected_node_num:
-            logger.info(f"CSR generated for all {expected_node_num} nodes")
-            approve_pending_csr()
-            return
-        logger.warning(
-            f"Some nodes are not generated CSRs. Expected"
-            f" {expected_node_num} but found {len(csr_nodes.keys())} CSRs."
-            f"retrying again"
-        )
-        # approve the pending CSRs here since newly added nodes will not
-        # generate CSR till existing CSRs are approved
-        pending_csrs = get_pending_csr()
-        if pending_csrs:
-            approve_csrs(pending_csrs)
-        # In vSphere deployment it sometime happes that VM doesn't get ip and
-        # then we need to restart it to make our CI more stable and let the VM
-        # to get IP and continue with loading ignition config. The rester of
-        # the VMs happens only once in reboot_timeout (120 seconds).
-        if vsphere_object and time.time() - start_time >= reboot_timeout:
-            start_time = time.time()
-            vsphere_object.find_vms_without_ip_and_restart()
+    with CSRApprover(usernames=()) as approver:
+        for csr_nodes in TimeoutSampler(
+            timeout=timeout, sleep=sleep, func=approver.get_nodes_csr
+        ):
+            logger.debug(f"CSR data: {csr_nodes}")
+            if len(csr_nodes.keys()) == expected_node_num:
+                logger.info(f"CSR generated for all {expected_node_num} nodes")
+                break
+            logger.warning(
+                f"Some nodes are not generated CSRs. Expected"
+                f" {expected_node_num} but found {len(csr_nodes.keys())} CSRs."
+                f"retrying again"
+            )
+            # In vSphere deployment it sometime happes that VM doesn't get ip
+            # and then we need to restart it to make our CI more stable and
+            # let the VM to get IP and continue with loading ignition config.
+            # The rester of the VMs happens only once in reboot_timeout (120
+            # seconds).
+            if vsphere_object and time.time() - start_time >= reboot_timeout:
+                start_time = time.time()
+                vsphere_object.find_vms_without_ip_and_restart()
+    logger.info(f"Join latency of the nodes: {approver.get_join_latency()}")
+    approve_pending_csr()
@@ -0,0 +1,230 @@
+"""
+In-process container registry stand-in for offline development of the
+registry load tests.
+
+The server implements the part of the registry HTTP API V2 used by
+:mod:`ocs_ci.utility.registry_client` (monolithic blob upload, manifests,
+blob download), keeps the content in memory and optionally requires the
+token authentication of the OpenShift registry::
+
+    with fake_registry(token="secret") as registry:
+        samples = run_client(registry.url, token="secret")
+
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from base64 import b64decode
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+log = logging.getLogger(__name__)
+
+BLOB_PATH = re.compile(r"^/v2/(?P<repo>.+)/blobs/(?P<digest>sha256:[0-9a-f]{64})$")
+UPLOADS_PATH = re.compile(r"^/v2/(?P<repo>.+)/blobs/uploads/$")
+UPLOAD_PATH = re.compile(r"^/v2/(?P<repo>.+)/blobs/uploads/(?P<upload>[0-9a-f-]+)$")
+MANIFEST_PATH = re.compile(r"^/v2/(?P<repo>.+)/manifests/(?P<reference>[^/]+)$")
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Serves the requests by the registry of the server
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        log.debug(format, *args)
+
+    @property
+    def registry(self):
+        return self.server.registry
+
+    def _send(self, code, body=b"", headers=None):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _authorized(self):
+        if not self.registry.token:
+            return True
+        auth = self.headers.get("Authorization", "")
+        if auth == f"Bearer {self.registry.bearer}":
+            return True
+        self._send(
+            401,
+            b'{"errors": [{"code": "UNAUTHORIZED"}]}',
+            {
+                "WWW-Authenticate": (
+                    f'Bearer realm="{self.registry.url}/openshift/token",'
+                    f'service="fake-registry"'
+                )
+            },
+        )
+        return False
+
+    def _token(self):
+        auth = self.headers.get("Authorization", "")
+        if auth.startswith("Basic "):
+            _, _, password = b64decode(auth[6:]).decode().partition(":")
+            if password == self.registry.token:
+                body = json.dumps({"token": self.registry.bearer}).encode()
+                return self._send(200, body, {"Content-Type": "application/json"})
+        self._send(401)
+
+    def _handle(self):
+        self.registry.stats[self.command] += 1
+        # the body is always read, the connection would be out of sync
+        self.data = self._body()
+        if self.registry.delay:
+            time.sleep(self.registry.delay)
+        path = urlparse(self.path).path
+        if path == "/openshift/token":
+            return self._token()
+        if not self._authorized():
+            return
+        if path == "/v2/":
+            return self._send(200, b"{}")
+        handler = getattr(self, f"_{self.command.lower()}")
+        handler(path)
+
+    def _post(self, path):
+        match = UPLOADS_PATH.match(path)
+        if not match:
+            return self._send(404)
+        upload = str(uuid.uuid4())
+        location = f"/v2/{match.group('repo')}/blobs/uploads/{upload}"
+        self._send(202, headers={"Location": location})
+
+    def _put(self, path):
+        data = self.data
+        match = UPLOAD_PATH.match(path)
+        if match:
+            digest = parse_qs(urlparse(self.path).query).get("digest", [""])[0]
+            if digest != f"sha256:{hashlib.sha256(data).hexdigest()}":
+                return self._send(400, b'{"errors": [{"code": "DIGEST_INVALID"}]}')
+            self.registry.blobs[digest] = data
+            return self._send(201, headers={"Docker-Content-Digest": digest})
+        match = MANIFEST_PATH.match(path)
+        if match:
+            manifest = json.loads(data.decode())
+            for blob in [manifest["config"]] + manifest["layers"]:
+                if blob["digest"] not in self.registry.blobs:
+                    return self._send(400, b'{"errors": [{"code": "BLOB_UNKNOWN"}]}')
+            key = (match.group("repo"), match.group("reference"))
+            self.registry.manifests[key] = data
+            return self._send(201)
+        self._send(404)
+
+    def _get(self, path):
+        match = BLOB_PATH.match(path)
+        if match and match.group("digest") in self.registry.blobs:
+            return self._send(
+                200,
+                self.registry.blobs[match.group("digest")],
+                {"Content-Type": "application/octet-stream"},
+            )
+        match = MANIFEST_PATH.match(path)
+        key = match and (match.group("repo"), match.group("reference"))
+        if key in self.registry.manifests:
+            return self._send(
+                200,
+                self.registry.manifests[key],
+                {
+                    "Content-Type": (
+                        "application/vnd.docker.distribution.manifest.v2+json"
+                    )
+                },
+            )
+        self._send(404)
+
+    _head = _get
+
+    do_GET = do_HEAD = do_POST = do_PUT = _handle
+
+
+class FakeRegistry(object):
+    """
+    Registry listening on a local port
+    """
+
+    def __init__(self, token=None, delay=0, host="127.0.0.1"):
+        """
+        Initializer function
+
+        Args:
+            token (str): Token required from the clients, no authentication
+                when not set
+            delay (float): Seconds each request is delayed by, to simulate
+                the latency of a remote registry
+            host (str): Address to listen on
+
+        """
+        self.token = token
+        self.bearer = uuid.uuid4().hex
+        self.delay = delay
+        self.stats = Counter()
+        # digest -> content of the blob
+        self.blobs = dict()
+        # (repository, tag) -> content of the manifest
+        self.manifests = dict()
+        self._server = _ThreadingHTTPServer((host, 0), _Handler)
+        self._server.registry = self
+        self.port = self._server.server_address[1]
+        self.url = f"http://{host}:{self.port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        """
+        Start serving the requests
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the server
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+@contextmanager
+def fake_registry(**kwargs):
+    """
+    Run the fake registry in the context
+
+    Args:
+        **kwargs: Passed to :class:`FakeRegistry`
+
+    Yields:
+        FakeRegistry: The running registry
+
+    """
+    registry = FakeRegistry(**kwargs)
+    registry.start()
+    log.info(f"Fake registry is listening on {registry.url}")
+    try:
+        yield registry
+    finally:
+        registry.stop()
+        log.info(f"Fake registry stopped: {dict(registry.stats)}")
@@ -0,0 +1,181 @@
+"""
+In-process SSH server stand-in for offline testing of the remote node
+operations.
+
+The server accepts any user with any password or key and runs the executed
+commands by the given handler, by default as a local shell command::
+
+    with fake_ssh_server() as server:
+        pool.exec_cmd("127.0.0.1", "uptime", port=server.port, password="x")
+        log.info(server.stats)
+
+"""
+import logging
+import socket
+import subprocess
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+import paramiko
+
+log = logging.getLogger(__name__)
+
+
+def run_local_command(command):
+    """
+    Run the command by the local shell
+
+    Args:
+        command (str): The command
+
+    Returns:
+        tuple: return code, stdout and stderr (bytes) of the command
+
+    """
+    completed = subprocess.run(
+        command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    return completed.returncode, completed.stdout, completed.stderr
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    """
+    Accepts any user and runs the exec requests by the server handler
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def get_allowed_auths(self, username):
+        return "password,publickey"
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_auth_publickey(self, username, key):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED_OPEN_REQUEST
+
+    def check_channel_exec_request(self, channel, command):
+        threading.Thread(
+            target=self.server.run_command,
+            args=(channel, command.decode()),
+            daemon=True,
+        ).start()
+        return True
+
+
+class FakeSSHServer(object):
+    """
+    SSH server listening on a local port
+    """
+
+    def __init__(self, handler=run_local_command, host="127.0.0.1"):
+        """
+        Initializer function
+
+        Args:
+            handler (function): Called with the command, returns a tuple of
+                return code, stdout and stderr (bytes)
+            host (str): Address to listen on
+
+        """
+        self.handler = handler
+        self.stats = Counter()
+        self._host_key = paramiko.RSAKey.generate(1024)
+        self._transports = []
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, 0))
+        self._socket.listen(100)
+        # accept is interrupted regularly to check for the stop of the server
+        self._socket.settimeout(0.2)
+        self._stopped = threading.Event()
+        self.port = self._socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+
+    def start(self):
+        """
+        Start accepting the connections
+        """
+        self._thread.start()
+
+    def _accept(self):
+        while not self._stopped.is_set():
+            try:
+                sock, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            sock.settimeout(None)
+            self.stats["connections"] += 1
+            transport = paramiko.Transport(sock)
+            # plain DH key exchange works with any cryptography backend
+            transport.get_security_options().kex = ("diffie-hellman-group14-sha1",)
+            transport.add_server_key(self._host_key)
+            self._transports.append(transport)
+            # start_server waits for the negotiation, don't block the accept
+            threading.Thread(
+                target=transport.start_server,
+                kwargs={"server": _ServerInterface(self)},
+                daemon=True,
+            ).start()
+
+    def run_command(self, channel, command):
+        """
+        Run the command of the channel and send its output and exit status
+        """
+        self.stats["commands"] += 1
+        try:
+            retcode, stdout, stderr = self.handler(command)
+        except Exception as ex:
+            retcode, stdout, stderr = 255, b"", str(ex).encode()
+        if stdout:
+            channel.sendall(stdout)
+        if stderr:
+            channel.sendall_stderr(stderr)
+        channel.send_exit_status(retcode)
+        channel.close()
+
+    def disconnect_all(self):
+        """
+        Drop all the client connections, e.g. to simulate a network outage
+        """
+        for transport in self._transports:
+            transport.close()
+        self._transports = []
+
+    def stop(self):
+        """
+        Stop the server and drop all the client connections
+        """
+        self._stopped.set()
+        self._thread.join()
+        self._socket.close()
+        self.disconnect_all()
+
+
+@contextmanager
+def fake_ssh_server(**kwargs):
+    """
+    Run the fake SSH server in the context
+
+    Args:
+        **kwargs: Passed to :class:`FakeSSHServer`
+
+    Yields:
+        FakeSSHServer: The running server
+
+    """
+    server = FakeSSHServer(**kwargs)
+    server.start()
+    log.info(f"Fake SSH server is listening on port {server.port}")
+    try:
+        yield server
+    finally:
+        server.stop()
+        log.info(f"Fake SSH server stopped: {dict(server.stats)}")
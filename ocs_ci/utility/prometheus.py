@@ -5,11 +5,16 @@ import requests
 import tempfile
 import time
 import yaml
+from collections import namedtuple
 from datetime import datetime
+from operator import itemgetter
+
+import numpy as np
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility import call_stats
 
 logger = logging.getLogger(name=__file__)
 
@@ -73,10 +78,70 @@ def check_alert_list(
     logger.info("Alerts were triggered correctly during utilization")
 
 
-def check_query_range_result_viafunction(
+# Decoded data series of a range query result, timestamps and values are
+# numpy arrays
+RangeSeries = namedtuple("RangeSeries", ["metric", "timestamps", "values"])
+
+
+def decode_query_range_result(result, is_float=False):
+    """
+    Decode ``[timestamp, "value"]`` pairs of all data series of a range query
+    result into numpy arrays, so that the data can be processed at once.
+
+    Args:
+        result (list): Data from ``query_range()`` method.
+        is_float (bool): assume that the value is float, otherwise assume int
+
+    Returns:
+        list: RangeSeries tuples with labels of the series, timestamps
+            (float array) and values (float or int array)
+
+    Raises:
+        ValueError: When a value can't be converted to the expected type
+
+    """
+    decoded = []
+    for metric in result:
+        samples = metric["values"]
+        timestamps = np.array(list(map(itemgetter(0), samples)), dtype=np.float64)
+        values = np.array(list(map(itemgetter(1), samples)), dtype=np.float64)
+        if not is_float:
+            # prometheus formats integral values without decimal point, so
+            # anything else (including NaN) is not an int
+            integral = np.isfinite(values) & (values == np.floor(values))
+            if not integral.all():
+                bad_value = samples[int(np.argmin(integral))][1]
+                raise ValueError(f"invalid literal for int(): '{bad_value}'")
+            values = values.astype(np.int64)
+        decoded.append(RangeSeries(metric["metric"], timestamps, values))
+    return decoded
+
+
+def elapsed_seconds(timestamps):
+    """
+    Number of whole seconds elapsed since the first timestamp, computed the
+    same way as ``(utcfromtimestamp(ts) - utcfromtimestamp(ts_0)).seconds``
+    (timestamps are rounded to microseconds first), for ranges shorter than a
+    day.
+
+    Args:
+        timestamps (numpy.ndarray): Unix timestamps
+
+    Returns:
+        numpy.ndarray: Elapsed whole seconds for each of the timestamps
+
+    """
+    whole = np.floor(timestamps)
+    microseconds = whole.astype(np.int64) * 10 ** 6 + np.round(
+        (timestamps - whole) * 10 ** 6
+    ).astype(np.int64)
+    return (microseconds - microseconds[0]) // 10 ** 6
+
+
+def check_query_range_result_masks(
     result,
-    is_value_good,
-    is_value_bad=lambda val: False,
+    good_mask,
+    bad_mask=None,
     exp_metric_num=None,
     exp_delay=None,
     exp_good_time=None,
@@ -84,13 +149,14 @@ def check_query_range_result_viafunction(
 ):
     """
     Check that result of range query matches expectations expressed via
-    ``is_value_good`` (and optionally ``is_value_bad``) functions, which takes
-    a value and returns True if the value is good (or bad).
+    ``good_mask`` (and optionally ``bad_mask``) functions, which takes a
+    numpy array of values of a data series and returns boolean array, with
+    True for good (or bad) values.
 
     Args:
         result (list): Data from ``query_range()`` method.
-        is_value_good (function): returns True for a good value
-        is_value_bad (function): returns True for a bad balue, indicating a
+        good_mask (function): returns True for good values
+        bad_mask (function): returns True for bad values, indicating a
             problem (optional, use if you need to distinguish bad and invalid
             values)
         exp_metric_num (int): expected number of data series in the result,
@@ -127,36 +193,38 @@ def check_query_range_result_viafunction(
         logger.error(msg)
         is_result_ok = False
 
-    for metric in result:
-        name = metric["metric"]["__name__"]
-        logger.info(f"checking metric {metric['metric']}")
+    for series in decode_query_range_result(result, is_float):
+        name = series.metric["__name__"]
+        logger.info(f"checking metric {series.metric}")
         # get start of the query range for which we are processing data
-        start_ts = metric["values"][0][0]
-        start_dt = datetime.utcfromtimestamp(start_ts)
+        start_dt = datetime.utcfromtimestamp(series.timestamps[0])
         logger.info(f"metrics for {name} starts at {start_dt}")
-        for ts, value in metric["values"]:
-            if is_float:
-                value = float(value)
-            else:
-                value = int(value)
-            dt = datetime.utcfromtimestamp(ts)
-            if is_value_good(value):
-                logger.debug(f"{name} has good value {value} at {dt}")
-            elif is_value_bad(value):
-                msg = f"{name} has bad value {value} at {dt}"
-                # delta is time since start of the query range
-                delta = dt - start_dt
-                if exp_delay is not None and delta.seconds < exp_delay:
-                    logger.info(msg + f" but within expected {exp_delay}s delay")
-                elif exp_good_time is not None and delta.seconds >= exp_good_time:
-                    logger.info(msg + f" but after {exp_good_time}s already passed")
-                else:
-                    logger.error(msg)
-                    bad_value_timestamps.append(dt)
-            else:
-                msg = f"{name} invalid (not good or bad): {value} at {dt}"
+        good = np.asarray(good_mask(series.values), dtype=bool)
+        not_good = ~good
+        if bad_mask is None:
+            bad = np.zeros_like(good)
+        else:
+            bad = not_good & np.asarray(bad_mask(series.values), dtype=bool)
+        invalid = not_good & ~bad
+        logger.debug(f"{name} has {np.count_nonzero(good)} good values")
+        # delta is time since start of the query range
+        delta = elapsed_seconds(series.timestamps)
+        values = series.values.tolist()
+        for i in np.flatnonzero(not_good):
+            dt = datetime.utcfromtimestamp(series.timestamps[i])
+            if invalid[i]:
+                msg = f"{name} invalid (not good or bad): {values[i]} at {dt}"
                 logger.error(msg)
                 invalid_value_timestamps.append(dt)
+                continue
+            msg = f"{name} has bad value {values[i]} at {dt}"
+            if exp_delay is not None and delta[i] < exp_delay:
+                logger.info(msg + f" but within expected {exp_delay}s delay")
+            elif exp_good_time is not None and delta[i] >= exp_good_time:
+                logger.info(msg + f" but after {exp_good_time}s already passed")
+            else:
+                logger.error(msg)
+                bad_value_timestamps.append(dt)
 
     if bad_value_timestamps != []:
         is_result_ok = False
@@ -170,6 +238,62 @@ def check_query_range_result_viafunction(
     return is_result_ok
 
 
+def check_query_range_result_viafunction(
+    result,
+    is_value_good,
+    is_value_bad=lambda val: False,
+    exp_metric_num=None,
+    exp_delay=None,
+    exp_good_time=None,
+    is_float=False,
+):
+    """
+    Check that result of range query matches expectations expressed via
+    ``is_value_good`` (and optionally ``is_value_bad``) functions, which takes
+    a value and returns True if the value is good (or bad).
+
+    The functions are called for every single value, use
+    ``check_query_range_result_masks()`` with functions working on numpy
+    arrays for long data series.
+
+    Args:
+        result (list): Data from ``query_range()`` method.
+        is_value_good (function): returns True for a good value
+        is_value_bad (function): returns True for a bad balue, indicating a
+            problem (optional, use if you need to distinguish bad and invalid
+            values)
+        exp_metric_num (int): expected number of data series in the result,
+            optional (eg. for ``ceph_health_status`` this would be 1, but
+            for something like ``ceph_osd_up`` this will be a number of
+            OSDs in the cluster)
+        exp_delay (int): Number of seconds from the start of the query
+            time range for which we should tolerate bad values. This is
+            useful if you change cluster state and processing of this
+            change is expected to take some time.
+        exp_good_time (int): Number of seconds during which we should see
+            good values in the metrics data. When this time passess values
+            can go bad (but can't be invalid). If not specified, good values
+            should be presend during the whole time.
+        is_float (bool): assume that the value is float, otherwise assume int
+
+    Returns:
+        bool: True if result matches given expectations, False otherwise
+    """
+
+    def to_mask(function):
+        return lambda values: [function(value) for value in values.tolist()]
+
+    return check_query_range_result_masks(
+        result,
+        to_mask(is_value_good),
+        to_mask(is_value_bad),
+        exp_metric_num,
+        exp_delay,
+        exp_good_time,
+        is_float,
+    )
+
+
 def check_query_range_result_enum(
     result,
     good_values,
@@ -206,12 +330,10 @@ def check_query_range_result_enum(
     Returns:
         bool: True if result matches given expectations, False otherwise
     """
-    is_value_good = lambda val: val in good_values  # noqa: E731
-    is_value_bad = lambda val: val in bad_values  # noqa: E731
-    is_result_ok = check_query_range_result_viafunction(
+    is_result_ok = check_query_range_result_masks(
         result,
-        is_value_good,
-        is_value_bad,
+        lambda values: np.isin(values, good_values),
+        lambda values: np.isin(values, bad_values),
         exp_metric_num,
         exp_delay,
         exp_good_time,
@@ -252,12 +374,10 @@ def check_query_range_result_limits(
     Returns:
         bool: True if result matches given expectations, False otherwise
     """
-    is_value_good = lambda val: good_min <= val <= good_max  # noqa: E731
-    is_value_bad = lambda val: False  # noqa: E731
-    is_result_ok = check_query_range_result_viafunction(
+    is_result_ok = check_query_range_result_masks(
         result,
-        is_value_good,
-        is_value_bad,
+        lambda values: (good_min <= values) & (values <= good_max),
+        None,
         exp_metric_num,
         exp_delay,
         exp_good_time,
@@ -378,12 +498,13 @@ class PrometheusAPI(object):
         logger.debug(f"verify={self._cacert}")
         logger.debug(f"params={payload}")
 
-        response = requests.get(
-            self._endpoint + pattern,
-            headers=headers,
-            verify=self._cacert,
-            params=payload,
-        )
+        with call_stats.timed("prometheus", "GET", resource, pattern):
+            response = requests.get(
+                self._endpoint + pattern,
+                headers=headers,
+                verify=self._cacert,
+                params=payload,
+            )
         return response
 
     def query(
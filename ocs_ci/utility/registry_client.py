@@ -0,0 +1,380 @@
+"""
+Minimal client of the container registry HTTP API V2 generating push and
+pull load with synthetic image layers.
+
+The module uses only the standard library, so it can be copied to and run in
+any pod with python3, it prints one JSON line per operation::
+
+    python3 registry_client.py --url https://registry:5000 --client 1 \\
+        --images 10 --layers 3 --layer-size 1048576 --token $TOKEN
+
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import ssl
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+MANIFEST_TYPE = "application/vnd.docker.distribution.manifest.v2+json"
+CONFIG_TYPE = "application/vnd.docker.container.image.v1+json"
+LAYER_TYPE = "application/vnd.docker.image.rootfs.diff.tar.gzip"
+# Size of the chunks the blobs are read in during the pull
+READ_SIZE = 1048576
+
+
+class RegistryError(Exception):
+    pass
+
+
+def digest_of(data):
+    """
+    Args:
+        data (bytes): Content of the blob
+
+    Returns:
+        str: The content digest used by the registry
+
+    """
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+class RegistryClient(object):
+    """
+    Client of one registry, with the token authentication of the registry
+    (e.g. the OpenShift internal registry) handled transparently
+    """
+
+    def __init__(self, url, token=None, user="unused", insecure=True, timeout=120):
+        """
+        Initializer function
+
+        Args:
+            url (str): URL of the registry, e.g. https://registry:5000
+            token (str): Password or token to authenticate with, e.g. the
+                output of 'oc whoami -t'
+            user (str): User name to authenticate with
+            insecure (bool): True for not verifying the TLS certificate
+            timeout (int): Timeout of each request in seconds
+
+        """
+        self.url = url.rstrip("/")
+        self.token = token
+        self.user = user
+        self.timeout = timeout
+        self.context = None
+        if insecure and self.url.startswith("https"):
+            self.context = ssl.create_default_context()
+            self.context.check_hostname = False
+            self.context.verify_mode = ssl.CERT_NONE
+        # scope -> bearer token issued by the registry
+        self._bearer = dict()
+
+    def _basic(self):
+        credentials = f"{self.user}:{self.token}".encode()
+        return f"Basic {base64.b64encode(credentials).decode()}"
+
+    def _authorize(self, challenge, scope):
+        """
+        Get the authorization for the challenge of the registry
+
+        Args:
+            challenge (str): WWW-Authenticate header of the 401 response
+            scope (str): Scope of the request, e.g. repository:ns/x:push,pull
+
+        Returns:
+            str: Value of the Authorization header
+
+        """
+        if not self.token:
+            raise RegistryError("Registry requires authentication, no token given")
+        if not challenge.lower().startswith("bearer"):
+            return self._basic()
+        params = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+        query = {"scope": scope}
+        if "service" in params:
+            query["service"] = params["service"]
+        request = urllib.request.Request(
+            f"{params['realm']}?{urllib.parse.urlencode(query)}",
+            headers={"Authorization": self._basic()},
+        )
+        with urllib.request.urlopen(
+            request, timeout=self.timeout, context=self.context
+        ) as response:
+            data = json.loads(response.read().decode())
+        self._bearer[scope] = data.get("token") or data.get("access_token")
+        return f"Bearer {self._bearer[scope]}"
+
+    def request(self, method, path, repo, data=None, headers=None):
+        """
+        Send the request to the registry
+
+        Args:
+            method (str): HTTP method
+            path (str): Path of the API, or the full URL (e.g. the upload
+                location returned by the registry)
+            repo (str): Repository the request is for, used for the scope of
+                the authentication
+            data (bytes): Body of the request
+            headers (dict): Additional headers
+
+        Returns:
+            http.client.HTTPResponse: The response, has to be closed
+
+        Raises:
+            RegistryError: In case the registry returned an error
+
+        """
+        url = path if path.startswith("http") else f"{self.url}{path}"
+        scope = f"repository:{repo}:push,pull"
+        headers = dict(headers or {})
+        if scope in self._bearer:
+            headers["Authorization"] = f"Bearer {self._bearer[scope]}"
+        for attempt in range(2):
+            request = urllib.request.Request(
+                url, data=data, headers=headers, method=method
+            )
+            try:
+                return urllib.request.urlopen(
+                    request, timeout=self.timeout, context=self.context
+                )
+            except urllib.error.HTTPError as ex:
+                if ex.code == 401 and attempt == 0:
+                    challenge = ex.headers.get("WWW-Authenticate", "")
+                    headers["Authorization"] = self._authorize(challenge, scope)
+                    continue
+                body = ex.read().decode(errors="replace")
+                raise RegistryError(f"{method} {url} failed: {ex.code} {body}")
+
+    def push_blob(self, repo, data):
+        """
+        Upload the blob to the repository (monolithic upload)
+
+        Args:
+            repo (str): Repository name, e.g. namespace/image
+            data (bytes): Content of the blob
+
+        Returns:
+            str: Digest of the blob
+
+        """
+        digest = digest_of(data)
+        with self.request("POST", f"/v2/{repo}/blobs/uploads/", repo, b"") as resp:
+            location = resp.headers["Location"]
+        location = urllib.parse.urljoin(f"{self.url}/", location)
+        separator = "&" if "?" in location else "?"
+        headers = {"Content-Type": "application/octet-stream"}
+        with self.request(
+            "PUT", f"{location}{separator}digest={digest}", repo, data, headers
+        ):
+            pass
+        return digest
+
+    def push_manifest(self, repo, tag, config, layers):
+        """
+        Upload the image manifest
+
+        Args:
+            repo (str): Repository name
+            tag (str): Tag of the image
+            config (tuple): Digest and size of the image config blob
+            layers (list): Tuples of the digest and size of the layer blobs
+
+        Returns:
+            int: Size of the manifest in bytes
+
+        """
+        manifest = {
+            "schemaVersion": 2,
+            "mediaType": MANIFEST_TYPE,
+            "config": {
+                "mediaType": CONFIG_TYPE,
+                "digest": config[0],
+                "size": config[1],
+            },
+            "layers": [
+                {"mediaType": LAYER_TYPE, "digest": digest, "size": size}
+                for digest, size in layers
+            ],
+        }
+        data = json.dumps(manifest).encode()
+        headers = {"Content-Type": MANIFEST_TYPE}
+        with self.request("PUT", f"/v2/{repo}/manifests/{tag}", repo, data, headers):
+            pass
+        return len(data)
+
+    def pull_manifest(self, repo, tag):
+        """
+        Returns:
+            tuple: The image manifest (dict) and its size in bytes
+
+        """
+        headers = {"Accept": MANIFEST_TYPE}
+        with self.request(
+            "GET", f"/v2/{repo}/manifests/{tag}", repo, headers=headers
+        ) as response:
+            data = response.read()
+        return json.loads(data.decode()), len(data)
+
+    def pull_blob(self, repo, digest):
+        """
+        Download the blob, the content is read and dropped
+
+        Returns:
+            int: Size of the blob in bytes
+
+        """
+        size = 0
+        with self.request("GET", f"/v2/{repo}/blobs/{digest}", repo) as response:
+            while True:
+                chunk = response.read(READ_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+        return size
+
+
+def _timed(samples, client, op, kind, func, *args):
+    """
+    Run the operation and append its sample
+
+    Returns:
+        The result of the operation, None if it failed
+
+    """
+    start = time.time()
+    sample = {"client": client, "op": op, "kind": kind, "start": start}
+    try:
+        result = func(*args)
+        sample["error"] = None
+    except Exception as ex:
+        result = None
+        sample["error"] = str(ex)
+    sample["seconds"] = time.time() - start
+    sample["bytes"] = 0
+    samples.append(sample)
+    return sample, result
+
+
+def run_client(
+    url,
+    client=0,
+    images=10,
+    layers=3,
+    layer_size=1048576,
+    repo_prefix="registry-load",
+    token=None,
+    insecure=True,
+):
+    """
+    Push the images with the synthetic layers, then pull all of them back
+
+    Args:
+        url (str): URL of the registry
+        client (int): Number of the client, part of the repository names
+        images (int): Number of the images pushed and pulled
+        layers (int): Number of the layers of each image
+        layer_size (int): Size of each layer in bytes
+        repo_prefix (str): Prefix of the repositories, e.g. the namespace
+            for the OpenShift registry
+        token (str): Password or token for the registry
+        insecure (bool): True for not verifying the TLS certificate
+
+    Returns:
+        list: dicts with the client, op (push or pull), kind (blob or
+            manifest), start (epoch), seconds, bytes and error (None when
+            the operation passed) of each operation
+
+    """
+    registry = RegistryClient(url, token=token, insecure=insecure)
+    samples = []
+    pushed = []
+    for image in range(images):
+        repo = f"{repo_prefix}/client{client}-image{image}"
+        blobs = []
+        for _ in range(layers):
+            # random content, the registry can't deduplicate the layers
+            data = os.urandom(layer_size)
+            sample, digest = _timed(
+                samples, client, "push", "blob", registry.push_blob, repo, data
+            )
+            if digest:
+                sample["bytes"] = len(data)
+                blobs.append((digest, len(data)))
+        config = json.dumps(
+            {
+                "architecture": "amd64",
+                "os": "linux",
+                "rootfs": {"type": "layers", "diff_ids": [d for d, _ in blobs]},
+            }
+        ).encode()
+        sample, config_digest = _timed(
+            samples, client, "push", "blob", registry.push_blob, repo, config
+        )
+        if config_digest is None or len(blobs) != layers:
+            continue
+        sample["bytes"] = len(config)
+        sample, size = _timed(
+            samples,
+            client,
+            "push",
+            "manifest",
+            registry.push_manifest,
+            repo,
+            "latest",
+            (config_digest, len(config)),
+            blobs,
+        )
+        if size:
+            sample["bytes"] = size
+            pushed.append(repo)
+    for repo in pushed:
+        sample, pulled = _timed(
+            samples, client, "pull", "manifest", registry.pull_manifest, repo, "latest"
+        )
+        if not pulled:
+            continue
+        manifest, sample["bytes"] = pulled
+        digests = [manifest["config"]["digest"]]
+        digests.extend(layer["digest"] for layer in manifest["layers"])
+        for digest in digests:
+            sample, size = _timed(
+                samples, client, "pull", "blob", registry.pull_blob, repo, digest
+            )
+            sample["bytes"] = size or 0
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Registry push/pull load client")
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--client", type=int, default=0)
+    parser.add_argument("--images", type=int, default=10)
+    parser.add_argument("--layers", type=int, default=3)
+    parser.add_argument("--layer-size", type=int, default=1048576)
+    parser.add_argument("--repo-prefix", default="registry-load")
+    parser.add_argument("--token", default=os.environ.get("REGISTRY_TOKEN"))
+    parser.add_argument("--verify-tls", action="store_true")
+    args = parser.parse_args(argv)
+    samples = run_client(
+        args.url,
+        client=args.client,
+        images=args.images,
+        layers=args.layers,
+        layer_size=args.layer_size,
+        repo_prefix=args.repo_prefix,
+        token=args.token,
+        insecure=not args.verify_tls,
+    )
+    for sample in samples:
+        sys.stdout.write(json.dumps(sample) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Pool of SSH sessions shared by the remote node operations
+
+One SSH connection (paramiko transport) is kept per host and credentials and
+reused for all the commands, each command runs in its own channel of the
+connection, so several commands can run on the same host at once without a
+new handshake. Connections are kept alive by SSH keepalive packets and are
+reconnected transparently when they drop. A command can be run across many
+hosts concurrently with the results streamed as they come::
+
+    pool = get_ssh_pool()
+    for result in pool.fan_out(hosts, "uptime", user="root", private_key=key):
+        logger.info(f"{result.host}: {result.stdout}")
+
+"""
+import logging
+import select
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from paramiko import AutoAddPolicy, SSHClient, SSHException
+
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+
+logger = logging.getLogger(__name__)
+
+# Seconds between the SSH keepalive packets of the pooled connections
+DEFAULT_KEEPALIVE = 30
+# Max. number of bytes received from the channel at once
+RECV_SIZE = 32768
+
+FanOutResult = namedtuple(
+    "FanOutResult", ["host", "retcode", "stdout", "stderr", "error"]
+)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class SSHSessionPool(object):
+    """
+    Shared SSH connections with multiplexed command channels
+    """
+
+    def __init__(self, keepalive=DEFAULT_KEEPALIVE):
+        """
+        Initializer function
+
+        Args:
+            keepalive (int): Seconds between the SSH keepalive packets
+
+        """
+        self.keepalive = keepalive
+        self.stats = Counter()
+        self._clients = dict()
+        self._locks = dict()
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        host,
+        user=None,
+        private_key=None,
+        password=None,
+        port=22,
+        look_for_keys=True,
+        timeout=None,
+        reconnect=False,
+    ):
+        """
+        Get the pooled connection to the host, connect if there's none or
+        the connection is not active anymore
+
+        Args:
+            host (str): Host name or IP address
+            user (str): User name to connect
+            private_key (str): Path to the private key to connect
+            password (str): Password to connect
+            port (int): SSH port of the host
+            look_for_keys (bool): True for trying the keys in ~/.ssh as well
+            timeout (float): Timeout of the TCP connect in seconds
+            reconnect (bool): True for a new connection even if the pooled
+                one looks active (e.g. it failed to open a channel)
+
+        Returns:
+            paramiko.SSHClient: The connected client
+
+        Raises:
+            paramiko.AuthenticationException: In case the authentication
+                failed
+            paramiko.SSHException: In case the SSH connection failed
+
+        """
+        key = (host, port, user, private_key, password)
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            client = self._clients.get(key)
+            transport = client.get_transport() if client else None
+            if transport and transport.is_active() and not reconnect:
+                self.stats["reused"] += 1
+                return client
+            if client:
+                logger.info(f"SSH connection to {host} is not active, reconnecting")
+                client.close()
+            client = SSHClient()
+            client.set_missing_host_key_policy(AutoAddPolicy())
+            client.connect(
+                host,
+                port=port,
+                username=user,
+                key_filename=private_key,
+                password=password,
+                look_for_keys=look_for_keys,
+                allow_agent=look_for_keys,
+                timeout=timeout,
+            )
+            client.get_transport().set_keepalive(self.keepalive)
+            self.stats["connected"] += 1
+            self._clients[key] = client
+            return client
+
+    def exec_cmd(self, host, cmd, timeout=None, **connect_kwargs):
+        """
+        Execute the command on the host in a new channel of the pooled
+        connection
+
+        Args:
+            host (str): Host name or IP address
+            cmd (str): Command to run
+            timeout (float): Seconds to wait for the command, no limit when
+                not specified
+            **connect_kwargs: Arguments of get_client
+
+        Returns:
+            tuple: tuple which contains command return code, output and error
+
+        Raises:
+            TimeoutExpiredError: In case the command hasn't finished in time
+
+        """
+        client = self.get_client(host, **connect_kwargs)
+        try:
+            channel = client.get_transport().open_session()
+        except (SSHException, EOFError, OSError) as ex:
+            # the drop of the connection may be noticed only once it's used
+            logger.info(f"SSH connection to {host} failed ({ex}), reconnecting")
+            client = self.get_client(host, reconnect=True, **connect_kwargs)
+            channel = client.get_transport().open_session()
+        self.stats["commands"] += 1
+        deadline = time.time() + timeout if timeout else None
+        stdout, stderr = [], []
+        try:
+            channel.exec_command(cmd)
+            # read both the streams while waiting, a full stderr window
+            # would block the command otherwise
+            while True:
+                if channel.recv_ready():
+                    stdout.append(channel.recv(RECV_SIZE))
+                elif channel.recv_stderr_ready():
+                    stderr.append(channel.recv_stderr(RECV_SIZE))
+                elif channel.exit_status_ready():
+                    break
+                else:
+                    if deadline and time.time() > deadline:
+                        raise TimeoutExpiredError(timeout, host, cmd)
+                    select.select([channel], [], [], 0.1)
+            # drain what came together with the exit status
+            while channel.recv_ready():
+                stdout.append(channel.recv(RECV_SIZE))
+            while channel.recv_stderr_ready():
+                stderr.append(channel.recv_stderr(RECV_SIZE))
+            retcode = channel.recv_exit_status()
+        finally:
+            channel.close()
+        return (
+            retcode,
+            b"".join(stdout).decode(errors="replace"),
+            b"".join(stderr).decode(errors="replace"),
+        )
+
+    def fan_out(self, hosts, cmd, max_workers=None, timeout=None, **connect_kwargs):
+        """
+        Execute the command on all the hosts concurrently
+
+        Args:
+            hosts (list): Host names or IP addresses
+            cmd (str): Command to run
+            max_workers (int): Max. number of hosts the command runs on at
+                once, all of them by default
+            timeout (float): Seconds to wait for the command on each host
+            **connect_kwargs: Arguments of get_client
+
+        Yields:
+            FanOutResult: Result of the command on a host, in the order the
+                command finishes. The error is the exception raised for the
+                host (e.g. failed connection), None if the command ran.
+
+        """
+        hosts = list(hosts)
+        if not hosts:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or len(hosts)) as executor:
+            futures = {
+                executor.submit(
+                    self.exec_cmd, host, cmd, timeout=timeout, **connect_kwargs
+                ): host
+                for host in hosts
+            }
+            for future in as_completed(futures):
+                host = futures[future]
+                try:
+                    retcode, stdout, stderr = future.result()
+                except Exception as ex:
+                    logger.warning(f"Failed to run {cmd} on {host}: {ex}")
+                    yield FanOutResult(host, None, None, None, ex)
+                else:
+                    yield FanOutResult(host, retcode, stdout, stderr, None)
+
+    def close(self):
+        """
+        Close all the pooled connections
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+def get_ssh_pool():
+    """
+    Returns:
+        SSHSessionPool: The SSH session pool shared by the whole session
+
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SSHSessionPool()
+        return _pool
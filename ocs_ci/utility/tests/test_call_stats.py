@@ -0,0 +1,83 @@
+# -*- coding: utf8 -*-
+
+import json
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from ocs_ci.ocs.request_layer import BACKGROUND, request_priority
+from ocs_ci.utility import call_stats
+from ocs_ci.utility.utils import run_cmd
+
+
+@pytest.fixture(autouse=True)
+def stats():
+    call_stats.reset()
+    call_stats.current_test = "test_node"
+    yield
+    call_stats.reset()
+
+
+@pytest.mark.parametrize(
+    "cmd,expected",
+    [
+        ("oc -n ns get Pod pod-1 -o yaml", ("oc", "get", "pod")),
+        ("oc --kubeconfig /tmp/k rsh tools-pod ceph health", ("oc", "rsh", "ceph")),
+        ("oc exec pod-1 -c cont -- rados df", ("oc", "exec", "rados")),
+        ("/usr/bin/aws s3 ls", ("aws", "s3", "")),
+    ],
+)
+def test_classify_command(cmd, expected):
+    assert call_stats.classify_command(cmd.split()) == expected
+
+
+def test_exec_cmd_recorded(tmp_path):
+    for _ in range(3):
+        run_cmd("echo 1")
+    call_stats.record("oc", "get", "pod", 42, "oc get pod pod-1")
+    histograms = call_stats.get_histograms()
+    assert histograms[("echo", "1", "")].count == 3
+    assert histograms[("oc", "get", "pod")].to_dict()["buckets"]["60"] == 1
+    slowest = call_stats.get_slowest_calls("test_node")
+    assert slowest[0][0] == 42
+    assert slowest[0][2:] == ("oc get pod", "oc get pod pod-1")
+    stats_file = tmp_path / "stats.json"
+    call_stats.dump(str(stats_file))
+    data = json.loads(stats_file.read_text())
+    assert data["test_node"]["calls"][0]["kind"] == "pod"
+    assert data["test_node"]["calls"][1]["count"] == 3
+
+
+def test_slowest_calls_limit():
+    for i in range(call_stats.SLOWEST_CALLS * 3):
+        call_stats.record("prometheus", "GET", "query", i, f"query {i}")
+    slowest = call_stats.get_slowest_calls()
+    assert len(slowest) == call_stats.SLOWEST_CALLS
+    assert slowest[0][3] == f"query {call_stats.SLOWEST_CALLS * 3 - 1}"
+
+
+def test_background_calls_recorded_separately():
+    call_stats.record("oc", "get", "pod", 1, "oc get pod")
+    with request_priority(BACKGROUND):
+        call_stats.record("oc", "get", "pod", 2, "oc get pod")
+        call_stats.record("oc", "rsh", "ceph", 3, "oc rsh tools ceph health")
+    assert call_stats.get_histograms()[("oc", "get", "pod")].count == 1
+    assert [call[0] for call in call_stats.get_slowest_calls()] == [1]
+    background = call_stats.get_histograms("test_node [background]")
+    assert sorted(background) == [("oc", "get", "pod"), ("oc", "rsh", "ceph")]
+    assert sorted(call_stats.to_dict()) == ["test_node", "test_node [background]"]
+
+
+def test_boto3_client():
+    client = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+    )
+    call_stats.instrument_boto3_client(client)
+    with Stubber(client) as stubber:
+        stubber.add_response("list_buckets", {"Buckets": []})
+        client.list_buckets()
+    assert call_stats.get_histograms()[("s3", "ListBuckets", "")].count == 1
@@ -0,0 +1,65 @@
+# -*- coding: utf8 -*-
+
+import logging
+
+from ocs_ci.utility import cassette
+from ocs_ci.utility.utils import exec_cmd, run_cmd
+
+
+def test_record_and_replay(tmp_path):
+    path = str(tmp_path / "test.cassette")
+    with cassette.recording(path) as recorded:
+        assert run_cmd("echo first") == "first\n"
+        assert run_cmd("sh -c 'echo second' --kubeconfig /tmp/a") == "second\n"
+        assert exec_cmd("sh -c 'exit 3'", ignore_error=True).returncode == 3
+    assert len(recorded.entries) == 3
+    assert recorded.summary()["echo first"]["calls"] == 1
+
+    with cassette.replaying(path) as replayed:
+        assert run_cmd("echo first") == "first\n"
+        assert run_cmd("echo first") == "first\n"
+        # kubeconfig differs between the runs and is not part of the key
+        assert run_cmd("sh -c 'echo second' --kubeconfig /tmp/b") == "second\n"
+        assert exec_cmd("sh -c 'exit 3'", ignore_error=True).returncode == 3
+    assert len(replayed.entries) == 3
+    assert not cassette.utils.command_handlers
+
+
+def test_replay_order_and_fallback(tmp_path, caplog):
+    path = str(tmp_path / "test.cassette")
+    with cassette.recording(path):
+        for status in ("Pending", "Pending", "Bound"):
+            run_cmd(f"echo get pvc pvc-1 {status}")
+    entries = cassette.Cassette.load(path).entries
+    # identical outputs are stored only once
+    assert entries[0]["stdout"] == entries[1]["stdout"]
+
+    with cassette.replaying(path):
+        assert run_cmd("echo get pvc pvc-1 Pending") == "get pvc pvc-1 Pending\n"
+        assert run_cmd("echo get pvc pvc-1 Pending") == "get pvc pvc-1 Pending\n"
+        # polling longer than in the recorded run gets the last response
+        assert run_cmd("echo get pvc pvc-1 Pending") == "get pvc pvc-1 Pending\n"
+        result = exec_cmd("echo get pvc pvc-2 Pending", ignore_error=True)
+        assert result.returncode == cassette.MISSING_RETURNCODE
+
+    with cassette.replaying(path, strict=False):
+        # randomly generated names differ between runs, non strict replay
+        # falls back to the next command of the same shape
+        with caplog.at_level(logging.WARNING, logger=cassette.__name__):
+            assert run_cmd("echo get pvc pvc-2 Pending") == "get pvc pvc-1 Pending\n"
+        assert "serving the response of the recorded command echo get pvc pvc-1" in (
+            caplog.text
+        )
+        assert run_cmd("echo get pvc pvc-2 Pending") == "get pvc pvc-1 Pending\n"
+        assert run_cmd("echo get pvc pvc-2 Bound") == "get pvc pvc-1 Bound\n"
+
+
+def test_command_key_and_shape(tmp_path):
+    yaml_file = tmp_path / "pvc.yaml"
+    yaml_file.write_text("kind: PersistentVolumeClaim")
+    cmd = ["oc", "--kubeconfig", "/tmp/a", "-n", "ns", "create", "-f"]
+    key = cassette.command_key(cmd + [str(yaml_file)])
+    assert "kubeconfig" not in key
+    assert str(yaml_file) not in key
+    assert cassette.command_shape(cmd + [str(yaml_file)]) == "oc create"
+    assert cassette.command_shape(["oc", "get", "Pod", "pod-1"]) == "oc get pod"
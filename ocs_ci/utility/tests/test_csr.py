@@ -0,0 +1,125 @@
+# -*- coding: utf8 -*-
+
+import base64
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from ocs_ci.utility import csr
+
+BOOTSTRAPPER = csr.NODE_CSR_USERNAMES[0]
+
+
+def csr_item(name, username, node_name, approved=False):
+    key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+    request = (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(
+            x509.Name(
+                [x509.NameAttribute(NameOID.COMMON_NAME, f"system:node:{node_name}")]
+            )
+        )
+        .sign(key, hashes.SHA256(), default_backend())
+    )
+    pem = request.public_bytes(serialization.Encoding.PEM)
+    return {
+        "metadata": {"name": name, "creationTimestamp": "2021-03-01T10:00:00Z"},
+        "spec": {"username": username, "request": base64.b64encode(pem).decode()},
+        "status": {"conditions": [{"type": "Approved"}]} if approved else {},
+    }
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    """
+    CSRs of the fake cluster, approved by csr.approve_csrs calls. The names
+    of the CSRs fetched by each csr.list_csrs call are recorded.
+    """
+    items = []
+    approve_calls = []
+    listed = []
+
+    def approve_csrs(names):
+        approve_calls.append(list(names))
+        for item in items:
+            if item["metadata"]["name"] in names:
+                item["status"] = {"conditions": [{"type": "Approved"}]}
+
+    def list_csrs(names, csr_ocp):
+        listed.append(list(names))
+        return [item for item in items if item["metadata"]["name"] in names]
+
+    def list_csr_states(csr_ocp):
+        return [
+            (
+                item["metadata"]["name"],
+                item["spec"]["username"],
+                not item["status"].get("conditions"),
+            )
+            for item in items
+        ]
+
+    monkeypatch.setattr(csr, "list_csrs", list_csrs)
+    monkeypatch.setattr(csr, "list_csr_states", list_csr_states)
+    monkeypatch.setattr(csr, "approve_csrs", approve_csrs)
+    return items, approve_calls, listed
+
+
+def test_get_csr_node_name():
+    assert csr.get_csr_node_name(csr_item("csr-a", BOOTSTRAPPER, "compute-0")) == (
+        "compute-0"
+    )
+    assert csr.get_csr_node_name({"metadata": {"name": "csr-b"}, "spec": {}}) is None
+
+
+def test_approver_batches(cluster, monkeypatch):
+    items, approve_calls, listed = cluster
+    monkeypatch.setattr(csr, "CSR_APPROVE_BATCH", 2)
+    items.extend(csr_item(f"csr-{i}", BOOTSTRAPPER, f"compute-{i}") for i in range(3))
+    items.append(csr_item("csr-old", BOOTSTRAPPER, "compute-9", approved=True))
+    items.append(csr_item("csr-other", "system:admin", "compute-0"))
+    approver = csr.CSRApprover()
+    assert approver.check() == ["csr-0", "csr-1", "csr-2"]
+    assert approve_calls == [["csr-0", "csr-1"], ["csr-2"]]
+    assert approver.check() == []
+    # the complete CSRs are fetched only once
+    assert [len(names) for names in listed] == [5]
+    latency = approver.get_join_latency()
+    assert sorted(latency) == ["compute-0", "compute-1", "compute-2"]
+    assert approver.get_nodes_csr()["node-bootstrapper"] == [
+        "csr-0",
+        "csr-1",
+        "csr-2",
+        "csr-old",
+    ]
+
+
+def test_approver_in_background(cluster):
+    items, approve_calls, _ = cluster
+    with csr.CSRApprover(interval=0.05) as approver:
+        items.append(csr_item("csr-a", BOOTSTRAPPER, "compute-0"))
+        items.append(csr_item("csr-b", "system:node:compute-0", "compute-0"))
+        for approved in csr.TimeoutSampler(5, 0.05, lambda: len(approver.approved)):
+            if approved == 2:
+                break
+    assert sum(approve_calls, []) == ["csr-a", "csr-b"]
+    assert list(approver.get_join_latency()) == ["compute-0"]
+
+
+def test_list_csr_states():
+    class FakeOCP(object):
+        def exec_oc_cmd(self, command, out_yaml_format):
+            assert "custom-columns" in command
+            return (
+                "csr-a   system:node:compute-0   <none>\n"
+                "csr-b   system:admin   Approved\n"
+            )
+
+    assert csr.list_csr_states(FakeOCP()) == [
+        ("csr-a", "system:node:compute-0", True),
+        ("csr-b", "system:admin", False),
+    ]
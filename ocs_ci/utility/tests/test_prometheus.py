@@ -2,7 +2,15 @@
 
 import pytest
 
-from ocs_ci.utility.prometheus import check_query_range_result_enum
+from datetime import datetime
+
+from ocs_ci.utility.prometheus import (
+    check_query_range_result_enum,
+    check_query_range_result_limits,
+    check_query_range_result_viafunction,
+    decode_query_range_result,
+    elapsed_seconds,
+)
 
 
 @pytest.fixture
@@ -204,3 +212,58 @@ def test_check_query_range_result_exp_good_time(query_range_result_bad_last_90s)
         exp_good_time=150,
     )
     assert result2, "taking exp_good_time into account, validation should pass"
+
+
+def test_check_query_range_result_viafunction(query_range_result_delay_60s):
+    """
+    Validation via per value functions matches the vectorized one.
+    """
+    result1 = check_query_range_result_viafunction(
+        query_range_result_delay_60s,
+        is_value_good=lambda val: val == 1,
+        is_value_bad=lambda val: val == 0,
+        exp_delay=60,
+    )
+    assert result1, "taking exp_delay into account, validation should pass"
+    result2 = check_query_range_result_viafunction(
+        query_range_result_delay_60s, is_value_good=lambda val: val == 1
+    )
+    assert not result2, "without bad values, 0 is an invalid value"
+
+
+def test_check_query_range_result_limits(query_range_result_ok):
+    """
+    Float values are checked against given limits.
+    """
+    query_range_result_ok[0]["values"][3][1] = "0.75"
+    assert check_query_range_result_limits(query_range_result_ok, 0.5, 1.0)
+    assert not check_query_range_result_limits(query_range_result_ok, 0.8, 1.0)
+
+
+def test_decode_query_range_result(query_range_result_ok):
+    """
+    Values are decoded as ints by default, non integral values are rejected
+    the same way as by int().
+    """
+    series = decode_query_range_result(query_range_result_ok)
+    assert len(series) == 2
+    assert series[0].metric["ceph_daemon"] == "mon.a"
+    assert series[0].values.tolist() == [1] * 16
+    query_range_result_ok[1]["values"][5][1] = "NaN"
+    with pytest.raises(ValueError):
+        decode_query_range_result(query_range_result_ok)
+    assert decode_query_range_result(query_range_result_ok, is_float=True)
+
+
+def test_elapsed_seconds(query_range_result_ok):
+    """
+    Elapsed seconds match the datetime based computation.
+    """
+    timestamps = [ts for ts, _ in query_range_result_ok[0]["values"]]
+    timestamps += [timestamps[0] + delta for delta in (0.9999995, 14.4999999, 59.5)]
+    start_dt = datetime.utcfromtimestamp(timestamps[0])
+    expected = [(datetime.utcfromtimestamp(ts) - start_dt).seconds for ts in timestamps]
+    series = decode_query_range_result(
+        [{"metric": {}, "values": [[ts, "1"] for ts in timestamps]}]
+    )
+    assert elapsed_seconds(series[0].timestamps).tolist() == expected
@@ -0,0 +1,86 @@
+# -*- coding: utf8 -*-
+
+import threading
+
+import pytest
+
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.utility.fake_ssh_server import fake_ssh_server, run_local_command
+from ocs_ci.utility.ssh_pool import SSHSessionPool
+
+
+@pytest.fixture
+def server():
+    with fake_ssh_server() as ssh_server:
+        yield ssh_server
+
+
+@pytest.fixture
+def pool():
+    ssh_pool = SSHSessionPool(keepalive=5)
+    yield ssh_pool
+    ssh_pool.close()
+
+
+def connect_kwargs(server):
+    return {"port": server.port, "password": "secret", "look_for_keys": False}
+
+
+def test_exec_cmd_reuses_connection(server, pool):
+    for i in range(3):
+        result = pool.exec_cmd(
+            "127.0.0.1",
+            f"echo out-{i}; echo err >&2; exit {i}",
+            **connect_kwargs(server),
+        )
+        assert result == (i, f"out-{i}\n", "err\n")
+    assert server.stats["connections"] == 1
+    assert server.stats["commands"] == 3
+
+
+def test_exec_cmd_large_stderr(server, pool):
+    retcode, stdout, stderr = pool.exec_cmd(
+        "127.0.0.1",
+        "head -c 3000000 /dev/zero | tr '\\0' e >&2; echo done",
+        timeout=30,
+        **connect_kwargs(server),
+    )
+    assert (retcode, stdout, len(stderr)) == (0, "done\n", 3000000)
+
+
+def test_reconnect_after_outage(server, pool):
+    assert pool.exec_cmd("127.0.0.1", "true", **connect_kwargs(server))[0] == 0
+    server.disconnect_all()
+    assert pool.exec_cmd("127.0.0.1", "true", **connect_kwargs(server))[0] == 0
+    assert server.stats["connections"] == 2
+
+
+def test_exec_cmd_timeout(server, pool):
+    with pytest.raises(TimeoutExpiredError):
+        pool.exec_cmd("127.0.0.1", "sleep 5", timeout=0.5, **connect_kwargs(server))
+
+
+def test_fan_out(pool):
+    barrier = threading.Barrier(2, timeout=10)
+
+    def wait_for_other_host(command):
+        # both hosts run the command at once, or the barrier times out
+        barrier.wait()
+        return run_local_command(command)
+
+    with fake_ssh_server(handler=wait_for_other_host) as server:
+        results = list(
+            pool.fan_out(
+                ["127.0.0.1", "localhost"], "echo ok", **connect_kwargs(server)
+            )
+        )
+    assert sorted(result.host for result in results) == ["127.0.0.1", "localhost"]
+    assert all(result.error is None for result in results)
+    assert all(result.stdout == "ok\n" for result in results)
+
+
+def test_fan_out_connection_error(pool):
+    with fake_ssh_server() as server:
+        port = server.port
+    (result,) = pool.fan_out(["127.0.0.1"], "true", port=port, look_for_keys=False)
+    assert result.error is not None and result.retcode is None
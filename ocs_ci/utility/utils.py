@@ -38,6 +38,7 @@ from ocs_ci.ocs.exceptions import (
     UnavailableBuildException,
     UnsupportedOSType,
 )
+from ocs_ci.utility import call_stats
 from ocs_ci.utility.retry import retry
 
 
@@ -59,6 +60,12 @@ RC = []
 failure = {}
 output = []
 unique_test_names = []
+# Handlers which can serve a command executed via exec_cmd instead of running
+# it locally. Handler is called with the command split into a list, the
+# timeout and kwargs for subprocess.run, and returns CompletedProcess or None
+# when it doesn't serve the command. See ocs_ci.ocs.fake_apiserver or
+# ocs_ci.utility.cassette for examples.
+command_handlers = []
 
 
 # function for getting the clients
@@ -481,14 +488,23 @@ def exec_cmd(cmd, secrets=None, timeout=600, ignore_error=False, **kwargs):
     log.info(f"Executing command: {masked_cmd}")
     if isinstance(cmd, str):
         cmd = shlex.split(cmd)
-    completed_process = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        stdin=subprocess.PIPE,
-        timeout=timeout,
-        **kwargs,
-    )
+    completed_process = None
+    start = time.monotonic()
+    for handler in command_handlers:
+        completed_process = handler(cmd, timeout, **kwargs)
+        if completed_process is not None:
+            break
+    if completed_process is None:
+        completed_process = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            timeout=timeout,
+            **kwargs,
+        )
+    duration = time.monotonic() - start
+    call_stats.record(*call_stats.classify_command(cmd), duration, masked_cmd)
     masked_stdout = mask_secrets(completed_process.stdout.decode(), secrets)
     if len(completed_process.stdout) > 0:
         log.debug(f"Command stdout: {masked_stdout}")
@@ -501,6 +517,7 @@ def exec_cmd(cmd, secrets=None, timeout=600, ignore_error=False, **kwargs):
     else:
         log.debug("Command stderr is empty")
     log.debug(f"Command return code: {completed_process.returncode}")
+    log.debug(f"Command took {duration:.3f} seconds")
     if completed_process.returncode and not ignore_error:
         raise CommandFailed(
             f"Error during execution of command: {masked_cmd}."
@@ -1588,6 +1605,8 @@ def ceph_health_check(namespace=None, tries=20, delay=30):
 def ceph_health_check_base(namespace=None):
     """
     Exec `ceph health` cmd on tools pod to determine health of cluster.
+    The health is sampled by the health oracle, see
+    ocs_ci.ocs.health_oracle.
 
     Args:
         namespace (str): Namespace of OCS
@@ -1601,24 +1620,9 @@ def ceph_health_check_base(namespace=None):
         boolean: True if HEALTH_OK
 
     """
-    namespace = namespace or config.ENV_DATA["cluster_namespace"]
-    run_cmd(
-        f"oc wait --for condition=ready pod "
-        f"-l app=rook-ceph-tools "
-        f"-n {namespace} "
-        f"--timeout=120s"
-    )
-    tools_pod = run_cmd(
-        f"oc -n {namespace} get pod -l 'app=rook-ceph-tools' "
-        f"-o jsonpath='{{.items[0].metadata.name}}'",
-        timeout=60,
-    )
-    health = run_cmd(f"oc -n {namespace} exec {tools_pod} -- ceph health")
-    if health.strip() == "HEALTH_OK":
-        log.info("Ceph cluster health is HEALTH_OK.")
-        return True
-    else:
-        raise CephHealthException(f"Ceph cluster health is not OK. Health: {health}")
+    from ocs_ci.ocs.health_oracle import get_health_oracle
+
+    return get_health_oracle(namespace).check_ceph_health()
 
 
 def get_rook_repo(branch="master", to_checkout=None):
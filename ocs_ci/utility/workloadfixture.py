@@ -14,6 +14,11 @@ import os
 import threading
 import time
 
+from ocs_ci.ocs.request_layer import (
+    BACKGROUND,
+    get_request_layer,
+    request_priority,
+)
 from ocs_ci.utility.prometheus import PrometheusAPI
 
 
@@ -69,19 +74,24 @@ def measure_operation(
             alert_list (list): List to be populated with alerts
 
         """
-        prometheus = PrometheusAPI()
-        logger.info("Logging of all prometheus alerts started")
-        while info.get("run"):
-            alerts_response = prometheus.get(
-                "alerts", payload={"silenced": False, "inhibited": False}
-            )
-            msg = f"Request {alerts_response.request.url} failed"
-            assert alerts_response.ok, msg
-            for alert in alerts_response.json().get("data").get("alerts"):
-                if alert not in alert_list:
-                    logger.info(f"Adding {alert} to alert list")
-                    alert_list.append(alert)
-            time.sleep(3)
+        # the requests of the alert logging mustn't slow down the measured
+        # operation, prometheus.get doesn't go through the request layer so
+        # each poll takes a background token explicitly
+        with request_priority(BACKGROUND):
+            prometheus = PrometheusAPI()
+            logger.info("Logging of all prometheus alerts started")
+            while info.get("run"):
+                get_request_layer().throttle()
+                alerts_response = prometheus.get(
+                    "alerts", payload={"silenced": False, "inhibited": False}
+                )
+                msg = f"Request {alerts_response.request.url} failed"
+                assert alerts_response.ok, msg
+                for alert in alerts_response.json().get("data").get("alerts"):
+                    if alert not in alert_list:
+                        logger.info(f"Adding {alert} to alert list")
+                        alert_list.append(alert)
+                time.sleep(3)
         logger.info("Logging of all prometheus alerts stopped")
 
     # check if file with results for this operation already exists
@@ -22,7 +22,15 @@ from ocs_ci.framework.pytest_customization.marks import (
     tier_marks,
     ignore_leftover_label,
 )
-from ocs_ci.ocs import constants, defaults, fio_artefacts, node, ocp, platform_nodes
+from ocs_ci.ocs import (
+    constants,
+    defaults,
+    fio_artefacts,
+    node,
+    ocp,
+    platform_nodes,
+    timeline,
+)
 from ocs_ci.ocs.bucket_utils import craft_s3_command
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
@@ -31,6 +39,7 @@ from ocs_ci.ocs.exceptions import (
     ResourceWrongStatusException,
     UnsupportedPlatformError,
 )
+from ocs_ci.ocs.health_oracle import get_health_oracle
 from ocs_ci.ocs.mcg_workload import mcg_job_factory as mcg_job_factory_implementation
 from ocs_ci.ocs.node import get_node_objs, schedule_nodes
 from ocs_ci.ocs.ocp import OCP
@@ -57,6 +66,7 @@ from ocs_ci.ocs.resources.pod import (
     Pod,
 )
 from ocs_ci.ocs.resources.pvc import PVC, create_restore_pvc
+from ocs_ci.ocs.request_layer import BACKGROUND, request_priority
 from ocs_ci.ocs.version import get_ocs_version, report_ocs_version
 from ocs_ci.ocs.cluster_load import ClusterLoad, wrap_msg
 from ocs_ci.utility import aws
@@ -70,7 +80,6 @@ from ocs_ci.utility.environment_check import (
 from ocs_ci.utility.uninstall_openshift_logging import uninstall_cluster_logging
 from ocs_ci.utility.utils import (
     ceph_health_check,
-    ceph_health_check_base,
     get_running_ocp_version,
     get_openshift_client,
     get_system_architecture,
@@ -997,8 +1006,55 @@ def tier_marks_name():
     return tier_marks_name
 
 
+@pytest.fixture(scope="session")
+def health_oracle(request, cluster):
+    """
+    Session wide oracle of the cluster health, which samples the health in
+    the background, see ocs_ci.ocs.health_oracle
+    """
+    oracle = get_health_oracle()
+    teardown = config.RUN["cli_params"]["teardown"]
+    skip_ocs_deployment = config.ENV_DATA["skip_ocs_deployment"]
+    dev_mode = config.RUN["cli_params"].get("dev_mode")
+    if teardown or skip_ocs_deployment or dev_mode:
+        return oracle
+
+    def finalizer():
+        oracle.stop()
+        oracle.log_timeline()
+
+    request.addfinalizer(finalizer)
+    oracle.start()
+    return oracle
+
+
+@pytest.fixture(scope="session", autouse=True)
+def timeline_recorder(request, health_oracle):
+    """
+    Record the timeline of the cluster and test events into the log dir when
+    enabled by RUN['timeline_recorder'], see ocs_ci.ocs.timeline
+    """
+    teardown = config.RUN["cli_params"]["teardown"]
+    skip_ocs_deployment = config.ENV_DATA["skip_ocs_deployment"]
+    dev_mode = config.RUN["cli_params"].get("dev_mode")
+    if (
+        not config.RUN.get("timeline_recorder")
+        or teardown
+        or skip_ocs_deployment
+        or dev_mode
+    ):
+        return None
+
+    request.addfinalizer(timeline.stop_recording)
+    path = os.path.join(
+        os.path.expanduser(config.RUN["log_dir"]),
+        f"timeline-{config.RUN['run_id']}.jsonl",
+    )
+    return timeline.start_recording(path)
+
+
 @pytest.fixture(scope="function", autouse=True)
-def health_checker(request, tier_marks_name):
+def health_checker(request, tier_marks_name, health_oracle):
     skipped = False
     dev_mode = config.RUN["cli_params"].get("dev_mode")
     if dev_mode:
@@ -1011,7 +1067,8 @@ def health_checker(request, tier_marks_name):
                 teardown = config.RUN["cli_params"]["teardown"]
                 skip_ocs_deployment = config.ENV_DATA["skip_ocs_deployment"]
                 if not (teardown or skip_ocs_deployment):
-                    ceph_health_check_base()
+                    # the test might have changed the health, so check it now
+                    health_oracle.check_ceph_health()
                     log.info("Ceph health check passed at teardown")
             except CephHealthException:
                 log.info("Ceph health check failed at teardown")
@@ -1026,7 +1083,9 @@ def health_checker(request, tier_marks_name):
         if mark.name in tier_marks_name:
             log.info("Checking for Ceph Health OK ")
             try:
-                status = ceph_health_check_base()
+                status = health_oracle.check_ceph_health(
+                    max_age=config.RUN["health_check_max_age"]
+                )
                 if status:
                     log.info("Ceph health check passed at setup")
                     return
@@ -1524,21 +1583,22 @@ def memory_leak_function(request):
         date time PID USER PR NI VIRT RES SHR S %CPU %MEM TIME+ COMMAND
         """
         oc = ocp.OCP(namespace=config.ENV_DATA["cluster_namespace"])
-        while get_flag_status() == "running":
-            for worker in node.get_worker_nodes():
-                filename = f"/tmp/{worker}-top-output.txt"
-                top_cmd = f"debug nodes/{worker} -- chroot /host top -n 2 b"
-                with open("/tmp/file.txt", "w+") as temp:
-                    temp.write(
-                        str(oc.exec_oc_cmd(command=top_cmd, out_yaml_format=False))
-                    )
-                    temp.seek(0)
-                    for line in temp:
-                        if line.__contains__("ceph-osd"):
-                            with open(filename, "a+") as f:
-                                f.write(str(datetime.now()))
-                                f.write(" ")
-                                f.write(line)
+        with request_priority(BACKGROUND):
+            while get_flag_status() == "running":
+                for worker in node.get_worker_nodes():
+                    filename = f"/tmp/{worker}-top-output.txt"
+                    top_cmd = f"debug nodes/{worker} -- chroot /host top -n 2 b"
+                    with open("/tmp/file.txt", "w+") as temp:
+                        temp.write(
+                            str(oc.exec_oc_cmd(command=top_cmd, out_yaml_format=False))
+                        )
+                        temp.seek(0)
+                        for line in temp:
+                            if line.__contains__("ceph-osd"):
+                                with open(filename, "a+") as f:
+                                    f.write(str(datetime.now()))
+                                    f.write(" ")
+                                    f.write(line)
 
     log.info("Start memory leak data capture in the test background")
     thread = threading.Thread(target=run_memory_leak_in_bg)
@@ -2968,28 +3028,48 @@ def multi_snapshot_factory(snapshot_factory):
 
     """
 
-    def factory(pvc_obj, wait=True, snapshot_name_suffix=None):
+    def factory(
+        pvc_obj, wait=True, snapshot_name_suffix=None, max_workers=None, timeout=None
+    ):
         """
         Args:
             pvc_obj (list): List PVC object from which snapshot has to be created
             wait (bool): True to wait for snapshot to be ready, False otherwise
             snapshot_name_suffix (str): Suffix to be added to snapshot
+            max_workers (int): Max. number of snapshots created at once
+            timeout (int): Time in seconds to wait for all the snapshots to
+                be ready, 60 seconds per snapshot by default
 
         Returns:
-            OCS: List of OCS instances of kind VolumeSnapshot
+            OCS: List of OCS instances of kind VolumeSnapshot, with the time
+                of submission (submitted_at) and, when waited for, the time
+                it was found ready (ready_at)
 
         """
-        snapshot = []
 
-        for obj in pvc_obj:
+        def create_snapshot(obj):
             log.info(f"Creating snapshot of PVC {obj.name}")
             snapshot_name = (
                 f"{obj.name}-{snapshot_name_suffix}" if snapshot_name_suffix else None
             )
+            submitted_at = time.time()
             snap_obj = snapshot_factory(
-                pvc_obj=obj, snapshot_name=snapshot_name, wait=wait
+                pvc_obj=obj, snapshot_name=snapshot_name, wait=False
             )
-            snapshot.append(snap_obj)
+            snap_obj.submitted_at = submitted_at
+            return snap_obj
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            snapshot = list(executor.map(create_snapshot, pvc_obj))
+
+        if wait and snapshot:
+            ready_times = helpers.wait_for_resources_state(
+                snapshot, "true", timeout=timeout or 60 * len(snapshot)
+            )
+            for snap_obj in snapshot:
+                snap_obj.ready_at = ready_times[
+                    (snap_obj.kind, snap_obj.namespace, snap_obj.name)
+                ]
         return snapshot
 
     return factory
@@ -3115,6 +3195,8 @@ def multi_snapshot_restore_factory(snapshot_restore_factory):
         access_mode=constants.ACCESS_MODE_RWO,
         status=constants.STATUS_BOUND,
         wait_each=False,
+        max_workers=None,
+        timeout=None,
     ):
         """
         Args:
@@ -3134,20 +3216,26 @@ def multi_snapshot_restore_factory(snapshot_restore_factory):
                 desired state.
             wait_each(bool): True to wait for each PVC to be in status 'status'
                 before creating next PVC, False otherwise
+            max_workers (int): Max. number of PVCs created at once, used
+                when not waiting for each PVC
+            timeout (int): Time in seconds to wait for all the PVCs to reach
+                the status, 60 seconds per PVC by default, used when not
+                waiting for each PVC
 
         Returns:
-            PVC: List of restored PVC object
+            PVC: List of restored PVC object, with the time of submission
+                (submitted_at) and, when waited for all at once, the time it
+                was found in the status (ready_at)
 
         """
-        new_pvcs = []
-
         status_tmp = status if wait_each else ""
 
-        for snap_obj in snapshot_obj:
+        def restore_snapshot(snap_obj):
             log.info(f"Creating a PVC from snapshot {snap_obj.name}")
             restore_pvc_name = (
                 f"{snap_obj.name}-{restore_pvc_suffix}" if restore_pvc_suffix else None
             )
+            submitted_at = time.time()
             restored_pvc = snapshot_restore_factory(
                 snapshot_obj=snap_obj,
                 restore_pvc_name=restore_pvc_name,
@@ -3158,12 +3246,23 @@ def multi_snapshot_restore_factory(snapshot_restore_factory):
                 access_mode=access_mode,
                 status=status_tmp,
             )
-            restored_pvc.snapshot = snapshot_obj
-            new_pvcs.append(restored_pvc)
+            restored_pvc.submitted_at = submitted_at
+            return restored_pvc
 
-        if status and not wait_each:
+        if wait_each:
+            new_pvcs = [restore_snapshot(snap_obj) for snap_obj in snapshot_obj]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                new_pvcs = list(executor.map(restore_snapshot, snapshot_obj))
+
+        if status and not wait_each and new_pvcs:
+            ready_times = helpers.wait_for_resources_state(
+                new_pvcs, status, timeout=timeout or 60 * len(new_pvcs)
+            )
             for restored_pvc in new_pvcs:
-                helpers.wait_for_resource_state(restored_pvc, status)
+                restored_pvc.ready_at = ready_times[
+                    (restored_pvc.kind, restored_pvc.namespace, restored_pvc.name)
+                ]
 
         return new_pvcs
 
@@ -3405,6 +3504,8 @@ def multi_pvc_clone_factory(pvc_clone_factory):
         access_mode=None,
         volume_mode=None,
         wait_each=False,
+        max_workers=None,
+        timeout=None,
     ):
         """
         Args:
@@ -3421,17 +3522,22 @@ def multi_pvc_clone_factory(pvc_clone_factory):
                 volume mode of parent PVC
             wait_each(bool): True to wait for each PVC to be in status 'status'
                 before creating next PVC, False otherwise
+            max_workers (int): Max. number of clones created at once, used
+                when not waiting for each PVC
+            timeout (int): Time in seconds to wait for all the clones to
+                reach the status, 60 seconds per clone by default, used when
+                not waiting for each PVC
 
         Returns:
-            PVC: List PVC instance
+            PVC: List PVC instance, with the time of submission
+                (submitted_at) and, when waited for all at once, the time it
+                was found in the status (ready_at)
 
         """
-        cloned_pvcs = []
-
         status_tmp = status if wait_each else ""
 
-        for obj in pvc_obj:
-            # Create clone
+        def clone_pvc(obj):
+            submitted_at = time.time()
             clone_pvc_obj = pvc_clone_factory(
                 pvc_obj=obj,
                 clone_name=clone_name,
@@ -3441,11 +3547,23 @@ def multi_pvc_clone_factory(pvc_clone_factory):
                 volume_mode=volume_mode,
                 status=status_tmp,
             )
-            cloned_pvcs.append(clone_pvc_obj)
+            clone_pvc_obj.submitted_at = submitted_at
+            return clone_pvc_obj
 
-        if status and not wait_each:
+        if wait_each:
+            cloned_pvcs = [clone_pvc(obj) for obj in pvc_obj]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                cloned_pvcs = list(executor.map(clone_pvc, pvc_obj))
+
+        if status and not wait_each and cloned_pvcs:
+            ready_times = helpers.wait_for_resources_state(
+                cloned_pvcs, status, timeout=timeout or 60 * len(cloned_pvcs)
+            )
             for cloned_pvc in cloned_pvcs:
-                helpers.wait_for_resource_state(cloned_pvc, status)
+                cloned_pvc.ready_at = ready_times[
+                    (cloned_pvc.kind, cloned_pvc.namespace, cloned_pvc.name)
+                ]
 
         return cloned_pvcs
 
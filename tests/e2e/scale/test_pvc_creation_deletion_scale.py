@@ -70,8 +70,18 @@ class TestPVCCreationDeletionScale(E2ETest):
             no_of_pvc=int(scale_pvc_count / 2), access_mode=access_mode, sc_name=sc_name
         )
 
-        # There is 2 kube_job to reduce the load, observed time_out problems
-        # during delete process of single kube_job and heavy load.
+        # Create all the PVCs by chunks, a single request per chunk
+        bulk = scale_lib.BulkApply(
+            pvc_dict_list1 + pvc_dict_list2, namespace=self.namespace
+        )
+        bulk.apply()
+
+        # Check all the PVC reached Bound state
+        pvc_bound_list = [key[2] for key in bulk.wait_for_ready(timeout=600)]
+
+        # The kube_jobs of the created PVCs are used for their deletion, there
+        # is 2 kube_job to reduce the load, observed time_out problems during
+        # delete process of single kube_job and heavy load.
         job_file1 = ObjectConfFile(
             name="job_profile_1",
             obj_dict_list=pvc_dict_list1,
@@ -85,24 +95,6 @@ class TestPVCCreationDeletionScale(E2ETest):
             tmp_path=tmp_path,
         )
 
-        # Create kube_job
-        job_file1.create(namespace=self.namespace)
-        job_file2.create(namespace=self.namespace)
-
-        # Check all the PVC reached Bound state
-        pvc_bound_list = scale_lib.check_all_pvc_reached_bound_state_in_kube_job(
-            kube_job_obj=job_file1,
-            namespace=self.namespace,
-            no_of_pvc=int(scale_pvc_count / 2),
-        )
-        pvc_bound_list.extend(
-            scale_lib.check_all_pvc_reached_bound_state_in_kube_job(
-                kube_job_obj=job_file2,
-                namespace=self.namespace,
-                no_of_pvc=int(scale_pvc_count / 2),
-            )
-        )
-
         logging.info(f"Number of PVCs in Bound state {len(pvc_bound_list)}")
 
         # Get PVC creation time